@@ -10,11 +10,19 @@ For detailed metadata support information, see the README.md file.
 """
 
 import contextlib
+import functools
+import os
+import threading
+import time
 import warnings
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any, Union, cast
 
 from ._audio_file import _AudioFile
+from ._batch import run_batch
+from ._verify_state import _VerifyState
+from .cache import invalidate_cached_results, read_through_cache
 from .exceptions import (
     FileCorruptedError,
     FileTypeNotSupportedError,
@@ -30,11 +38,18 @@ from .manager._rating_supporting.id3v2._Id3v2Manager import _Id3v2Manager
 from .manager._rating_supporting.riff._RiffManager import _RiffManager
 from .manager._rating_supporting.vorbis._VorbisManager import _VorbisManager
 from .manager.id3v1._Id3v1Manager import _Id3v1Manager
+from .utils.batch_executor import BatchExecutor
+from .utils.batch_result import BatchReadResult, BatchVerifyResult, BatchWriteResult
 from .utils.flac_md5_state import FlacMd5State
+from .utils.flac_md5_verification_method import FlacMd5VerificationMethod
+from .utils.flac_md5_verifier import DEFAULT_READ_CHUNK_SIZE
 from .utils.metadata_format import MetadataFormat
+from .utils.metadata_write_report import MetadataWriteReport
 from .utils.metadata_writing_strategy import MetadataWritingStrategy
+from .utils.padding_policy import PaddingFunction
 from .utils.types import UnifiedMetadata, UnifiedMetadataValue
 from .utils.unified_metadata_key import UnifiedMetadataKey
+from .utils.validation_level import ValidationLevel
 
 FILE_EXTENSION_NOT_HANDLED_MESSAGE = "The file's format is not handled by the service."
 
@@ -54,6 +69,8 @@ def _get_metadata_manager(
     metadata_format: MetadataFormat | None = None,
     normalized_rating_max_value: int | None = None,
     id3v2_version: tuple[int, int, int] | None = None,
+    padding: PaddingFunction | None = None,
+    fields: frozenset[UnifiedMetadataKey] | None = None,
 ) -> _MetadataManager:
     audio_file_prioritized_tag_formats = MetadataFormat.get_priorities().get(audio_file.file_extension)
     if not audio_file_prioritized_tag_formats:
@@ -71,16 +88,29 @@ def _get_metadata_manager(
             # Determine ID3v2 version based on provided version or use default
             version = id3v2_version if id3v2_version is not None else (2, 3, 0)  # Default to ID3v2.3
             id3v2_manager_class = cast(type[_Id3v2Manager], manager_class)
-            return cast(
+            manager = cast(
                 _MetadataManager,
                 id3v2_manager_class(
                     audio_file=audio_file,
                     normalized_rating_max_value=normalized_rating_max_value,
                     id3v2_version=version,
+                    padding=padding,
                 ),
             )
-        return manager_class(audio_file=audio_file, normalized_rating_max_value=normalized_rating_max_value)  # type: ignore[call-arg]
-    return manager_class(audio_file=audio_file)  # type: ignore[call-arg]
+        elif manager_class is _VorbisManager:
+            vorbis_manager_class = cast(type[_VorbisManager], manager_class)
+            manager = cast(
+                _MetadataManager,
+                vorbis_manager_class(
+                    audio_file=audio_file, normalized_rating_max_value=normalized_rating_max_value, padding=padding
+                ),
+            )
+        else:
+            manager = manager_class(audio_file=audio_file, normalized_rating_max_value=normalized_rating_max_value)  # type: ignore[call-arg]
+    else:
+        manager = manager_class(audio_file=audio_file)  # type: ignore[call-arg]
+    manager.fields = fields
+    return manager
 
 
 def _get_metadata_managers(
@@ -88,6 +118,8 @@ def _get_metadata_managers(
     tag_formats: list[MetadataFormat] | None = None,
     normalized_rating_max_value: int | None = None,
     id3v2_version: tuple[int, int, int] | None = None,
+    padding: PaddingFunction | None = None,
+    fields: frozenset[UnifiedMetadataKey] | None = None,
 ) -> dict[MetadataFormat, _MetadataManager]:
     managers = {}
 
@@ -102,6 +134,8 @@ def _get_metadata_managers(
             metadata_format=metadata_format,
             normalized_rating_max_value=normalized_rating_max_value,
             id3v2_version=id3v2_version,
+            padding=padding,
+            fields=fields,
         )
     return managers
 
@@ -111,6 +145,7 @@ def get_unified_metadata(
     normalized_rating_max_value: int | None = None,
     id3v2_version: tuple[int, int, int] | None = None,
     metadata_format: MetadataFormat | None = None,
+    fields: Iterable[UnifiedMetadataKey | str] | None = None,
 ) -> UnifiedMetadata:
     """Get metadata from a file, either unified across all formats or from a specific format only.
 
@@ -127,6 +162,8 @@ def get_unified_metadata(
             When provided, ratings are normalized to this scale. Defaults to None (raw values).
         id3v2_version: ID3v2 version tuple for ID3v2-specific operations
         metadata_format: Specific metadata format to read from. If None, reads from all available formats.
+        fields: Unified metadata keys to read. If None (default), all fields are read. Only the frames, comments and
+            INFO subchunks these keys are read from are decoded, so that large embedded pictures are skipped.
 
     Returns:
         Dictionary containing metadata fields
@@ -134,6 +171,7 @@ def get_unified_metadata(
     Raises:
         FileTypeNotSupportedError: If the file format is not supported
         FileNotFoundError: If the file does not exist
+        MetadataFieldNotSupportedByLibError: If a field is not a valid UnifiedMetadataKey
 
     Examples:
         # Get all metadata with raw rating values (unified)
@@ -161,9 +199,44 @@ def get_unified_metadata(
             "song.mp3", metadata_format=MetadataFormat.ID3V2, normalized_rating_max_value=100
         )
         print(metadata.get(UnifiedMetadataKey.RATING))  # Returns 0-100
+
+        # Read only the fields needed to deduplicate a library, skipping embedded pictures
+        metadata = get_unified_metadata("song.mp3", fields=[UnifiedMetadataKey.TITLE, UnifiedMetadataKey.ISRC])
     """
-    audio_file = _AudioFile(file)
+    unified_fields = None if fields is None else frozenset(_ensure_unified_metadata_key(field) for field in fields)
+    return read_through_cache(
+        file,
+        f"unified:{normalized_rating_max_value}:{id3v2_version}:{metadata_format}:{_get_fields_kind(unified_fields)}",
+        functools.partial(
+            _read_unified_metadata, file, normalized_rating_max_value, id3v2_version, metadata_format, unified_fields
+        ),
+    )
+
+
+def _get_fields_kind(fields: frozenset[UnifiedMetadataKey] | None) -> str:
+    """Get the part of the cache kind of a read that depends on the fields read."""
+    return "all" if fields is None else ",".join(sorted(field.value for field in fields))
 
+
+def _read_unified_metadata(
+    file: PublicFileType,
+    normalized_rating_max_value: int | None,
+    id3v2_version: tuple[int, int, int] | None,
+    metadata_format: MetadataFormat | None,
+    fields: frozenset[UnifiedMetadataKey] | None = None,
+) -> UnifiedMetadata:
+    return _get_unified_metadata_of_file(
+        _AudioFile(file), normalized_rating_max_value, id3v2_version, metadata_format, fields
+    )
+
+
+def _get_unified_metadata_of_file(
+    audio_file: _AudioFile,
+    normalized_rating_max_value: int | None,
+    id3v2_version: tuple[int, int, int] | None,
+    metadata_format: MetadataFormat | None,
+    fields: frozenset[UnifiedMetadataKey] | None,
+) -> UnifiedMetadata:
     # If specific format requested, return data from that format only
     if metadata_format is not None:
         manager = _get_metadata_manager(
@@ -171,12 +244,16 @@ def get_unified_metadata(
             metadata_format=metadata_format,
             normalized_rating_max_value=normalized_rating_max_value,
             id3v2_version=id3v2_version,
+            fields=fields,
         )
         return manager.get_unified_metadata()
 
     # Get all available managers for this file type
     all_managers = _get_metadata_managers(
-        audio_file=audio_file, normalized_rating_max_value=normalized_rating_max_value, id3v2_version=id3v2_version
+        audio_file=audio_file,
+        normalized_rating_max_value=normalized_rating_max_value,
+        id3v2_version=id3v2_version,
+        fields=fields,
     )
 
     # Get file-specific format priorities
@@ -187,19 +264,42 @@ def get_unified_metadata(
         if format_type in all_managers:
             managers_by_precedence.append((format_type, all_managers[format_type]))
 
+    return _merge_unified_metadata_by_precedence(managers_by_precedence)
+
+
+def _merge_unified_metadata_by_precedence(
+    managers_by_precedence: list[tuple[MetadataFormat, _MetadataManager]],
+) -> UnifiedMetadata:
+    """Merge the unified metadata of several managers, asking each manager exactly once.
+
+    For every unified key, the first non-None value found in precedence order wins. Managers that fail to read are
+    skipped so that the remaining formats can still provide values.
+
+    Args:
+        managers_by_precedence: (format, manager) pairs ordered from highest to lowest precedence
+
+    Returns:
+        Unified metadata dictionary with keys in UnifiedMetadataKey order
+    """
+    unified_metadata_by_precedence: list[UnifiedMetadata] = []
+    for _format_type, manager in managers_by_precedence:
+        try:
+            unified_metadata_by_precedence.append(manager.get_unified_metadata())
+        except Exception:
+            # If this manager fails, continue with the next one
+            continue
+    return _merge_unified_metadata(unified_metadata_by_precedence)
+
+
+def _merge_unified_metadata(unified_metadata_by_precedence: list[UnifiedMetadata]) -> UnifiedMetadata:
+    """Merge unified metadata dictionaries ordered from highest to lowest precedence."""
     result: dict[UnifiedMetadataKey, UnifiedMetadataValue] = {}
     for unified_metadata_key in UnifiedMetadataKey:
-        for _format_type, manager in managers_by_precedence:
-            try:
-                unified_metadata = manager.get_unified_metadata()
-                if unified_metadata_key in unified_metadata:
-                    value = unified_metadata[unified_metadata_key]
-                    if value is not None:
-                        result[unified_metadata_key] = value
-                        break
-            except Exception:
-                # If this manager fails, continue to the next one
-                continue
+        for unified_metadata in unified_metadata_by_precedence:
+            value = unified_metadata.get(unified_metadata_key)
+            if value is not None:
+                result[unified_metadata_key] = value
+                break
     return result
 
 
@@ -259,6 +359,8 @@ def get_unified_metadata_field(
     unified_metadata_key = _ensure_unified_metadata_key(unified_metadata_key)
 
     audio_file = _AudioFile(file)
+    # Only the frames and comments of the requested field are decoded
+    fields = frozenset({unified_metadata_key})
 
     if metadata_format is not None:
         # Get metadata from specific format
@@ -267,6 +369,7 @@ def get_unified_metadata_field(
             metadata_format=metadata_format,
             normalized_rating_max_value=normalized_rating_max_value,
             id3v2_version=id3v2_version,
+            fields=fields,
         )
         try:
             return manager.get_unified_metadata_field(unified_metadata_key=unified_metadata_key)
@@ -278,7 +381,10 @@ def get_unified_metadata_field(
     else:
         # Use priority order across all formats
         managers_prioritized = _get_metadata_managers(
-            audio_file=audio_file, normalized_rating_max_value=normalized_rating_max_value, id3v2_version=id3v2_version
+            audio_file=audio_file,
+            normalized_rating_max_value=normalized_rating_max_value,
+            id3v2_version=id3v2_version,
+            fields=fields,
         )
 
         # Try each manager in priority order until we find a value
@@ -535,14 +641,7 @@ def validate_metadata_for_update(
         normalized_key = _ensure_unified_metadata_key(key)
         normalized_metadata[normalized_key] = value
 
-    # Validate types
-    _validate_unified_metadata_types(normalized_metadata)
-
-    # Validate rating if present
-    _validate_rating_value(normalized_metadata, normalized_rating_max_value)
-
-    # Validate field formats (release_date, track_number, disc_number, disc_total, isrc)
-    _validate_metadata_field_formats(normalized_metadata)
+    _validate_metadata_for_writing(normalized_metadata, normalized_rating_max_value)
 
 
 def update_metadata(
@@ -554,7 +653,8 @@ def update_metadata(
     metadata_format: MetadataFormat | None = None,
     fail_on_unsupported_field: bool = False,
     warn_on_unsupported_field: bool = True,
-) -> None:
+    padding: PaddingFunction | None = None,
+) -> list[MetadataWriteReport]:
     """Update metadata in an audio file.
 
     This function writes metadata to the specified audio file using the appropriate
@@ -579,9 +679,15 @@ def update_metadata(
         warn_on_unsupported_field: If True (default), issues warnings when unsupported fields are encountered.
             If False, suppresses warnings about unsupported fields. Automatically set to False when
             fail_on_unsupported_field is True.
+        padding: Padding policy for ID3v2 tags and FLAC VORBIS_COMMENT blocks, either a PaddingPolicy
+            (fixed size, percentage of the tag or preserve existing) or a mutagen-style callable taking a
+            mutagen.PaddingInfo. Tags that fit in their existing space plus padding are rewritten in place without
+            moving the audio data. Defaults to None (mutagen's default policy for ID3v2, reuse of the existing padding
+            for Vorbis).
 
     Returns:
-        None
+        One MetadataWriteReport per ID3v2 or Vorbis tag written, telling whether it was written in place or the audio
+        data had to be shifted. Other formats are not reported.
 
     Raises:
         FileTypeNotSupportedError: If the file format is not supported
@@ -650,18 +756,15 @@ def update_metadata(
 
         # Suppress warnings about unsupported fields
         update_metadata("song.mp3", metadata, warn_on_unsupported_field=False)
+
+        # Reserve room for future edits so that they do not move the audio data
+        reports = update_metadata("song.flac", metadata, padding=PaddingPolicy.percentage(50))
+        reports[0].in_place  # False on the first write if the tag had to grow, True on later small edits
     """
     audio_file = _AudioFile(file)
 
     # Validate that both parameters are not specified simultaneously
-    if metadata_strategy is not None and metadata_format is not None:
-        msg = (
-            "Cannot specify both metadata_strategy and metadata_format. "
-            "When metadata_format is specified, strategy is not applicable. "
-            "Choose either: use metadata_strategy for multi-format management, "
-            "or metadata_format for single-format writing."
-        )
-        raise MetadataWritingConflictParametersError(msg)
+    _validate_metadata_writing_parameters(metadata_strategy, metadata_format)
 
     # Automatically disable warnings when failing on unsupported fields
     # This provides a more intuitive API where fail takes precedence over warn
@@ -673,7 +776,40 @@ def update_metadata(
         metadata_strategy = MetadataWritingStrategy.SYNC
 
     # Handle strategy-specific behavior before writing
-    # Validate provided unified_metadata value types before attempting any writes
+    # Validate provided unified_metadata values before attempting any writes
+    _validate_metadata_for_writing(unified_metadata, normalized_rating_max_value)
+
+    try:
+        return _handle_metadata_strategy(
+            audio_file,
+            unified_metadata,
+            metadata_strategy,
+            normalized_rating_max_value,
+            id3v2_version,
+            metadata_format,
+            fail_on_unsupported_field,
+            warn_on_unsupported_field,
+            padding,
+        )
+    finally:
+        invalidate_cached_results(file)
+
+
+def _validate_metadata_writing_parameters(
+    metadata_strategy: MetadataWritingStrategy | None, metadata_format: MetadataFormat | None
+) -> None:
+    if metadata_strategy is not None and metadata_format is not None:
+        msg = (
+            "Cannot specify both metadata_strategy and metadata_format. "
+            "When metadata_format is specified, strategy is not applicable. "
+            "Choose either: use metadata_strategy for multi-format management, "
+            "or metadata_format for single-format writing."
+        )
+        raise MetadataWritingConflictParametersError(msg)
+
+
+def _validate_metadata_for_writing(unified_metadata: UnifiedMetadata, normalized_rating_max_value: int | None) -> None:
+    # Validate value types
     _validate_unified_metadata_types(unified_metadata)
 
     # Validate rating if present
@@ -682,17 +818,6 @@ def update_metadata(
     # Validate field formats (release_date, track_number, disc_number, disc_total, isrc)
     _validate_metadata_field_formats(unified_metadata)
 
-    _handle_metadata_strategy(
-        audio_file,
-        unified_metadata,
-        metadata_strategy,
-        normalized_rating_max_value,
-        id3v2_version,
-        metadata_format,
-        fail_on_unsupported_field,
-        warn_on_unsupported_field,
-    )
-
 
 def _handle_metadata_strategy(
     audio_file: _AudioFile,
@@ -703,8 +828,13 @@ def _handle_metadata_strategy(
     target_format: MetadataFormat | None = None,
     fail_on_unsupported_field: bool = False,
     warn_on_unsupported_field: bool = True,
-) -> None:
-    """Handle metadata strategy-specific behavior for all strategies."""
+    padding: PaddingFunction | None = None,
+) -> list[MetadataWriteReport]:
+    """Handle metadata strategy-specific behavior for all strategies.
+
+    Returns:
+        The write reports of the managers that wrote a tag
+    """
 
     # Get the target format (specified format or native format)
     if target_format:
@@ -723,14 +853,18 @@ def _handle_metadata_strategy(
             tag_formats=[target_format_actual],
             normalized_rating_max_value=normalized_rating_max_value,
             id3v2_version=id3v2_version,
+            padding=padding,
         )
         target_manager = all_managers[target_format_actual]
         target_manager.update_metadata(unified_metadata)
-        return
+        return _collect_write_reports(all_managers)
 
     # Get all available managers for this file type
     all_managers = _get_metadata_managers(
-        audio_file=audio_file, normalized_rating_max_value=normalized_rating_max_value, id3v2_version=id3v2_version
+        audio_file=audio_file,
+        normalized_rating_max_value=normalized_rating_max_value,
+        id3v2_version=id3v2_version,
+        padding=padding,
     )
 
     # Get other formats (non-target)
@@ -837,11 +971,7 @@ def _handle_metadata_strategy(
             elif fmt_name == "id3v2":
                 # Check if file starts with ID3
                 try:
-                    from pathlib import Path
-
-                    with Path(audio_file.file_path).open("rb") as f:
-                        header = f.read(3)
-                        has_existing = header == b"ID3"
+                    has_existing = audio_file.get_context().head.startswith(b"ID3")
                 except Exception:
                     has_existing = False
             elif fmt_name == "vorbis":
@@ -927,6 +1057,12 @@ def _handle_metadata_strategy(
                 # Some managers might not support writing or might fail for other reasons
                 pass
 
+    return _collect_write_reports(all_managers)
+
+
+def _collect_write_reports(managers: dict[MetadataFormat, _MetadataManager]) -> list[MetadataWriteReport]:
+    return [manager.last_write_report for manager in managers.values() if manager.last_write_report is not None]
+
 
 def delete_all_metadata(
     file: PublicFileType,
@@ -978,7 +1114,15 @@ def delete_all_metadata(
         For selective field removal, use update_metadata with None values instead.
     """
     audio_file = _AudioFile(file)
+    try:
+        return _delete_all_metadata(audio_file, metadata_format, id3v2_version)
+    finally:
+        invalidate_cached_results(file)
+
 
+def _delete_all_metadata(
+    audio_file: _AudioFile, metadata_format: MetadataFormat | None, id3v2_version: tuple[int, int, int] | None
+) -> bool:
     # If specific format requested, delete only that format
     if metadata_format:
         manager = _get_metadata_manager(
@@ -1006,11 +1150,13 @@ def delete_all_metadata(
     return success_count > 0
 
 
-def get_bitrate(file: PublicFileType) -> int:
+def get_bitrate(file: PublicFileType, wav_ffprobe_fallback: bool = False) -> int:
     """Get the bitrate of an audio file.
 
     Args:
         file: Audio file path (str or Path)
+        wav_ffprobe_fallback: For WAV files, ask ffprobe for values the native RIFF chunk parser could not
+            determine (default: False)
 
     Returns:
         Bitrate in bits per second (bps)
@@ -1024,15 +1170,17 @@ def get_bitrate(file: PublicFileType) -> int:
         print(f"Bitrate: {bitrate} bps")
         print(f"Bitrate: {bitrate // 1000} kbps")
     """
-    audio_file = _AudioFile(file)
+    audio_file = _AudioFile(file, wav_ffprobe_fallback=wav_ffprobe_fallback)
     return audio_file.get_bitrate()
 
 
-def get_channels(file: PublicFileType) -> int:
+def get_channels(file: PublicFileType, wav_ffprobe_fallback: bool = False) -> int:
     """Get the number of channels in an audio file.
 
     Args:
         file: Audio file path (str or Path)
+        wav_ffprobe_fallback: For WAV files, ask ffprobe for values the native RIFF chunk parser could not
+            determine (default: False)
 
     Returns:
         Number of audio channels (e.g., 1 for mono, 2 for stereo)
@@ -1045,7 +1193,7 @@ def get_channels(file: PublicFileType) -> int:
         channels = get_channels("song.mp3")
         print(f"Channels: {channels}")
     """
-    audio_file = _AudioFile(file)
+    audio_file = _AudioFile(file, wav_ffprobe_fallback=wav_ffprobe_fallback)
     return audio_file.get_channels()
 
 
@@ -1070,11 +1218,13 @@ def get_file_size(file: PublicFileType) -> int:
     return audio_file.get_file_size()
 
 
-def get_sample_rate(file: PublicFileType) -> int:
+def get_sample_rate(file: PublicFileType, wav_ffprobe_fallback: bool = False) -> int:
     """Get the sample rate of an audio file in Hz.
 
     Args:
         file: Audio file path (str or Path)
+        wav_ffprobe_fallback: For WAV files, ask ffprobe for values the native RIFF chunk parser could not
+            determine (default: False)
 
     Returns:
         Sample rate in Hz
@@ -1087,11 +1237,11 @@ def get_sample_rate(file: PublicFileType) -> int:
         sample_rate = get_sample_rate("song.mp3")
         print(f"Sample rate: {sample_rate} Hz")
     """
-    audio_file = _AudioFile(file)
+    audio_file = _AudioFile(file, wav_ffprobe_fallback=wav_ffprobe_fallback)
     return audio_file.get_sample_rate()
 
 
-def is_audio_file(file: PublicFileType) -> bool:
+def is_audio_file(file: PublicFileType, validation_level: ValidationLevel = ValidationLevel.FULL) -> bool:
     """Check if a file is a valid audio file supported by the library.
 
     This function validates that the file exists, has a supported extension (.mp3, .flac, .wav),
@@ -1099,6 +1249,9 @@ def is_audio_file(file: PublicFileType) -> bool:
 
     Args:
         file: File path (str or Path) to check
+        validation_level: How thoroughly the content is checked (default: ValidationLevel.FULL, a full mutagen
+            parse). ValidationLevel.MAGIC only checks the format marker in one small read, which suits scanning
+            directories of mixed content. Strings "none", "magic", "structural" and "full" are accepted
 
     Returns:
         True if the file is a valid audio file, False otherwise
@@ -1115,20 +1268,26 @@ def is_audio_file(file: PublicFileType) -> bool:
             metadata = get_unified_metadata("unknown.txt")
         else:
             print("File is not a supported audio format")
+
+        # Cheap check of the format marker only
+        if is_audio_file("download.mp3", validation_level=ValidationLevel.MAGIC):
+            print("Looks like an MP3 file")
     """
     try:
-        _AudioFile(file)
+        _AudioFile(file, validation_level=validation_level)
     except (FileNotFoundError, FileTypeNotSupportedError, FileCorruptedError):
         return False
     else:
         return True
 
 
-def get_duration_in_sec(file: PublicFileType) -> float:
+def get_duration_in_sec(file: PublicFileType, wav_ffprobe_fallback: bool = False) -> float:
     """Get the duration of an audio file in seconds.
 
     Args:
         file: Audio file path (str or Path)
+        wav_ffprobe_fallback: For WAV files, ask ffprobe for values the native RIFF chunk parser could not
+            determine (default: False)
 
     Returns:
         Duration in seconds as a float
@@ -1145,11 +1304,15 @@ def get_duration_in_sec(file: PublicFileType) -> float:
         minutes = duration / 60
         print(f"Duration: {minutes:.2f} minutes")
     """
-    audio_file = _AudioFile(file)
+    audio_file = _AudioFile(file, wav_ffprobe_fallback=wav_ffprobe_fallback)
     return audio_file.get_duration_in_sec()
 
 
-def is_flac_md5_valid(file: PublicFileType) -> FlacMd5State:
+def is_flac_md5_valid(
+    file: PublicFileType,
+    method: FlacMd5VerificationMethod = FlacMd5VerificationMethod.FLAC_CLI,
+    chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+) -> FlacMd5State:
     """Check the MD5 checksum validation state of a FLAC file.
 
     This function verifies the integrity of a FLAC file by checking its MD5 signature.
@@ -1157,6 +1320,10 @@ def is_flac_md5_valid(file: PublicFileType) -> FlacMd5State:
 
     Args:
         file: Audio file path (str or Path; must be FLAC)
+        method: How the audio is checked (default: FlacMd5VerificationMethod.FLAC_CLI, which runs `flac -t`).
+            FlacMd5VerificationMethod.NATIVE decodes in-process, without the flac tool or spawning a process, but is
+            much slower on long files
+        chunk_size: Number of bytes read at a time when decoding in-process
 
     Returns:
         FlacMd5State indicating the validation state:
@@ -1167,7 +1334,7 @@ def is_flac_md5_valid(file: PublicFileType) -> FlacMd5State:
 
     Raises:
         FileTypeNotSupportedError: If the file is not a FLAC file
-        FileNotFoundError: If the file does not exist
+        FileNotFoundError: If the file does not exist, or method is FLAC_CLI and the flac tool is not installed
 
     Examples:
         from audiometa import is_flac_md5_valid, FlacMd5State
@@ -1182,10 +1349,13 @@ def is_flac_md5_valid(file: PublicFileType) -> FlacMd5State:
             print("MD5 cannot be validated due to ID3v1 tags")
         else:
             print("FLAC file may be corrupted")
+
+        # Verify without the flac tool
+        state = is_flac_md5_valid("song.flac", method=FlacMd5VerificationMethod.NATIVE)
     """
     audio_file = _AudioFile(file)
     try:
-        return audio_file.is_flac_file_md5_valid()
+        return audio_file.is_flac_file_md5_valid(method=method, chunk_size=chunk_size)
     except FileCorruptedError:
         return FlacMd5State.INVALID
 
@@ -1205,11 +1375,18 @@ def fix_md5_checking(file: PublicFileType) -> str:
         RuntimeError: If the FLAC command fails to execute
     """
     audio_file = _AudioFile(file)
-    return audio_file.get_file_with_corrected_md5(delete_original=True)
+    try:
+        return audio_file.get_file_with_corrected_md5(delete_original=True)
+    finally:
+        invalidate_cached_results(file)
 
 
 def get_full_metadata(
-    file: PublicFileType, include_headers: bool = True, include_technical: bool = True
+    file: PublicFileType,
+    include_headers: bool = True,
+    include_technical: bool = True,
+    wav_ffprobe_fallback: bool = False,
+    flac_md5_method: FlacMd5VerificationMethod = FlacMd5VerificationMethod.FLAC_CLI,
 ) -> dict[str, Any]:
     """Get comprehensive metadata including all available information from a file.
 
@@ -1225,6 +1402,9 @@ def get_full_metadata(
         file: Audio file path (str or Path)
         include_headers: Whether to include format-specific header information (default: True)
         include_technical: Whether to include technical audio information (default: True)
+        wav_ffprobe_fallback: For WAV files, ask ffprobe for technical values the native RIFF chunk parser could not
+            determine (default: False)
+        flac_md5_method: How the MD5 signature of FLAC files is checked (default: FlacMd5VerificationMethod.FLAC_CLI)
 
     Returns:
         Comprehensive dictionary containing all available metadata and technical information
@@ -1253,8 +1433,27 @@ def get_full_metadata(
         print(f"ID3v2 Version: {full_metadata['headers']['id3v2']['version']}")
         print(f"Has ID3v1 Header: {full_metadata['headers']['id3v1']['present']}")
     """
-    audio_file = _AudioFile(file)
 
+    def read() -> dict[str, Any]:
+        audio_file = _AudioFile(file, wav_ffprobe_fallback=wav_ffprobe_fallback)
+        return _get_full_metadata(audio_file, include_headers, include_technical, flac_md5_method)
+
+    return read_through_cache(
+        file, f"full:{include_headers}:{include_technical}:{wav_ffprobe_fallback}:{flac_md5_method}", read
+    )
+
+
+def _get_full_metadata(
+    audio_file: _AudioFile,
+    include_headers: bool,
+    include_technical: bool,
+    flac_md5_method: FlacMd5VerificationMethod,
+) -> dict[str, Any]:
+    """Build the result of get_full_metadata from an opened audio file.
+
+    The file is parsed once: the unified metadata is merged from the per-format metadata of the same managers, and
+    technical info that the audio file has already cached, such as the MD5 state of a FLAC file, is not computed again.
+    """
     # Get all available managers for this file type
     all_managers = _get_metadata_managers(audio_file=audio_file, normalized_rating_max_value=None, id3v2_version=None)
 
@@ -1275,22 +1474,13 @@ def get_full_metadata(
         },
     }
 
-    # Get unified metadata (same as get_unified_metadata)
-    result["unified_metadata"] = get_unified_metadata(file)
-
     # Get technical information
     if include_technical:
         try:
             result["technical_info"] = {
-                "duration_seconds": audio_file.get_duration_in_sec(),
-                "bitrate_bps": audio_file.get_bitrate(),
-                "sample_rate_hz": audio_file.get_sample_rate(),
-                "channels": audio_file.get_channels(),
-                "file_size_bytes": get_file_size(file),
-                "file_extension": audio_file.file_extension,
-                "audio_format_name": audio_file.get_audio_format_name(),
+                **audio_file.get_technical_info().to_dict(),
                 "is_flac_md5_valid": (
-                    audio_file.is_flac_file_md5_valid() == FlacMd5State.VALID
+                    audio_file.is_flac_file_md5_valid(method=flac_md5_method) == FlacMd5State.VALID
                     if audio_file.file_extension == ".flac"
                     else None
                 ),
@@ -1371,4 +1561,346 @@ def get_full_metadata(
                     "chunk_structure": {},
                 }
 
+    # Merge the unified metadata from the per-format metadata (same as get_unified_metadata)
+    result["unified_metadata"] = _merge_unified_metadata(list(metadata_format_dict.values()))
+
     return result
+
+
+def read_many(
+    files: Iterable[PublicFileType],
+    *,
+    workers: int | None = None,
+    executor: BatchExecutor = BatchExecutor.THREAD,
+    fields: Iterable[UnifiedMetadataKey | str] | None = None,
+    include_technical: bool = False,
+    normalized_rating_max_value: int | None = None,
+    ordered: bool = True,
+    max_in_flight: int | None = None,
+) -> Iterator[BatchReadResult]:
+    """Read the unified metadata of many files in parallel.
+
+    Files are read in a worker pool and their results are yielded as an iterator. Errors are captured in the result of
+    the file that caused them instead of being raised, so one unreadable file does not stop the batch. Files are pulled
+    lazily from the iterable and at most max_in_flight of them are in progress at once, so memory use stays flat on very
+    large inputs.
+
+    Args:
+        files: Audio file paths (str or Path), consumed lazily
+        workers: Number of workers. Defaults to the default of the executor kind (based on the CPU count)
+        executor: BatchExecutor.THREAD (default) when reads wait on storage, e.g. network shares, or
+            BatchExecutor.PROCESS when parsing is CPU-bound, e.g. local SSDs.
+            Strings "thread" and "process" are accepted
+        fields: Unified metadata keys to read, as in get_unified_metadata. If None, all fields are read
+        include_technical: Whether to read technical information (duration, bitrate, sample rate, channels and size)
+        normalized_rating_max_value: Maximum value for rating normalization, as in get_unified_metadata
+        ordered: Whether results are yielded in the order of the files (default) rather than as they complete
+        max_in_flight: Maximum number of files being read ahead of the results being consumed. Defaults to 4 per worker
+
+    Returns:
+        Iterator of BatchReadResult, one per file
+
+    Raises:
+        ValueError: If workers or max_in_flight is lower than 1
+        MetadataFieldNotSupportedByLibError: If a field is not a valid UnifiedMetadataKey
+
+    Examples:
+        # Read a whole library with 16 threads
+        for result in read_many(Path("library").rglob("*.flac"), workers=16):
+            if result.ok:
+                print(result.file, result.unified_metadata.get(UnifiedMetadataKey.TITLE))
+            else:
+                print(f"{result.file}: {result.error}")
+
+        # Parse local files in a process pool, yielding results as they complete
+        results = read_many(paths, executor=BatchExecutor.PROCESS, ordered=False, include_technical=True)
+    """
+    unified_fields = None if fields is None else frozenset(_ensure_unified_metadata_key(field) for field in fields)
+    read_file = functools.partial(
+        _read_file_for_batch,
+        fields=unified_fields,
+        include_technical=include_technical,
+        normalized_rating_max_value=normalized_rating_max_value,
+    )
+    return run_batch(read_file, files, executor, workers, ordered, max_in_flight)
+
+
+def _read_file_for_batch(
+    file: PublicFileType,
+    fields: frozenset[UnifiedMetadataKey] | None,
+    include_technical: bool,
+    normalized_rating_max_value: int | None,
+) -> BatchReadResult:
+    try:
+        if include_technical:
+            unified_metadata, technical_info = read_through_cache(
+                file,
+                f"unified_technical:{normalized_rating_max_value}:{_get_fields_kind(fields)}",
+                functools.partial(_read_unified_metadata_and_technical_info, file, fields, normalized_rating_max_value),
+            )
+        else:
+            unified_metadata = get_unified_metadata(
+                file, normalized_rating_max_value=normalized_rating_max_value, fields=fields
+            )
+            technical_info = {}
+    except Exception as e:
+        return BatchReadResult(file=file, error=e)
+    else:
+        return BatchReadResult(file=file, unified_metadata=unified_metadata, technical_info=technical_info)
+
+
+def _read_unified_metadata_and_technical_info(
+    file: PublicFileType,
+    fields: frozenset[UnifiedMetadataKey] | None,
+    normalized_rating_max_value: int | None,
+) -> tuple[UnifiedMetadata, dict[str, Any]]:
+    """Read the unified metadata and the technical info of a file, parsing it once."""
+    with _AudioFile(file) as audio_file:
+        unified_metadata = _get_unified_metadata_of_file(audio_file, normalized_rating_max_value, None, None, fields)
+        return unified_metadata, audio_file.get_technical_info().to_dict()
+
+
+# File, metadata and validation error of a file to write in update_many
+type _BatchWriteJob = tuple[PublicFileType, Mapping[UnifiedMetadataKey, Any], Exception | None]
+
+
+def update_many(
+    files: Iterable[PublicFileType | tuple[PublicFileType, Mapping[UnifiedMetadataKey, Any]]],
+    unified_metadata: Mapping[UnifiedMetadataKey, Any] | None = None,
+    *,
+    workers: int | None = None,
+    max_concurrent_flac_writes: int | None = None,
+    normalized_rating_max_value: int | None = None,
+    id3v2_version: tuple[int, int, int] | None = None,
+    metadata_strategy: MetadataWritingStrategy | None = None,
+    metadata_format: MetadataFormat | None = None,
+    fail_on_unsupported_field: bool = False,
+    warn_on_unsupported_field: bool = True,
+    padding: PaddingFunction | None = None,
+) -> list[BatchWriteResult]:
+    """Update the metadata of many files in parallel.
+
+    Each file is written as with update_metadata, in a thread pool. Files are given either alone, in which case
+    unified_metadata is written to them, or as (file, metadata) pairs to write different metadata to each file, e.g. one
+    title per track of an album. Each distinct metadata dictionary is validated once rather than once per file.
+    Validation and write errors are captured in the result of the file they concern instead of being raised, so one
+    failing file does not stop the batch. A file given several times, under the same path or another one, is written
+    once per occurrence, one write after the other in the order of the files.
+
+    Writing ID3v2 tags to FLAC files runs external tools, so FLAC files are limited to max_concurrent_flac_writes at a
+    time independently of the number of workers.
+
+    Args:
+        files: Audio file paths (str or Path), or (file, metadata) pairs
+        unified_metadata: Metadata written to the files given without their own metadata
+        workers: Number of worker threads. Defaults to the default of ThreadPoolExecutor (based on the CPU count)
+        max_concurrent_flac_writes: Maximum number of FLAC files written at once. Defaults to the CPU count
+        normalized_rating_max_value: As in update_metadata
+        id3v2_version: As in update_metadata
+        metadata_strategy: As in update_metadata
+        metadata_format: As in update_metadata
+        fail_on_unsupported_field: As in update_metadata
+        warn_on_unsupported_field: As in update_metadata
+        padding: As in update_metadata
+
+    Returns:
+        One BatchWriteResult per file occurrence, in the order of the files
+
+    Raises:
+        ValueError: If a file is given without metadata while unified_metadata is None, or if workers or
+            max_concurrent_flac_writes is lower than 1
+        MetadataWritingConflictParametersError: If both metadata_strategy and metadata_format are specified
+
+    Examples:
+        # Retag a whole release
+        album_metadata = {UnifiedMetadataKey.ALBUM: "Album", UnifiedMetadataKey.RATING: 80}
+        results = update_many(Path("album").glob("*.flac"), album_metadata, normalized_rating_max_value=100)
+        failed = [result for result in results if not result.ok]
+
+        # Write one title per track
+        update_many([("01.mp3", {UnifiedMetadataKey.TITLE: "Intro"}), ("02.mp3", {UnifiedMetadataKey.TITLE: "Outro"})])
+    """
+    _validate_metadata_writing_parameters(metadata_strategy, metadata_format)
+
+    if max_concurrent_flac_writes is None:
+        max_concurrent_flac_writes = os.cpu_count() or 1
+    elif max_concurrent_flac_writes < 1:
+        msg = f"max_concurrent_flac_writes must be at least 1, got {max_concurrent_flac_writes}"
+        raise ValueError(msg)
+
+    # Validate each distinct metadata dictionary once. The dictionaries are kept alive so that their ids stay unique
+    validation_errors: dict[int, Exception | None] = {}
+    validated_metadata: list[Mapping[UnifiedMetadataKey, Any]] = []
+    # Jobs on the same file are written one after the other by one worker, as concurrent writes of a file would corrupt
+    # it. Each job keeps its index in the files to return the results in their order
+    jobs_by_file: dict[Path, list[tuple[int, _BatchWriteJob]]] = {}
+    job_count = 0
+    for item in files:
+        if isinstance(item, tuple):
+            file, file_metadata = item
+        elif unified_metadata is None:
+            msg = f"No metadata given for {item}: pass unified_metadata or (file, metadata) pairs"
+            raise ValueError(msg)
+        else:
+            file, file_metadata = item, unified_metadata
+
+        if id(file_metadata) not in validation_errors:
+            validated_metadata.append(file_metadata)
+            try:
+                _validate_metadata_for_writing(dict(file_metadata), normalized_rating_max_value)
+                validation_errors[id(file_metadata)] = None
+            except Exception as e:
+                validation_errors[id(file_metadata)] = e
+        job = (file, file_metadata, validation_errors[id(file_metadata)])
+        jobs_by_file.setdefault(Path(file).resolve(), []).append((job_count, job))
+        job_count += 1
+
+    write_file = functools.partial(
+        _write_file_for_batch,
+        flac_writes=threading.BoundedSemaphore(max_concurrent_flac_writes),
+        metadata_strategy=metadata_strategy or MetadataWritingStrategy.SYNC,
+        normalized_rating_max_value=normalized_rating_max_value,
+        id3v2_version=id3v2_version,
+        metadata_format=metadata_format,
+        fail_on_unsupported_field=fail_on_unsupported_field,
+        warn_on_unsupported_field=warn_on_unsupported_field and not fail_on_unsupported_field,
+        padding=padding,
+    )
+
+    def write_file_jobs(file_jobs: list[tuple[int, _BatchWriteJob]]) -> list[tuple[int, BatchWriteResult]]:
+        return [(index, write_file(job)) for index, job in file_jobs]
+
+    results: list[BatchWriteResult | None] = [None] * job_count
+    for file_results in run_batch(
+        write_file_jobs, jobs_by_file.values(), BatchExecutor.THREAD, workers, ordered=False, max_in_flight=None
+    ):
+        for index, result in file_results:
+            results[index] = result
+    return cast(list[BatchWriteResult], results)
+
+
+def _write_file_for_batch(
+    job: _BatchWriteJob,
+    flac_writes: threading.BoundedSemaphore,
+    metadata_strategy: MetadataWritingStrategy,
+    normalized_rating_max_value: int | None,
+    id3v2_version: tuple[int, int, int] | None,
+    metadata_format: MetadataFormat | None,
+    fail_on_unsupported_field: bool,
+    warn_on_unsupported_field: bool,
+    padding: PaddingFunction | None,
+) -> BatchWriteResult:
+    file, unified_metadata, validation_error = job
+    if validation_error is not None:
+        return BatchWriteResult(file=file, error=validation_error)
+
+    try:
+        audio_file = _AudioFile(file)
+        with flac_writes if audio_file.file_extension == ".flac" else contextlib.nullcontext():
+            # Managers normalize values in place, and the dictionary may be shared with other files
+            write_reports = _handle_metadata_strategy(
+                audio_file,
+                dict(unified_metadata),
+                metadata_strategy,
+                normalized_rating_max_value,
+                id3v2_version,
+                metadata_format,
+                fail_on_unsupported_field,
+                warn_on_unsupported_field,
+                padding,
+            )
+    except Exception as e:
+        return BatchWriteResult(file=file, error=e)
+    else:
+        return BatchWriteResult(file=file, write_reports=write_reports)
+    finally:
+        invalidate_cached_results(file)
+
+
+def verify_many(
+    files: Iterable[PublicFileType],
+    *,
+    workers: int | None = None,
+    executor: BatchExecutor = BatchExecutor.THREAD,
+    method: FlacMd5VerificationMethod = FlacMd5VerificationMethod.FLAC_CLI,
+    chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+    state_file: PublicFileType | None = None,
+    ordered: bool = False,
+    max_in_flight: int | None = None,
+) -> Iterator[BatchVerifyResult]:
+    """Check the MD5 signature of many FLAC files in parallel.
+
+    Each file is checked as with is_flac_md5_valid, in a worker pool, and results are yielded as they complete. Errors
+    are captured in the result of the file that caused them instead of being raised, so one unreadable file does not
+    stop the audit. Files are pulled lazily from the iterable, as in read_many.
+
+    With a state file, every successfully checked file is recorded as soon as its result is yielded, and files already
+    recorded are skipped without being yielded, as long as their size and modification time have not changed. Running
+    the same audit again with the same state file thus resumes it where it was interrupted.
+
+    Args:
+        files: FLAC file paths (str or Path), consumed lazily
+        workers: Number of workers. Defaults to the default of the executor kind (based on the CPU count)
+        executor: BatchExecutor.THREAD (default) or BatchExecutor.PROCESS, as in read_many. Threads suit
+            FlacMd5VerificationMethod.FLAC_CLI, whose work is done by flac processes, and processes suit
+            FlacMd5VerificationMethod.NATIVE, which decodes in Python
+        method: How the audio is checked, as in is_flac_md5_valid
+        chunk_size: Number of bytes read at a time when decoding in-process
+        state_file: Path of the JSON Lines file recording the checked files, created if it does not exist, or None to
+            check every file
+        ordered: Whether results are yielded in the order of the files rather than as they complete (default)
+        max_in_flight: Maximum number of files being checked ahead of the results being consumed. Defaults to 4 per
+            worker
+
+    Returns:
+        Iterator of BatchVerifyResult, one per file that is not skipped
+
+    Raises:
+        ValueError: If workers or max_in_flight is lower than 1, or if method is not a valid FlacMd5VerificationMethod
+        OSError: If the state file cannot be read or written
+
+    Examples:
+        # Audit an archive with 8 flac processes, resuming from the previous run if any
+        for result in verify_many(Path("archive").rglob("*.flac"), workers=8, state_file="audit-state.jsonl"):
+            if result.md5_state != FlacMd5State.VALID:
+                print(result.file, result.md5_state, result.error)
+    """
+    verify_file = functools.partial(
+        _verify_file_for_batch, method=FlacMd5VerificationMethod(method), chunk_size=chunk_size
+    )
+    if state_file is None:
+        return run_batch(verify_file, files, executor, workers, ordered, max_in_flight)
+
+    state = _VerifyState(state_file)
+    pending_files = (file for file in files if not state.is_done(file))
+    return _record_verify_results(
+        run_batch(verify_file, pending_files, executor, workers, ordered, max_in_flight), state
+    )
+
+
+def _record_verify_results(results: Iterator[BatchVerifyResult], state: _VerifyState) -> Iterator[BatchVerifyResult]:
+    try:
+        for result in results:
+            state.record(result)
+            yield result
+    finally:
+        state.close()
+
+
+def _verify_file_for_batch(
+    file: PublicFileType, method: FlacMd5VerificationMethod, chunk_size: int
+) -> BatchVerifyResult:
+    start = time.perf_counter()
+    try:
+        with _AudioFile(file) as audio_file:
+            file_size = audio_file.get_file_size()
+            try:
+                md5_state = audio_file.is_flac_file_md5_valid(method=method, chunk_size=chunk_size)
+            except FileCorruptedError:
+                md5_state = FlacMd5State.INVALID
+    except Exception as e:
+        return BatchVerifyResult(file=file, duration_sec=time.perf_counter() - start, error=e)
+    else:
+        return BatchVerifyResult(
+            file=file, md5_state=md5_state, file_size_bytes=file_size, duration_sec=time.perf_counter() - start
+        )
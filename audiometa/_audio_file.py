@@ -2,42 +2,91 @@
 
 import contextlib
 import json
+import os
 import subprocess
 import tempfile
 import types
 import warnings
+from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from mutagen.flac import FLAC, StreamInfo
-from mutagen.mp3 import MP3
 from mutagen.wave import WAVE
 
+from ._audio_file_context import FLAC_MARKER, HEAD_READ_SIZE, _AudioFileContext
 from .exceptions import (
     AudioFileMetadataParseError,
     DurationNotFoundError,
     FileByteMismatchError,
     FileCorruptedError,
     FileTypeNotSupportedError,
+    FlacFrameDecodeError,
     FlacMd5CheckFailedError,
     InvalidChunkDecodeError,
 )
-from .manager._rating_supporting.id3v2._id3v2_constants import ID3V2_HEADER_SIZE
-from .manager._rating_supporting.riff._riff_constants import RIFF_HEADER_SIZE
+from .manager._rating_supporting.riff._riff_constants import RIFF_FORM_IDS, RIFF_HEADER_SIZE
+from .manager._rating_supporting.riff._riff_stream_info import _WavStreamInfo
+from .manager._rating_supporting.vorbis._vorbis_constants import VORBIS_MIN_AUDIO_BLOCK_SIZE
+from .manager.id3v1._constants import ID3V1_TAG_SIZE
 from .utils.flac_md5_state import FlacMd5State
+from .utils.flac_md5_verification_method import FlacMd5VerificationMethod
+from .utils.flac_md5_verifier import DEFAULT_READ_CHUNK_SIZE, verify_flac_md5
 from .utils.metadata_format import MetadataFormat
+from .utils.mpeg_frame_header import MPEG_FRAME_HEADER_SIZE, parse_mpeg_frame_header
 from .utils.mutagen_exception_handler import handle_mutagen_exception
 from .utils.tool_path_resolver import get_tool_path
+from .utils.validation_level import ValidationLevel
+
+# Number of bytes after the ID3v2 tag searched for the first MPEG frame by the structural validation of MP3 files
+MPEG_SYNC_SEARCH_SIZE = HEAD_READ_SIZE
 
 # Type alias for files that can be handled (must be disk-based)
 type DiskBasedFile = str | Path | bytes | object
 
 
+@dataclass(frozen=True)
+class _TechnicalInfo:
+    """Technical information of an audio file, as returned in the technical_info of get_full_metadata."""
+
+    duration_in_sec: float
+    bitrate: int
+    sample_rate: int
+    channels: int
+    file_size: int
+    file_extension: str
+    audio_format_name: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "duration_seconds": self.duration_in_sec,
+            "bitrate_bps": self.bitrate,
+            "sample_rate_hz": self.sample_rate,
+            "channels": self.channels,
+            "file_size_bytes": self.file_size,
+            "file_extension": self.file_extension,
+            "audio_format_name": self.audio_format_name,
+        }
+
+
 class _AudioFile:
     file: DiskBasedFile
     file_path: str
 
-    def __init__(self, file: DiskBasedFile):
+    def __init__(
+        self,
+        file: DiskBasedFile,
+        wav_ffprobe_fallback: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.FULL,
+    ):
+        """Open an audio file and validate its content.
+
+        Args:
+            file: Audio file path or object exposing a path
+            wav_ffprobe_fallback: For WAV files, ask ffprobe for the technical info the native RIFF chunk parser could
+                not determine, instead of failing or reporting 0
+            validation_level: How thoroughly the content of the file is checked. See ValidationLevel
+        """
         if isinstance(file, str):
             self.file = file
             self.file_path = file
@@ -61,9 +110,16 @@ class _AudioFile:
             msg = f"Unsupported file type: {type(file)}"
             raise FileTypeNotSupportedError(msg)
 
-        if not Path(self.file_path).exists():
+        self.wav_ffprobe_fallback = wav_ffprobe_fallback
+        self._ffprobe_data: dict[str, Any] | None = None
+        self._flac_md5_state: FlacMd5State | None = None
+        self._technical_info: _TechnicalInfo | None = None
+        self._context: _AudioFileContext | None = None
+        try:
+            self._stat_result: os.stat_result | None = Path(self.file_path).stat()
+        except (FileNotFoundError, NotADirectoryError, ValueError):
             msg = f"File {self.file_path} does not exist"
-            raise FileNotFoundError(msg)
+            raise FileNotFoundError(msg) from None
 
         file_extension = Path(self.file_path).suffix.lower()
         self.file_extension = file_extension
@@ -75,24 +131,158 @@ class _AudioFile:
             raise FileTypeNotSupportedError(msg)
 
         # Validate that the file content is valid for the format
+        validation_level = ValidationLevel(validation_level)
+        if validation_level == ValidationLevel.NONE:
+            return
         try:
             if file_extension == ".mp3":
-                MP3(self.file_path)
+                self._validate_mp3_file(validation_level)
             elif file_extension == ".flac":
-                FLAC(self.file_path)
+                self._validate_flac_file(validation_level)
             elif file_extension == ".wav":
                 # Use custom WAV validation that handles ID3v2 tags
-                self._validate_wav_file(self.file_path)
+                self._validate_wav_file()
         except Exception as e:
+            self.invalidate_context()
             msg = f"The file content is corrupted or not a valid {file_extension.upper()} file: {e!s}"
             raise FileCorruptedError(msg) from e
 
+    def get_context(self) -> _AudioFileContext:
+        """Get the parse context of the file, creating it on first use.
+
+        The context is shared by all metadata managers and technical-info getters working on this file, so that the
+        file is opened, stat'ed and parsed only once.
+        """
+        if self._context is None:
+            self._context = _AudioFileContext(self.file_path, stat_result=self._stat_result)
+        return self._context
+
+    def invalidate_context(self) -> None:
+        """Drop the parse context so that the next read reflects changes written to the file."""
+        if self._context is not None:
+            self._context.release()
+            self._context = None
+        self._stat_result = None
+        self._ffprobe_data = None
+        self._flac_md5_state = None
+        self._technical_info = None
+
+    def _get_wav_stream_info(self) -> _WavStreamInfo | None:
+        """Get the natively parsed stream info of a WAV file.
+
+        Returns:
+            The stream info, or None if the chunks cannot be decoded and the ffprobe fallback is enabled
+
+        Raises:
+            InvalidChunkDecodeError: If the chunks cannot be decoded and the ffprobe fallback is disabled
+        """
+        try:
+            return self.get_context().get_wav_stream_info()
+        except InvalidChunkDecodeError:
+            if self.wav_ffprobe_fallback:
+                return None
+            raise
+
+    def needs_wav_ffprobe(self) -> bool:
+        """Whether reading the technical info of the file will run ffprobe.
+
+        This is the case for WAV files with the ffprobe fallback enabled whose RIFF chunks do not give all the values.
+        """
+        if self.file_extension != ".wav" or not self.wav_ffprobe_fallback or self._ffprobe_data is not None:
+            return False
+        try:
+            stream_info = self._get_wav_stream_info()
+        except Exception:
+            return False
+        return (
+            stream_info is None
+            or min(stream_info.duration_in_sec, stream_info.bitrate, stream_info.sample_rate, stream_info.channels) <= 0
+        )
+
+    def get_ffprobe_command(self) -> list[str]:
+        return [
+            get_tool_path("ffprobe"),
+            "-v",
+            "quiet",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            "-select_streams",
+            "a:0",  # Select first audio stream
+            self.file_path,
+        ]
+
+    def set_ffprobe_output(self, returncode: int, stdout: str) -> None:
+        """Parse and cache the output of the command given by get_ffprobe_command.
+
+        Raises:
+            FileCorruptedError: If ffprobe failed
+            AudioFileMetadataParseError: If the output is not valid JSON
+        """
+        if returncode != 0:
+            msg = "ffprobe could not parse the audio file."
+            raise FileCorruptedError(msg)
+
+        try:
+            self._ffprobe_data = json.loads(stdout)
+        except json.JSONDecodeError as e:
+            msg = "Failed to parse audio file metadata from ffprobe output"
+            raise AudioFileMetadataParseError(msg) from e
+
+    def _probe_wav_with_ffprobe(self) -> dict[str, Any]:
+        """Run ffprobe once on the file and cache its JSON report of the format and first audio stream."""
+        if self._ffprobe_data is None:
+            result = subprocess.run(self.get_ffprobe_command(), capture_output=True, text=True, check=False)
+            self.set_ffprobe_output(result.returncode, result.stdout)
+        return cast(dict[str, Any], self._ffprobe_data)
+
+    def _get_wav_ffprobe_stream(self) -> dict[str, Any]:
+        streams = self._probe_wav_with_ffprobe().get("streams")
+        if not streams:
+            msg = "No audio streams found"
+            raise AudioFileMetadataParseError(msg)
+        return cast(dict[str, Any], streams[0])
+
+    def _get_wav_duration_with_ffprobe(self) -> float:
+        data = self._probe_wav_with_ffprobe()
+        try:
+            # Try format duration first, then stream duration if available
+            duration = float(
+                data.get("format", {}).get("duration")
+                or next((s.get("duration") for s in data.get("streams", []) if s.get("duration")), 0)
+            )
+        except (TypeError, ValueError) as e:
+            msg = "Failed to parse audio file metadata from ffprobe output"
+            raise AudioFileMetadataParseError(msg) from e
+
+        if duration <= 0:
+            msg = "Could not determine audio duration"
+            raise DurationNotFoundError(msg)
+        return duration
+
+    def _get_wav_bitrate_with_ffprobe(self) -> int:
+        stream = self._get_wav_ffprobe_stream()
+        try:
+            # Get bitrate directly if available
+            if "bit_rate" in stream:
+                return int(stream["bit_rate"])
+
+            # Calculate from sample_rate * channels * bits_per_sample if no direct bitrate
+            sample_rate = int(stream.get("sample_rate", 0))
+            channels = int(stream.get("channels", 0))
+            bits_per_sample = int(stream.get("bits_per_raw_sample", 0) or stream.get("bits_per_sample", 0))
+        except (TypeError, ValueError) as e:
+            msg = "Failed to parse audio file metadata from ffprobe output"
+            raise AudioFileMetadataParseError(msg) from e
+        return sample_rate * channels * bits_per_sample
+
     def get_duration_in_sec(self) -> float:
         path = self.file_path
 
         if self.file_extension == ".mp3":
             try:
-                audio = MP3(path)
+                audio = self.get_context().get_mp3()
                 return float(audio.info.length)
             except Exception as exc:
                 # If MP3 fails, try other formats as fallback
@@ -108,55 +298,17 @@ class _AudioFile:
                         raise DurationNotFoundError(msg) from exc
 
         elif self.file_extension == ".wav":
-            try:
-                # Use ffprobe to get duration, more tolerant of file format issues
-                result = subprocess.run(
-                    [
-                        get_tool_path("ffprobe"),
-                        "-v",
-                        "quiet",
-                        "-print_format",
-                        "json",
-                        "-show_format",
-                        "-show_streams",
-                        path,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-
-                if result.returncode != 0:
-                    msg = "Failed to probe audio file"
-                    raise RuntimeError(msg)
-
-                data = json.loads(result.stdout)
-                # Try format duration first, then stream duration if available
-                duration = float(
-                    data.get("format", {}).get("duration")
-                    or next((s.get("duration") for s in data.get("streams", []) if s.get("duration")), 0)
-                )
-
-                if duration <= 0:
-                    msg = "Could not determine audio duration"
-                    raise DurationNotFoundError(msg) from None
-            except json.JSONDecodeError as e:
-                msg = "Failed to parse audio file metadata from ffprobe output"
-                raise AudioFileMetadataParseError(msg) from e
-            except DurationNotFoundError:
-                raise
-            except Exception as exc:
-                if str(exc) == "Failed to probe audio file":
-                    msg = "ffprobe could not parse the audio file."
-                    raise FileCorruptedError(msg) from exc
-                msg = f"Failed to read WAV file duration: {exc!s}"
-                raise RuntimeError(msg) from exc
-            else:
-                return duration
+            stream_info = self._get_wav_stream_info()
+            if stream_info is not None and stream_info.duration_in_sec > 0:
+                return stream_info.duration_in_sec
+            if self.wav_ffprobe_fallback:
+                return self._get_wav_duration_with_ffprobe()
+            msg = "Could not determine audio duration"
+            raise DurationNotFoundError(msg)
 
         elif self.file_extension == ".flac":
             try:
-                return float(FLAC(path).info.length)
+                return float(self.get_context().get_flac().info.length)
             except Exception as exc:
                 error_str = str(exc)
                 if "file said" in error_str and "bytes, read" in error_str:
@@ -171,75 +323,31 @@ class _AudioFile:
             raise FileTypeNotSupportedError(msg)
 
     def get_bitrate(self) -> int:
-        path = self.file_path
         if self.file_extension == ".mp3":
-            audio = MP3(path)
+            audio = self.get_context().get_mp3()
             # Get MP3 bitrate directly from audio stream
             if audio.info.bitrate:
                 return int(audio.info.bitrate)
             return 0
         if self.file_extension == ".wav":
-            try:
-                # Use ffprobe to get audio stream information
-                result = subprocess.run(
-                    [
-                        "ffprobe",
-                        "-v",
-                        "quiet",
-                        "-print_format",
-                        "json",
-                        "-show_streams",
-                        "-select_streams",
-                        "a:0",  # Select first audio stream
-                        path,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-
-                if result.returncode != 0:
-                    msg = "Failed to probe audio file"
-                    raise RuntimeError(msg) from None
-
-                data = json.loads(result.stdout)
-                if not data.get("streams"):
-                    msg = "No audio streams found"
-                    raise RuntimeError(msg) from None
-
-                stream = data["streams"][0]
-                # Get bitrate directly if available
-                if "bit_rate" in stream:
-                    return int(stream["bit_rate"])
-
-                # Calculate from sample_rate * channels * bits_per_sample if no direct bitrate
-                sample_rate = int(stream.get("sample_rate", 0))
-                channels = int(stream.get("channels", 0))
-                bits_per_sample = int(stream.get("bits_per_raw_sample", 0) or stream.get("bits_per_sample", 0))
-
-                if not all([sample_rate, channels, bits_per_sample]):
-                    msg = "Missing audio stream information"
-                    raise RuntimeError(msg) from None
-
-                return sample_rate * channels * bits_per_sample
-            except json.JSONDecodeError as e:
-                msg = "Failed to parse audio file metadata from ffprobe output"
-                raise AudioFileMetadataParseError(msg) from e
-            except Exception as exc:
-                msg = f"Failed to read WAV file bitrate: {exc!s}"
-                raise RuntimeError(msg) from exc
-        elif self.file_extension == ".flac":
-            audio_info = cast(StreamInfo, FLAC(path).info)
+            stream_info = self._get_wav_stream_info()
+            if stream_info is not None and stream_info.bitrate > 0:
+                return stream_info.bitrate
+            if self.wav_ffprobe_fallback:
+                return self._get_wav_bitrate_with_ffprobe()
+            return 0
+        if self.file_extension == ".flac":
+            audio_info = cast(StreamInfo, self.get_context().get_flac().info)
             return int(audio_info.bitrate)
-        else:
-            msg = f"Reading is not supported for file type: {self.file_extension}"
-            raise FileTypeNotSupportedError(msg)
+        msg = f"Reading is not supported for file type: {self.file_extension}"
+        raise FileTypeNotSupportedError(msg)
 
     def read(self, size: int = -1) -> bytes:
         with Path(self.file_path).open("rb") as f:
             return f.read(size)
 
     def write(self, data: bytes) -> int:
+        self.invalidate_context()
         with Path(self.file_path).open("wb") as f:
             return f.write(data)
 
@@ -248,6 +356,7 @@ class _AudioFile:
             return f.seek(offset, whence)
 
     def close(self) -> None:
+        self.invalidate_context()
         if hasattr(self.file, "close"):
             self.file.close()
 
@@ -267,18 +376,12 @@ class _AudioFile:
         return self.file_path
 
     def _is_md5_unset(self) -> bool:
-        """Check if FLAC file has unset MD5 checksum (all zeros)."""
+        """Check if FLAC file has unset MD5 checksum (all zeros).
+
+        Only the STREAMINFO block is read, right after the ID3v2 tag if there is one.
+        """
         try:
-            with Path(self.file_path).open("rb") as f:
-                data = f.read()
-                flac_marker_pos = data.find(b"fLaC")
-                if flac_marker_pos == -1:
-                    return False
-                md5_start = flac_marker_pos + 4 + 1 + 18
-                if md5_start + 16 > len(data):
-                    return False
-                md5_bytes = data[md5_start : md5_start + 16]
-                return md5_bytes == b"\x00" * 16
+            return self.get_context().get_flac_stream_info().is_md5_unset
         except Exception:
             return False
 
@@ -289,15 +392,60 @@ class _AudioFile:
         ID3v2 tags do not interfere with flac -t validation.
         """
         try:
-            with Path(self.file_path).open("rb") as f:
-                # Check for ID3v1 at the end (last 128 bytes)
-                f.seek(-128, 2)
-                id3v1_header = f.read(3)
-                return id3v1_header == b"TAG"
+            # Check for ID3v1 at the end (last 128 bytes)
+            tail = self.get_context().tail
+            return len(tail) == ID3V1_TAG_SIZE and tail.startswith(b"TAG")
         except Exception:
             return False
 
-    def is_flac_file_md5_valid(self) -> FlacMd5State:
+    def is_flac_file_md5_valid(
+        self,
+        method: FlacMd5VerificationMethod = FlacMd5VerificationMethod.FLAC_CLI,
+        chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+    ) -> FlacMd5State:
+        """Check the MD5 signature of a FLAC file against its audio data.
+
+        Args:
+            method: FLAC_CLI runs `flac -t`. NATIVE decodes in-process, which needs no external tool and spawns no
+                process, but is much slower than `flac -t` on long files
+            chunk_size: Number of bytes read at a time when decoding in-process
+
+        Returns:
+            The MD5 validation state
+
+        Raises:
+            FileNotFoundError: If method is FLAC_CLI and the flac tool is not installed
+        """
+        state = self.get_flac_md5_state_without_test()
+        if state is not None:
+            return state
+
+        if method == FlacMd5VerificationMethod.NATIVE:
+            return self.check_flac_md5_natively(chunk_size)
+
+        # Run flac -t to validate MD5
+        try:
+            result = subprocess.run(self.get_flac_test_command(), capture_output=True, check=False)
+        except FileNotFoundError as e:
+            # Decoding in-process instead would be orders of magnitude slower, so it is only done when asked for
+            msg = "The flac tool is not installed, use FlacMd5VerificationMethod.NATIVE to check the MD5 in-process"
+            raise FileNotFoundError(msg) from e
+
+        # Combine stdout and stderr as flac may output to either
+        return self.set_flac_test_output(result.returncode, result.stdout.decode() + result.stderr.decode())
+
+    def get_flac_md5_state_without_test(self) -> FlacMd5State | None:
+        """Get the MD5 state of a FLAC file when it is known without checking the audio data.
+
+        This is also the case once the audio data has been checked, as the result is cached until the file is written.
+
+        Returns:
+            FlacMd5State.UNSET if the MD5 signature is all zeros, the cached state if the audio data has already been
+            checked, None if the audio data has to be checked
+
+        Raises:
+            FileTypeNotSupportedError: If the file is not a FLAC file
+        """
         if self.file_extension != ".flac":
             msg = "The file is not a FLAC file"
             raise FileTypeNotSupportedError(msg)
@@ -305,40 +453,69 @@ class _AudioFile:
         # Check if MD5 is unset (all zeros)
         if self._is_md5_unset():
             return FlacMd5State.UNSET
+        return self._flac_md5_state
 
-        # Run flac -t to validate MD5
-        result = subprocess.run([get_tool_path("flac"), "-t", self.file_path], capture_output=True, check=False)
+    def get_flac_test_command(self) -> list[str]:
+        return [get_tool_path("flac"), "-t", self.file_path]
 
-        # Combine stdout and stderr as flac may output to either
-        stdout_output = result.stdout.decode()
-        stderr_output = result.stderr.decode()
-        combined_output = stdout_output + stderr_output
+    def set_flac_test_output(self, returncode: int, output: str) -> FlacMd5State:
+        """Interpret and cache the result of the command given by get_flac_test_command.
+
+        Args:
+            returncode: Exit code of flac
+            output: Combined standard output and error of flac
+
+        Raises:
+            FlacMd5CheckFailedError: If flac succeeded without reporting the file as ok
+        """
+        self._flac_md5_state = self._get_flac_md5_state_from_test(returncode, output)
+        return self._flac_md5_state
 
+    def _get_flac_md5_state_from_test(self, returncode: int, output: str) -> FlacMd5State:
         # Check for explicit success message
-        if result.returncode == 0 and "ok" in combined_output.lower():
+        if returncode == 0 and "ok" in output.lower():
             return FlacMd5State.VALID
 
         # Check for ID3v1-related errors when ID3v1 tags are present
         has_id3v1 = self._has_id3v1_tags()
-        if has_id3v1 and "FLAC__STREAM_DECODER_ERROR_STATUS_LOST_SYNC" in combined_output:
+        if has_id3v1 and "FLAC__STREAM_DECODER_ERROR_STATUS_LOST_SYNC" in output:
             return FlacMd5State.UNCHECKABLE_DUE_TO_ID3V1
 
         # Check for explicit MD5 mismatch (corruption)
-        if "MD5 signature mismatch" in combined_output:
+        if "MD5 signature mismatch" in output:
             return FlacMd5State.INVALID
 
         # If flac -t failed and we have ID3v1 tags, it's likely due to ID3v1 interference
-        if has_id3v1 and result.returncode != 0:
+        if has_id3v1 and returncode != 0:
             return FlacMd5State.UNCHECKABLE_DUE_TO_ID3V1
 
         # If return code is non-zero and no specific error message, assume invalid
-        if result.returncode != 0:
+        if returncode != 0:
             return FlacMd5State.INVALID
 
         # If return code was 0 but no "ok" found, something unexpected happened
         msg = "The Flac file md5 check failed"
         raise FlacMd5CheckFailedError(msg)
 
+    def check_flac_md5_natively(self, chunk_size: int = DEFAULT_READ_CHUNK_SIZE) -> FlacMd5State:
+        """Check and cache the MD5 signature of a FLAC file by decoding its audio data in-process."""
+        self._flac_md5_state = self._get_flac_md5_state_natively(chunk_size)
+        return self._flac_md5_state
+
+    def _get_flac_md5_state_natively(self, chunk_size: int) -> FlacMd5State:
+        # flac -t loses sync on a trailing ID3v1 tag; report the same state so that both methods agree
+        if self._has_id3v1_tags():
+            return FlacMd5State.UNCHECKABLE_DUE_TO_ID3V1
+
+        context = self.get_context()
+        last_block = context.get_flac_blocks()[-1]
+        audio_offset = last_block.data_offset + last_block.size
+        try:
+            is_valid = verify_flac_md5(self.file_path, audio_offset, context.get_flac().info, chunk_size)
+        except FlacFrameDecodeError:
+            return FlacMd5State.INVALID
+        return FlacMd5State.VALID if is_valid else FlacMd5State.INVALID
+
     def get_file_with_corrected_md5(self, delete_original: bool = False) -> str:
         """Get a new temporary file with corrected MD5 signature.
 
@@ -446,7 +623,7 @@ class _AudioFile:
         """
         if self.file_extension == ".mp3":
             try:
-                audio = MP3(self.file_path)
+                audio = self.get_context().get_mp3()
                 if audio.info.sample_rate is not None:
                     return int(float(audio.info.sample_rate))
             except Exception:
@@ -454,37 +631,17 @@ class _AudioFile:
             return 0
         if self.file_extension == ".wav":
             try:
-                result = subprocess.run(
-                    [
-                        "ffprobe",
-                        "-v",
-                        "quiet",
-                        "-print_format",
-                        "json",
-                        "-show_streams",
-                        "-select_streams",
-                        "a:0",
-                        self.file_path,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-
-                if result.returncode != 0:
-                    return 0
-
-                data = json.loads(result.stdout)
-                if not data.get("streams"):
-                    return 0
-
-                stream = data["streams"][0]
-                return int(stream.get("sample_rate", 0))
+                stream_info = self._get_wav_stream_info()
+                if stream_info is not None and stream_info.sample_rate > 0:
+                    return stream_info.sample_rate
+                if self.wav_ffprobe_fallback:
+                    return int(self._get_wav_ffprobe_stream().get("sample_rate", 0))
             except Exception:
-                return 0
-        elif self.file_extension == ".flac":
+                pass
+            return 0
+        if self.file_extension == ".flac":
             try:
-                audio_info = cast(StreamInfo, FLAC(self.file_path).info)
+                audio_info = cast(StreamInfo, self.get_context().get_flac().info)
                 return int(float(audio_info.sample_rate))
             except Exception:
                 return 0
@@ -504,7 +661,7 @@ class _AudioFile:
         """
         if self.file_extension == ".mp3":
             try:
-                audio = MP3(self.file_path)
+                audio = self.get_context().get_mp3()
                 if audio.info.channels is not None:
                     return int(float(audio.info.channels))
             except Exception:
@@ -512,37 +669,17 @@ class _AudioFile:
             return 0
         if self.file_extension == ".wav":
             try:
-                result = subprocess.run(
-                    [
-                        "ffprobe",
-                        "-v",
-                        "quiet",
-                        "-print_format",
-                        "json",
-                        "-show_streams",
-                        "-select_streams",
-                        "a:0",
-                        self.file_path,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-
-                if result.returncode != 0:
-                    return 0
-
-                data = json.loads(result.stdout)
-                if not data.get("streams"):
-                    return 0
-
-                stream = data["streams"][0]
-                return int(stream.get("channels", 0))
+                stream_info = self._get_wav_stream_info()
+                if stream_info is not None and stream_info.channels > 0:
+                    return stream_info.channels
+                if self.wav_ffprobe_fallback:
+                    return int(self._get_wav_ffprobe_stream().get("channels", 0))
             except Exception:
-                return 0
-        elif self.file_extension == ".flac":
+                pass
+            return 0
+        if self.file_extension == ".flac":
             try:
-                audio_info = cast(StreamInfo, FLAC(self.file_path).info)
+                audio_info = cast(StreamInfo, self.get_context().get_flac().info)
                 return int(float(audio_info.channels))
             except Exception:
                 return 0
@@ -550,6 +687,24 @@ class _AudioFile:
             msg = f"Reading is not supported for file type: {self.file_extension}"
             raise FileTypeNotSupportedError(msg)
 
+    def get_technical_info(self) -> _TechnicalInfo:
+        """Get the technical information of the file, computed on first access and kept until the file is written.
+
+        Raises:
+            DurationNotFoundError: If the duration cannot be determined
+        """
+        if self._technical_info is None:
+            self._technical_info = _TechnicalInfo(
+                duration_in_sec=self.get_duration_in_sec(),
+                bitrate=self.get_bitrate(),
+                sample_rate=self.get_sample_rate(),
+                channels=self.get_channels(),
+                file_size=self.get_file_size(),
+                file_extension=self.file_extension,
+                audio_format_name=self.get_audio_format_name(),
+            )
+        return self._technical_info
+
     def get_file_size(self) -> int:
         """Get the file size in bytes.
 
@@ -557,7 +712,7 @@ class _AudioFile:
             File size in bytes
         """
         try:
-            return Path(self.file_path).stat().st_size
+            return self.get_context().size
         except OSError:
             return 0
 
@@ -570,73 +725,104 @@ class _AudioFile:
         audio_format_names = {".mp3": "MP3", ".flac": "FLAC", ".wav": "WAV"}
         return audio_format_names.get(self.file_extension, "Unknown")
 
-    def _skip_id3v2_tags(self, data: bytes) -> bytes:
-        """Skip ID3v2 tags if present at the start of the file.
+    def _validate_mp3_file(self, validation_level: ValidationLevel) -> None:
+        """Validate MP3 file structure.
 
-        Returns the data starting from after any ID3v2 tags.
+        The full level parses the file with mutagen, which scans the MPEG stream and its VBR headers. The cheaper levels
+        only look at the start of the file.
         """
-        if data.startswith(b"ID3"):
-            # ID3v2 header is 10 bytes:
-            # 3 bytes: ID3
-            # 2 bytes: version
-            # 1 byte: flags
-            # 4 bytes: size (synchsafe integer)
-            if len(data) < ID3V2_HEADER_SIZE:
-                return data
-
-            # Get size from synchsafe integer (7 bits per byte)
-            size_bytes = data[6:ID3V2_HEADER_SIZE]
-            size = (
-                ((size_bytes[0] & 0x7F) << 21)
-                | ((size_bytes[1] & 0x7F) << 14)
-                | ((size_bytes[2] & 0x7F) << 7)
-                | (size_bytes[3] & 0x7F)
-            )
+        context = self.get_context()
+        if validation_level == ValidationLevel.FULL:
+            context.get_mp3()
+            return
 
-            # Skip the header (10 bytes) plus the size of the tag
-            return data[ID3V2_HEADER_SIZE + size :]
-        return data
+        head = context.head
+        if not head.startswith(b"ID3") and parse_mpeg_frame_header(head[:MPEG_FRAME_HEADER_SIZE]) is None:
+            msg = "No ID3v2 tag or MPEG frame header at the start of the file"
+            raise FileCorruptedError(msg)
+        if validation_level == ValidationLevel.STRUCTURAL:
+            self._validate_mpeg_frames()
 
-    def _validate_wav_file(self, file_path: str) -> None:
-        """Validate WAV file structure, handling ID3v2 tags at the beginning.
+    def _validate_mpeg_frames(self) -> None:
+        """Check that the audio data starts with two consecutive MPEG frames of the same stream.
 
-        This method performs lightweight validation of the RIFF/WAV structure without relying on mutagen for files that
-        have ID3v2 tags.
+        The first frame is searched for in the first MPEG_SYNC_SEARCH_SIZE bytes after the ID3v2 tag. A frame ending at
+        the end of the file or right before an ID3v1 tag needs no successor.
         """
-        with Path(file_path).open("rb") as f:
-            # Read enough data to cover potential ID3v2 tags (up to ~1MB for very large tags)
-            header_data = f.read(RIFF_HEADER_SIZE)
-
-            # Skip ID3v2 tags if present
-            if header_data.startswith(b"ID3"):
-                # Read the full file to properly handle ID3v2 tags
-                f.seek(0)
-                full_data = f.read()
-
-                # Skip the ID3v2 tag
-                clean_data = self._skip_id3v2_tags(full_data)
+        context = self.get_context()
+        audio_start = context.id3v2_size
+        window = context.read_header_bytes(audio_start, MPEG_SYNC_SEARCH_SIZE)
+        position = window.find(b"\xff")
+        while position != -1:
+            frame_header = parse_mpeg_frame_header(window[position : position + MPEG_FRAME_HEADER_SIZE])
+            if frame_header is not None:
+                next_offset = audio_start + position + frame_header.frame_length
+                next_bytes = context.read_header_bytes(next_offset, MPEG_FRAME_HEADER_SIZE)
+                if len(next_bytes) < MPEG_FRAME_HEADER_SIZE or next_bytes.startswith(b"TAG"):
+                    return
+                next_frame_header = parse_mpeg_frame_header(next_bytes)
+                if next_frame_header is not None and frame_header.is_same_stream(next_frame_header):
+                    return
+            position = window.find(b"\xff", position + 1)
+        msg = "No MPEG audio frames found after the ID3v2 tag"
+        raise FileCorruptedError(msg)
+
+    def _validate_flac_file(self, validation_level: ValidationLevel) -> None:
+        """Validate FLAC file structure.
+
+        The full level parses the metadata blocks with mutagen. The cheaper levels read the fLaC marker and the
+        STREAMINFO block that must follow it, after the ID3v2 tag if there is one, from the head buffer.
+        """
+        context = self.get_context()
+        if validation_level == ValidationLevel.FULL:
+            context.get_flac()
+            return
 
-                # Check if we have enough data for RIFF header after skipping ID3v2
-                if len(clean_data) < RIFF_HEADER_SIZE:
-                    msg = "File too small after skipping ID3v2 tags"
-                    raise FileCorruptedError(msg)
+        if context.read_header_bytes(context.id3v2_size, len(FLAC_MARKER)) != FLAC_MARKER:
+            msg = "Not a valid FLAC file"
+            raise FileCorruptedError(msg)
+        if validation_level != ValidationLevel.STRUCTURAL:
+            return
 
-                riff_header = clean_data[:RIFF_HEADER_SIZE]
-            else:
-                riff_header = header_data
+        try:
+            stream_info = context.get_flac_stream_info()
+        except ValueError as e:
+            raise FileCorruptedError(str(e)) from e
+        if (
+            stream_info.min_block_size < VORBIS_MIN_AUDIO_BLOCK_SIZE
+            or stream_info.max_block_size < stream_info.min_block_size
+            or stream_info.sample_rate == 0
+        ):
+            msg = "Invalid STREAMINFO block"
+            raise FileCorruptedError(msg)
+
+    def _validate_wav_file(self) -> None:
+        """Validate WAV file structure, handling ID3v2 tags at the beginning.
 
-            # Validate RIFF header
+        This method performs lightweight validation of the RIFF/WAV structure without relying on mutagen for files that
+        have ID3v2 tags. Only the RIFF header is read, right after the ID3v2 tag if there is one. It is the same at all
+        validation levels: files whose fmt chunk cannot be decoded are still accepted, as ffprobe may read them.
+        """
+        context = self.get_context()
+        id3v2_size = context.id3v2_size
+        if id3v2_size:
+            riff_header = context.read_at(id3v2_size, RIFF_HEADER_SIZE)
+            # Check if we have enough data for RIFF header after skipping ID3v2
             if len(riff_header) < RIFF_HEADER_SIZE:
-                msg = "File too small to contain RIFF header"
+                msg = "File too small after skipping ID3v2 tags"
                 raise FileCorruptedError(msg)
+        else:
+            riff_header = context.head[:RIFF_HEADER_SIZE]
 
-            if not riff_header.startswith(b"RIFF"):
-                msg = "Invalid RIFF header"
-                raise FileCorruptedError(msg)
+        # Validate RIFF header
+        if len(riff_header) < RIFF_HEADER_SIZE:
+            msg = "File too small to contain RIFF header"
+            raise FileCorruptedError(msg)
 
-            if riff_header[8:12] != b"WAVE":
-                msg = "Not a WAVE file"
-                raise FileCorruptedError(msg)
+        if riff_header[:4] not in RIFF_FORM_IDS:
+            msg = "Invalid RIFF header"
+            raise FileCorruptedError(msg)
 
-            # Basic structure validation passed
-            return
+        if riff_header[8:12] != b"WAVE":
+            msg = "Not a WAVE file"
+            raise FileCorruptedError(msg)
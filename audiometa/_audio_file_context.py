@@ -0,0 +1,339 @@
+"""Per-file parse context shared by everything that reads one audio file."""
+
+import mmap
+import os
+import struct
+import weakref
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from mutagen.flac import FLAC
+from mutagen.mp3 import MP3
+
+from .manager._rating_supporting.id3v2._id3v2_constants import ID3V2_HEADER_SIZE
+from .manager._rating_supporting.riff._riff_constants import (
+    RF64_DS64_MIN_SIZE,
+    RF64_SIZE_PLACEHOLDER,
+    RIFF_CHUNK_HEADER_SIZE,
+    RIFF_FORM_IDS,
+    RIFF_HEADER_SIZE,
+)
+from .manager._rating_supporting.riff._riff_stream_info import _WavStreamInfo
+from .manager._rating_supporting.vorbis._flac_stream_info import FLAC_MARKER, _FlacStreamInfo
+from .manager._rating_supporting.vorbis._vorbis_constants import VORBIS_BLOCK_HEADER_SIZE
+from .manager.id3v1._constants import ID3V1_TAG_SIZE
+
+# Number of bytes read from the start of the file on first access. Large enough for the ID3v2 header, the RIFF header
+# or the FLAC marker plus STREAMINFO block, small enough to stay within a single filesystem read.
+HEAD_READ_SIZE = 4096
+
+ID3V2_FOOTER_FLAG = 0x10
+
+
+@dataclass(frozen=True)
+class _FlacMetadataBlock:
+    """Location of one FLAC metadata block in the file."""
+
+    block_type: int
+    offset: int  # Offset of the 4-byte block header
+    size: int  # Size of the block data, excluding the header
+    is_last: bool
+
+    @property
+    def data_offset(self) -> int:
+        return self.offset + VORBIS_BLOCK_HEADER_SIZE
+
+
+@dataclass(frozen=True)
+class _RiffChunk:
+    """Location of one chunk of a RIFF/WAVE file."""
+
+    chunk_id: bytes
+    offset: int  # Offset of the 8-byte chunk header
+    size: int  # Size of the chunk data, excluding the header and the pad byte. Taken from ds64 for RF64 data chunks
+
+    @property
+    def data_offset(self) -> int:
+        return self.offset + RIFF_CHUNK_HEADER_SIZE
+
+    @property
+    def padded_size(self) -> int:
+        """Size of the chunk data including the pad byte that follows odd-sized chunks."""
+        return self.size + (self.size & 1)
+
+
+class _MappedFile:
+    """Read-only memory map of a file, sliced without copying its content.
+
+    Only the pages touched by a read are loaded from disk, so probing a few headers costs a few page faults whatever the
+    size of the file. Files that cannot be mapped, such as empty files or files on some virtual file systems, are read
+    with plain reads from the file object instead.
+    """
+
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+        self._mmap: mmap.mmap | None = None
+        # Empty files raise ValueError, file objects without a descriptor and unsupported file systems raise OSError
+        with suppress(OSError, ValueError):
+            self._mmap = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, offset: int, size: int) -> bytes:
+        """Copy `size` bytes at `offset`, fewer if the file ends before."""
+        if self._mmap is None:
+            self._fileobj.seek(offset)
+            return self._fileobj.read(size)
+        return self._mmap[offset : offset + size]
+
+    def view(self, offset: int, size: int) -> memoryview:
+        """Get `size` bytes at `offset` (fewer if the file ends before) without copying them.
+
+        The view must be released, for instance by using it in a `with` block, for the map to be closed on release.
+        """
+        if self._mmap is None:
+            return memoryview(self.read(offset, size))
+        return memoryview(self._mmap)[offset : offset + size]
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        """Get the offset of the first occurrence of `sub` at or after `start`, or -1 if there is none.
+
+        The file is scanned page by page and the scan stops at the first match.
+        """
+        if self._mmap is None:
+            self._fileobj.seek(start)
+            index = self._fileobj.read().find(sub)
+            return index if index == -1 else start + index
+        return self._mmap.find(sub, start)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            # A view that is still alive keeps the map open until it is garbage collected
+            with suppress(BufferError):
+                self._mmap.close()
+            self._mmap = None
+
+
+class _AudioFileContext:
+    """Lazily parsed state of one audio file, shared by its metadata managers and technical-info getters.
+
+    The file is opened, stat'ed and memory-mapped at most once per context. Header bytes, tail bytes, the FLAC block
+    layout and the mutagen objects are each computed on first access and then reused. The context must be released
+    before the file is written and dropped after, which is what _AudioFile.invalidate_context() does.
+    """
+
+    def __init__(self, file_path: str, stat_result: os.stat_result | None = None):
+        self.file_path = file_path
+        self._stat_result = stat_result
+        self._fileobj: BinaryIO | None = None
+        self._finalizer: weakref.finalize | None = None
+        self._mapped_file: _MappedFile | None = None
+        self._head: bytes | None = None
+        self._tail: bytes | None = None
+        self._flac_blocks: list[_FlacMetadataBlock] | None = None
+        self._riff_chunks: list[_RiffChunk] | None = None
+        self._wav_stream_info: _WavStreamInfo | None = None
+        self._flac_stream_info: _FlacStreamInfo | None = None
+        self._mp3: MP3 | None = None
+        self._flac: FLAC | None = None
+
+    @property
+    def stat(self) -> os.stat_result:
+        if self._stat_result is None:
+            self._stat_result = Path(self.file_path).stat()
+        return self._stat_result
+
+    @property
+    def size(self) -> int:
+        return self.stat.st_size
+
+    @property
+    def fileobj(self) -> BinaryIO:
+        """Read-only handle on the file, opened on first access and closed when the context is released."""
+        if self._fileobj is None:
+            fileobj = Path(self.file_path).open("rb")  # noqa: SIM115
+            self._fileobj = fileobj
+            # Close the handle when the context is garbage collected without an explicit release
+            self._finalizer = weakref.finalize(self, fileobj.close)
+        return self._fileobj
+
+    @property
+    def mapped_file(self) -> _MappedFile:
+        """Read-only memory map of the file, created on first access and closed when the context is released."""
+        if self._mapped_file is None:
+            self._mapped_file = _MappedFile(self.fileobj)
+        return self._mapped_file
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        return self.mapped_file.read(offset, size)
+
+    def view_at(self, offset: int, size: int) -> memoryview:
+        """Get a view of bytes of the file without copying them. See _MappedFile.view()."""
+        return self.mapped_file.view(offset, size)
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        return self.mapped_file.find(sub, start)
+
+    def read_header_bytes(self, offset: int, size: int) -> bytes:
+        """Read bytes that are usually near the start of the file, served from the head buffer when possible."""
+        if offset + size <= len(self.head):
+            return self.head[offset : offset + size]
+        return self.read_at(offset, size)
+
+    @property
+    def head(self) -> bytes:
+        """First HEAD_READ_SIZE bytes of the file (fewer for smaller files)."""
+        if self._head is None:
+            self._head = self.read_at(0, HEAD_READ_SIZE)
+        return self._head
+
+    @property
+    def tail(self) -> bytes:
+        """Last ID3V1_TAG_SIZE bytes of the file (the whole file if it is smaller)."""
+        if self._tail is None:
+            tail_size = min(self.size, ID3V1_TAG_SIZE)
+            self._tail = self.read_at(self.size - tail_size, tail_size)
+        return self._tail
+
+    @property
+    def id3v2_size(self) -> int:
+        """Total size of the ID3v2 tag at the start of the file (header, body and footer), or 0 if there is none."""
+        head = self.head
+        if not head.startswith(b"ID3") or len(head) < ID3V2_HEADER_SIZE:
+            return 0
+        size_bytes = head[6:ID3V2_HEADER_SIZE]
+        tag_size = (
+            ((size_bytes[0] & 0x7F) << 21)
+            | ((size_bytes[1] & 0x7F) << 14)
+            | ((size_bytes[2] & 0x7F) << 7)
+            | (size_bytes[3] & 0x7F)
+        )
+        footer_size = ID3V2_HEADER_SIZE if head[5] & ID3V2_FOOTER_FLAG else 0
+        return ID3V2_HEADER_SIZE + tag_size + footer_size
+
+    def get_flac_blocks(self) -> list[_FlacMetadataBlock]:
+        """Get the FLAC metadata block layout by walking the block headers.
+
+        Raises:
+            ValueError: If the FLAC marker is not found after the optional ID3v2 tag
+        """
+        if self._flac_blocks is None:
+            offset = self.id3v2_size
+            if self.read_at(offset, len(FLAC_MARKER)) != FLAC_MARKER:
+                msg = "Not a valid FLAC file"
+                raise ValueError(msg)
+            offset += len(FLAC_MARKER)
+
+            blocks: list[_FlacMetadataBlock] = []
+            is_last = False
+            while not is_last:
+                block_header = self.read_at(offset, VORBIS_BLOCK_HEADER_SIZE)
+                if len(block_header) < VORBIS_BLOCK_HEADER_SIZE:
+                    break
+                is_last = bool(block_header[0] & 0x80)
+                block_size = struct.unpack(">I", b"\x00" + block_header[1:])[0]
+                blocks.append(
+                    _FlacMetadataBlock(
+                        block_type=block_header[0] & 0x7F, offset=offset, size=block_size, is_last=is_last
+                    )
+                )
+                offset += VORBIS_BLOCK_HEADER_SIZE + block_size
+            self._flac_blocks = blocks
+        return self._flac_blocks
+
+    def get_riff_chunks(self) -> list[_RiffChunk]:
+        """Get the chunk layout of a RIFF/WAVE file by walking the chunk headers.
+
+        Only the 8-byte chunk headers are read, so the cost does not depend on the size of the audio data. RF64 and
+        BW64 files are supported: the 64-bit data size found in the ds64 chunk replaces the placeholder size of the data
+        chunk.
+
+        Raises:
+            ValueError: If no RIFF/WAVE header is found after the optional ID3v2 tag
+        """
+        if self._riff_chunks is None:
+            start = self.id3v2_size
+            riff_header = self.read_header_bytes(start, RIFF_HEADER_SIZE)
+            if len(riff_header) < RIFF_HEADER_SIZE or riff_header[:4] not in RIFF_FORM_IDS:
+                msg = "Invalid RIFF header"
+                raise ValueError(msg)
+            if riff_header[8:12] != b"WAVE":
+                msg = "Not a WAVE file"
+                raise ValueError(msg)
+
+            # Stop at the end of the RIFF form so that trailing data such as an ID3v1 tag is not taken for a chunk.
+            # Writers streaming to a pipe leave the size at 0 or at the placeholder, in which case the file size rules.
+            riff_size = struct.unpack("<I", riff_header[4:8])[0]
+            end = self.size
+            if RIFF_CHUNK_HEADER_SIZE <= riff_size < RF64_SIZE_PLACEHOLDER:
+                end = min(end, start + RIFF_CHUNK_HEADER_SIZE + riff_size)
+
+            chunks: list[_RiffChunk] = []
+            ds64_data_size: int | None = None
+            offset = start + RIFF_HEADER_SIZE
+            while offset + RIFF_CHUNK_HEADER_SIZE <= end:
+                chunk_header = self.read_header_bytes(offset, RIFF_CHUNK_HEADER_SIZE)
+                chunk_id = chunk_header[:4]
+                chunk_size = struct.unpack("<I", chunk_header[4:8])[0]
+                if chunk_id == b"ds64" and chunk_size >= RF64_DS64_MIN_SIZE:
+                    ds64 = self.read_header_bytes(offset + RIFF_CHUNK_HEADER_SIZE, RF64_DS64_MIN_SIZE)
+                    if len(ds64) == RF64_DS64_MIN_SIZE:
+                        ds64_data_size = struct.unpack("<Q", ds64[8:16])[0]
+                elif chunk_id == b"data" and chunk_size == RF64_SIZE_PLACEHOLDER and ds64_data_size is not None:
+                    chunk_size = ds64_data_size
+                chunk = _RiffChunk(chunk_id=chunk_id, offset=offset, size=chunk_size)
+                chunks.append(chunk)
+                offset = chunk.data_offset + chunk.padded_size
+            self._riff_chunks = chunks
+        return self._riff_chunks
+
+    def get_wav_stream_info(self) -> _WavStreamInfo:
+        """Get the audio stream properties of a WAV file, parsed from its fmt, fact and data chunks.
+
+        Raises:
+            InvalidChunkDecodeError: If the chunk layout or the fmt chunk cannot be decoded
+        """
+        if self._wav_stream_info is None:
+            self._wav_stream_info = _WavStreamInfo.from_context(self)
+        return self._wav_stream_info
+
+    def get_flac_stream_info(self) -> _FlacStreamInfo:
+        """Get the audio stream properties of a FLAC file, parsed from its STREAMINFO block.
+
+        Raises:
+            ValueError: If the fLaC marker is missing or is not followed by a STREAMINFO block
+        """
+        if self._flac_stream_info is None:
+            self._flac_stream_info = _FlacStreamInfo.from_context(self)
+        return self._flac_stream_info
+
+    def get_rewound_fileobj(self) -> BinaryIO:
+        """Get the shared handle positioned at the start of the file, ready to be handed to a mutagen loader.
+
+        mutagen reads from the current position of file objects rather than from the start.
+        """
+        fileobj = self.fileobj
+        fileobj.seek(0)
+        return fileobj
+
+    def get_mp3(self) -> MP3:
+        if self._mp3 is None:
+            # Only the stream info and the size of the ID3v2 tag are used: frames are read by the ID3v2 manager, so none
+            # of them is decoded here
+            self._mp3 = MP3(self.get_rewound_fileobj(), known_frames={})
+        return self._mp3
+
+    def get_flac(self) -> FLAC:
+        if self._flac is None:
+            self._flac = FLAC(self.get_rewound_fileobj())
+        return self._flac
+
+    def release(self) -> None:
+        """Close the memory map and the file handle held by the context."""
+        if self._mapped_file is not None:
+            self._mapped_file.close()
+            self._mapped_file = None
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._fileobj = None
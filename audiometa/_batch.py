@@ -0,0 +1,108 @@
+"""Bounded parallel execution shared by the batch functions of the public API."""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
+
+from .utils.batch_executor import BatchExecutor
+
+# Number of tasks submitted ahead of the results being consumed, per worker, when max_in_flight is not given
+IN_FLIGHT_TASKS_PER_WORKER = 4
+
+
+def _get_worker_count(executor: BatchExecutor, workers: int | None) -> int:
+    """Get the number of workers of the pool, defaulting to the defaults of the concurrent.futures executors."""
+    if workers is not None:
+        if workers < 1:
+            msg = f"workers must be at least 1, got {workers}"
+            raise ValueError(msg)
+        return workers
+    cpu_count = os.cpu_count() or 1
+    if executor == BatchExecutor.PROCESS:
+        return cpu_count
+    return min(32, cpu_count + 4)
+
+
+def _create_executor(executor: BatchExecutor, workers: int) -> Executor:
+    if executor == BatchExecutor.PROCESS:
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="audiometa")
+
+
+def _iter_in_order[T, R](
+    pool: Executor, function: Callable[[T], R], items: Iterator[T], max_in_flight: int
+) -> Iterator[R]:
+    futures: deque[Future[R]] = deque(pool.submit(function, item) for item in islice(items, max_in_flight))
+    while futures:
+        result = futures.popleft().result()
+        for item in islice(items, 1):
+            futures.append(pool.submit(function, item))
+        yield result
+
+
+def _iter_as_completed[T, R](
+    pool: Executor, function: Callable[[T], R], items: Iterator[T], max_in_flight: int
+) -> Iterator[R]:
+    pending: set[Future[R]] = {pool.submit(function, item) for item in islice(items, max_in_flight)}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        pending.update(pool.submit(function, item) for item in islice(items, len(done)))
+        for future in done:
+            yield future.result()
+
+
+def run_batch[T, R](
+    function: Callable[[T], R],
+    items: Iterable[T],
+    executor: BatchExecutor,
+    workers: int | None,
+    ordered: bool,
+    max_in_flight: int | None,
+) -> Iterator[R]:
+    """Apply a function to each item in a worker pool and yield the results.
+
+    At most max_in_flight items are submitted ahead of the results being consumed, so items are pulled lazily from the
+    iterable and memory use does not grow with the number of items. Leaving the iteration early cancels the items that
+    have not started yet. The function must capture its own errors: an exception it raises ends the iteration. For
+    process pools, the function and the items must be picklable.
+
+    Args:
+        function: Function applied to each item
+        items: Items to process, consumed lazily
+        executor: Kind of worker pool
+        workers: Number of workers, or None for the default of the executor kind
+        ordered: Whether results are yielded in the order of the items rather than as they complete
+        max_in_flight: Maximum number of submitted items whose result has not been yielded yet, or None for
+            IN_FLIGHT_TASKS_PER_WORKER per worker
+
+    Raises:
+        ValueError: If workers or max_in_flight is lower than 1
+    """
+    executor = BatchExecutor(executor)
+    worker_count = _get_worker_count(executor, workers)
+    if max_in_flight is None:
+        max_in_flight = worker_count * IN_FLIGHT_TASKS_PER_WORKER
+    elif max_in_flight < 1:
+        msg = f"max_in_flight must be at least 1, got {max_in_flight}"
+        raise ValueError(msg)
+    return _run_batch(function, iter(items), executor, worker_count, ordered, max_in_flight)
+
+
+def _run_batch[T, R](
+    function: Callable[[T], R],
+    items: Iterator[T],
+    executor: BatchExecutor,
+    workers: int,
+    ordered: bool,
+    max_in_flight: int,
+) -> Iterator[R]:
+    pool = _create_executor(executor, workers)
+    try:
+        if ordered:
+            yield from _iter_in_order(pool, function, items, max_in_flight)
+        else:
+            yield from _iter_as_completed(pool, function, items, max_in_flight)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,75 @@
+"""State file of verify_many, recording the files already checked so that an interrupted audit can resume."""
+
+import json
+from pathlib import Path
+from typing import TextIO
+
+from .utils.batch_result import BatchVerifyResult
+
+
+class _VerifyState:
+    """Append-only JSON Lines file of the files whose MD5 signature has been checked.
+
+    Each line holds the absolute path, size and modification time of a checked file, and its MD5 state. A file is only
+    considered done while it keeps the same size and modification time, so files rewritten since their check are
+    checked again. Lines are flushed one by one: a crash loses at most the line being written, and a truncated last line
+    is ignored on load.
+    """
+
+    def __init__(self, file_path: str | Path):
+        self.file_path = Path(file_path).expanduser()
+        self._done: set[tuple[str, int, int]] = set()
+        # Whether the last line was cut by a crash, in which case the next line must not be appended to it
+        self._is_last_line_truncated = False
+        if self.file_path.exists():
+            with self.file_path.open(encoding="utf-8") as f:
+                for line in f:
+                    self._is_last_line_truncated = not line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                        self._done.add((entry["path"], entry["size"], entry["mtime_ns"]))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        self._file: TextIO | None = None
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    @staticmethod
+    def _get_identity(file: str | Path) -> tuple[str, int, int]:
+        stat_result = Path(file).stat()
+        return str(Path(file).absolute()), stat_result.st_size, stat_result.st_mtime_ns
+
+    def is_done(self, file: str | Path) -> bool:
+        """Check whether the file was checked and has not changed since. Missing files are not done."""
+        try:
+            return self._get_identity(file) in self._done
+        except OSError:
+            return False
+
+    def record(self, result: BatchVerifyResult) -> None:
+        """Record a successfully checked file.
+
+        Raises:
+            OSError: If the state file cannot be written
+        """
+        if not result.ok or result.md5_state is None:
+            return
+        try:
+            path, size, mtime_ns = self._get_identity(result.file)
+        except OSError:
+            return
+        if self._file is None:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.file_path.open("a", encoding="utf-8")
+            if self._is_last_line_truncated:
+                self._file.write("\n")
+        entry = {"path": path, "size": size, "mtime_ns": mtime_ns, "md5_state": result.md5_state.value}
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        self._done.add((path, size, mtime_ns))
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,3 @@
+"""Version of the library, kept in sync with pyproject.toml by bump2version."""
+
+__version__ = "0.8.1"
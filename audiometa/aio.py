@@ -0,0 +1,249 @@
+"""Asyncio versions of the main functions of the public API.
+
+The functions of this module take the same parameters and return the same values as their counterparts in the
+audiometa module, without blocking the event loop:
+- File reads, parsing and writes run in a thread pool bounded by the concurrency limit
+- The ffprobe and flac tools are run with asyncio.create_subprocess_exec
+- At most the concurrency limit of calls run at once per event loop; further calls wait for a slot, so that a burst of
+  calls cannot start hundreds of external processes
+
+Examples:
+    from audiometa import aio
+
+    aio.set_concurrency_limit(8)
+    metadata = await aio.get_unified_metadata("song.mp3")
+    state = await aio.is_flac_md5_valid("song.flac")
+"""
+
+import asyncio
+import contextlib
+import functools
+import os
+import threading
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from . import PublicFileType, _get_full_metadata
+from . import get_unified_metadata as _get_unified_metadata
+from . import update_metadata as _update_metadata
+from ._audio_file import _AudioFile
+from .exceptions import FileCorruptedError
+from .utils.flac_md5_state import FlacMd5State
+from .utils.flac_md5_verification_method import FlacMd5VerificationMethod
+from .utils.flac_md5_verifier import DEFAULT_READ_CHUNK_SIZE
+from .utils.metadata_format import MetadataFormat
+from .utils.metadata_write_report import MetadataWriteReport
+from .utils.metadata_writing_strategy import MetadataWritingStrategy
+from .utils.padding_policy import PaddingFunction
+from .utils.types import UnifiedMetadata
+from .utils.unified_metadata_key import UnifiedMetadataKey
+
+# Default number of calls running at once, which is also the number of threads of the pool
+DEFAULT_CONCURRENCY_LIMIT = os.cpu_count() or 1
+
+
+class _Runtime:
+    """Thread pool and per-event-loop limiters shared by the functions of this module."""
+
+    def __init__(self, concurrency_limit: int):
+        self.concurrency_limit = concurrency_limit
+        self.limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.executor: ThreadPoolExecutor | None = None
+        self.lock = threading.Lock()
+
+    def set_concurrency_limit(self, limit: int) -> None:
+        with self.lock:
+            self.concurrency_limit = limit
+            self.limiters.clear()
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+                self.executor = None
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency_limit, thread_name_prefix="audiometa-aio"
+                )
+            return self.executor
+
+    def get_limiter(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            limiter = self.limiters.get(loop)
+            if limiter is None:
+                limiter = self.limiters[loop] = asyncio.Semaphore(self.concurrency_limit)
+            return limiter
+
+
+_runtime = _Runtime(DEFAULT_CONCURRENCY_LIMIT)
+
+
+def get_concurrency_limit() -> int:
+    """Get the maximum number of calls of this module running at once per event loop."""
+    return _runtime.concurrency_limit
+
+
+def set_concurrency_limit(limit: int) -> None:
+    """Set the maximum number of calls of this module running at once per event loop.
+
+    Calls already running keep their slot; the new limit applies to the calls made afterwards.
+
+    Args:
+        limit: Maximum number of calls running at once, which is also the number of threads of the pool
+
+    Raises:
+        ValueError: If limit is lower than 1
+    """
+    if limit < 1:
+        msg = f"limit must be at least 1, got {limit}"
+        raise ValueError(msg)
+    _runtime.set_concurrency_limit(limit)
+
+
+@contextlib.asynccontextmanager
+async def _limit() -> AsyncIterator[None]:
+    async with _runtime.get_limiter():
+        yield
+
+
+async def _run_in_executor[R](function: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_runtime.get_executor(), functools.partial(function, *args, **kwargs))
+
+
+async def _run_tool(command: list[str]) -> tuple[int, str, str]:
+    """Run an external tool and get its exit code, standard output and standard error.
+
+    The process is killed if the calling task is cancelled.
+
+    Raises:
+        FileNotFoundError: If the tool is not installed
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate()
+        returncode = await process.wait()
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return returncode, stdout.decode(), stderr.decode()
+
+
+async def _check_flac_md5(audio_file: _AudioFile, method: FlacMd5VerificationMethod, chunk_size: int) -> FlacMd5State:
+    state = await _run_in_executor(audio_file.get_flac_md5_state_without_test)
+    if state is not None:
+        return state
+    if method == FlacMd5VerificationMethod.NATIVE:
+        return await _run_in_executor(audio_file.check_flac_md5_natively, chunk_size)
+    try:
+        returncode, stdout, stderr = await _run_tool(audio_file.get_flac_test_command())
+    except FileNotFoundError as e:
+        msg = "The flac tool is not installed, use FlacMd5VerificationMethod.NATIVE to check the MD5 in-process"
+        raise FileNotFoundError(msg) from e
+    # Combine stdout and stderr as flac may output to either
+    return await _run_in_executor(audio_file.set_flac_test_output, returncode, stdout + stderr)
+
+
+async def _probe_wav_with_ffprobe(audio_file: _AudioFile) -> None:
+    returncode, stdout, _stderr = await _run_tool(audio_file.get_ffprobe_command())
+    audio_file.set_ffprobe_output(returncode, stdout)
+
+
+async def get_unified_metadata(
+    file: PublicFileType,
+    normalized_rating_max_value: int | None = None,
+    id3v2_version: tuple[int, int, int] | None = None,
+    metadata_format: MetadataFormat | None = None,
+    fields: Iterable[UnifiedMetadataKey | str] | None = None,
+) -> UnifiedMetadata:
+    """Get metadata from a file without blocking the event loop.
+
+    See audiometa.get_unified_metadata.
+    """
+    async with _limit():
+        return await _run_in_executor(
+            _get_unified_metadata, file, normalized_rating_max_value, id3v2_version, metadata_format, fields
+        )
+
+
+async def get_full_metadata(
+    file: PublicFileType,
+    include_headers: bool = True,
+    include_technical: bool = True,
+    wav_ffprobe_fallback: bool = False,
+    flac_md5_method: FlacMd5VerificationMethod = FlacMd5VerificationMethod.FLAC_CLI,
+) -> dict[str, Any]:
+    """Get comprehensive metadata from a file without blocking the event loop.
+
+    See audiometa.get_full_metadata. The ffprobe and flac tools are run asynchronously before the rest of the metadata
+    is read in the thread pool.
+    """
+    async with _limit():
+        audio_file = await _run_in_executor(_AudioFile, file, wav_ffprobe_fallback=wav_ffprobe_fallback)
+        if include_technical:
+            # Errors are left to the technical info of the result, which reports them as zeros
+            if audio_file.file_extension == ".flac":
+                with contextlib.suppress(Exception):
+                    await _check_flac_md5(audio_file, flac_md5_method, DEFAULT_READ_CHUNK_SIZE)
+            elif await _run_in_executor(audio_file.needs_wav_ffprobe):
+                with contextlib.suppress(Exception):
+                    await _probe_wav_with_ffprobe(audio_file)
+        return await _run_in_executor(
+            _get_full_metadata, audio_file, include_headers, include_technical, flac_md5_method
+        )
+
+
+async def update_metadata(
+    file: PublicFileType,
+    unified_metadata: dict[UnifiedMetadataKey, Any] | UnifiedMetadata,
+    normalized_rating_max_value: int | None = None,
+    id3v2_version: tuple[int, int, int] | None = None,
+    metadata_strategy: MetadataWritingStrategy | None = None,
+    metadata_format: MetadataFormat | None = None,
+    fail_on_unsupported_field: bool = False,
+    warn_on_unsupported_field: bool = True,
+    padding: PaddingFunction | None = None,
+) -> list[MetadataWriteReport]:
+    """Update metadata in an audio file without blocking the event loop.
+
+    See audiometa.update_metadata. The whole write runs in the thread pool, including the id3v2 tool run to write ID3v2
+    tags to FLAC files, so that a file is never left half-written by a cancelled task.
+    """
+    async with _limit():
+        return await _run_in_executor(
+            _update_metadata,
+            file,
+            unified_metadata,
+            normalized_rating_max_value,
+            id3v2_version,
+            metadata_strategy,
+            metadata_format,
+            fail_on_unsupported_field,
+            warn_on_unsupported_field,
+            padding,
+        )
+
+
+async def is_flac_md5_valid(
+    file: PublicFileType,
+    method: FlacMd5VerificationMethod = FlacMd5VerificationMethod.FLAC_CLI,
+    chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+) -> FlacMd5State:
+    """Check the MD5 checksum validation state of a FLAC file without blocking the event loop.
+
+    See audiometa.is_flac_md5_valid. With FlacMd5VerificationMethod.FLAC_CLI, `flac -t` is run asynchronously.
+    """
+    async with _limit():
+        audio_file = await _run_in_executor(_AudioFile, file)
+        try:
+            return await _check_flac_md5(audio_file, method, chunk_size)
+        except FileCorruptedError:
+            return FlacMd5State.INVALID
@@ -0,0 +1,268 @@
+"""Opt-in persistent cache of the results of the reading functions.
+
+Results are stored in a SQLite database and keyed on the identity of the file: its absolute path, size, modification
+time and inode. A cached result is only returned while the file still has the same identity, so that a rescan of an
+unchanged library costs one stat per file. The whole cache is dropped when the library version or the format priorities
+change, and the writing functions of audiometa remove the entries of the files they write.
+
+Examples:
+    from audiometa import get_unified_metadata
+    from audiometa.cache import MetadataCache, set_metadata_cache
+
+    set_metadata_cache(MetadataCache("~/.cache/audiometa.sqlite3"))
+    get_unified_metadata("song.mp3")  # Parsed and stored
+    get_unified_metadata("song.mp3")  # Returned from the cache until the file changes
+"""
+
+import contextlib
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, cast
+
+from ._version import __version__
+from .utils.metadata_format import MetadataFormat
+
+# Default maximum total size of the cached results
+DEFAULT_MAX_SIZE_BYTES = 256 * 1024 * 1024
+
+# Fraction of max_size_bytes kept when the least recently used entries are evicted, so that eviction does not run on
+# every insert once the cache is full
+EVICTION_TARGET_RATIO = 0.9
+
+# Bumped when the database layout or the pickled values change
+CACHE_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    value BLOB NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (path, kind)
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+"""
+
+
+def get_cache_fingerprint() -> str:
+    """Get the fingerprint of what the cached results depend on besides the files themselves.
+
+    Returns:
+        A hash of the cache schema version, the library version and the format priorities
+    """
+    priorities = {
+        extension: [metadata_format.value for metadata_format in metadata_formats]
+        for extension, metadata_formats in sorted(MetadataFormat.get_priorities().items())
+    }
+    fingerprint = f"{CACHE_SCHEMA_VERSION}:{__version__}:{priorities}"
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+class MetadataCache:
+    """Persistent cache of read results, stored in a SQLite database.
+
+    The database can be shared by several processes. Each process opens its own connection on first use, and
+    connections are shared by the threads of a process.
+
+    Args:
+        path: Path of the database file, created if needed
+        max_size_bytes: Maximum total size of the cached results. The least recently used entries are evicted beyond it
+
+    Raises:
+        ValueError: If max_size_bytes is lower than 1
+    """
+
+    def __init__(self, path: str | Path, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        if max_size_bytes < 1:
+            msg = f"max_size_bytes must be at least 1, got {max_size_bytes}"
+            raise ValueError(msg)
+        self.path = Path(path).expanduser()
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.RLock()
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+        self._total_size = 0
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # A connection inherited from a parent process through fork must not be used
+        if self._connection is None or self._connection_pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+
+            fingerprint = get_cache_fingerprint()
+            row = connection.execute("SELECT value FROM settings WHERE name = 'fingerprint'").fetchone()
+            if row is None or row[0] != fingerprint:
+                with connection:
+                    connection.execute("DELETE FROM entries")
+                    connection.execute(
+                        "INSERT OR REPLACE INTO settings (name, value) VALUES ('fingerprint', ?)", (fingerprint,)
+                    )
+
+            self._connection = connection
+            self._connection_pid = os.getpid()
+            self._total_size = self._get_stored_size()
+        return self._connection
+
+    def _get_stored_size(self) -> int:
+        connection = cast(sqlite3.Connection, self._connection)
+        return int(connection.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM entries").fetchone()[0])
+
+    def get_or_read[R](self, file_path: str, kind: str, read: Callable[[], R]) -> R:
+        """Get a cached result, or read and cache it if the file changed or was never read.
+
+        Args:
+            file_path: Path of the file
+            kind: Name of the result, including the parameters it depends on
+            read: Function reading the result from the file
+
+        Returns:
+            The cached or freshly read result. Errors of the database, such as a locked, read-only or full database,
+            are ignored: the result is then read from the file and not stored
+        """
+        file_path = str(Path(file_path).absolute())
+        try:
+            stat_result = Path(file_path).stat()
+        except OSError:
+            # Let the reading function report the error
+            return read()
+        identity = (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino)
+
+        try:
+            value = self._get_cached_value(file_path, kind, identity)
+        except (sqlite3.Error, OSError):
+            return read()
+        if value is not None:
+            return cast(R, pickle.loads(value))
+
+        # The file is stat'ed before it is read, so a change made while reading leaves a stale identity that misses
+        result = read()
+        with contextlib.suppress(sqlite3.Error, OSError):
+            self._store(file_path, kind, identity, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        return result
+
+    def _get_cached_value(self, file_path: str, kind: str, identity: tuple[int, int, int]) -> bytes | None:
+        """Get the pickled result stored for a file, or None if there is none for its current identity."""
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT size, mtime_ns, inode, value FROM entries WHERE path = ? AND kind = ?", (file_path, kind)
+                )
+                .fetchone()
+            )
+            if row is None or tuple(row[:3]) != identity:
+                return None
+            with self._get_connection() as connection:
+                connection.execute(
+                    "UPDATE entries SET last_used = ? WHERE path = ? AND kind = ?", (time.time_ns(), file_path, kind)
+                )
+            return cast(bytes, row[3])
+
+    def _store(self, file_path: str, kind: str, identity: tuple[int, int, int], value: bytes) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                # Results of a previous version of the file are stale whatever their kind
+                connection.execute(
+                    "DELETE FROM entries WHERE path = ? AND NOT (size = ? AND mtime_ns = ? AND inode = ?)",
+                    (file_path, *identity),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (path, kind, size, mtime_ns, inode, value, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (file_path, kind, *identity, value, time.time_ns()),
+                )
+            self._total_size += len(value)
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache is back under its target size."""
+        connection = self._get_connection()
+        # Other processes may have written to the database since the size was last read
+        self._total_size = self._get_stored_size()
+        target_size = int(self.max_size_bytes * EVICTION_TARGET_RATIO)
+        if self._total_size <= self.max_size_bytes:
+            return
+        rows = connection.execute("SELECT path, kind, LENGTH(value) FROM entries ORDER BY last_used")
+        evicted: list[tuple[str, str]] = []
+        for path, kind, size in rows:
+            if self._total_size <= target_size:
+                break
+            evicted.append((path, kind))
+            self._total_size -= size
+        with connection:
+            connection.executemany("DELETE FROM entries WHERE path = ? AND kind = ?", evicted)
+
+    def invalidate(self, file_path: str) -> None:
+        """Remove all the cached results of a file."""
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute("DELETE FROM entries WHERE path = ?", (str(Path(file_path).absolute()),))
+
+    def clear(self) -> None:
+        """Remove all the cached results."""
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute("DELETE FROM entries")
+            self._total_size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._connection_pid = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._get_connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+
+class _ActiveCache:
+    cache: MetadataCache | None = None
+
+
+def set_metadata_cache(cache: MetadataCache | None) -> None:
+    """Set the cache used by the reading functions of audiometa, or disable caching with None (default)."""
+    _ActiveCache.cache = cache
+
+
+def get_metadata_cache() -> MetadataCache | None:
+    """Get the cache used by the reading functions of audiometa, or None if caching is disabled."""
+    return _ActiveCache.cache
+
+
+def read_through_cache[R](file: Any, kind: str, read: Callable[[], R]) -> R:
+    """Read a result through the active cache, or directly when caching is disabled or the file is not a path."""
+    cache = _ActiveCache.cache
+    if cache is None or not isinstance(file, str | Path):
+        return read()
+    return cache.get_or_read(os.fspath(file), kind, read)
+
+
+def invalidate_cached_results(file: Any) -> None:
+    """Remove the cached results of a file from the active cache, after it has been written.
+
+    Errors of the database are ignored, so that they do not fail a write that succeeded. The results left behind were
+    stored under the previous size and modification time of the file, so they are not returned.
+    """
+    cache = _ActiveCache.cache
+    if cache is not None and isinstance(file, str | Path):
+        with contextlib.suppress(sqlite3.Error, OSError):
+            cache.invalidate(os.fspath(file))
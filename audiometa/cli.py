@@ -2,32 +2,59 @@
 """AudioMeta CLI - Command-line interface for audio metadata operations."""
 
 import argparse
+import contextlib
+import dataclasses
+import itertools
 import json
+import signal
 import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Generator, Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO, cast
 
 from audiometa import (
+    FlacMd5State,
     UnifiedMetadataKey,
     delete_all_metadata,
     get_full_metadata,
     get_unified_metadata,
     update_metadata,
     validate_metadata_for_update,
+    verify_many,
 )
+from audiometa._batch import run_batch
+from audiometa.cache import MetadataCache, set_metadata_cache
 from audiometa.exceptions import (
     FileTypeNotSupportedError,
     InvalidRatingValueError,
     MetadataFormatNotSupportedByAudioFormatError,
 )
+from audiometa.index import IndexScanReport, MetadataIndex
+from audiometa.utils.batch_executor import BatchExecutor
+from audiometa.utils.batch_result import BatchVerifyResult
+from audiometa.utils.file_walker import walk_audio_files
+from audiometa.utils.flac_md5_verification_method import FlacMd5VerificationMethod
 from audiometa.utils.metadata_format import MetadataFormat
+from audiometa.utils.storage_detector import detect_storage_type, get_recommended_worker_count
 from audiometa.utils.types import UnifiedMetadata
+from audiometa.watcher import DEFAULT_DEBOUNCE_SEC, DEFAULT_POLL_INTERVAL_SEC, watch_index
+
+BYTES_PER_MB = 1_000_000
+
+# JSON lines are flushed once this many records are buffered, or once the oldest buffered record is this old
+JSONL_FLUSH_RECORDS = 64
+JSONL_FLUSH_INTERVAL_SEC = 0.5
 
 
 def format_output(data: Any, output_format: str) -> str:
     """Format output data according to specified format."""
     if output_format == "json":
         return json.dumps(data, indent=2)
+    if output_format == "jsonl":
+        return json.dumps(data)
     if output_format == "yaml":
         try:
             import yaml  # type: ignore[import-untyped]
@@ -125,48 +152,167 @@ def format_as_table(data: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def _read_metadata(args: argparse.Namespace) -> None:
-    """Read and display metadata from audio file(s)."""
-    files = expand_file_patterns(
-        args.files, getattr(args, "recursive", False), getattr(args, "continue_on_error", False)
-    )
+def _get_job_count(args: argparse.Namespace) -> int:
+    """Get the number of files processed at once, sizing it from the CPU count and the storage of the files for auto."""
+    jobs = getattr(args, "jobs", 1)
+    if jobs == "auto":
+        return get_recommended_worker_count(detect_storage_type(args.files[0]))
+    return int(jobs)
 
-    if not files:
-        return  # No files found, but continue_on_error was set
 
+def _iter_unique_files(files: Iterable[Path]) -> Iterator[Path]:
+    """Skip the files already given, under the same path or another one leading to the same file."""
+    seen: set[Path] = set()
     for file_path in files:
+        resolved_path = file_path.resolve()
+        if resolved_path not in seen:
+            seen.add(resolved_path)
+            yield file_path
+
+
+def _apply_to_files[R](
+    args: argparse.Namespace,
+    files: Iterable[Path],
+    operation: Callable[[Path], R],
+    ordered: bool = True,
+    writes_files: bool = False,
+) -> Generator[tuple[Path, R | None, Exception | None], None, None]:
+    """Apply an operation to each file, in a thread pool when --jobs is above 1.
+
+    Yields (file, result, None) or (file, None, exception) for each file, so that outputs and errors are reported from
+    the main thread as in a serial run. Closing the iterator, e.g. when exiting on an error, cancels the files that have
+    not started yet. If the operation writes the files, files given twice are only processed once in a thread pool, as
+    two jobs writing the same file in place at once would corrupt it.
+    """
+
+    def apply(file_path: Path) -> tuple[Path, R | None, Exception | None]:
         try:
-            if getattr(args, "format_type", None) == "unified":
-                metadata: Any = get_unified_metadata(file_path)
+            return file_path, operation(file_path), None
+        except Exception as e:
+            return file_path, None, e
+
+    job_count = _get_job_count(args)
+    if job_count == 1:
+        yield from map(apply, files)
+    else:
+        if writes_files:
+            files = _iter_unique_files(files)
+        yield from run_batch(apply, files, BatchExecutor.THREAD, job_count, ordered, None)
+
+
+class _ReadOutput:
+    """Destination of the outputs of the read commands: stdout, or the --output file opened once for all the files.
+
+    The file is opened on the first output, so that it is not created when no file can be read. JSON lines are flushed
+    in batches, so that consumers get each record shortly after it is read without one system call per record. A timer
+    flushes the batch once its oldest record is JSONL_FLUSH_INTERVAL_SEC old, even while the next file is still read.
+    """
+
+    def __init__(self, output_path: str | None, flush_in_batches: bool):
+        self.output_path = output_path
+        self.flush_in_batches = flush_in_batches
+        self._stream: TextIO | None = None if output_path else sys.stdout
+        self._unflushed_count = 0
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.Lock()  # The timer flushes from its own thread
+
+    def write(self, output: str) -> None:
+        """Write the output of a file.
+
+        Raises:
+            OSError: If the output file cannot be opened or written
+        """
+        with self._lock:
+            if self._stream is None:
+                self._stream = Path(cast(str, self.output_path)).open("w", encoding="utf-8")  # noqa: SIM115
+            self._stream.write(output if output.endswith("\n") else output + "\n")
+            if not self.flush_in_batches:
+                return
+            self._unflushed_count += 1
+            if self._unflushed_count >= JSONL_FLUSH_RECORDS:
+                self._flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(JSONL_FLUSH_INTERVAL_SEC, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._stream is not None:
+            self._stream.flush()
+        self._unflushed_count = 0
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            # A timer that fired while a batch was being flushed must not flush the records of the next batch early
+            if self._flush_timer is not threading.current_thread():
+                return
+            # A failing stream is reported by the next write or by close, from the main thread
+            with contextlib.suppress(OSError):
+                self._flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._stream is None:
+                return
+            if self._stream is sys.stdout:
+                self._stream.flush()
             else:
-                metadata = get_full_metadata(
-                    file_path,
-                    include_headers=not getattr(args, "no_headers", False),
-                    include_technical=not getattr(args, "no_technical", False),
-                )
+                self._stream.close()
+            self._stream = None
+
+
+def _read_metadata(args: argparse.Namespace) -> None:
+    """Read and display metadata from audio file(s).
 
-            output = format_output(metadata, args.output_format)
+    With --format jsonl, each file is output as one JSON object on its own line, with its path under "file", as soon as
+    it is read. Files that cannot be read are output with their error message under "error" instead.
+    """
+    is_jsonl = args.output_format == "jsonl"
+
+    def read_output(file_path: Path) -> str:
+        if getattr(args, "format_type", None) == "unified":
+            metadata: Any = get_unified_metadata(file_path)
+        else:
+            metadata = get_full_metadata(
+                file_path,
+                include_headers=not getattr(args, "no_headers", False),
+                include_technical=not getattr(args, "no_technical", False),
+            )
+        if is_jsonl:
+            metadata = {"file": str(file_path), **metadata}
+        return format_output(metadata, args.output_format)
+
+    files = _iter_command_files(args)
+    ordered = not getattr(args, "unordered", False)
+    read_output_stream = _ReadOutput(args.output, flush_in_batches=is_jsonl)
+    try:
+        with contextlib.closing(_apply_to_files(args, files, read_output, ordered)) as results:
+            for file_path, output, error in results:
+                if error is not None:
+                    if is_jsonl:
+                        error_output = format_output({"file": str(file_path), "error": str(error)}, "jsonl")
+                        with contextlib.suppress(OSError):
+                            read_output_stream.write(error_output)
+                    _handle_file_operation_error(error, file_path, args.continue_on_error)
+                    continue
 
-            if args.output:
                 try:
-                    with Path(args.output).open("w") as f:
-                        f.write(output)
-                except (PermissionError, OSError) as e:
+                    read_output_stream.write(cast(str, output))
+                except OSError as e:
                     _handle_file_operation_error(e, args.output, args.continue_on_error)
-            else:
-                sys.stdout.write(output)
-                if not output.endswith("\n"):
-                    sys.stdout.write("\n")
-
-        except (FileTypeNotSupportedError, FileNotFoundError, PermissionError, OSError, Exception) as e:
-            _handle_file_operation_error(e, file_path, args.continue_on_error)
+    finally:
+        read_output_stream.close()
 
 
 def _write_metadata(args: argparse.Namespace) -> None:
     """Write metadata to audio file(s)."""
-    files = expand_file_patterns(
-        args.files, getattr(args, "recursive", False), getattr(args, "continue_on_error", False)
-    )
+    files = _iter_command_files(args)
 
     # Build metadata dictionary from command line arguments
     metadata: UnifiedMetadata = {}
@@ -257,94 +403,319 @@ def _write_metadata(args: argparse.Namespace) -> None:
         sys.stderr.write(f"Error: {e}\n")
         sys.exit(1)
 
-    for file_path in files:
-        try:
-            update_kwargs: dict[str, Any] = {}
-            if hasattr(args, "force_format") and args.force_format:
-                format_map = {
-                    "id3v2": MetadataFormat.ID3V2,
-                    "id3v1": MetadataFormat.ID3V1,
-                    "vorbis": MetadataFormat.VORBIS,
-                    "riff": MetadataFormat.RIFF,
-                }
-                update_kwargs["metadata_format"] = format_map[args.force_format]
-            update_metadata(file_path, metadata, **update_kwargs)
-            if len(files) > 1:
-                sys.stdout.write(f"Updated metadata for: {file_path}\n")
-            else:
-                sys.stdout.write("Updated metadata\n")
-
-        except (FileTypeNotSupportedError, FileNotFoundError, PermissionError, OSError, Exception) as e:
-            if isinstance(e, MetadataFormatNotSupportedByAudioFormatError):
-                sys.stderr.write(f"Error: {e}\n")
+    update_kwargs: dict[str, Any] = {}
+    if hasattr(args, "force_format") and args.force_format:
+        format_map = {
+            "id3v2": MetadataFormat.ID3V2,
+            "id3v1": MetadataFormat.ID3V1,
+            "vorbis": MetadataFormat.VORBIS,
+            "riff": MetadataFormat.RIFF,
+        }
+        update_kwargs["metadata_format"] = format_map[args.force_format]
+
+    def write(file_path: Path) -> None:
+        update_metadata(file_path, metadata, **update_kwargs)
+
+    first_files = list(itertools.islice(files, 2))
+    with contextlib.closing(
+        _apply_to_files(args, itertools.chain(first_files, files), write, writes_files=True)
+    ) as results:
+        for file_path, _, error in results:
+            if error is None:
+                if len(first_files) > 1:
+                    sys.stdout.write(f"Updated metadata for: {file_path}\n")
+                else:
+                    sys.stdout.write("Updated metadata\n")
+            elif isinstance(error, MetadataFormatNotSupportedByAudioFormatError):
+                sys.stderr.write(f"Error: {error}\n")
                 if not args.continue_on_error:
                     sys.exit(1)
             else:
-                _handle_file_operation_error(e, file_path, args.continue_on_error)
+                _handle_file_operation_error(error, file_path, args.continue_on_error)
 
 
 def _delete_metadata(args: argparse.Namespace) -> None:
     """Delete metadata from audio file(s)."""
-    files = expand_file_patterns(
-        args.files, getattr(args, "recursive", False), getattr(args, "continue_on_error", False)
-    )
-
-    for file_path in files:
-        try:
-            success = delete_all_metadata(file_path)
-            if success:
-                if len(files) > 1:
+    files = _iter_command_files(args)
+
+    first_files = list(itertools.islice(files, 2))
+    with contextlib.closing(
+        _apply_to_files(args, itertools.chain(first_files, files), delete_all_metadata, writes_files=True)
+    ) as results:
+        for file_path, success, error in results:
+            if error is not None:
+                _handle_file_operation_error(error, file_path, args.continue_on_error)
+            elif success:
+                if len(first_files) > 1:
                     sys.stdout.write(f"Deleted metadata from: {file_path}\n")
                 else:
                     sys.stdout.write("Deleted metadata\n")
             else:
                 sys.stderr.write(f"Warning: No metadata found in: {file_path}\n")
 
-        except (FileTypeNotSupportedError, FileNotFoundError, PermissionError, OSError, Exception) as e:
-            _handle_file_operation_error(e, file_path, args.continue_on_error)
 
+class _VerifyProgress:
+    """Counts and throughput of a running MD5 audit, written to stderr."""
+
+    def __init__(self, stream: TextIO, live: bool):
+        self.stream = stream
+        self.live = live  # Whether the line is rewritten after each file, for terminals
+        self.start = time.perf_counter()
+        self.file_count = 0
+        self.byte_count = 0
+        self.state_counts: Counter[str] = Counter()
+
+    def add(self, result: BatchVerifyResult) -> None:
+        self.file_count += 1
+        self.byte_count += result.file_size_bytes
+        self.state_counts[result.md5_state.value if result.md5_state is not None else "error"] += 1
+        if self.live:
+            self.stream.write(f"\r{self.format()}")
+            self.stream.flush()
+
+    def format(self) -> str:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        megabytes = self.byte_count / BYTES_PER_MB
+        line = (
+            f"{self.file_count} files, {megabytes:.1f} MB in {elapsed:.1f}s "
+            f"({megabytes / elapsed:.1f} MB/s, {self.file_count / elapsed:.1f} files/s)"
+        )
+        if self.state_counts:
+            line += ": " + ", ".join(f"{count} {state}" for state, count in sorted(self.state_counts.items()))
+        return line
+
+    def finish(self) -> None:
+        # Terminals get the final counts over the live line
+        prefix = "\r" if self.live else ""
+        self.stream.write(f"{prefix}{self.format()}\n")
+        self.stream.flush()
+
+
+def _verify_md5(args: argparse.Namespace) -> None:
+    """Check the MD5 signature of FLAC file(s) in parallel, writing one JSON line per file as they complete."""
+    flac_files = (file for file in _iter_command_files(args) if file.suffix.lower() == ".flac")
+    first_file = next(flac_files, None)
+    if first_file is None:
+        sys.stderr.write("Error: No FLAC files found\n")
+        sys.exit(1)
+    files = itertools.chain([first_file], flac_files)
 
-def expand_file_patterns(patterns: list[str], recursive: bool = False, continue_on_error: bool = False) -> list[Path]:
-    """Expand file patterns and globs into a list of Path objects."""
-    files = []
+    try:
+        output = Path(args.output).open("a", encoding="utf-8") if args.output else sys.stdout  # noqa: SIM115
+    except OSError as e:
+        _handle_file_operation_error(e, args.output, continue_on_error=False)
+        return
+    progress = _VerifyProgress(sys.stderr, live=not args.no_progress and sys.stderr.isatty())
+    has_failures = False
+    try:
+        results = verify_many(files, workers=args.workers, method=args.method, state_file=args.state_file)
+        for result in results:
+            output.write(json.dumps(result.to_dict()) + "\n")
+            output.flush()
+            progress.add(result)
+            has_failures = has_failures or not result.ok or result.md5_state == FlacMd5State.INVALID
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if not args.no_progress:
+            progress.finish()
+
+    if has_failures:
+        sys.exit(1)
+
+
+def _watch(args: argparse.Namespace) -> None:
+    """Keep an index up to date with the changes made to a directory, writing one JSON line per update of the index."""
+    index = MetadataIndex(args.index)
+    stop_event = threading.Event()
+    # Stopped by a service manager as by Ctrl+C, after the update in progress
+    signal.signal(signal.SIGTERM, lambda _signal_number, _frame: stop_event.set())
+
+    def write_report(report: IndexScanReport) -> None:
+        sys.stdout.write(json.dumps(dataclasses.asdict(report)) + "\n")
+        sys.stdout.flush()
+
+    try:
+        watch_index(
+            index,
+            args.directory,
+            debounce_sec=args.debounce,
+            poll_interval_sec=args.poll_interval,
+            use_inotify=False if args.polling else None,
+            initial_scan=not args.no_initial_scan,
+            workers=args.workers,
+            on_update=write_report,
+            stop_event=stop_event,
+        )
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        sys.stderr.write(f"Error: {e}\n")
+        sys.exit(1)
+    finally:
+        index.close()
+
+
+def _serve(args: argparse.Namespace) -> None:
+    """Answer metadata requests on a Unix socket until interrupted."""
+    # Imported here, as Unix sockets are not available on every platform
+    from audiometa.server import MetadataServer
+
+    if args.cache:
+        set_metadata_cache(MetadataCache(args.cache))
+    try:
+        server = MetadataServer(args.socket, workers=args.workers)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        sys.exit(1)
+    # Stopped by a service manager as by Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
 
+    sys.stderr.write(f"Listening on {server.socket_path}\n")
+    sys.stderr.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+def _client(args: argparse.Namespace) -> None:
+    """Send requests to a server and write one JSON line per response, exiting with 1 if any request failed."""
+    # Imported here, as Unix sockets are not available on every platform
+    from audiometa.server import send_requests
+
+    lines: Iterable[str] = args.requests or sys.stdin
+    requests = (json.loads(line) for line in lines if line.strip())
+    has_failed = False
+    try:
+        for response in send_requests(args.socket, requests):
+            has_failed = has_failed or not response.get("ok")
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+    except json.JSONDecodeError as e:
+        sys.stderr.write(f"Error: Invalid request: {e}\n")
+        sys.exit(1)
+    except OSError as e:
+        sys.stderr.write(f"Error: {e}\n")
+        sys.exit(1)
+    if has_failed:
+        sys.exit(1)
+
+
+def iter_file_patterns(
+    patterns: list[str],
+    recursive: bool = False,
+    *,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    follow_symlinks: bool = False,
+) -> Iterator[Path]:
+    """Expand file patterns and globs into Path objects, lazily.
+
+    Directories are only searched when recursive is True, in a single concurrent pass over their tree (see
+    walk_audio_files), and their files are yielded as they are found. The include and exclude patterns and
+    follow_symlinks apply to the files found in directories.
+    """
     for pattern in patterns:
         path = Path(pattern)
 
         if path.exists():
             if path.is_file():
-                files.append(path)
+                yield path
             elif path.is_dir() and recursive:
-                # Recursively find audio files
-                for ext in [".mp3", ".flac", ".wav"]:
-                    files.extend(path.rglob(f"*{ext}"))
+                yield from walk_audio_files(
+                    [path], include=include or (), exclude=exclude or (), follow_symlinks=follow_symlinks
+                )
         else:
             # Try glob pattern
-            pattern_path = Path(pattern)
+            matches: Iterable[Path]
             if "*" in pattern or "?" in pattern or "[" in pattern:
                 # Use glob for patterns
-                if pattern_path.is_absolute():
-                    matches = list(pattern_path.parent.glob(pattern_path.name))
-                else:
-                    matches = list(Path().glob(pattern))
+                matches = path.parent.glob(path.name) if path.is_absolute() else Path().glob(pattern)
             else:
-                matches = [pattern_path]
+                matches = [path]
             for match in matches:
                 # Skip hidden files (those starting with .)
                 if not match.name.startswith(".") and match.is_file():
-                    files.append(match)
+                    yield match
 
-    if not files:
-        if continue_on_error:
-            sys.stderr.write("Warning: No valid audio files found\n")
-            return []
-        error_msg = "Error: No valid audio files found\n"
-        sys.stderr.write(error_msg)
-        sys.exit(1)
 
+def _report_no_files(continue_on_error: bool) -> None:
+    if continue_on_error:
+        sys.stderr.write("Warning: No valid audio files found\n")
+        return
+    sys.stderr.write("Error: No valid audio files found\n")
+    sys.exit(1)
+
+
+def expand_file_patterns(patterns: list[str], recursive: bool = False, continue_on_error: bool = False) -> list[Path]:
+    """Expand file patterns and globs into a list of Path objects."""
+    files = list(iter_file_patterns(patterns, recursive))
+    if not files:
+        _report_no_files(continue_on_error)
     return files
 
 
+def _iter_command_files(args: argparse.Namespace) -> Iterator[Path]:
+    """Expand the file arguments of a command lazily, warning or exiting as expand_file_patterns if there are none."""
+    files = iter_file_patterns(
+        args.files,
+        getattr(args, "recursive", False),
+        include=getattr(args, "include", None),
+        exclude=getattr(args, "exclude", None),
+        follow_symlinks=getattr(args, "follow_symlinks", False),
+    )
+    first_file = next(files, None)
+    if first_file is None:
+        _report_no_files(getattr(args, "continue_on_error", False))
+        return iter(())
+    return itertools.chain([first_file], files)
+
+
+def _parse_jobs(value: str) -> int | str:
+    if value == "auto":
+        return value
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        msg = f"must be a positive integer or auto, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return jobs
+
+
+def _add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_parse_jobs,
+        default=1,
+        metavar="N|auto",
+        help="Number of files processed at once (default: 1). auto picks it from the CPU count and the kind of storage "
+        "(SSD, HDD or network file system) the files are on",
+    )
+
+
+def _add_file_search_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--recursive", "-r", action="store_true", help="Process directories recursively")
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="GLOB",
+        help="Only process the files found in directories that match this pattern (repeatable)",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="GLOB",
+        help="Skip the files and directories found in directories that match this pattern (repeatable)",
+    )
+    parser.add_argument("--follow-symlinks", action="store_true", help="Search the directories symbolic links point to")
+
+
 def _create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -358,6 +729,8 @@ Examples:
   audiometa write song.mp3 --title "New Title" --artist "Artist"
   audiometa delete song.mp3                  # Delete all metadata
   audiometa read music/ --recursive          # Process directory recursively
+  audiometa verify archive/ -r --workers 8 --state-file audit.jsonl
+  audiometa watch music/ --index music.sqlite3  # Keep an index up to date
         """,
     )
 
@@ -368,15 +741,19 @@ Examples:
     read_parser.add_argument("files", nargs="+", help="Audio file(s) or pattern(s)")
     read_parser.add_argument(
         "--format",
-        choices=["json", "yaml", "table"],
+        choices=["json", "jsonl", "yaml", "table"],
         default="json",
         dest="output_format",
-        help="Output format (default: json)",
+        help="Output format (default: json). jsonl writes one JSON object per file and line, as files are read",
     )
     read_parser.add_argument("--output", "-o", help="Output file (default: stdout)")
     read_parser.add_argument("--no-headers", action="store_true", help="Exclude header information")
     read_parser.add_argument("--no-technical", action="store_true", help="Exclude technical information")
-    read_parser.add_argument("--recursive", "-r", action="store_true", help="Process directories recursively")
+    _add_file_search_arguments(read_parser)
+    _add_jobs_argument(read_parser)
+    read_parser.add_argument(
+        "--unordered", action="store_true", help="With --jobs, output files as they are read rather than in order"
+    )
     read_parser.add_argument(
         "--continue-on-error", action="store_true", help="Continue processing other files on error"
     )
@@ -387,13 +764,17 @@ Examples:
     unified_parser.add_argument("files", nargs="+", help="Audio file(s) or pattern(s)")
     unified_parser.add_argument(
         "--format",
-        choices=["json", "yaml", "table"],
+        choices=["json", "jsonl", "yaml", "table"],
         default="json",
         dest="output_format",
-        help="Output format (default: json)",
+        help="Output format (default: json). jsonl writes one JSON object per file and line, as files are read",
     )
     unified_parser.add_argument("--output", "-o", help="Output file (default: stdout)")
-    unified_parser.add_argument("--recursive", "-r", action="store_true", help="Process directories recursively")
+    _add_file_search_arguments(unified_parser)
+    _add_jobs_argument(unified_parser)
+    unified_parser.add_argument(
+        "--unordered", action="store_true", help="With --jobs, output files as they are read rather than in order"
+    )
     unified_parser.add_argument(
         "--continue-on-error", action="store_true", help="Continue processing other files on error"
     )
@@ -437,7 +818,8 @@ Examples:
         choices=["id3v2", "id3v1", "vorbis", "riff"],
         help="Force a specific metadata format (id3v2, id3v1, vorbis, or riff)",
     )
-    write_parser.add_argument("--recursive", "-r", action="store_true", help="Process directories recursively")
+    _add_file_search_arguments(write_parser)
+    _add_jobs_argument(write_parser)
     write_parser.add_argument(
         "--continue-on-error", action="store_true", help="Continue processing other files on error"
     )
@@ -446,12 +828,103 @@ Examples:
     # Delete command
     delete_parser = subparsers.add_parser("delete", help="Delete all metadata from audio file(s)")
     delete_parser.add_argument("files", nargs="+", help="Audio file(s) or pattern(s)")
-    delete_parser.add_argument("--recursive", "-r", action="store_true", help="Process directories recursively")
+    _add_file_search_arguments(delete_parser)
+    _add_jobs_argument(delete_parser)
     delete_parser.add_argument(
         "--continue-on-error", action="store_true", help="Continue processing other files on error"
     )
     delete_parser.set_defaults(func=_delete_metadata)
 
+    # Verify command
+    verify_parser = subparsers.add_parser(
+        "verify",
+        help="Check the MD5 signature of FLAC file(s) in parallel",
+        description="Check the MD5 signature of FLAC files in parallel and write one JSON line per file as soon as it "
+        "is checked. Files that are not FLAC files are ignored. Exits with status 1 if a file is invalid or cannot be "
+        "checked.",
+    )
+    verify_parser.add_argument("files", nargs="+", help="FLAC file(s), directories or pattern(s)")
+    verify_parser.add_argument(
+        "--workers", type=int, help="Number of files checked at once (default: based on the CPU count)"
+    )
+    verify_parser.add_argument(
+        "--method",
+        choices=[method.value for method in FlacMd5VerificationMethod],
+        default=FlacMd5VerificationMethod.FLAC_CLI.value,
+        help="Run flac -t (flac_cli, default) or decode in-process (native)",
+    )
+    verify_parser.add_argument(
+        "--state-file",
+        help="File recording the checked files; files recorded in it by a previous run are skipped, to resume an audit",
+    )
+    verify_parser.add_argument("--output", "-o", help="File the JSON lines are appended to (default: stdout)")
+    verify_parser.add_argument(
+        "--no-progress", action="store_true", help="Do not report progress and throughput on stderr"
+    )
+    _add_file_search_arguments(verify_parser)
+    verify_parser.set_defaults(func=_verify_md5)
+
+    # Watch command
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Keep a metadata index up to date with the changes made to a directory",
+        description="Index a directory, then read the files changed in it as they change and update the index, until "
+        "interrupted. Changes are detected with inotify where available, and by scanning the directory at intervals "
+        "otherwise. One JSON line with the counts of files read, unchanged and removed is written per update.",
+    )
+    watch_parser.add_argument("directory", help="Directory to watch, recursively")
+    watch_parser.add_argument("--index", required=True, help="SQLite database of the index, created if needed")
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE_SEC,
+        help=f"Seconds without new changes before the index is updated (default: {DEFAULT_DEBOUNCE_SEC})",
+    )
+    watch_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL_SEC,
+        help=f"Seconds between two scans when inotify is not used (default: {DEFAULT_POLL_INTERVAL_SEC})",
+    )
+    watch_parser.add_argument(
+        "--polling", action="store_true", help="Scan the directory at intervals, even with inotify"
+    )
+    watch_parser.add_argument(
+        "--no-initial-scan",
+        action="store_true",
+        help="Do not index the changes made while the directory was not watched",
+    )
+    watch_parser.add_argument(
+        "--workers", type=int, help="Number of files read at once (default: based on the CPU count)"
+    )
+    watch_parser.set_defaults(func=_watch)
+
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Answer metadata requests on a Unix socket",
+        description="Listen on a Unix socket and answer read, unified, write and delete requests sent as JSON lines, "
+        "until interrupted. Scripts that run audiometa once per file save the interpreter startup and imports of each "
+        "run. Send requests with the client command, or any tool that writes to Unix sockets.",
+    )
+    serve_parser.add_argument("--socket", required=True, help="Path of the socket file to listen on")
+    serve_parser.add_argument(
+        "--workers", type=int, help="Number of requests run at once (default: based on the CPU count)"
+    )
+    serve_parser.add_argument("--cache", help="SQLite database caching the metadata read, created if needed")
+    serve_parser.set_defaults(func=_serve)
+
+    # Client command
+    client_parser = subparsers.add_parser(
+        "client",
+        help="Send requests to a server started with serve",
+        description='Send JSON requests such as \'{"command": "unified", "file": "song.mp3"}\' to a server over one '
+        "connection, and write one JSON line per response, in order. Exits with 1 if any request failed.",
+    )
+    client_parser.add_argument("--socket", required=True, help="Path of the socket file the server listens on")
+    client_parser.add_argument("requests", nargs="*", help="Requests to send (default: one per line of stdin)")
+    client_parser.set_defaults(func=_client)
+
     return parser
 
 
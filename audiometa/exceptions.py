@@ -21,6 +21,10 @@ class InvalidChunkDecodeError(FileCorruptedError):
     """Raised when a chunk cannot be decoded properly."""
 
 
+class FlacFrameDecodeError(FileCorruptedError):
+    """Raised when a FLAC audio frame cannot be decoded or fails its CRC check."""
+
+
 class DurationNotFoundError(FileCorruptedError):
     """Raised when audio duration cannot be determined."""
 
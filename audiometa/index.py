@@ -0,0 +1,570 @@
+"""Persistent catalog of an audio library, queried without parsing the files again.
+
+The index stores one row per audio file in a SQLite database: its unified metadata, its technical info, and the
+unified and raw metadata of each format, as returned by get_full_metadata. Rows are keyed on the absolute path of the
+file and remember its size and modification time, so that a rescan only reads the files that were added or changed
+since the previous scan. The values of the unified metadata and of the technical info are also stored one per row in
+an indexed table, so that queries on them are answered by SQLite.
+
+Examples:
+    from audiometa.index import Between, Contains, MetadataIndex
+    from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+    index = MetadataIndex("~/.cache/audiometa-index.sqlite3")
+    index.scan("~/Music")  # Reads every file the first time, then only new and changed files
+    for entry in index.query({UnifiedMetadataKey.ARTISTS: Contains("daft"), UnifiedMetadataKey.BPM: Between(120, 130)}):
+        print(entry.path, entry.unified_metadata.get(UnifiedMetadataKey.TITLE))
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from . import _ensure_unified_metadata_key, _get_full_metadata
+from ._audio_file import _AudioFile
+from ._batch import run_batch
+from .cache import get_cache_fingerprint
+from .utils.batch_executor import BatchExecutor
+from .utils.flac_md5_verification_method import FlacMd5VerificationMethod
+from .utils.types import UnifiedMetadata
+from .utils.unified_metadata_key import UnifiedMetadataKey
+
+# Bumped when the database layout or the stored values change
+INDEX_SCHEMA_VERSION = 1
+
+# Number of indexed files written per transaction during a scan
+SCAN_COMMIT_INTERVAL = 500
+
+# Keys of the technical info that can be used in queries, besides the unified metadata keys
+TECHNICAL_INFO_FIELDS = frozenset(
+    {
+        "duration_seconds",
+        "bitrate_bps",
+        "sample_rate_hz",
+        "channels",
+        "file_size_bytes",
+        "file_extension",
+        "audio_format_name",
+    }
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    scan_id INTEGER NOT NULL,
+    error TEXT,
+    unified_metadata TEXT NOT NULL,
+    technical_info TEXT NOT NULL,
+    metadata_format TEXT NOT NULL,
+    raw_metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS field_values (
+    path TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value_text TEXT,
+    value_number REAL
+);
+CREATE INDEX IF NOT EXISTS field_values_path ON field_values (path);
+CREATE INDEX IF NOT EXISTS field_values_text ON field_values (key, value_text);
+CREATE INDEX IF NOT EXISTS field_values_number ON field_values (key, value_number);
+"""
+
+_SELECT_ENTRIES = (
+    "SELECT path, size, mtime_ns, error, unified_metadata, technical_info, metadata_format, raw_metadata FROM files"
+)
+
+
+def get_index_fingerprint() -> str:
+    """Get the fingerprint of what the indexed rows depend on besides the files themselves.
+
+    Returns:
+        A hash of the index schema version and of the fingerprint of the cache (library version and format priorities)
+    """
+    return hashlib.sha256(f"{INDEX_SCHEMA_VERSION}:{get_cache_fingerprint()}".encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class Contains:
+    """Query condition matching fields with a value containing a text, ignoring the case of ASCII letters."""
+
+    text: str
+
+
+@dataclass(frozen=True)
+class Between:
+    """Query condition matching fields with a numeric value in a range, bounds included.
+
+    Numeric strings such as "128" or the "3/12" of a track number are compared by their leading number. A bound set to
+    None leaves the range open on that side.
+    """
+
+    low: float | None = None
+    high: float | None = None
+
+
+IndexCondition = str | int | float | Contains | Between
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Indexed metadata of a file, as of its last scan.
+
+    Attributes:
+        path: Absolute path of the file
+        size: Size of the file in bytes when it was read
+        mtime_ns: Modification time of the file when it was read
+        unified_metadata: Unified metadata, as returned by get_unified_metadata
+        technical_info: Technical info, as in get_full_metadata but without the FLAC MD5 check
+        metadata_format: Unified metadata of each format, as in get_full_metadata
+        raw_metadata: Raw metadata of each format, as in get_full_metadata with include_headers=True
+        error: Message of the error raised when reading the file, or None if it was read. Files that could not be read
+            are kept in the index so that they are not read again until they change
+    """
+
+    path: Path
+    size: int
+    mtime_ns: int
+    unified_metadata: UnifiedMetadata = field(default_factory=dict)
+    technical_info: dict[str, Any] = field(default_factory=dict)
+    metadata_format: dict[str, UnifiedMetadata] = field(default_factory=dict)
+    raw_metadata: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class IndexScanReport:
+    """Summary of a scan or an update of the index.
+
+    Attributes:
+        file_count: Number of audio files found
+        read_count: Number of new or changed files that were read
+        unchanged_count: Number of files left as indexed because they did not change
+        error_count: Number of files read that raised an error, included in read_count
+        removed_count: Number of rows removed because their file no longer exists
+    """
+
+    file_count: int = 0
+    read_count: int = 0
+    unchanged_count: int = 0
+    error_count: int = 0
+    removed_count: int = 0
+
+
+@dataclass(frozen=True)
+class _IndexedFile:
+    """Row of a file read by a scan worker, with its values already encoded for storage."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    error: str | None
+    unified_metadata: str = "{}"
+    technical_info: str = "{}"
+    metadata_format: str = "{}"
+    raw_metadata: str = "{}"
+    field_values: list[tuple[str, str | None, float | None]] = field(default_factory=list)
+
+
+def _to_number(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.split("/", 1)[0].strip())
+        except ValueError:
+            return None
+    return None
+
+
+def _get_field_values(fields: Mapping[UnifiedMetadataKey | str, Any]) -> list[tuple[str, str | None, float | None]]:
+    """Explode fields into (key, text, number) rows, one per value of multi-value fields."""
+    rows: list[tuple[str, str | None, float | None]] = []
+    for key, value in fields.items():
+        field_name = key.value if isinstance(key, UnifiedMetadataKey) else key
+        values = value if isinstance(value, list) else [value]
+        rows.extend((field_name, str(item), _to_number(item)) for item in values if item is not None)
+    return rows
+
+
+def _read_file_for_index(identity: tuple[str, int, int]) -> _IndexedFile:
+    path, size, mtime_ns = identity
+    try:
+        with _AudioFile(path) as audio_file:
+            full_metadata = _get_full_metadata(
+                audio_file,
+                include_headers=True,
+                include_technical=False,
+                flac_md5_method=FlacMd5VerificationMethod.FLAC_CLI,
+            )
+            technical_info = audio_file.get_technical_info().to_dict()
+    except Exception as e:
+        return _IndexedFile(path=path, size=size, mtime_ns=mtime_ns, error=str(e) or type(e).__name__)
+
+    unified_metadata = full_metadata["unified_metadata"]
+    return _IndexedFile(
+        path=path,
+        size=size,
+        mtime_ns=mtime_ns,
+        error=None,
+        unified_metadata=json.dumps(unified_metadata, default=str),
+        technical_info=json.dumps(technical_info, default=str),
+        metadata_format=json.dumps(full_metadata["metadata_format"], default=str),
+        raw_metadata=json.dumps(full_metadata["raw_metadata"], default=str),
+        field_values=_get_field_values({**unified_metadata, **technical_info}),
+    )
+
+
+def _load_unified_metadata(data: str) -> UnifiedMetadata:
+    return {UnifiedMetadataKey(key): value for key, value in json.loads(data).items()}
+
+
+class MetadataIndex:
+    """Catalog of the metadata of audio files, stored in a SQLite database.
+
+    Each process opens its own connection on first use, and connections are shared by the threads of a process. The
+    whole index is emptied when the library version or the format priorities change, so the next scan reads every file.
+
+    Args:
+        path: Path of the database file, created if needed
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self._lock = threading.RLock()
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # A connection inherited from a parent process through fork must not be used
+        if self._connection is None or self._connection_pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+
+            fingerprint = get_index_fingerprint()
+            row = connection.execute("SELECT value FROM settings WHERE name = 'fingerprint'").fetchone()
+            if row is None or row[0] != fingerprint:
+                with connection:
+                    connection.execute("DELETE FROM files")
+                    connection.execute("DELETE FROM field_values")
+                    connection.execute(
+                        "INSERT OR REPLACE INTO settings (name, value) VALUES ('fingerprint', ?)", (fingerprint,)
+                    )
+
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _start_scan(self) -> int:
+        """Get a new scan id, which marks the rows of the files seen by the scan."""
+        with self._get_connection() as connection:
+            row = connection.execute("SELECT value FROM settings WHERE name = 'scan_id'").fetchone()
+            scan_id = int(row[0]) + 1 if row is not None else 1
+            connection.execute("INSERT OR REPLACE INTO settings (name, value) VALUES ('scan_id', ?)", (str(scan_id),))
+        return scan_id
+
+    def scan(
+        self,
+        patterns: str | Path | Iterable[str | Path],
+        *,
+        recursive: bool = True,
+        workers: int | None = None,
+        executor: BatchExecutor = BatchExecutor.THREAD,
+        remove_missing: bool = True,
+    ) -> IndexScanReport:
+        """Index the audio files matching patterns, reading only the files that are new or changed.
+
+        Patterns are expanded as by the audiometa command line: files, directories (searched recursively for MP3, FLAC
+        and WAV files if recursive is True) and glob patterns.
+
+        Args:
+            patterns: Files, directories or glob patterns
+            recursive: Whether directories are searched recursively
+            workers: Number of workers reading the changed files, as in read_many
+            executor: Kind of worker pool, as in read_many
+            remove_missing: Whether to remove the rows of the files that are no longer in the scanned directories
+
+        Returns:
+            Counts of the files found, read, unchanged and removed
+        """
+        # Imported here because the command line module imports the whole library
+        from .cli import iter_file_patterns
+
+        if isinstance(patterns, str | Path):
+            patterns = [patterns]
+        expanded_patterns = [str(Path(pattern).expanduser()) for pattern in patterns]
+        files = iter_file_patterns(expanded_patterns, recursive=recursive)
+
+        with self._lock:
+            scan_id = self._start_scan()
+            report = self._index_files(files, scan_id, workers, executor)
+            removed_count = 0
+            if remove_missing and recursive:
+                roots = [Path(pattern).absolute() for pattern in expanded_patterns if Path(pattern).is_dir()]
+                removed_count = self._remove_unseen(roots, scan_id)
+        return IndexScanReport(
+            file_count=report.file_count,
+            read_count=report.read_count,
+            unchanged_count=report.unchanged_count,
+            error_count=report.error_count,
+            removed_count=removed_count,
+        )
+
+    def update(
+        self,
+        files: Iterable[str | Path],
+        *,
+        workers: int | None = None,
+        executor: BatchExecutor = BatchExecutor.THREAD,
+    ) -> IndexScanReport:
+        """Index the given files if they are new or changed, and remove the rows of those that no longer exist.
+
+        Args:
+            files: Audio file paths
+            workers: Number of workers reading the changed files, as in read_many
+            executor: Kind of worker pool, as in read_many
+
+        Returns:
+            Counts of the files read, unchanged and removed
+        """
+        existing_files: list[Path] = []
+        missing_paths: list[str] = []
+        for file in files:
+            path = Path(file).expanduser()
+            if path.is_file():
+                existing_files.append(path)
+            else:
+                missing_paths.append(str(path.absolute()))
+
+        with self._lock:
+            report = self._index_files(existing_files, self._start_scan(), workers, executor)
+            removed_count = self._remove_paths(missing_paths)
+        return IndexScanReport(
+            file_count=report.file_count,
+            read_count=report.read_count,
+            unchanged_count=report.unchanged_count,
+            error_count=report.error_count,
+            removed_count=removed_count,
+        )
+
+    def _index_files(
+        self, files: Iterable[Path], scan_id: int, workers: int | None, executor: BatchExecutor
+    ) -> IndexScanReport:
+        connection = self._get_connection()
+        counts = {"file_count": 0, "unchanged_count": 0}
+        unchanged_paths: list[str] = []
+
+        def iter_changed_files() -> Iterator[tuple[str, int, int]]:
+            # Pulled lazily by the worker pool, so the files are stat'ed as the reads progress
+            for file in files:
+                path = str(file.absolute())
+                try:
+                    stat_result = file.stat()
+                except OSError:
+                    continue
+                counts["file_count"] += 1
+                identity = (stat_result.st_size, stat_result.st_mtime_ns)
+                row = connection.execute("SELECT size, mtime_ns FROM files WHERE path = ?", (path,)).fetchone()
+                if row is not None and tuple(row) == identity:
+                    counts["unchanged_count"] += 1
+                    unchanged_paths.append(path)
+                    continue
+                # The file is stat'ed before it is read, so a change made while reading is read again by the next scan
+                yield (path, *identity)
+
+        read_count = 0
+        error_count = 0
+        pending: list[_IndexedFile] = []
+        for indexed_file in run_batch(_read_file_for_index, iter_changed_files(), executor, workers, False, None):
+            read_count += 1
+            error_count += indexed_file.error is not None
+            pending.append(indexed_file)
+            if len(pending) + len(unchanged_paths) >= SCAN_COMMIT_INTERVAL:
+                self._store(pending, unchanged_paths, scan_id)
+        self._store(pending, unchanged_paths, scan_id)
+
+        return IndexScanReport(
+            file_count=counts["file_count"],
+            read_count=read_count,
+            unchanged_count=counts["unchanged_count"],
+            error_count=error_count,
+        )
+
+    def _store(self, indexed_files: list[_IndexedFile], unchanged_paths: list[str], scan_id: int) -> None:
+        """Write the read files and mark the unchanged ones as seen, in one transaction, then empty both lists."""
+        with self._get_connection() as connection:
+            paths = [(indexed_file.path,) for indexed_file in indexed_files]
+            connection.executemany("DELETE FROM field_values WHERE path = ?", paths)
+            connection.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, scan_id, error, unified_metadata, technical_info, "
+                "metadata_format, raw_metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        indexed_file.path,
+                        indexed_file.size,
+                        indexed_file.mtime_ns,
+                        scan_id,
+                        indexed_file.error,
+                        indexed_file.unified_metadata,
+                        indexed_file.technical_info,
+                        indexed_file.metadata_format,
+                        indexed_file.raw_metadata,
+                    )
+                    for indexed_file in indexed_files
+                ],
+            )
+            connection.executemany(
+                "INSERT INTO field_values (path, key, value_text, value_number) VALUES (?, ?, ?, ?)",
+                [
+                    (indexed_file.path, *field_value)
+                    for indexed_file in indexed_files
+                    for field_value in indexed_file.field_values
+                ],
+            )
+            connection.executemany(
+                "UPDATE files SET scan_id = ? WHERE path = ?", [(scan_id, path) for path in unchanged_paths]
+            )
+        indexed_files.clear()
+        unchanged_paths.clear()
+
+    def _get_paths_under(self, root: Path, excluded_scan_id: int | None = None) -> list[str]:
+        """Get the indexed paths under a directory, except those seen by the scan excluded_scan_id."""
+        prefix = f"{root}{os.sep}"
+        rows = self._get_connection().execute(
+            "SELECT path FROM files WHERE substr(path, 1, ?) = ? AND scan_id IS NOT ?",
+            (len(prefix), prefix, excluded_scan_id),
+        )
+        return [row[0] for row in rows]
+
+    def _remove_unseen(self, roots: list[Path], scan_id: int) -> int:
+        """Remove the rows of the files under roots that were not seen by the scan."""
+        return self._remove_paths([path for root in roots for path in self._get_paths_under(root, scan_id)])
+
+    def _remove_paths(self, paths: list[str]) -> int:
+        with self._get_connection() as connection:
+            connection.executemany("DELETE FROM field_values WHERE path = ?", [(path,) for path in paths])
+            return sum(connection.execute("DELETE FROM files WHERE path = ?", (path,)).rowcount for path in paths)
+
+    def get(self, file: str | Path) -> IndexEntry | None:
+        """Get the indexed metadata of a file, or None if it is not in the index."""
+        path = str(Path(file).expanduser().absolute())
+        with self._lock:
+            row = self._get_connection().execute(f"{_SELECT_ENTRIES} WHERE path = ?", (path,)).fetchone()
+        return None if row is None else _to_entry(row)
+
+    def query(self, conditions: Mapping[UnifiedMetadataKey | str, IndexCondition] | None = None) -> list[IndexEntry]:
+        """Get the indexed files matching all the conditions, sorted by path.
+
+        A condition on a multi-value field, such as ARTISTS, matches when any of the values matches.
+
+        Args:
+            conditions: Conditions keyed by UnifiedMetadataKey or technical info key (e.g. "duration_seconds"). A value
+                matches fields equal to it, Contains(text) matches fields containing the text and Between(low, high)
+                matches fields with a numeric value in the range. If None or empty, all the files are returned
+
+        Returns:
+            Entries of the matching files, including the files that could not be read if there are no conditions
+
+        Raises:
+            MetadataFieldNotSupportedByLibError: If a key is neither a UnifiedMetadataKey nor a technical info key
+            TypeError: If a condition is of an unsupported type
+        """
+        clauses: list[str] = []
+        parameters: list[Any] = []
+        values: list[Any]
+        for key, condition in (conditions or {}).items():
+            field_name = key if key in TECHNICAL_INFO_FIELDS else _ensure_unified_metadata_key(key).value
+            if isinstance(condition, Contains):
+                escaped = condition.text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                clause, values = "value_text LIKE ? ESCAPE '\\'", [f"%{escaped}%"]
+            elif isinstance(condition, Between):
+                clause, values = (
+                    "value_number BETWEEN ? AND ?",
+                    [
+                        float("-inf") if condition.low is None else condition.low,
+                        float("inf") if condition.high is None else condition.high,
+                    ],
+                )
+            elif isinstance(condition, bool) or not isinstance(condition, str | int | float):
+                msg = f"Unsupported condition for {field_name}: {condition!r}"
+                raise TypeError(msg)
+            elif isinstance(condition, str):
+                clause, values = "value_text = ?", [condition]
+            else:
+                clause, values = "value_number = ?", [float(condition)]
+            clauses.append(f"path IN (SELECT path FROM field_values WHERE key = ? AND {clause})")
+            parameters.extend([field_name, *values])
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._get_connection().execute(f"{_SELECT_ENTRIES}{where} ORDER BY path", parameters).fetchall()
+        return [_to_entry(row) for row in rows]
+
+    def remove(self, file: str | Path) -> bool:
+        """Remove a file from the index.
+
+        Returns:
+            Whether the file was in the index
+        """
+        with self._lock:
+            return self._remove_paths([str(Path(file).expanduser().absolute())]) > 0
+
+    def remove_tree(self, directory: str | Path) -> int:
+        """Remove all the files under a directory from the index, e.g. after the directory was deleted.
+
+        Returns:
+            Number of files removed
+        """
+        with self._lock:
+            return self._remove_paths(self._get_paths_under(Path(directory).expanduser().absolute()))
+
+    def clear(self) -> None:
+        """Remove all the files from the index."""
+        with self._lock, self._get_connection() as connection:
+            connection.execute("DELETE FROM files")
+            connection.execute("DELETE FROM field_values")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._connection_pid = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._get_connection().execute("SELECT COUNT(*) FROM files").fetchone()[0])
+
+
+def _to_entry(row: tuple[Any, ...]) -> IndexEntry:
+    path, size, mtime_ns, error, unified_metadata, technical_info, metadata_format, raw_metadata = row
+    return IndexEntry(
+        path=Path(path),
+        size=size,
+        mtime_ns=mtime_ns,
+        unified_metadata=_load_unified_metadata(unified_metadata),
+        technical_info=json.loads(technical_info),
+        metadata_format={
+            format_name: {UnifiedMetadataKey(key): value for key, value in format_metadata.items()}
+            for format_name, format_metadata in json.loads(metadata_format).items()
+        },
+        raw_metadata=json.loads(raw_metadata),
+        error=error,
+    )
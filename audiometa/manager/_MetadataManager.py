@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from .._audio_file import _AudioFile
 from ..exceptions import MetadataFieldNotSupportedByMetadataFormatError
 from ..utils.id3v1_genre_code_map import ID3V1_GENRE_CODE_MAP
+from ..utils.metadata_write_report import MetadataWriteReport
 from ..utils.types import RawMetadataDict, RawMetadataKey, UnifiedMetadata, UnifiedMetadataValue
 
 # Separators in order of priority for multi-value metadata fields
@@ -29,6 +30,11 @@ class _MetadataManager:
     raw_clean_metadata: RawMetadataDict | None = None
     raw_clean_metadata_uppercase_keys: RawMetadataDict | None = None
     update_using_mutagen_metadata: bool
+    # Set by managers that control where their tag is written, after each update
+    last_write_report: MetadataWriteReport | None = None
+    # Unified metadata keys to read, or None to read all of them. Managers restricted to some keys skip the raw fields
+    # of the other keys while parsing, so they are only used for reading
+    fields: frozenset[UnifiedMetadataKey] | None = None
 
     def __init__(
         self,
@@ -574,9 +580,31 @@ class _MetadataManager:
         # No code found, return as-is
         return genre_entry if genre_entry else None
 
+    def _get_raw_keys_read(self, unified_metadata_key: UnifiedMetadataKey) -> tuple[str, ...]:
+        """Get the raw keys a unified metadata key is read from.
+
+        Managers reading undirectly mapped keys extend this with the raw keys these keys are read from.
+        """
+        raw_metadata_key = self.metadata_keys_direct_map_read.get(unified_metadata_key)
+        return (raw_metadata_key,) if raw_metadata_key else ()
+
+    def _get_raw_keys_to_read(self) -> frozenset[str] | None:
+        """Get the raw keys of the fields to read, or None when all the raw keys are read."""
+        if self.fields is None:
+            return None
+        return frozenset(
+            str(raw_key)
+            for unified_metadata_key in self.fields
+            if unified_metadata_key in self.metadata_keys_direct_map_read
+            for raw_key in self._get_raw_keys_read(unified_metadata_key)
+        )
+
     def get_unified_metadata(self) -> UnifiedMetadata:
         unified_metadata: UnifiedMetadata = {}
-        for metadata_key in self.metadata_keys_direct_map_read:
+        metadata_keys = self.metadata_keys_direct_map_read
+        if self.fields is not None:
+            metadata_keys = {key: value for key, value in metadata_keys.items() if key in self.fields}
+        for metadata_key in metadata_keys:
             unified_metadata_value = self.get_unified_metadata_field(metadata_key)
             if unified_metadata_value is not None:
                 unified_metadata[metadata_key] = unified_metadata_value
@@ -754,15 +782,23 @@ class _MetadataManager:
                         app_metadata_value=app_metadata_value,
                         unified_metadata_key=unified_metadata_key,
                     )
-            self.raw_mutagen_metadata.save(self.audio_file.file_path)
+            # The file is written while no memory map of it is open
+            self.audio_file.invalidate_context()
+            try:
+                self.raw_mutagen_metadata.save(self.audio_file.file_path)
+            finally:
+                self.audio_file.invalidate_context()
 
     def delete_metadata(self) -> bool:
         if self.raw_mutagen_metadata is None:
             self.raw_mutagen_metadata = self._extract_mutagen_metadata()
 
+        self.audio_file.invalidate_context()
         try:
             self.raw_mutagen_metadata.delete()
         except Exception:
             return False
         else:
             return True
+        finally:
+            self.audio_file.invalidate_context()
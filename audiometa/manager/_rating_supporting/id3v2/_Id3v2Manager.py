@@ -1,12 +1,12 @@
 import contextlib
-import shutil
 import subprocess
-import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
+from mutagen import PaddingInfo
 from mutagen._file import FileType as MutagenMetadata
-from mutagen.id3 import ID3
+from mutagen._util import resize_bytes
+from mutagen.id3 import ID3, Frames, Frames_2_2
 from mutagen.id3._frames import (
     COMM,
     POPM,
@@ -33,7 +33,9 @@ from mutagen.id3._frames import (
     TYER,
     USLT,
     WOAR,
+    Frame,
 )
+from mutagen.id3._tags import ID3Header
 from mutagen.id3._util import ID3NoHeaderError
 
 from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
@@ -43,6 +45,9 @@ from ....utils.tool_path_resolver import get_tool_path
 if TYPE_CHECKING:
     from ...._audio_file import _AudioFile
 from ....exceptions import FileCorruptedError, MetadataFieldNotSupportedByMetadataFormatError
+from ....utils.metadata_format import MetadataFormat
+from ....utils.metadata_write_report import MetadataWriteReport
+from ....utils.padding_policy import PaddingFunction, get_padding
 from ....utils.rating_profiles import RatingWriteProfile
 from ....utils.types import RawMetadataDict, RawMetadataKey, UnifiedMetadata, UnifiedMetadataValue
 from ..._MetadataManager import _MetadataManager as MetadataManager
@@ -50,6 +55,29 @@ from .._RatingSupportingMetadataManager import _RatingSupportingMetadataManager
 from ._id3v2_constants import ID3V2_DATE_FORMAT_LENGTH, ID3V2_VERSION_3, ID3V2_VERSION_4
 
 
+class _ProjectedId3Frames(dict[str, type[Frame]]):
+    """Frame classes of mutagen in which only the frames to read can be looked up.
+
+    mutagen looks up the class of each frame by its ID and keeps the frames without a class as undecoded bytes, so the
+    other frames, such as APIC pictures, are skipped without being decoded. Membership still covers all the frames, as
+    mutagen relies on it to detect how the frame sizes of ID3v2.4 tags are encoded.
+
+    Args:
+        frame_ids: IDs of the frames to read, as ID3v2.3/2.4 IDs. The matching ID3v2.2 frames are read too
+    """
+
+    def __init__(self, frame_ids: frozenset[str]):
+        super().__init__({**Frames, **Frames_2_2})
+        self.frame_ids = frame_ids | {
+            frame_id for frame_id, frame_class in Frames_2_2.items() if frame_class.__base__.__name__ in frame_ids
+        }
+
+    def __getitem__(self, frame_id: str) -> type[Frame]:
+        if frame_id not in self.frame_ids:
+            raise KeyError(frame_id)
+        return super().__getitem__(frame_id)
+
+
 class _Id3v2Manager(_RatingSupportingMetadataManager):
     """ID3v2 metadata manager for audio files.
 
@@ -262,8 +290,10 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
         audio_file: "_AudioFile",
         normalized_rating_max_value: int | None = None,
         id3v2_version: tuple[int, int, int] = (2, 3, 0),
+        padding: PaddingFunction | None = None,
     ):
         self.id3v2_version = id3v2_version
+        self.padding = padding
         metadata_keys_direct_map_read = {
             UnifiedMetadataKey.TITLE: self.Id3TextFrame.TITLE,
             UnifiedMetadataKey.ARTISTS: self.Id3TextFrame.ARTISTS,
@@ -317,9 +347,23 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
             normalized_rating_max_value=normalized_rating_max_value,
         )
 
+    def _get_raw_keys_read(self, unified_metadata_key: UnifiedMetadataKey) -> tuple[str, ...]:
+        if unified_metadata_key == UnifiedMetadataKey.RATING:
+            return (self.Id3TextFrame.RATING,)
+        if unified_metadata_key in (UnifiedMetadataKey.DISC_NUMBER, UnifiedMetadataKey.DISC_TOTAL):
+            return (self.Id3TextFrame.DISC_NUMBER,)
+        if unified_metadata_key == UnifiedMetadataKey.REPLAYGAIN:
+            return ("TXXX",)
+        if unified_metadata_key == UnifiedMetadataKey.RELEASE_DATE:
+            return (self.Id3TextFrame.RECORDING_TIME, self.Id3TextFrame.YEAR, self.Id3TextFrame.DATE)
+        return super()._get_raw_keys_read(unified_metadata_key)
+
     def _extract_mutagen_metadata(self) -> RawMetadataDict:
+        context = self.audio_file.get_context()
+        raw_keys_to_read = self._get_raw_keys_to_read()
+        known_frames = None if raw_keys_to_read is None else _ProjectedId3Frames(raw_keys_to_read)
         try:
-            id3 = ID3(self.audio_file.file_path, load_v1=False, translate=False)
+            id3 = ID3(context.get_rewound_fileobj(), known_frames=known_frames, load_v1=False, translate=False)
 
             # Upgrade to specified version if different
             if id3.version != self.id3v2_version:
@@ -328,7 +372,7 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
             return cast(RawMetadataDict, id3)
         except ID3NoHeaderError:
             try:
-                id3 = ID3(self.audio_file.file_path, load_v1=True, translate=False)
+                id3 = ID3(context.get_rewound_fileobj(), load_v1=True, translate=False)
                 id3.clear()  # Exclude ID3v1 tags
                 id3.version = self.id3v2_version
                 return cast(RawMetadataDict, id3)
@@ -650,70 +694,41 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
         # Add one frame with multiple text values (mutagen handles null separation)
         raw_mutagen_metadata_id3.add(text_frame_class(encoding=3, text=values))
 
-    def _preserve_id3v1_metadata(self, file_path: str) -> bytes | None:
-        """Read and preserve existing ID3v1 metadata from the end of the file.
+    def _save_with_version(self, file_path: str) -> None:
+        """Save the ID3v2 tag at the start of the file with the configured version, leaving the rest of it untouched.
 
-        Returns:
-            The 128-byte ID3v1 tag data if present, None otherwise
+        mutagen's ID3.save() is not used as is because it always rewrites (or removes) the ID3v1 tag from the ID3v2
+        frames. Here the tag is serialized by mutagen and written in place when it fits in the size of the existing tag,
+        padding included, and the padding policy keeps that size. Otherwise the data after the tag is shifted once with
+        a streaming block copy. The audio data and any ID3v1 tag at the end of the file are never read into memory.
         """
-        with Path(file_path).open("rb") as f:
-            f.seek(-128, 2)  # Seek to last 128 bytes
-            data = f.read(128)
-            if data.startswith(b"TAG"):
-                return data
-        return None
-
-    def _save_with_id3v1_preservation(self, file_path: str, id3v1_data: bytes | None) -> None:
-        """Save ID3v2 metadata while preserving ID3v1 data.
-
-        Args:
-            file_path: Path to the audio file
-            id3v1_data: The 128-byte ID3v1 tag data to preserve, or None
-        """
-        if self.raw_mutagen_metadata is not None:
-            # Extract the major version number from the tuple (2, 3, 0) -> 3
-            version_major = self.id3v2_version[1]
-            id3_metadata: ID3 = cast(ID3, self.raw_mutagen_metadata)
-
-            if id3v1_data:
-                # Save to a temporary file first
-                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-                    temp_path = temp_file.name
-
-                try:
-                    # Copy the original file to temp file first
-                    shutil.copy2(file_path, temp_path)
-
-                    # Save ID3v2 to temp file (this will overwrite ID3v2 tags in the copy)
-                    id3_metadata.save(temp_path, v2_version=version_major)
-
-                    # Read the temp file and append ID3v1 data
-                    with Path(temp_path).open("rb") as f:
-                        temp_data = f.read()
-
-                    # Append ID3v1 data to the temp file
-                    final_data = temp_data + id3v1_data
-
-                    # Write the final file
-                    with Path(file_path).open("wb") as f:
-                        f.write(final_data)
+        if self.raw_mutagen_metadata is None:
+            return
+        id3_metadata: ID3 = cast(ID3, self.raw_mutagen_metadata)
 
-                finally:
-                    # Clean up temp file
-                    with contextlib.suppress(OSError):
-                        Path(temp_path).unlink()
-            else:
-                # No ID3v1 data to preserve, save normally
-                id3_metadata.save(file_path, v2_version=version_major)
+        with Path(file_path).open("r+b") as f:
+            try:
+                old_size = ID3Header(f).size
+            except ID3NoHeaderError:
+                old_size = 0
+            padding_sizes = []
 
-    def _save_with_version(self, file_path: str) -> None:
-        """Save ID3 tags with the specified version, preserving existing ID3v1 metadata."""
-        if self.raw_mutagen_metadata is not None:
-            # Preserve existing ID3v1 metadata before saving ID3v2
-            id3v1_data = self._preserve_id3v1_metadata(file_path)
+            def get_tag_padding(info: PaddingInfo) -> int:
+                padding_sizes.append(get_padding(self.padding, old_size, old_size - info.padding, info.size))
+                return padding_sizes[-1]
 
-            # Save ID3v2 while preserving ID3v1
-            self._save_with_id3v1_preservation(file_path, id3v1_data)
+            # Extract the major version number from the tuple (2, 3, 0) -> 3
+            data = id3_metadata._prepare_data(f, 0, old_size, self.id3v2_version[1], "/", get_tag_padding)
+            resize_bytes(f, old_size, len(data), 0)
+            f.seek(0)
+            f.write(data)
+
+        self.last_write_report = MetadataWriteReport(
+            MetadataFormat.ID3V2,
+            in_place=len(data) == old_size,
+            tag_size=len(data) - padding_sizes[-1],
+            padding_size=padding_sizes[-1],
+        )
 
     def update_metadata(self, unified_metadata: UnifiedMetadata) -> None:
         """Update ID3v2 metadata using hybrid approach: mutagen for most formats, external tools for FLAC.
@@ -755,7 +770,11 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
         """
         # For FLAC files, use external tools instead of mutagen to avoid file corruption
         if self.audio_file.file_extension == ".flac":
-            self._update_metadata_for_flac(unified_metadata)
+            self.audio_file.invalidate_context()
+            try:
+                self._update_metadata_for_flac(unified_metadata)
+            finally:
+                self.audio_file.invalidate_context()
             return
 
         if not self.metadata_keys_direct_map_write:
@@ -764,9 +783,6 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
 
         self._validate_and_process_rating(unified_metadata)
 
-        # Preserve ID3v1 metadata before any modifications
-        id3v1_data = self._preserve_id3v1_metadata(self.audio_file.file_path)
-
         # Update the raw mutagen metadata (without saving yet)
         if self.raw_mutagen_metadata is None:
             self.raw_mutagen_metadata = cast(MutagenMetadata, self._extract_mutagen_metadata())
@@ -793,8 +809,13 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
                     unified_metadata_key=unified_metadata_key,
                 )
 
-        # Save with ID3v1 preservation
-        self._save_with_id3v1_preservation(self.audio_file.file_path, id3v1_data)
+        # Save in place, the ID3v1 tag at the end of the file is left as is. The file is written while no memory map of
+        # it is open
+        self.audio_file.invalidate_context()
+        try:
+            self._save_with_version(self.audio_file.file_path)
+        finally:
+            self.audio_file.invalidate_context()
 
     def _update_metadata_for_flac(self, unified_metadata: UnifiedMetadata) -> None:
         """Update ID3v2 metadata for FLAC files using external tools to avoid file corruption."""
@@ -907,6 +928,7 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
         Returns:
             bool: True if metadata was successfully deleted, False otherwise
         """
+        self.audio_file.invalidate_context()
         try:
             # Create a new ID3 instance and use delete() to remove all ID3v2 tags
             id3 = ID3(self.audio_file.file_path)
@@ -918,6 +940,8 @@ class _Id3v2Manager(_RatingSupportingMetadataManager):
             return False
         else:
             return True
+        finally:
+            self.audio_file.invalidate_context()
 
     def get_header_info(self) -> dict:
         try:
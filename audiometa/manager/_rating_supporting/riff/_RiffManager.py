@@ -1,43 +1,56 @@
 import contextlib
 import os
+import struct
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from mutagen._file import FileType as MutagenMetadata
-from mutagen.wave import WAVE
+from mutagen._util import resize_bytes
 
 if TYPE_CHECKING:
     from ...._audio_file import _AudioFile
+    from ...._audio_file_context import _AudioFileContext, _RiffChunk
 from ....exceptions import ConfigurationError, FileTypeNotSupportedError, MetadataFieldNotSupportedByMetadataFormatError
 from ....utils.id3v1_genre_code_map import ID3V1_GENRE_CODE_MAP
 from ....utils.rating_profiles import RatingWriteProfile
 from ....utils.types import RawMetadataDict, RawMetadataKey, UnifiedMetadata, UnifiedMetadataValue
 from ....utils.unified_metadata_key import UnifiedMetadataKey
 from .._RatingSupportingMetadataManager import _RatingSupportingMetadataManager
-from ..id3v2._id3v2_constants import ID3V2_HEADER_SIZE
 from ._riff_constants import (
     BEXT_LOUDNESS_METADATA_SIZE,
     BEXT_MIN_CHUNK_SIZE,
     BEXT_ORIGINATION_DATE_SIZE,
     BEXT_ORIGINATION_TIME_SIZE,
     BWF_V2_VERSION,
+    RF64_SIZE_PLACEHOLDER,
     RIFF_AUDIO_FORMAT_IEEE_FLOAT,
+    RIFF_CHUNK_HEADER_SIZE,
     RIFF_CHUNK_ID_SIZE,
     RIFF_FORMAT_CHUNK_MIN_SIZE,
     RIFF_HEADER_SIZE,
-    RIFF_MIN_DATA_SIZE_FOR_ID3V2,
-    RIFF_WAVE_FORMAT_POSITION,
+    RIFF_INFO_LIST_TYPE,
 )
 
 
+@dataclass(frozen=True)
+class _RiffInfoMetadata:
+    """Raw RIFF metadata of a file, standing in for a mutagen object since mutagen cannot read INFO chunks.
+
+    The info attribute maps the FourCC of each INFO tag to its values, mirroring the info attribute of the mutagen
+    WAVE object that was previously built and then overwritten.
+    """
+
+    info: dict[str, list[str]]
+
+
 class _RiffManager(_RatingSupportingMetadataManager):
     """Manages RIFF metadata for WAV audio files.
 
     Implementation Note:
-    While mutagen is used for reading WAV metadata, it does not support writing RIFF metadata. This is a known
-    limitation of the library, which only provides read-only access to WAVE files' metadata through its WAVE class.
-    Therefore, this manager implements its own RIFF metadata writing functionality by directly manipulating the file's
-    INFO chunk according to the RIFF specification.
+    Mutagen does not support RIFF metadata: its WAVE class only provides access to ID3 tags stored in WAVE files.
+    Therefore, this manager implements its own RIFF metadata reading and writing functionality by directly parsing and
+    manipulating the file's INFO chunk according to the RIFF specification.
 
     RIFF Format:
     RIFF (Resource Interchange File Format) is the standard metadata format for WAV files. The INFO chunk in RIFF/WAV
@@ -156,95 +169,88 @@ class _RiffManager(_RatingSupportingMetadataManager):
             update_using_mutagen_metadata=False,
         )
 
-    def _skip_id3v2_tags(self, data: bytes) -> bytes:
-        """Skip ID3v2 tags if present at the start of the file.
+    def _find_chunk(self, context: "_AudioFileContext", chunk_id: bytes) -> "_RiffChunk | None":
+        """Find the first chunk with the given ID in the chunk index of the file."""
+        for chunk in context.get_riff_chunks():
+            if chunk.chunk_id == chunk_id:
+                return chunk
+        return None
+
+    def _find_info_chunk(self, context: "_AudioFileContext") -> "_RiffChunk | None":
+        """Find the first LIST chunk of type INFO in the chunk index of the file.
 
-        Returns the data starting from after any ID3v2 tags.
+        Raises:
+            ValueError: If the file has no valid RIFF/WAVE header
         """
-        if data.startswith(b"ID3"):
-            # ID3v2 header is 10 bytes:
-            # 3 bytes: ID3
-            # 2 bytes: version
-            # 1 byte: flags
-            # 4 bytes: size (synchsafe integer)
-            if len(data) < ID3V2_HEADER_SIZE:
-                return data
-
-            # Get size from synchsafe integer (7 bits per byte)
-            size_bytes = data[6:ID3V2_HEADER_SIZE]
-            size = (
-                ((size_bytes[0] & 0x7F) << 21)
-                | ((size_bytes[1] & 0x7F) << 14)
-                | ((size_bytes[2] & 0x7F) << 7)
-                | (size_bytes[3] & 0x7F)
-            )
+        for chunk in context.get_riff_chunks():
+            if (
+                chunk.chunk_id == b"LIST"
+                and context.read_header_bytes(chunk.data_offset, RIFF_CHUNK_ID_SIZE) == RIFF_INFO_LIST_TYPE
+            ):
+                return chunk
+        return None
+
+    def _read_chunk_data(self, context: "_AudioFileContext", chunk: "_RiffChunk") -> bytes:
+        """Read the payload of a chunk, stopping at the end of the file if the chunk is truncated."""
+        return context.read_at(chunk.data_offset, max(0, min(chunk.size, context.size - chunk.data_offset)))
 
-            # Skip the header (10 bytes) plus the size of the tag
-            return data[ID3V2_HEADER_SIZE + size :]
-        return data
+    def _view_chunk_data(self, context: "_AudioFileContext", chunk: "_RiffChunk") -> memoryview:
+        """Get the payload of a chunk without copying it, stopping at the end of the file if the chunk is truncated."""
+        return context.view_at(chunk.data_offset, max(0, min(chunk.size, context.size - chunk.data_offset)))
 
-    def _extract_riff_metadata_directly(self, file_data: bytes) -> dict[str, list[str]]:
-        """Manually extract metadata from RIFF chunks without relying on external libraries.
+    def _extract_riff_metadata_directly(
+        self, info_data: bytes | memoryview, field_ids: frozenset[str] | None = None
+    ) -> dict[str, list[str]]:
+        """Manually extract metadata from the payload of a LIST/INFO chunk without relying on external libraries.
 
-        This method directly parses the RIFF structure to extract metadata from the INFO chunk.
+        Args:
+            info_data: The LIST chunk payload, starting with the INFO list type. Only the values of the extracted
+                subchunks are copied out of a view
+            field_ids: FourCCs of the subchunks to extract, or None to extract all of them. Other subchunks are skipped
+                without being decoded
         """
         info_tags: dict[str, list[str]] = {}
-
-        # Skip ID3v2 if present
-        file_data = self._skip_id3v2_tags(file_data)
-
-        # Validate RIFF header
-        if (
-            len(file_data) < RIFF_HEADER_SIZE
-            or file_data[:RIFF_CHUNK_ID_SIZE] != b"RIFF"
-            or file_data[RIFF_WAVE_FORMAT_POSITION:RIFF_HEADER_SIZE] != b"WAVE"
-        ):
+        if info_data[:RIFF_CHUNK_ID_SIZE] != RIFF_INFO_LIST_TYPE:
             return info_tags
 
-        pos = 12  # Start after RIFF header
-        while pos < len(file_data) - 8:
-            chunk_id = file_data[pos : pos + 4]
-            chunk_size = int.from_bytes(file_data[pos + 4 : pos + 8], "little")
-
-            if chunk_id == b"LIST" and pos + 12 <= len(file_data) and file_data[pos + 8 : pos + 12] == b"INFO":
-                # Process INFO chunk
-                info_pos = pos + 12
-                info_end = pos + 8 + chunk_size
-
-                while info_pos < info_end - 8:
-                    # Extract each metadata field
-                    field_id = file_data[info_pos : info_pos + 4].decode("ascii", errors="ignore")
-                    field_size = int.from_bytes(file_data[info_pos + 4 : info_pos + 8], "little")
-
-                    if field_size > 0 and info_pos + 8 + field_size <= info_end:
-                        # -1 to exclude null terminator
-                        field_data = file_data[info_pos + 8 : info_pos + 8 + field_size - 1]
-                        try:
-                            # Decode and handle null-terminated strings
-                            field_value = field_data.decode("utf-8", errors="ignore")
-                            # Split on null byte and take first part if exists
-                            field_value = field_value.split("\x00")[0].strip()
-                            # Compare field_id with enum member values (FourCC strings)
-                            if (
-                                any(field_id == member.value for member in self.RiffTagKey.__members__.values())
-                                and field_value
-                            ):
-                                if field_id not in info_tags:
-                                    info_tags[field_id] = []
-                                info_tags[field_id].append(field_value)
-                        except UnicodeDecodeError:
-                            pass
-
-                    # Move to next field, maintaining alignment
-                    info_pos += 8 + ((field_size + 1) & ~1)
-                break
-
-            # Move to next chunk, maintaining alignment
-            pos += 8 + ((chunk_size + 1) & ~1)
+        info_pos = RIFF_CHUNK_ID_SIZE
+        info_end = len(info_data)
+        while info_pos < info_end - 8:
+            # Extract each metadata field
+            field_id = str(info_data[info_pos : info_pos + 4], "ascii", errors="ignore")
+            field_size = int.from_bytes(info_data[info_pos + 4 : info_pos + 8], "little")
+
+            is_field_read = field_ids is None or field_id in field_ids
+            if is_field_read and field_size > 0 and info_pos + 8 + field_size <= info_end:
+                # -1 to exclude null terminator
+                field_data = info_data[info_pos + 8 : info_pos + 8 + field_size - 1]
+                try:
+                    # Decode and handle null-terminated strings
+                    field_value = str(field_data, "utf-8", errors="ignore")
+                    # Split on null byte and take first part if exists
+                    field_value = field_value.split("\x00")[0].strip()
+                    # Compare field_id with enum member values (FourCC strings)
+                    if any(field_id == member.value for member in self.RiffTagKey.__members__.values()) and field_value:
+                        if field_id not in info_tags:
+                            info_tags[field_id] = []
+                        info_tags[field_id].append(field_value)
+                except UnicodeDecodeError:
+                    pass
+
+            # Move to next field, maintaining alignment
+            info_pos += 8 + ((field_size + 1) & ~1)
 
         return info_tags
 
-    def _extract_bext_chunk(self, file_data: bytes) -> dict[str, Any] | None:
+    def _read_info_tags(self, context: "_AudioFileContext") -> dict[str, list[str]]:
+        """Read the INFO tags of the file, loading only the payload of its LIST/INFO chunk."""
+        info_chunk = self._find_info_chunk(context)
+        if info_chunk is None:
+            return {}
+        with self._view_chunk_data(context, info_chunk) as info_data:
+            return self._extract_riff_metadata_directly(info_data, field_ids=self._get_raw_keys_to_read())
+
+    def _extract_bext_chunk(self, context: "_AudioFileContext") -> dict[str, Any] | None:
         """Extract and parse the bext chunk from BWF files.
 
         BWF has multiple versions:
@@ -275,160 +281,137 @@ class _RiffManager(_RatingSupportingMetadataManager):
         Returns:
             Dictionary with parsed bext fields or None if bext chunk not found
         """
-        # Skip ID3v2 if present
-        file_data = self._skip_id3v2_tags(file_data)
-
-        # Validate RIFF header
-        if (
-            len(file_data) < RIFF_HEADER_SIZE
-            or file_data[:RIFF_CHUNK_ID_SIZE] != b"RIFF"
-            or file_data[RIFF_WAVE_FORMAT_POSITION:RIFF_HEADER_SIZE] != b"WAVE"
-        ):
+        bext_chunk = self._find_chunk(context, b"bext")
+        if bext_chunk is None:
             return None
 
-        pos = 12  # Start after RIFF header
-        while pos < len(file_data) - 8:
-            chunk_id = file_data[pos : pos + 4]
-            chunk_size = int.from_bytes(file_data[pos + 4 : pos + 8], "little")
-
-            if chunk_id == b"bext":
-                # Found bext chunk
-                bext_data_start = pos + 8
-                bext_data_end = bext_data_start + chunk_size
-
-                if bext_data_end > len(file_data):
-                    return None
-
-                bext_data = file_data[bext_data_start:bext_data_end]
-
-                # Minimum bext chunk size is 602 bytes (256+32+32+10+8+8+2+64+190)
-                if len(bext_data) < BEXT_MIN_CHUNK_SIZE:
-                    return None
-
-                bext_fields: dict[str, Any] = {}
-
-                # Parse fixed fields
-                offset = 0
-
-                # Description (256 bytes)
-                description_bytes = bext_data[offset : offset + 256]
-                description = description_bytes.split(b"\x00")[0].decode("ascii", errors="ignore").strip()
-                if description:
-                    bext_fields["Description"] = description
-                offset += 256
-
-                # Originator (32 bytes)
-                originator_bytes = bext_data[offset : offset + 32]
-                originator = originator_bytes.split(b"\x00")[0].decode("ascii", errors="ignore").strip()
-                if originator:
-                    bext_fields["Originator"] = originator
-                offset += 32
-
-                # OriginatorReference (32 bytes)
-                originator_ref_bytes = bext_data[offset : offset + 32]
-                originator_ref = originator_ref_bytes.split(b"\x00")[0].decode("ascii", errors="ignore").strip()
-                if originator_ref:
-                    bext_fields["OriginatorReference"] = originator_ref
-                offset += 32
-
-                # OriginationDate (10 bytes, YYYY-MM-DD)
-                origination_date_bytes = bext_data[offset : offset + BEXT_ORIGINATION_DATE_SIZE]
-                origination_date = origination_date_bytes.decode("ascii", errors="ignore").strip()
-                if origination_date and len(origination_date) == BEXT_ORIGINATION_DATE_SIZE:
-                    bext_fields["OriginationDate"] = origination_date
-                offset += BEXT_ORIGINATION_DATE_SIZE
-
-                # OriginationTime (8 bytes, HH:MM:SS)
-                origination_time_bytes = bext_data[offset : offset + BEXT_ORIGINATION_TIME_SIZE]
-                origination_time = origination_time_bytes.decode("ascii", errors="ignore").strip()
-                if origination_time and len(origination_time) == BEXT_ORIGINATION_TIME_SIZE:
-                    bext_fields["OriginationTime"] = origination_time
-                offset += BEXT_ORIGINATION_TIME_SIZE
-
-                # TimeReference (8 bytes, uint64, little-endian)
-                if offset + 8 <= len(bext_data):
-                    time_reference = int.from_bytes(bext_data[offset : offset + 8], "little")
-                    bext_fields["TimeReference"] = time_reference
-                offset += 8
-
-                # Version (2 bytes, uint16, little-endian)
-                if offset + 2 <= len(bext_data):
-                    version = int.from_bytes(bext_data[offset : offset + 2], "little")
-                    bext_fields["Version"] = version
-                offset += 2
+        bext_data = self._read_chunk_data(context, bext_chunk)
+        if len(bext_data) < bext_chunk.size:
+            return None
 
-                # UMID (64 bytes, binary)
-                if offset + 64 <= len(bext_data):
-                    umid_bytes = bext_data[offset : offset + 64]
-                    # Check if UMID is not all zeros
-                    if any(umid_bytes):
-                        # Format as hex string for readability
-                        umid_hex = umid_bytes.hex().upper()
-                        bext_fields["UMID"] = umid_hex
-                offset += 64
-
-                # Reserved (190 bytes) - in BWF v2, loudness metadata is stored at the START of reserved bytes
-                # Parse loudness metadata if BWF v2 (version >= 2)
-                if version >= BWF_V2_VERSION and offset + BEXT_LOUDNESS_METADATA_SIZE <= len(bext_data):
-                    # Loudness metadata starts at offset 412 (start of reserved bytes area)
-                    # LoudnessValue (2 bytes, int16, little-endian, stored as 0.01 LU units by bwfmetaedit)
-                    loudness_value_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
-                    if loudness_value_raw != 0:  # 0 means not set
-                        # bwfmetaedit stores as 0.01 units, convert to LU
-                        bext_fields["LoudnessValue"] = round(loudness_value_raw / 100.0, 2)
-                    offset += 2
-
-                    # LoudnessRange (2 bytes, int16, little-endian, stored as 0.01 LU units)
-                    if offset + 2 <= len(bext_data):
-                        loudness_range_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
-                        if loudness_range_raw != 0:  # 0 means not set
-                            bext_fields["LoudnessRange"] = round(loudness_range_raw / 100.0, 2)
-                        offset += 2
-
-                    # MaxTruePeakLevel (2 bytes, int16, little-endian, stored as 0.01 dB units)
-                    if offset + 2 <= len(bext_data):
-                        max_true_peak_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
-                        if max_true_peak_raw != 0:  # 0 means not set
-                            bext_fields["MaxTruePeakLevel"] = round(max_true_peak_raw / 100.0, 2)
-                        offset += 2
-
-                    # MaxMomentaryLoudness (2 bytes, int16, little-endian, stored as 0.01 LU units)
-                    if offset + 2 <= len(bext_data):
-                        max_momentary_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
-                        if max_momentary_raw != 0:  # 0 means not set
-                            bext_fields["MaxMomentaryLoudness"] = round(max_momentary_raw / 100.0, 2)
-                        offset += 2
-
-                    # MaxShortTermLoudness (2 bytes, int16, little-endian, stored as 0.01 LU units)
-                    if offset + 2 <= len(bext_data):
-                        max_short_term_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
-                        if max_short_term_raw != 0:  # 0 means not set
-                            bext_fields["MaxShortTermLoudness"] = round(max_short_term_raw / 100.0, 2)
-                        offset += 2
-
-                    # Skip remaining reserved bytes (190 - 10 = 180 bytes)
-                    offset += 180
-                else:
-                    # Skip all reserved bytes if not v2
-                    offset += 190
+        # Minimum bext chunk size is 602 bytes (256+32+32+10+8+8+2+64+190)
+        if len(bext_data) < BEXT_MIN_CHUNK_SIZE:
+            return None
 
-                # CodingHistory (variable length, null-terminated)
-                if offset < len(bext_data):
-                    coding_history_bytes = bext_data[offset:]
-                    # Find null terminator or end of chunk
-                    null_pos = coding_history_bytes.find(b"\x00")
-                    if null_pos >= 0:
-                        coding_history_bytes = coding_history_bytes[:null_pos]
-                    coding_history = coding_history_bytes.decode("ascii", errors="ignore").strip()
-                    if coding_history:
-                        bext_fields["CodingHistory"] = coding_history
+        bext_fields: dict[str, Any] = {}
+
+        # Parse fixed fields
+        offset = 0
+
+        # Description (256 bytes)
+        description_bytes = bext_data[offset : offset + 256]
+        description = description_bytes.split(b"\x00")[0].decode("ascii", errors="ignore").strip()
+        if description:
+            bext_fields["Description"] = description
+        offset += 256
+
+        # Originator (32 bytes)
+        originator_bytes = bext_data[offset : offset + 32]
+        originator = originator_bytes.split(b"\x00")[0].decode("ascii", errors="ignore").strip()
+        if originator:
+            bext_fields["Originator"] = originator
+        offset += 32
+
+        # OriginatorReference (32 bytes)
+        originator_ref_bytes = bext_data[offset : offset + 32]
+        originator_ref = originator_ref_bytes.split(b"\x00")[0].decode("ascii", errors="ignore").strip()
+        if originator_ref:
+            bext_fields["OriginatorReference"] = originator_ref
+        offset += 32
+
+        # OriginationDate (10 bytes, YYYY-MM-DD)
+        origination_date_bytes = bext_data[offset : offset + BEXT_ORIGINATION_DATE_SIZE]
+        origination_date = origination_date_bytes.decode("ascii", errors="ignore").strip()
+        if origination_date and len(origination_date) == BEXT_ORIGINATION_DATE_SIZE:
+            bext_fields["OriginationDate"] = origination_date
+        offset += BEXT_ORIGINATION_DATE_SIZE
+
+        # OriginationTime (8 bytes, HH:MM:SS)
+        origination_time_bytes = bext_data[offset : offset + BEXT_ORIGINATION_TIME_SIZE]
+        origination_time = origination_time_bytes.decode("ascii", errors="ignore").strip()
+        if origination_time and len(origination_time) == BEXT_ORIGINATION_TIME_SIZE:
+            bext_fields["OriginationTime"] = origination_time
+        offset += BEXT_ORIGINATION_TIME_SIZE
+
+        # TimeReference (8 bytes, uint64, little-endian)
+        if offset + 8 <= len(bext_data):
+            time_reference = int.from_bytes(bext_data[offset : offset + 8], "little")
+            bext_fields["TimeReference"] = time_reference
+        offset += 8
+
+        # Version (2 bytes, uint16, little-endian)
+        if offset + 2 <= len(bext_data):
+            version = int.from_bytes(bext_data[offset : offset + 2], "little")
+            bext_fields["Version"] = version
+        offset += 2
+
+        # UMID (64 bytes, binary)
+        if offset + 64 <= len(bext_data):
+            umid_bytes = bext_data[offset : offset + 64]
+            # Check if UMID is not all zeros
+            if any(umid_bytes):
+                # Format as hex string for readability
+                umid_hex = umid_bytes.hex().upper()
+                bext_fields["UMID"] = umid_hex
+        offset += 64
+
+        # Reserved (190 bytes) - in BWF v2, loudness metadata is stored at the START of reserved bytes
+        # Parse loudness metadata if BWF v2 (version >= 2)
+        if version >= BWF_V2_VERSION and offset + BEXT_LOUDNESS_METADATA_SIZE <= len(bext_data):
+            # Loudness metadata starts at offset 412 (start of reserved bytes area)
+            # LoudnessValue (2 bytes, int16, little-endian, stored as 0.01 LU units by bwfmetaedit)
+            loudness_value_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
+            if loudness_value_raw != 0:  # 0 means not set
+                # bwfmetaedit stores as 0.01 units, convert to LU
+                bext_fields["LoudnessValue"] = round(loudness_value_raw / 100.0, 2)
+            offset += 2
+
+            # LoudnessRange (2 bytes, int16, little-endian, stored as 0.01 LU units)
+            if offset + 2 <= len(bext_data):
+                loudness_range_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
+                if loudness_range_raw != 0:  # 0 means not set
+                    bext_fields["LoudnessRange"] = round(loudness_range_raw / 100.0, 2)
+                offset += 2
+
+            # MaxTruePeakLevel (2 bytes, int16, little-endian, stored as 0.01 dB units)
+            if offset + 2 <= len(bext_data):
+                max_true_peak_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
+                if max_true_peak_raw != 0:  # 0 means not set
+                    bext_fields["MaxTruePeakLevel"] = round(max_true_peak_raw / 100.0, 2)
+                offset += 2
 
-                return bext_fields if bext_fields else None
+            # MaxMomentaryLoudness (2 bytes, int16, little-endian, stored as 0.01 LU units)
+            if offset + 2 <= len(bext_data):
+                max_momentary_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
+                if max_momentary_raw != 0:  # 0 means not set
+                    bext_fields["MaxMomentaryLoudness"] = round(max_momentary_raw / 100.0, 2)
+                offset += 2
 
-            # Move to next chunk, maintaining alignment
-            pos += 8 + ((chunk_size + 1) & ~1)
+            # MaxShortTermLoudness (2 bytes, int16, little-endian, stored as 0.01 LU units)
+            if offset + 2 <= len(bext_data):
+                max_short_term_raw = int.from_bytes(bext_data[offset : offset + 2], "little", signed=True)
+                if max_short_term_raw != 0:  # 0 means not set
+                    bext_fields["MaxShortTermLoudness"] = round(max_short_term_raw / 100.0, 2)
+                offset += 2
 
-        return None
+            # Skip remaining reserved bytes (190 - 10 = 180 bytes)
+            offset += 180
+        else:
+            # Skip all reserved bytes if not v2
+            offset += 190
+
+        # CodingHistory (variable length, null-terminated)
+        if offset < len(bext_data):
+            coding_history_bytes = bext_data[offset:]
+            # Find null terminator or end of chunk
+            null_pos = coding_history_bytes.find(b"\x00")
+            if null_pos >= 0:
+                coding_history_bytes = coding_history_bytes[:null_pos]
+            coding_history = coding_history_bytes.decode("ascii", errors="ignore").strip()
+            if coding_history:
+                bext_fields["CodingHistory"] = coding_history
+
+        return bext_fields if bext_fields else None
 
     @contextlib.contextmanager
     def _suppress_output(self) -> Any:
@@ -444,53 +427,37 @@ class _RiffManager(_RatingSupportingMetadataManager):
         """Extract RIFF metadata from WAV files using direct RIFF chunk parsing.
 
         This method reads the WAV file's INFO chunk directly, providing the most reliable way to access RIFF metadata.
+        The tags are parsed straight from the file: no mutagen WAVE object is built, as it would only be discarded, and
+        files starting with an ID3v2 tag do not need to be copied without it first.
         """
-        self.audio_file.seek(0)
-        file_data = self.audio_file.read()
-
-        # Skip ID3v2 metadata if present and create a clean RIFF file for mutagen
-        clean_data = self._skip_id3v2_tags(file_data)
-
-        # Create a temporary file with just the RIFF data for mutagen to parse
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_file.write(clean_data)
-            temp_file.flush()
-
-            try:
-                # Create WAVE object with the clean RIFF data
-                wave = WAVE(filename=temp_file.name)
-                info_tags = self._extract_riff_metadata_directly(file_data)  # Use original data for our custom parsing
-                wave.info = info_tags
-                return cast(RawMetadataDict, wave)
-            finally:
-                # Clean up temporary file
-
-                with contextlib.suppress(OSError):
-                    Path(temp_file.name).unlink()
+        return cast(RawMetadataDict, _RiffInfoMetadata(info=self._read_info_tags(self.audio_file.get_context())))
 
     def _convert_raw_mutagen_metadata_to_dict_with_potential_duplicate_keys(
         self, raw_mutagen_metadata: MutagenMetadata
     ) -> RawMetadataDict:
         """Convert RIFF metadata to dictionary.
 
-        Extracts tags from our custom info_tags attribute which contains the directly parsed INFO chunk data.
+        Extracts tags from the info attribute of the _RiffInfoMetadata built by _extract_mutagen_metadata, which
+        contains the directly parsed INFO chunk data.
         """
-        raw_mutagen_metadata_wav: WAVE = cast(WAVE, raw_mutagen_metadata)
+        info_tags = cast(_RiffInfoMetadata, raw_mutagen_metadata).info
         raw_metadata_dict: dict = {}
 
-        # Get metadata from our custom info which contains the directly parsed INFO chunk
-        if hasattr(raw_mutagen_metadata_wav, "info") and raw_mutagen_metadata_wav.info is not None:
-            info_tags = raw_mutagen_metadata_wav.info
-            for key, value in info_tags.items():
-                # key is a FourCC string; check against enum member values
-                if any(key == member.value for member in self.RiffTagKey.__members__.values()):
-                    # info_tags now contains lists of values, so we can pass them directly
-                    raw_metadata_dict[key] = value
+        for key, value in info_tags.items():
+            # key is a FourCC string; check against enum member values
+            if any(key == member.value for member in self.RiffTagKey.__members__.values()):
+                # info_tags contains lists of values, so we can pass them directly
+                raw_metadata_dict[key] = value
 
         return raw_metadata_dict
 
+    def _get_raw_keys_read(self, unified_metadata_key: UnifiedMetadataKey) -> tuple[str, ...]:
+        if unified_metadata_key == UnifiedMetadataKey.GENRES_NAMES:
+            return (self.RiffTagKey.GENRES_NAMES_OR_CODES,)
+        if unified_metadata_key == UnifiedMetadataKey.RATING:
+            return (self.RiffTagKey.RATING,)
+        return super()._get_raw_keys_read(unified_metadata_key)
+
     def _get_raw_rating_by_traktor_or_not(self, raw_clean_metadata: RawMetadataDict) -> tuple[int | None, bool]:
         # raw_clean_metadata uses FourCC string keys; compare using enum .value
         rating_key = self.RiffTagKey.RATING
@@ -536,54 +503,19 @@ class _RiffManager(_RatingSupportingMetadataManager):
                 msg = f"{unified_metadata_key} metadata not supported by RIFF format"
                 raise MetadataFieldNotSupportedByMetadataFormatError(msg)
 
-        # Read the entire file into a mutable bytearray
-        self.audio_file.seek(0)
-        file_data = bytearray(self.audio_file.read())
-
-        # Check if we should preserve ID3v2 tags based on the calling context
-        # In PRESERVE strategy, we should not strip ID3v2 tags as they will be restored later
-        should_preserve_id3v2 = self._should_preserve_id3v2_tags()
-
-        if should_preserve_id3v2:
-            # For PRESERVE strategy, work with the full file data including ID3v2 tags
-            # We'll write RIFF metadata without affecting the ID3v2 section
-            pass  # file_data already contains the full file including ID3v2
-        else:
-            # For other strategies (CLEANUP, SYNC), strip ID3v2 tags as before
-            skipped_data = self._skip_id3v2_tags(bytes(file_data))
-            file_data = bytearray(skipped_data)
-
-        # Find RIFF header and validate
-        # If ID3v2 tags are present, we need to find the RIFF header after them
-        if should_preserve_id3v2 and file_data.startswith(b"ID3"):
-            # Find RIFF header after ID3v2 tags
-            riff_start = self._find_riff_header_after_id3v2(file_data)
-            if riff_start == -1:
-                msg = "Invalid WAV file format - RIFF header not found after ID3v2 tags"
-                raise MetadataFieldNotSupportedByMetadataFormatError(msg)
-            # Work with the RIFF portion only for metadata updates
-            riff_data = file_data[riff_start:]
-        else:
-            riff_data = file_data
-
-        if (
-            len(riff_data) < RIFF_HEADER_SIZE
-            or bytes(riff_data[:RIFF_CHUNK_ID_SIZE]) != b"RIFF"
-            or bytes(riff_data[RIFF_WAVE_FORMAT_POSITION:RIFF_HEADER_SIZE]) != b"WAVE"
-        ):
+        # Only the chunk headers and the LIST/INFO payload are read, the audio data is never loaded
+        context = self.audio_file.get_context()
+        try:
+            info_chunk = self._find_info_chunk(context)
+        except ValueError as e:
             msg = "Invalid WAV file format"
-            raise MetadataFieldNotSupportedByMetadataFormatError(msg)
-
-        # Find or create LIST INFO chunk in the RIFF data
-        info_chunk_start = self._find_info_chunk_in_file_data(riff_data)
-        if info_chunk_start == -1:
-            info_chunk_start = self._create_info_chunk_after_wave_header(riff_data)
-
-        # Process metadata updates
-        info_chunk_size = int.from_bytes(bytes(riff_data[info_chunk_start + 4 : info_chunk_start + 8]), "little")
+            raise MetadataFieldNotSupportedByMetadataFormatError(msg) from e
 
         # Read existing metadata to preserve it
-        existing_metadata = self._extract_riff_metadata_directly(bytes(riff_data))
+        existing_metadata: dict[str, list[str]] = {}
+        if info_chunk is not None:
+            with self._view_chunk_data(context, info_chunk) as info_data:
+                existing_metadata = self._extract_riff_metadata_directly(info_data)
 
         # Convert existing metadata to unified format for merging
         existing_unified_metadata: UnifiedMetadata = {}
@@ -634,25 +566,13 @@ class _RiffManager(_RatingSupportingMetadataManager):
         new_info_chunk.extend(b"INFO")
         new_info_chunk.extend(new_tags_data)
 
-        # Replace old INFO chunk in RIFF data
-        riff_data[info_chunk_start : info_chunk_start + info_chunk_size + 8] = new_info_chunk
-
-        # Update RIFF chunk size
-        total_size = len(riff_data) - 8  # Exclude RIFF and size fields
-        riff_data[4:8] = total_size.to_bytes(4, "little")
-
-        # If we preserved ID3v2 tags, we need to reconstruct the full file
-        if should_preserve_id3v2 and file_data.startswith(b"ID3"):
-            # Reconstruct the full file with ID3v2 tags + updated RIFF data
-            id3v2_size = self._get_id3v2_size(file_data)
-            final_file_data = bytearray(file_data[:id3v2_size])  # Keep ID3v2 tags
-            final_file_data.extend(riff_data)  # Add updated RIFF data
+        # Replace the old INFO chunk, or add one at the end of the RIFF form so that the audio data is not moved
+        if info_chunk is not None:
+            self._replace_riff_region(
+                info_chunk.offset, RIFF_CHUNK_HEADER_SIZE + info_chunk.padded_size, bytes(new_info_chunk)
+            )
         else:
-            final_file_data = riff_data
-
-        # Write updated file
-        self.audio_file.seek(0)
-        self.audio_file.write(final_file_data)
+            self._replace_riff_region(self._get_new_chunk_offset(context), 0, bytes(new_info_chunk))
 
     def delete_metadata(self) -> bool:
         """Delete all RIFF metadata from the audio file.
@@ -664,76 +584,65 @@ class _RiffManager(_RatingSupportingMetadataManager):
             bool: True if metadata was successfully deleted, False otherwise
         """
         try:
-            # Read the entire file into a mutable bytearray
-            self.audio_file.seek(0)
-            file_data = bytearray(self.audio_file.read())
-
-            # Check if we should preserve ID3v2 tags
-            should_preserve_id3v2 = self._should_preserve_id3v2_tags()
-
-            if should_preserve_id3v2:
-                # For files with ID3v2 tags, work with the RIFF portion only
-                if file_data.startswith(b"ID3"):
-                    # Find RIFF header after ID3v2 tags
-                    riff_start = self._find_riff_header_after_id3v2(file_data)
-                    if riff_start == -1:
-                        return False  # No RIFF header found
-                    riff_data = file_data[riff_start:]
-                else:
-                    riff_data = file_data
-            else:
-                # For files without ID3v2 tags, work with the entire file
-                riff_data = file_data
-
-            # Find and remove LIST INFO chunk
-            info_chunk_start = self._find_info_chunk_in_file_data(riff_data)
-            if info_chunk_start == -1:
+            info_chunk = self._find_info_chunk(self.audio_file.get_context())
+            if info_chunk is None:
                 return True  # No INFO chunk found, consider deletion successful
 
-            # Get the size of the INFO chunk
-            info_chunk_size = int.from_bytes(bytes(riff_data[info_chunk_start + 4 : info_chunk_start + 8]), "little")
-
-            # Remove the INFO chunk
-            riff_data[info_chunk_start : info_chunk_start + info_chunk_size + 8] = b""
-
-            # Update RIFF chunk size
-            total_size = len(riff_data) - 8  # Exclude RIFF and size fields
-            riff_data[4:8] = total_size.to_bytes(4, "little")
-
-            # If we preserved ID3v2 tags, reconstruct the full file
-            if should_preserve_id3v2 and file_data.startswith(b"ID3"):
-                id3v2_size = self._get_id3v2_size(file_data)
-                final_file_data = bytearray(file_data[:id3v2_size])  # Keep ID3v2 tags
-                final_file_data.extend(riff_data)  # Add updated RIFF data
-            else:
-                final_file_data = riff_data
-
-            # Write updated file
-            self.audio_file.seek(0)
-            self.audio_file.write(final_file_data)
+            self._replace_riff_region(info_chunk.offset, RIFF_CHUNK_HEADER_SIZE + info_chunk.padded_size, b"")
         except Exception:
             return False
         else:
             return True
 
-    def _find_info_chunk_in_file_data(self, file_data: bytearray) -> int:
-        pos = 12  # Start after RIFF header
-        while pos < len(file_data) - 8:
-            if (
-                bytes(file_data[pos : pos + 4]) == b"LIST"
-                and pos + 8 < len(file_data)
-                and bytes(file_data[pos + 8 : pos + 12]) == b"INFO"
-            ):
-                return pos
-            chunk_size = int.from_bytes(bytes(file_data[pos + 4 : pos + 8]), "little")
-            pos += 8 + ((chunk_size + 1) & ~1)  # Move to next chunk, maintaining alignment
-        return -1
+    def _get_new_chunk_offset(self, context: "_AudioFileContext") -> int:
+        """Get the offset at which a new chunk is added: right after the last chunk of the RIFF form.
 
-    def _create_info_chunk_after_wave_header(self, file_data: bytearray) -> int:
-        info_chunk = bytearray(b"LIST\x04\x00\x00\x00INFO")  # Minimal INFO chunk
-        insert_pos = 12  # After RIFF+size+WAVE
-        file_data[insert_pos:insert_pos] = info_chunk
-        return insert_pos
+        Appending keeps the audio data where it is. If the last chunk is truncated, the new chunk goes right after the
+        RIFF header (and the ds64 chunk of RF64 files, which must come first) instead.
+        """
+        chunks = context.get_riff_chunks()
+        riff_data_start = context.id3v2_size + RIFF_HEADER_SIZE
+        if not chunks:
+            return riff_data_start
+        end_of_chunks = chunks[-1].data_offset + chunks[-1].padded_size
+        if end_of_chunks <= context.size:
+            return end_of_chunks
+        if chunks[0].chunk_id == b"ds64":
+            return chunks[0].data_offset + chunks[0].padded_size
+        return riff_data_start
+
+    def _replace_riff_region(self, offset: int, old_size: int, data: bytes) -> None:
+        """Replace old_size bytes at offset with data and update the RIFF size accordingly.
+
+        Only the replaced region and the size field are written. If the size changes, the bytes that follow are moved
+        in place by mutagen, which works on a bounded buffer, so memory use does not depend on the size of the file.
+        """
+        context = self.audio_file.get_context()
+        riff_start = context.id3v2_size
+        riff_size = struct.unpack("<I", context.read_header_bytes(riff_start + 4, 4))[0]
+        ds64_chunk = self._find_chunk(context, b"ds64")
+        size_delta = len(data) - old_size
+        self.audio_file.invalidate_context()
+
+        with Path(self.audio_file.file_path).open("r+b") as f:
+            resize_bytes(f, old_size, len(data), offset)
+            f.seek(offset)
+            f.write(data)
+
+            if riff_size == RF64_SIZE_PLACEHOLDER and ds64_chunk is not None:
+                # RF64: the real RIFF size is the first 64-bit field of the ds64 chunk
+                f.seek(ds64_chunk.data_offset)
+                ds64_riff_size = struct.unpack("<Q", f.read(8))[0]
+                f.seek(ds64_chunk.data_offset)
+                f.write(struct.pack("<Q", ds64_riff_size + size_delta))
+            else:
+                if riff_size >= RIFF_CHUNK_HEADER_SIZE:
+                    new_riff_size = riff_size + size_delta
+                else:
+                    # Size left unset by a streaming writer: the RIFF form runs to the end of the file
+                    new_riff_size = f.seek(0, os.SEEK_END) - riff_start - RIFF_CHUNK_HEADER_SIZE
+                f.seek(riff_start + 4)
+                f.write(struct.pack("<I", min(new_riff_size, RF64_SIZE_PLACEHOLDER)))
 
     def _get_riff_key_for_metadata(
         self, app_key: UnifiedMetadataKey, _value: UnifiedMetadataValue
@@ -793,147 +702,36 @@ class _RiffManager(_RatingSupportingMetadataManager):
                 return cast(int | None, code)
         return cast(int | None, 12)  # Default to 'Other' genre if not found
 
-    def _should_preserve_id3v2_tags(self) -> bool:
-        """Determine if ID3v2 tags should be preserved based on the calling context and file state.
-
-        This method detects if the RIFF manager is being called in a PRESERVE strategy
-        context by checking the call stack. In PRESERVE strategy, the high-level
-        _handle_metadata_strategy function will restore ID3v2 metadata after RIFF
-        writing, so we should not strip it.
-
-        We preserve ID3v2 tags when:
-        1. We're in a PRESERVE strategy context AND we're writing to RIFF format
-        2. We're in a SYNC strategy context AND we're writing to RIFF format
-        3. ID3v2 tags exist in the file (for coexistence support)
-        """
-        import inspect
-
-        # First, check if ID3v2 tags exist in the file
-        # This allows coexistence even when not in a strategy context
-        try:
-            with Path(self.audio_file.file_path).open("rb") as f:
-                first_bytes = f.read(10)
-                if first_bytes.startswith(b"ID3"):
-                    # ID3v2 tags exist, preserve them for coexistence
-                    return True
-        except Exception:
-            # If we can't read the file, fall back to strategy detection
-            pass
-
-        # Get the call stack
-        frame = inspect.currentframe()
-        try:
-            # Look for _handle_metadata_strategy in the call stack
-            while frame:
-                if (
-                    frame.f_code.co_name == "_handle_metadata_strategy"
-                    and "strategy" in frame.f_locals
-                    and "target_format_actual" in frame.f_locals
-                ):
-                    # Check if we're in the PRESERVE strategy branch
-                    # Look at the local variables to determine the strategy and target format
-                    strategy = frame.f_locals["strategy"]
-                    target_format = frame.f_locals["target_format_actual"]
-                    from audiometa.utils.metadata_format import MetadataFormat
-                    from audiometa.utils.metadata_writing_strategy import MetadataWritingStrategy
-
-                    # Preserve ID3v2 tags when:
-                    # 1. PRESERVE strategy and target format is RIFF (preserve existing ID3v2 tags)
-                    # 2. SYNC strategy and target format is RIFF
-                    #    (preserve ID3v2 tags that were written by other managers)
-                    if strategy in (MetadataWritingStrategy.PRESERVE, MetadataWritingStrategy.SYNC):
-                        return bool(target_format == MetadataFormat.RIFF)
-                    return False
-                frame = frame.f_back
-        finally:
-            del frame
-
-        # Default to not preserving (for backward compatibility)
-        return False
-
-    def _find_riff_header_after_id3v2(self, file_data: bytearray) -> int:
-        """Find the RIFF header after ID3v2 tags in the file data.
-
-        Returns the position of the RIFF header or -1 if not found.
-        """
-        if not file_data.startswith(b"ID3"):
-            return -1
-
-        # Skip ID3v2 tags using existing method
-        skipped_data = self._skip_id3v2_tags(bytes(file_data))
-        if not skipped_data.startswith(b"RIFF"):
-            return -1
-
-        # Calculate the position where RIFF starts
-        return len(file_data) - len(skipped_data)
-
-    def _get_id3v2_size(self, file_data: bytearray) -> int:
-        """Get the size of ID3v2 tags at the beginning of the file.
-
-        Returns the total size including header and data.
-        """
-        if not file_data.startswith(b"ID3"):
-            return 0
-
-        if len(file_data) < RIFF_MIN_DATA_SIZE_FOR_ID3V2:
-            return 0
-
-        # Get size from synchsafe integer (7 bits per byte)
-        size_bytes = file_data[6:ID3V2_HEADER_SIZE]
-        size = (
-            ((size_bytes[0] & 0x7F) << 21)
-            | ((size_bytes[1] & 0x7F) << 14)
-            | ((size_bytes[2] & 0x7F) << 7)
-            | (size_bytes[3] & 0x7F)
-        )
-
-        return 10 + size  # Header (10 bytes) + data size
-
     def get_header_info(self) -> dict:
         try:
-            # Read file data to analyze RIFF structure
-            self.audio_file.seek(0)
-            file_data = self.audio_file.read()
-
-            if (
-                len(file_data) < RIFF_HEADER_SIZE
-                or not file_data.startswith(b"RIFF")
-                or file_data[RIFF_WAVE_FORMAT_POSITION:RIFF_HEADER_SIZE] != b"WAVE"
-            ):
-                return {"present": False, "chunk_info": {}}
-
-            # Parse RIFF chunk info
-            riff_chunk_size = int.from_bytes(file_data[4:8], "little")
+            context = self.audio_file.get_context()
+            chunks = context.get_riff_chunks()
+            riff_chunk_size = struct.unpack("<I", context.read_header_bytes(context.id3v2_size + 4, 4))[0]
             info_chunk_size = 0
             audio_format = "Unknown"
             subchunk_size = 0
 
             # Find INFO chunk
-            pos = 12
-            while pos < len(file_data) - 8:
-                chunk_id = file_data[pos : pos + 4]
-                chunk_size = int.from_bytes(file_data[pos + 4 : pos + 8], "little")
-
-                if chunk_id == b"LIST" and file_data[pos + 8 : pos + 12] == b"INFO":
-                    info_chunk_size = chunk_size
+            for chunk in chunks:
+                if (
+                    chunk.chunk_id == b"LIST"
+                    and context.read_header_bytes(chunk.data_offset, RIFF_CHUNK_ID_SIZE) == RIFF_INFO_LIST_TYPE
+                ):
+                    info_chunk_size = chunk.size
                     break
-                if chunk_id == b"fmt ":
+                if chunk.chunk_id == b"fmt ":
                     # Parse format chunk
-                    if chunk_size >= RIFF_FORMAT_CHUNK_MIN_SIZE:
-                        audio_format_code = int.from_bytes(file_data[pos + 8 : pos + 10], "little")
+                    if chunk.size >= RIFF_FORMAT_CHUNK_MIN_SIZE:
+                        audio_format_code = int.from_bytes(context.read_header_bytes(chunk.data_offset, 2), "little")
                         if audio_format_code == 1:
                             audio_format = "PCM"
                         elif audio_format_code == RIFF_AUDIO_FORMAT_IEEE_FLOAT:
                             audio_format = "IEEE Float"
                         else:
                             audio_format = f"Code {audio_format_code}"
-                elif chunk_id == b"data":
-                    subchunk_size = chunk_size
+                elif chunk.chunk_id == b"data":
+                    subchunk_size = chunk.size
                     break
-
-                pos += 8 + chunk_size
-                if chunk_size % 2 == 1:  # Word alignment
-                    pos += 1
         except Exception:
             return {"present": False, "chunk_info": {}}
         else:
@@ -957,9 +755,7 @@ class _RiffManager(_RatingSupportingMetadataManager):
                 # Still try to extract bext chunk even if no INFO metadata
                 chunk_structure = {}
                 try:
-                    self.audio_file.seek(0)
-                    file_data = self.audio_file.read()
-                    bext_data = self._extract_bext_chunk(file_data)
+                    bext_data = self._extract_bext_chunk(self.audio_file.get_context())
                     if bext_data:
                         chunk_structure["bext"] = bext_data
                 except Exception:
@@ -983,9 +779,7 @@ class _RiffManager(_RatingSupportingMetadataManager):
             # Extract bext chunk
             chunk_structure = {}
             try:
-                self.audio_file.seek(0)
-                file_data = self.audio_file.read()
-                bext_data = self._extract_bext_chunk(file_data)
+                bext_data = self._extract_bext_chunk(self.audio_file.get_context())
                 if bext_data:
                     chunk_structure["bext"] = bext_data
             except Exception:
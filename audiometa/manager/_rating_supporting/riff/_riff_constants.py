@@ -8,6 +8,22 @@ RIFF_INFO_CHUNK_MIN_SIZE = 16
 RIFF_MIN_VERSION_LENGTH = 3
 RIFF_AUDIO_FORMAT_IEEE_FLOAT = 3
 RIFF_FORMAT_CHUNK_MIN_SIZE = 16
+RIFF_CHUNK_HEADER_SIZE = 8  # 4-byte chunk ID + 4-byte little-endian size
+RIFF_INFO_LIST_TYPE = b"INFO"  # List type of the LIST chunk holding the INFO tags
+
+# RIFF container variants carrying a WAVE form. RF64 and BW64 files store sizes above 4 GiB in a ds64 chunk and put
+# RF64_SIZE_PLACEHOLDER in the 32-bit size fields.
+RIFF_FORM_IDS = (b"RIFF", b"RF64", b"BW64")
+RF64_SIZE_PLACEHOLDER = 0xFFFFFFFF
+RF64_DS64_MIN_SIZE = 24  # riffSize, dataSize and sampleCount, 8 bytes each
+
+# fmt chunk format tags
+RIFF_AUDIO_FORMAT_PCM = 1
+RIFF_AUDIO_FORMAT_ALAW = 6
+RIFF_AUDIO_FORMAT_MULAW = 7
+RIFF_AUDIO_FORMAT_EXTENSIBLE = 0xFFFE
+RIFF_FORMAT_EXTENSIBLE_MIN_SIZE = 40
+RIFF_FORMAT_EXTENSIBLE_SUBFORMAT_POSITION = 24  # The format tag is the first 2 bytes of the SubFormat GUID
 
 # BWF bext chunk constants
 BEXT_MIN_CHUNK_SIZE = 602  # 256+32+32+10+8+8+2+64+190
@@ -0,0 +1,129 @@
+"""Native parsing of the audio stream properties of WAV files."""
+
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ....exceptions import InvalidChunkDecodeError
+from ._riff_constants import (
+    RF64_SIZE_PLACEHOLDER,
+    RIFF_AUDIO_FORMAT_ALAW,
+    RIFF_AUDIO_FORMAT_EXTENSIBLE,
+    RIFF_AUDIO_FORMAT_IEEE_FLOAT,
+    RIFF_AUDIO_FORMAT_MULAW,
+    RIFF_AUDIO_FORMAT_PCM,
+    RIFF_FORMAT_CHUNK_MIN_SIZE,
+    RIFF_FORMAT_EXTENSIBLE_MIN_SIZE,
+    RIFF_FORMAT_EXTENSIBLE_SUBFORMAT_POSITION,
+)
+
+if TYPE_CHECKING:
+    from ...._audio_file_context import _AudioFileContext
+
+# Formats storing one fixed-size block per sample frame, whose duration follows from the data size alone
+UNCOMPRESSED_FORMAT_TAGS = frozenset(
+    {RIFF_AUDIO_FORMAT_PCM, RIFF_AUDIO_FORMAT_IEEE_FLOAT, RIFF_AUDIO_FORMAT_ALAW, RIFF_AUDIO_FORMAT_MULAW}
+)
+
+FACT_CHUNK_MIN_SIZE = 4
+
+
+@dataclass(frozen=True)
+class _WavStreamInfo:
+    """Audio stream properties of a WAV file, read from its fmt, fact and data chunks.
+
+    For WAVE_FORMAT_EXTENSIBLE files, format_tag is the format of the SubFormat GUID rather than 0xFFFE.
+    """
+
+    format_tag: int
+    channels: int
+    sample_rate: int
+    avg_bytes_per_sec: int
+    block_align: int
+    bits_per_sample: int
+    data_size: int
+    sample_count: int | None = None  # From the fact chunk, only meaningful for compressed formats
+
+    @property
+    def is_uncompressed(self) -> bool:
+        return self.format_tag in UNCOMPRESSED_FORMAT_TAGS
+
+    @property
+    def duration_in_sec(self) -> float:
+        """Duration of the audio data in seconds, or 0.0 if it cannot be determined."""
+        if self.sample_rate <= 0:
+            return 0.0
+        if self.is_uncompressed and self.block_align > 0:
+            return (self.data_size // self.block_align) / self.sample_rate
+        if self.sample_count:
+            return self.sample_count / self.sample_rate
+        if self.avg_bytes_per_sec > 0:
+            return self.data_size / self.avg_bytes_per_sec
+        return 0.0
+
+    @property
+    def bitrate(self) -> int:
+        """Bitrate in bits per second, or 0 if it cannot be determined."""
+        if self.is_uncompressed and self.bits_per_sample > 0:
+            return self.sample_rate * self.channels * self.bits_per_sample
+        return self.avg_bytes_per_sec * 8
+
+    @classmethod
+    def from_context(cls, context: "_AudioFileContext") -> "_WavStreamInfo":
+        """Parse the stream properties using the chunk layout of the file context.
+
+        Only the fmt and fact chunks are read. The size of the data chunk comes from its header and is clamped to the
+        bytes actually present, so truncated files report the duration of what can still be played.
+
+        Raises:
+            InvalidChunkDecodeError: If the file has no decodable fmt chunk
+        """
+        try:
+            chunks = context.get_riff_chunks()
+        except ValueError as e:
+            msg = f"Failed to decode RIFF chunks: {e}"
+            raise InvalidChunkDecodeError(msg) from e
+
+        fmt_chunk = next((chunk for chunk in chunks if chunk.chunk_id == b"fmt "), None)
+        if fmt_chunk is None or fmt_chunk.size < RIFF_FORMAT_CHUNK_MIN_SIZE:
+            msg = "Failed to decode RIFF chunks: missing or truncated fmt chunk"
+            raise InvalidChunkDecodeError(msg)
+        fmt_data = context.read_header_bytes(
+            fmt_chunk.data_offset, min(fmt_chunk.size, RIFF_FORMAT_EXTENSIBLE_MIN_SIZE)
+        )
+        if len(fmt_data) < RIFF_FORMAT_CHUNK_MIN_SIZE:
+            msg = "Failed to decode RIFF chunks: missing or truncated fmt chunk"
+            raise InvalidChunkDecodeError(msg)
+
+        format_tag, channels, sample_rate, avg_bytes_per_sec, block_align, bits_per_sample = struct.unpack(
+            "<HHIIHH", fmt_data[:RIFF_FORMAT_CHUNK_MIN_SIZE]
+        )
+        if format_tag == RIFF_AUDIO_FORMAT_EXTENSIBLE and len(fmt_data) >= RIFF_FORMAT_EXTENSIBLE_MIN_SIZE:
+            subformat_position = RIFF_FORMAT_EXTENSIBLE_SUBFORMAT_POSITION
+            format_tag = struct.unpack("<H", fmt_data[subformat_position : subformat_position + 2])[0]
+
+        data_size = 0
+        data_chunk = next((chunk for chunk in chunks if chunk.chunk_id == b"data"), None)
+        if data_chunk is not None:
+            data_size = max(0, min(data_chunk.size, context.size - data_chunk.data_offset))
+
+        sample_count = None
+        fact_chunk = next((chunk for chunk in chunks if chunk.chunk_id == b"fact"), None)
+        if fact_chunk is not None and fact_chunk.size >= FACT_CHUNK_MIN_SIZE:
+            fact_data = context.read_header_bytes(fact_chunk.data_offset, FACT_CHUNK_MIN_SIZE)
+            if len(fact_data) == FACT_CHUNK_MIN_SIZE:
+                fact_sample_count = struct.unpack("<I", fact_data)[0]
+                # RF64 files keep the real count in ds64 and put a placeholder here
+                if fact_sample_count != RF64_SIZE_PLACEHOLDER:
+                    sample_count = fact_sample_count
+
+        return cls(
+            format_tag=format_tag,
+            channels=channels,
+            sample_rate=sample_rate,
+            avg_bytes_per_sec=avg_bytes_per_sec,
+            block_align=block_align,
+            bits_per_sample=bits_per_sample,
+            data_size=data_size,
+            sample_count=sample_count,
+        )
@@ -1,17 +1,20 @@
-import contextlib
-import struct
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 if TYPE_CHECKING:
     from ...._audio_file import _AudioFile
 from ....exceptions import FileCorruptedError, InvalidRatingValueError, MetadataFieldNotSupportedByMetadataFormatError
+from ....utils.padding_policy import PaddingFunction
 from ....utils.rating_profiles import RatingWriteProfile
-from ....utils.tool_path_resolver import get_tool_path
 from ....utils.types import RawMetadataDict, RawMetadataKey, UnifiedMetadata, UnifiedMetadataValue
 from ....utils.unified_metadata_key import UnifiedMetadataKey
 from .._RatingSupportingMetadataManager import _RatingSupportingMetadataManager
-from ._vorbis_constants import VORBIS_BLOCK_HEADER_SIZE, VORBIS_COMMENT_BLOCK_TYPE, VORBIS_ID3V2_HEADER_SIZE
+from ._vorbis_comment_writer import (
+    encode_vorbis_comments,
+    parse_vorbis_comments,
+    update_vorbis_comment_entries,
+    write_vorbis_comment_block,
+)
+from ._vorbis_constants import VORBIS_COMMENT_BLOCK_TYPE, VORBIS_DEFAULT_VENDOR_STRING
 
 T = TypeVar("T", str, int)
 
@@ -29,8 +32,8 @@ class _VorbisManager(_RatingSupportingMetadataManager):
 
     Implementation Details:
     - Reading: Custom FLAC parsing to preserve original Vorbis comment key casing
-    - Writing: External metaflac tool to maintain proper key casing per Vorbis specification
-    - The Vorbis specification recommends uppercase keys, which metaflac preserves during writing
+    - Writing: Custom FLAC block writing with uppercase keys, as the Vorbis specification recommends
+    - The VORBIS_COMMENT block is rewritten in place when it fits in the surrounding padding
     - Custom parsing for reading avoids mutagen's lowercase conversion behavior
 
     Compatible Extensions:
@@ -71,7 +74,13 @@ class _VorbisManager(_RatingSupportingMetadataManager):
         REPLAYGAIN = "REPLAYGAIN"
         PUBLISHER = "PUBLISHER"
 
-    def __init__(self, audio_file: "_AudioFile", normalized_rating_max_value: int | None = None):
+    def __init__(
+        self,
+        audio_file: "_AudioFile",
+        normalized_rating_max_value: int | None = None,
+        padding: PaddingFunction | None = None,
+    ):
+        self.padding = padding
         metadata_keys_direct_map_read = {
             UnifiedMetadataKey.TITLE: self.VorbisKey.TITLE,
             UnifiedMetadataKey.ARTISTS: self.VorbisKey.ARTIST,
@@ -126,6 +135,11 @@ class _VorbisManager(_RatingSupportingMetadataManager):
             normalized_rating_max_value=normalized_rating_max_value,
         )
 
+    def _get_raw_keys_read(self, unified_metadata_key: UnifiedMetadataKey) -> tuple[str, ...]:
+        if unified_metadata_key == UnifiedMetadataKey.RATING:
+            return (self.VorbisKey.RATING, self.VorbisKey.RATING_TRAKTOR)
+        return super()._get_raw_keys_read(unified_metadata_key)
+
     def _extract_mutagen_metadata(self) -> RawMetadataDict:
         """Read Vorbis comments from a FLAC file.
 
@@ -134,66 +148,32 @@ class _VorbisManager(_RatingSupportingMetadataManager):
         Returns a dict: {key: [values]}.
         """
         comments: dict[str, list[str]] = {}
-        with Path(self.audio_file.file_path).open("rb") as f:
-            # --- Step 1: Skip ID3v2 tags if present, then find FLAC header ---
-            header = f.read(4)
-            if header in (b"ID3\x03", b"ID3\x04"):
-                # ID3v2 tag present, skip it
-                f.seek(0)  # Reset to beginning
-                # Read ID3v2 header to get tag size
-                id3_header = f.read(VORBIS_ID3V2_HEADER_SIZE)
-                if len(id3_header) >= VORBIS_ID3V2_HEADER_SIZE:
-                    # ID3v2 tag size is stored in bytes 6-9 (syncsafe integer)
-                    tag_size = (
-                        ((id3_header[6] & 0x7F) << 21)
-                        | ((id3_header[7] & 0x7F) << 14)
-                        | ((id3_header[8] & 0x7F) << 7)
-                        | (id3_header[9] & 0x7F)
-                    )
-                    # Skip the ID3v2 tag
-                    f.seek(tag_size + VORBIS_ID3V2_HEADER_SIZE)
-                # Now read the FLAC header
-                header = f.read(4)
-
-            if header != b"fLaC":
-                msg = "Not a valid FLAC file"
-                raise ValueError(msg)
-
-            # --- Step 2: Read metadata blocks ---
-            is_last = False
-            while not is_last:
-                block_header = f.read(VORBIS_BLOCK_HEADER_SIZE)
-                if len(block_header) < VORBIS_BLOCK_HEADER_SIZE:
-                    break
-                is_last = bool(block_header[0] & 0x80)
-                block_type = block_header[0] & 0x7F
-                block_size = struct.unpack(">I", b"\x00" + block_header[1:])[0]
-                data = f.read(block_size)
-
-                # --- Step 3: Look for VORBIS_COMMENT block ---
-                if block_type == VORBIS_COMMENT_BLOCK_TYPE:  # VORBIS_COMMENT
-                    offset = 0
-                    # Vendor length (32-bit LE)
-                    vendor_len = struct.unpack("<I", data[offset : offset + 4])[0]
-                    offset += 4 + vendor_len
-                    # Number of comments
-                    num_comments = struct.unpack("<I", data[offset : offset + 4])[0]
-                    offset += 4
-
-                    for _ in range(num_comments):
-                        comment_len = struct.unpack("<I", data[offset : offset + 4])[0]
-                        offset += 4
-                        comment_bytes = data[offset : offset + comment_len]
-                        offset += comment_len
-                        comment_str = comment_bytes.decode("utf-8", errors="replace")
-
-                        # Split key=value at first '='
-                        if "=" not in comment_str:
-                            continue
-                        key, value = comment_str.split("=", 1)
-                        # Preserve original case
-                        comments.setdefault(key, []).append(value)
-                    break
+        context = self.audio_file.get_context()
+        raw_keys_to_read = self._get_raw_keys_to_read()
+
+        # --- Step 1: Find the VORBIS_COMMENT block in the block layout (ID3v2 tags are skipped by the context) ---
+        for block in context.get_flac_blocks():
+            if block.block_type != VORBIS_COMMENT_BLOCK_TYPE:
+                continue
+            with context.view_at(block.data_offset, block.size) as block_data:
+                _vendor, entries = parse_vorbis_comments(block_data)
+
+            # --- Step 2: Parse the comments ---
+            for entry in entries:
+                if raw_keys_to_read is not None:
+                    # Keys are ASCII, so the comments that are not read are skipped without decoding their value
+                    key_bytes, separator, _value_bytes = entry.partition(b"=")
+                    if not separator or key_bytes.decode("ascii", errors="replace").upper() not in raw_keys_to_read:
+                        continue
+                comment_str = entry.decode("utf-8", errors="replace")
+
+                # Split key=value at first '='
+                if "=" not in comment_str:
+                    continue
+                key, value = comment_str.split("=", 1)
+                # Preserve original case
+                comments.setdefault(key, []).append(value)
+            break
 
         return cast(RawMetadataDict, comments)
 
@@ -270,30 +250,30 @@ class _VorbisManager(_RatingSupportingMetadataManager):
         raw_metadata_key: RawMetadataKey,
         app_metadata_value: UnifiedMetadataValue,
     ) -> None:
+        # Raw keys are stored as plain strings: members whose name differs from their value would not match them
+        key = str(raw_metadata_key)
         if app_metadata_value is not None:
             if isinstance(app_metadata_value, list):
                 # For multi-value fields, keep as separate entries
-                raw_mutagen_metadata[raw_metadata_key] = [str(v) for v in app_metadata_value]
-            # Convert BPM to string for Vorbis comments
-            elif raw_metadata_key == self.VorbisKey.BPM:
-                raw_mutagen_metadata[raw_metadata_key] = [str(app_metadata_value)]
+                raw_mutagen_metadata[key] = [str(v) for v in app_metadata_value]
             else:
-                raw_mutagen_metadata[raw_metadata_key] = [str(app_metadata_value)]
-        elif raw_metadata_key in raw_mutagen_metadata:
-            del raw_mutagen_metadata[raw_metadata_key]
+                raw_mutagen_metadata[key] = [str(app_metadata_value)]
+        elif key in raw_mutagen_metadata:
+            del raw_mutagen_metadata[key]
 
     def update_metadata(self, unified_metadata: UnifiedMetadata) -> None:
-        """Update Vorbis metadata in FLAC files using external metaflac tool.
+        """Update Vorbis metadata in FLAC files by rewriting the VORBIS_COMMENT block natively.
 
-        This method uses the metaflac external command-line tool instead of Python libraries
-        to ensure proper Vorbis specification compliance and prevent file corruption.
+        The block is rebuilt in memory and written back in place when it fits in the space of the current block and of
+        the PADDING blocks around it. The file is only rewritten when the block has to grow beyond that space. No
+        external tool is spawned.
 
         Key Features:
         - **Uppercase Key Casing**: Preserves proper Vorbis key casing (TITLE, ARTIST, etc.)
           unlike mutagen which converts to lowercase
+        - **Untouched Comments Preserved**: Fields that are not updated keep their original casing, values and order
         - **Multi-Value Support**: Creates separate tag entries for list values
-        - **File Integrity**: Prevents corruption that occurs with some Python libraries
-        - **Deletion Support**: Properly removes tags when None values are passed
+        - **Deletion Support**: Properly removes tags when None values are passed, whatever their casing in the file
 
         Multi-Value Behavior:
         - List values create separate tag entries (Vorbis specification compliant)
@@ -302,17 +282,13 @@ class _VorbisManager(_RatingSupportingMetadataManager):
           * ARTIST=Artist Two
         - NOT: ARTIST=Artist One;Artist Two (semicolon-joined)
 
-        External Tool Requirements:
-        - Requires 'metaflac' command-line tool to be installed
-        - Falls back to FileCorruptedError if metaflac is not available
-
         Args:
             unified_metadata: Dictionary of metadata to write/update
                              Use None values to delete specific fields
 
         Raises:
             MetadataFieldNotSupportedByMetadataFormatError: If field not supported
-            FileCorruptedError: If metaflac tool fails or is not found
+            FileCorruptedError: If the FLAC metadata blocks cannot be read or written
         """
         if not self.metadata_keys_direct_map_write:
             msg = "This format does not support metadata modification"
@@ -328,7 +304,11 @@ class _VorbisManager(_RatingSupportingMetadataManager):
             unified_metadata[UnifiedMetadataKey.DISC_TOTAL] = None
 
         # Get current metadata
-        current_metadata = self._extract_mutagen_metadata()
+        # Keys are uppercased so that an update replaces every case variant of a field, as reading merges them
+        original_metadata: dict[str, list] = {}
+        for key, values in self._extract_mutagen_metadata().items():
+            original_metadata.setdefault(str(key).upper(), []).extend(values or [])
+        current_metadata: dict = {key: list(values) for key, values in original_metadata.items()}
 
         # Update metadata dict
         for unified_metadata_key in list(unified_metadata.keys()):
@@ -359,94 +339,44 @@ class _VorbisManager(_RatingSupportingMetadataManager):
                     unified_metadata_key=unified_metadata_key,
                 )
 
-        # Write metadata using metaflac
-        self._write_metadata_with_metaflac(current_metadata)
+        # Only the fields whose values changed are rewritten, the other comments are kept as they are in the file
+        changed_fields = {
+            key: current_metadata.get(key)
+            for key in dict.fromkeys([*original_metadata, *current_metadata])
+            if original_metadata.get(key) != current_metadata.get(key)
+        }
+        try:
+            if changed_fields:
+                self._write_vorbis_comments(changed_fields)
+        finally:
+            self.audio_file.invalidate_context()
 
         # Clear cached metadata to ensure subsequent reads reflect the changes
         self.raw_clean_metadata = None
         self.raw_clean_metadata_uppercase_keys = None
 
-    def _write_metadata_with_metaflac(self, metadata: dict) -> None:
-        """Write metadata to the FLAC file using metaflac external tool."""
-        try:
-            import subprocess
-
-            # Map unified metadata keys to metaflac tag names (uppercase)
-            key_mapping = {
-                "TITLE": "TITLE",
-                "ARTIST": "ARTIST",
-                "ALBUM": "ALBUM",
-                "DATE": "DATE",
-                "GENRE": "GENRE",
-                "COMMENT": "COMMENT",
-                "TRACKNUMBER": "TRACKNUMBER",
-                "DISCNUMBER": "DISCNUMBER",
-                "DISCTOTAL": "DISCTOTAL",
-                "BPM": "BPM",
-                "COMPOSER": "COMPOSER",
-                "COPYRIGHT": "COPYRIGHT",
-                "LYRICS": "LYRICS",
-                "LANGUAGE": "LANGUAGE",
-                "RATING": "RATING",
-                "ALBUMARTIST": "ALBUMARTIST",
-                "MOOD": "MOOD",
-                "KEY": "KEY",
-                "ENCODER": "ENCODER",
-                "URL": "URL",
-                "ISRC": "ISRC",
-                "PUBLISHER": "PUBLISHER",
-            }
+    def _write_vorbis_comments(self, fields: dict[str, list[str] | None]) -> None:
+        """Write updated fields to the VORBIS_COMMENT block of the FLAC file.
 
-            # Get all possible tags that we might need to remove
-            # This includes both tags in the metadata dict and all possible tags
-            tags_to_remove = set()
-
-            # Add tags that are in the metadata dict (these are being updated/deleted)
-            for key in metadata:
-                if key in key_mapping:
-                    tags_to_remove.add(key_mapping[key])
-
-            # Also remove all possible tags to ensure clean state
-            # This is necessary because we might be deleting tags that aren't in the metadata dict
-            for metaflac_key in key_mapping.values():
-                tags_to_remove.add(metaflac_key)
-
-            # Remove all existing tags
-            if tags_to_remove:
-                for metaflac_key in tags_to_remove:
-                    with contextlib.suppress(subprocess.CalledProcessError):
-                        subprocess.run(
-                            [get_tool_path("metaflac"), "--remove-tag=" + metaflac_key, self.audio_file.file_path],
-                            check=True,
-                            capture_output=True,
-                        )
-
-            # Then, add new tags for non-None values
-            set_cmd = [get_tool_path("metaflac")]
-            for key, values in metadata.items():
-                if key in key_mapping and values is not None:
-                    metaflac_key = key_mapping[key]
-
-                    # Handle list values by creating separate tag entries
-                    if isinstance(values, list):
-                        for value in values:
-                            if value:  # Only add non-empty values
-                                set_cmd.extend(["--set-tag", f"{metaflac_key}={value}"])
-                    else:
-                        value = str(values)
-                        if value:  # Only add non-empty values
-                            set_cmd.extend(["--set-tag", f"{metaflac_key}={value}"])
-
-            # Add file path and execute
-            if len(set_cmd) > 1:  # Only if we have tags to set
-                set_cmd.append(self.audio_file.file_path)
-                subprocess.run(set_cmd, check=True, capture_output=True)
-
-        except subprocess.CalledProcessError as e:
-            msg = f"Failed to write metadata with metaflac: {e}"
-            raise FileCorruptedError(msg) from e
-        except FileNotFoundError as e:
-            msg = "metaflac tool not found. Please install it to write Vorbis metadata to FLAC files."
+        Comments of fields that are not updated keep their original casing, values and order, as does the vendor
+        string. A missing VORBIS_COMMENT block is created.
+        """
+        context = self.audio_file.get_context()
+        try:
+            comment_block = next(
+                (block for block in context.get_flac_blocks() if block.block_type == VORBIS_COMMENT_BLOCK_TYPE), None
+            )
+            if comment_block is not None:
+                with context.view_at(comment_block.data_offset, comment_block.size) as block_data:
+                    vendor, entries = parse_vorbis_comments(block_data)
+            else:
+                vendor, entries = VORBIS_DEFAULT_VENDOR_STRING.encode(), []
+            entries = update_vorbis_comment_entries(entries, fields)
+            self.last_write_report = write_vorbis_comment_block(
+                context, encode_vorbis_comments(vendor, entries), self.padding
+            )
+        except (ValueError, OSError) as e:
+            msg = f"Failed to write Vorbis comments: {e}"
             raise FileCorruptedError(msg) from e
 
     def get_header_info(self) -> dict:
@@ -482,21 +412,15 @@ class _VorbisManager(_RatingSupportingMetadataManager):
             return {"raw_data": None, "parsed_fields": {}, "frames": {}, "comments": {}, "chunk_structure": {}}
 
     def delete_metadata(self) -> bool:
-        """Delete all metadata from the FLAC file by removing the VORBIS_COMMENT block."""
-        import subprocess
-
+        """Delete all metadata from the FLAC file by turning the VORBIS_COMMENT block into padding."""
         try:
-            # Remove all VORBIS_COMMENT blocks from the FLAC file
-            subprocess.run(
-                [get_tool_path("metaflac"), "--remove", "--block-type=VORBIS_COMMENT", self.audio_file.file_path],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            write_vorbis_comment_block(self.audio_file.get_context(), None)
+        except (ValueError, OSError):
             return False
         else:
             return True
+        finally:
+            self.audio_file.invalidate_context()
 
     def _get_undirectly_mapped_metadata_value_other_than_rating_from_raw_clean_metadata(
         self, _raw_clean_metadata: RawMetadataDict, unified_metadata_key: UnifiedMetadataKey
@@ -515,9 +439,9 @@ class _VorbisManager(_RatingSupportingMetadataManager):
                 if self.normalized_rating_max_value is None:
                     # When no normalization, write value as-is (already validated by parent class)
                     if isinstance(app_metadata_value, int | float):
-                        raw_mutagen_metadata[self.VorbisKey.RATING] = [str(int(app_metadata_value))]
+                        raw_mutagen_metadata[str(self.VorbisKey.RATING)] = [str(int(app_metadata_value))]
                     else:
-                        raw_mutagen_metadata[self.VorbisKey.RATING] = [str(app_metadata_value)]
+                        raw_mutagen_metadata[str(self.VorbisKey.RATING)] = [str(app_metadata_value)]
                 else:
                     try:
                         # Preserve float values to support half-star ratings (consistent with classic star rating
@@ -527,16 +451,14 @@ class _VorbisManager(_RatingSupportingMetadataManager):
                         else:
                             normalized_rating = float(str(app_metadata_value))
                         file_rating = self._convert_normalized_rating_to_file_rating(normalized_rating)
-                        raw_mutagen_metadata[self.VorbisKey.RATING] = [str(file_rating)]
+                        raw_mutagen_metadata[str(self.VorbisKey.RATING)] = [str(file_rating)]
                     except (TypeError, ValueError) as e:
                         msg = f"Invalid rating value: {app_metadata_value}. Expected a numeric value."
                         raise InvalidRatingValueError(msg) from e
             else:
                 # Remove rating
-                if self.VorbisKey.RATING in raw_mutagen_metadata:
-                    del raw_mutagen_metadata[self.VorbisKey.RATING]
-                if self.VorbisKey.RATING_TRAKTOR in raw_mutagen_metadata:
-                    del raw_mutagen_metadata[self.VorbisKey.RATING_TRAKTOR]
+                raw_mutagen_metadata.pop(str(self.VorbisKey.RATING), None)
+                raw_mutagen_metadata.pop(str(self.VorbisKey.RATING_TRAKTOR), None)
         else:
             msg = f"Metadata key not handled: {unified_metadata_key}"
             raise MetadataFieldNotSupportedByMetadataFormatError(msg)
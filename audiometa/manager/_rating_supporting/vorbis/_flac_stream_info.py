@@ -0,0 +1,96 @@
+"""Native parsing of the STREAMINFO block of FLAC files."""
+
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ._vorbis_constants import VORBIS_BLOCK_HEADER_SIZE, VORBIS_STREAMINFO_BLOCK_SIZE, VORBIS_STREAMINFO_BLOCK_TYPE
+
+if TYPE_CHECKING:
+    from ...._audio_file_context import _AudioFileContext
+
+FLAC_MARKER = b"fLaC"
+FLAC_MD5_SIGNATURE_SIZE = 16
+FLAC_UNSET_MD5_SIGNATURE = b"\x00" * FLAC_MD5_SIGNATURE_SIZE
+
+
+@dataclass(frozen=True)
+class _FlacStreamInfo:
+    """Audio stream properties of a FLAC file, read from its STREAMINFO block.
+
+    Frame sizes and the total number of samples are 0 when the encoder did not know them.
+    """
+
+    min_block_size: int  # In samples
+    max_block_size: int
+    min_frame_size: int  # In bytes
+    max_frame_size: int
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+    total_samples: int
+    md5_signature: bytes  # MD5 of the decoded audio, all zeros if the encoder did not compute it
+
+    @property
+    def is_md5_unset(self) -> bool:
+        return self.md5_signature == FLAC_UNSET_MD5_SIGNATURE
+
+    @property
+    def duration_in_sec(self) -> float:
+        """Duration of the audio stream in seconds, or 0.0 if it is not known."""
+        if self.sample_rate <= 0:
+            return 0.0
+        return self.total_samples / self.sample_rate
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "_FlacStreamInfo":
+        """Parse the 34 bytes of a STREAMINFO block, without its block header.
+
+        Raises:
+            ValueError: If the data is too short
+        """
+        if len(data) < VORBIS_STREAMINFO_BLOCK_SIZE:
+            msg = "Truncated STREAMINFO block"
+            raise ValueError(msg)
+        min_block_size, max_block_size = struct.unpack(">HH", data[0:4])
+        # Sample rate (20 bits), channels - 1 (3 bits), bits per sample - 1 (5 bits), total samples (36 bits)
+        packed = int.from_bytes(data[10:18], "big")
+        return cls(
+            min_block_size=min_block_size,
+            max_block_size=max_block_size,
+            min_frame_size=int.from_bytes(data[4:7], "big"),
+            max_frame_size=int.from_bytes(data[7:10], "big"),
+            sample_rate=packed >> 44,
+            channels=((packed >> 41) & 0x07) + 1,
+            bits_per_sample=((packed >> 36) & 0x1F) + 1,
+            total_samples=packed & 0xFFFFFFFFF,
+            md5_signature=bytes(data[18:VORBIS_STREAMINFO_BLOCK_SIZE]),
+        )
+
+    @classmethod
+    def from_context(cls, context: "_AudioFileContext") -> "_FlacStreamInfo":
+        """Parse the STREAMINFO block that must follow the fLaC marker, after the ID3v2 tag if there is one.
+
+        The size of the ID3v2 tag comes from its header, and only the marker and the STREAMINFO block are read, in a
+        single read that usually falls within the head buffer of the context.
+
+        Raises:
+            ValueError: If the fLaC marker is missing or is not followed by a STREAMINFO block
+        """
+        data = context.read_header_bytes(
+            context.id3v2_size, len(FLAC_MARKER) + VORBIS_BLOCK_HEADER_SIZE + VORBIS_STREAMINFO_BLOCK_SIZE
+        )
+        if not data.startswith(FLAC_MARKER):
+            msg = "Not a valid FLAC file"
+            raise ValueError(msg)
+
+        block_header = data[len(FLAC_MARKER) : len(FLAC_MARKER) + VORBIS_BLOCK_HEADER_SIZE]
+        stream_info = data[len(FLAC_MARKER) + VORBIS_BLOCK_HEADER_SIZE :]
+        if (
+            len(stream_info) < VORBIS_STREAMINFO_BLOCK_SIZE
+            or block_header[0] & 0x7F != VORBIS_STREAMINFO_BLOCK_TYPE
+            or int.from_bytes(block_header[1:], "big") != VORBIS_STREAMINFO_BLOCK_SIZE
+        ):
+            msg = "The first metadata block is not a STREAMINFO block"
+            raise ValueError(msg)
+        return cls.from_bytes(stream_info)
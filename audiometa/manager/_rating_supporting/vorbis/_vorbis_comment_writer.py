@@ -0,0 +1,261 @@
+"""Native encoding and writing of the VORBIS_COMMENT block of FLAC files."""
+
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mutagen import PaddingInfo
+
+from ....utils.metadata_format import MetadataFormat
+from ....utils.metadata_write_report import MetadataWriteReport
+from ....utils.padding_policy import PaddingFunction, get_padding
+from ._vorbis_constants import (
+    VORBIS_BLOCK_HEADER_SIZE,
+    VORBIS_COMMENT_BLOCK_TYPE,
+    VORBIS_DEFAULT_PADDING_SIZE,
+    VORBIS_LAST_BLOCK_FLAG,
+    VORBIS_MAX_BLOCK_SIZE,
+    VORBIS_PADDING_BLOCK_TYPE,
+)
+
+if TYPE_CHECKING:
+    from ...._audio_file_context import _AudioFileContext, _FlacMetadataBlock
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def parse_vorbis_comments(data: bytes | memoryview) -> tuple[bytes, list[bytes]]:
+    """Split the data of a VORBIS_COMMENT block into its vendor string and its raw "KEY=value" entries.
+
+    Entries are returned undecoded so that comments which are not modified can be written back byte for byte. The data
+    can be a view of the memory-mapped file: only the vendor string and the entries are copied out of it.
+
+    Raises:
+        ValueError: If a length field points past the end of the block
+    """
+    offset = 0
+
+    def read_length() -> int:
+        nonlocal offset
+        if offset + 4 > len(data):
+            msg = "Truncated VORBIS_COMMENT block"
+            raise ValueError(msg)
+        length: int = struct.unpack("<I", data[offset : offset + 4])[0]
+        offset += 4
+        return length
+
+    vendor_len = read_length()
+    vendor = bytes(data[offset : offset + vendor_len])
+    offset += vendor_len
+    entries = []
+    for _ in range(read_length()):
+        comment_len = read_length()
+        if offset + comment_len > len(data):
+            msg = "Truncated VORBIS_COMMENT block"
+            raise ValueError(msg)
+        entries.append(bytes(data[offset : offset + comment_len]))
+        offset += comment_len
+    return vendor, entries
+
+
+def encode_vorbis_comments(vendor: bytes, entries: list[bytes]) -> bytes:
+    """Encode a vendor string and raw "KEY=value" entries into the data of a VORBIS_COMMENT block."""
+    parts = [struct.pack("<I", len(vendor)), vendor, struct.pack("<I", len(entries))]
+    for entry in entries:
+        parts.append(struct.pack("<I", len(entry)))
+        parts.append(entry)
+    return b"".join(parts)
+
+
+def update_vorbis_comment_entries(entries: list[bytes], fields: dict[str, list[str] | None]) -> list[bytes]:
+    """Replace the values of some fields in a list of raw Vorbis comment entries.
+
+    Field names are matched case-insensitively, as the Vorbis specification requires: every entry of an updated field
+    is dropped, whatever its casing, and the new values are appended with the key exactly as given. Entries of other
+    fields are kept untouched, in their original order and casing.
+
+    Args:
+        entries: Raw "KEY=value" entries as stored in the block
+        fields: New values by field name. None or an empty list removes the field
+
+    Returns:
+        The updated entries
+    """
+    updated_keys = {key.upper() for key in fields}
+    updated_entries = [entry for entry in entries if _get_entry_key(entry).upper() not in updated_keys]
+    for key, values in fields.items():
+        updated_entries.extend(f"{key}={value}".encode() for value in values or [] if value)
+    return updated_entries
+
+
+def _get_entry_key(entry: bytes) -> str:
+    return entry.split(b"=", 1)[0].decode("ascii", errors="replace")
+
+
+def _encode_block_header(block_type: int, size: int, *, is_last: bool) -> bytes:
+    return bytes([block_type | (VORBIS_LAST_BLOCK_FLAG if is_last else 0)]) + size.to_bytes(3, "big")
+
+
+def _encode_padding_block(size: int, *, is_last: bool) -> bytes:
+    return _encode_block_header(VORBIS_PADDING_BLOCK_TYPE, size, is_last=is_last) + bytes(size)
+
+
+def _get_block_end(block: "_FlacMetadataBlock") -> int:
+    return block.data_offset + block.size
+
+
+def _find_comment_region(blocks: list["_FlacMetadataBlock"]) -> tuple[int, int] | None:
+    """Find the consecutive blocks that the VORBIS_COMMENT block may be written over.
+
+    The region is the existing VORBIS_COMMENT block together with the PADDING blocks around it or, for a file without
+    comments, the largest run of PADDING blocks.
+
+    Returns:
+        The indexes of the first and last blocks of the region, or None if the file has neither comments nor padding
+    """
+    comment_index = next(
+        (index for index, block in enumerate(blocks) if block.block_type == VORBIS_COMMENT_BLOCK_TYPE), None
+    )
+    if comment_index is not None:
+        candidates = [comment_index]
+    else:
+        candidates = [index for index, block in enumerate(blocks) if block.block_type == VORBIS_PADDING_BLOCK_TYPE]
+
+    regions = []
+    for candidate in candidates:
+        first = last = candidate
+        while first > 0 and blocks[first - 1].block_type == VORBIS_PADDING_BLOCK_TYPE:
+            first -= 1
+        while last < len(blocks) - 1 and blocks[last + 1].block_type == VORBIS_PADDING_BLOCK_TYPE:
+            last += 1
+        regions.append((first, last))
+    return max(regions, key=lambda region: _get_block_end(blocks[region[1]]) - blocks[region[0]].offset, default=None)
+
+
+def _get_default_padding(info: PaddingInfo) -> int:
+    """Reuse all the space left over when the block fits in place, otherwise leave VORBIS_DEFAULT_PADDING_SIZE bytes."""
+    if info.padding >= 0:
+        return int(info.padding)
+    return VORBIS_BLOCK_HEADER_SIZE + VORBIS_DEFAULT_PADDING_SIZE
+
+
+def write_vorbis_comment_block(
+    context: "_AudioFileContext", block_data: bytes | None, padding: PaddingFunction | None = None
+) -> MetadataWriteReport:
+    """Write the VORBIS_COMMENT block of a FLAC file, or remove it if block_data is None.
+
+    The padding policy is asked how much space to leave after the block, PADDING block header included. When that
+    matches the space left over in the current block and the PADDING blocks around it, the block is overwritten in
+    place, which only rewrites the metadata region. Otherwise the file is rewritten through a temporary file with the
+    new block placed after STREAMINFO, followed by the requested padding. The audio frames are copied unchanged in both
+    cases. Removing the block always turns its space into padding in place.
+
+    The context must be invalidated by the caller once the block is written.
+
+    Args:
+        context: Parse context of the FLAC file
+        block_data: Data of the new VORBIS_COMMENT block, or None to remove it
+        padding: Padding policy. None reuses all the space left over when the block fits and leaves
+            VORBIS_DEFAULT_PADDING_SIZE bytes of padding when the file has to be rewritten
+
+    Returns:
+        How the block was written
+
+    Raises:
+        ValueError: If the file is not a FLAC file, the block is larger than the FLAC block size limit or the padding
+            policy returns a negative size
+        OSError: If the file cannot be written
+    """
+    if block_data is not None and len(block_data) > VORBIS_MAX_BLOCK_SIZE:
+        msg = f"Vorbis comments too large for a FLAC metadata block ({len(block_data)} bytes)"
+        raise ValueError(msg)
+
+    blocks = context.get_flac_blocks()
+    region = _find_comment_region(blocks)
+    available_size = 0 if region is None else _get_block_end(blocks[region[1]]) - blocks[region[0]].offset
+    required_size = 0 if block_data is None else VORBIS_BLOCK_HEADER_SIZE + len(block_data)
+
+    if block_data is None:
+        # The region only holds the comments when the file has some, otherwise there is nothing to remove
+        if region is not None and any(block.block_type == VORBIS_COMMENT_BLOCK_TYPE for block in blocks):
+            _write_in_place(context.file_path, blocks[region[0]], blocks[region[1]], None)
+        return MetadataWriteReport(MetadataFormat.VORBIS, in_place=True, tag_size=0, padding_size=available_size)
+
+    trailing_size = context.size - _get_block_end(blocks[-1])
+    padding_size = get_padding(padding or _get_default_padding, available_size, required_size, trailing_size)
+    # A PADDING block cannot be smaller than its header
+    padding_size = max(padding_size, VORBIS_BLOCK_HEADER_SIZE) if padding_size else 0
+
+    if region is not None and required_size + padding_size == available_size:
+        _write_in_place(context.file_path, blocks[region[0]], blocks[region[1]], block_data)
+        in_place = True
+    else:
+        _rewrite_file(context, blocks, block_data, padding_size)
+        in_place = False
+    return MetadataWriteReport(
+        MetadataFormat.VORBIS, in_place=in_place, tag_size=required_size, padding_size=padding_size
+    )
+
+
+def _write_in_place(
+    file_path: str, first: "_FlacMetadataBlock", last: "_FlacMetadataBlock", block_data: bytes | None
+) -> None:
+    available_size = _get_block_end(last) - first.offset
+    padding_size = available_size - (0 if block_data is None else VORBIS_BLOCK_HEADER_SIZE + len(block_data))
+    parts = []
+    if block_data is not None:
+        comment_is_last = last.is_last and padding_size == 0
+        parts.append(_encode_block_header(VORBIS_COMMENT_BLOCK_TYPE, len(block_data), is_last=comment_is_last))
+        parts.append(block_data)
+    if padding_size:
+        parts.append(_encode_padding_block(padding_size - VORBIS_BLOCK_HEADER_SIZE, is_last=last.is_last))
+
+    with Path(file_path).open("r+b") as f:
+        f.seek(first.offset)
+        f.write(b"".join(parts))
+
+
+def _rewrite_file(
+    context: "_AudioFileContext", blocks: list["_FlacMetadataBlock"], block_data: bytes, padding_size: int
+) -> None:
+    kept_blocks = [
+        block for block in blocks if block.block_type not in (VORBIS_COMMENT_BLOCK_TYPE, VORBIS_PADDING_BLOCK_TYPE)
+    ]
+    # STREAMINFO always comes first, the comments go right after it
+    new_blocks = [(block.block_type, context.read_at(block.data_offset, block.size)) for block in kept_blocks]
+    new_blocks.insert(1, (VORBIS_COMMENT_BLOCK_TYPE, block_data))
+
+    metadata_start = blocks[0].offset
+    audio_offset = _get_block_end(blocks[-1])
+    parts = [context.read_at(0, metadata_start)]
+    for index, (block_type, data) in enumerate(new_blocks):
+        is_last = not padding_size and index == len(new_blocks) - 1
+        parts.append(_encode_block_header(block_type, len(data), is_last=is_last))
+        parts.append(data)
+    if padding_size:
+        parts.append(_encode_padding_block(padding_size - VORBIS_BLOCK_HEADER_SIZE, is_last=True))
+
+    file_path = Path(context.file_path)
+    # The temporary file is created next to the original so that it can replace it atomically
+    with tempfile.NamedTemporaryFile(dir=file_path.parent, suffix=file_path.suffix, delete=False) as temp_file:
+        temp_path = Path(temp_file.name)
+        try:
+            temp_file.write(b"".join(parts))
+            with file_path.open("rb") as source:
+                source.seek(audio_offset)
+                shutil.copyfileobj(source, temp_file, COPY_BUFFER_SIZE)
+        except BaseException:
+            temp_file.close()
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    try:
+        shutil.copymode(file_path, temp_path)
+        # Windows cannot replace a file that is still open
+        context.release()
+        temp_path.replace(file_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
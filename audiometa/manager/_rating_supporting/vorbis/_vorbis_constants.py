@@ -4,3 +4,11 @@ VORBIS_ID3V2_HEADER_SIZE = 10
 VORBIS_BLOCK_HEADER_SIZE = 4
 VORBIS_COMMENT_BLOCK_TYPE = 4
 VORBIS_CHUNK_ID_SIZE = 4
+VORBIS_PADDING_BLOCK_TYPE = 1
+VORBIS_MAX_BLOCK_SIZE = 0xFFFFFF  # Block sizes are stored on 24 bits
+VORBIS_LAST_BLOCK_FLAG = 0x80
+VORBIS_DEFAULT_PADDING_SIZE = 4096  # Padding added when the metadata blocks have to be rewritten, as libFLAC does
+VORBIS_DEFAULT_VENDOR_STRING = "audiometa"
+VORBIS_STREAMINFO_BLOCK_TYPE = 0
+VORBIS_STREAMINFO_BLOCK_SIZE = 34
+VORBIS_MIN_AUDIO_BLOCK_SIZE = 16  # Smallest block size a STREAMINFO block may declare
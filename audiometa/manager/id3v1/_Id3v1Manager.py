@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any, cast
 
 from mutagen._file import FileType as MutagenMetadata
@@ -8,7 +9,8 @@ from ..._audio_file import _AudioFile
 from ...exceptions import FileCorruptedError, MetadataFieldNotSupportedByMetadataFormatError
 from ...utils.types import RawMetadataDict, RawMetadataKey, UnifiedMetadata, UnifiedMetadataValue
 from .._MetadataManager import _MetadataManager
-from ._constants import ID3V1_MIN_COMMENT_LENGTH_TO_CHECK_TRACK_NUMBER, ID3V1_TAG_SIZE
+from ._constants import ID3V1_MIN_COMMENT_LENGTH_TO_CHECK_TRACK_NUMBER
+from ._id3v1_tag_writer import write_id3v1_tag
 from .id3v1_raw_metadata import Id3v1RawMetadata
 from .id3v1_raw_metadata_key import Id3v1RawMetadataKey
 
@@ -128,7 +130,7 @@ class _Id3v1Manager(_MetadataManager):
 
     def _extract_mutagen_metadata(self) -> Id3v1RawMetadata:
         try:
-            return Id3v1RawMetadata(fileobj=self.audio_file.file_path)
+            return Id3v1RawMetadata(fileobj=self.audio_file.file_path, tail_data=self.audio_file.get_context().tail)
         except Exception as exc:
             msg = f"Failed to extract ID3v1 metadata: {exc}"
             raise FileCorruptedError(msg) from exc
@@ -261,21 +263,16 @@ class _Id3v1Manager(_MetadataManager):
                 msg = f"{unified_metadata_key} metadata not supported by {metadata_format_name} format"
                 raise MetadataFieldNotSupportedByMetadataFormatError(msg)
 
-        # Read the entire file
-        self.audio_file.seek(0)
-        file_data = bytearray(self.audio_file.read())
-
         # Create ID3v1 tag data
         tag_data = self._create_id3v1_tag_data(unified_metadata)
 
-        # Find and remove existing ID3v1 tag if present
-        self._remove_existing_id3v1_tag(file_data)
-
-        # Append new ID3v1 tag
-        file_data.extend(tag_data)
-
-        # Write back to file
-        self.audio_file.write(file_data)
+        # Replace the existing ID3v1 tag or append a new one, without reading or rewriting the rest of the file
+        self.audio_file.invalidate_context()
+        try:
+            with Path(self.audio_file.file_path).open("r+b") as f:
+                write_id3v1_tag(f, tag_data)
+        finally:
+            self.audio_file.invalidate_context()
 
     def _create_id3v1_tag_data(self, unified_metadata: UnifiedMetadata) -> bytes:
         """Create 128-byte ID3v1 tag data from app metadata."""
@@ -362,21 +359,6 @@ class _Id3v1Manager(_MetadataManager):
 
         return bytes(tag_data)
 
-    def _remove_existing_id3v1_tag(self, file_data: bytearray) -> bool:
-        """Remove existing ID3v1 tag from file data if present.
-
-        Returns:
-            bool: True if a tag was removed, False otherwise
-        """
-        if len(file_data) >= ID3V1_TAG_SIZE:
-            # Check if last 128 bytes contain ID3v1 tag
-            last_128 = file_data[-ID3V1_TAG_SIZE:]
-            if last_128[:3] == b"TAG":
-                # Remove the last 128 bytes
-                del file_data[-ID3V1_TAG_SIZE:]
-                return True
-        return False
-
     def _truncate_string(self, text: str, max_length: int) -> str:
         """Truncate string to maximum length, handling encoding properly."""
         if len(text) <= max_length:
@@ -405,20 +387,15 @@ class _Id3v1Manager(_MetadataManager):
         Returns:
             bool: True if metadata was successfully deleted, False otherwise
         """
+        self.audio_file.invalidate_context()
         try:
-            # Read the entire file
-            self.audio_file.seek(0)
-            file_data = bytearray(self.audio_file.read())
-
-            # Remove existing ID3v1 tag if present
-            if self._remove_existing_id3v1_tag(file_data):
-                # Write back to file
-                self.audio_file.write(file_data)
-                return True
+            # Truncate the existing ID3v1 tag if present
+            with Path(self.audio_file.file_path).open("r+b") as f:
+                return write_id3v1_tag(f, None)
         except Exception:
             return False
-        else:
-            return False
+        finally:
+            self.audio_file.invalidate_context()
 
     def get_header_info(self) -> dict:
         try:
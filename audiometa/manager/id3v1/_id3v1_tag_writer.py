@@ -0,0 +1,34 @@
+"""In-place writing of the ID3v1 tag at the end of audio files."""
+
+import os
+from typing import BinaryIO
+
+from ._constants import ID3V1_TAG_SIZE
+
+ID3V1_TAG_MARKER = b"TAG"
+
+
+def write_id3v1_tag(fileobj: BinaryIO, tag_data: bytes | None) -> bool:
+    """Replace, append or remove the ID3v1 tag of a file in place.
+
+    Only the last 128 bytes of the file are read, and nothing before the tag is rewritten, whatever the size of the
+    audio data.
+
+    Args:
+        fileobj: The file, opened for reading and writing ("r+b")
+        tag_data: The 128-byte tag to write, or None to remove the existing tag
+
+    Returns:
+        bool: True if the file had an ID3v1 tag before the call
+    """
+    end = fileobj.seek(0, os.SEEK_END)
+    has_tag = False
+    if end >= ID3V1_TAG_SIZE:
+        fileobj.seek(end - ID3V1_TAG_SIZE)
+        has_tag = fileobj.read(len(ID3V1_TAG_MARKER)) == ID3V1_TAG_MARKER
+
+    fileobj.seek(end - ID3V1_TAG_SIZE if has_tag else end)
+    if tag_data is not None:
+        fileobj.write(tag_data)
+    fileobj.truncate()
+    return has_tag
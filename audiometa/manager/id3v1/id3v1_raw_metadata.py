@@ -13,6 +13,7 @@ from ._constants import (
     ID3V1_TRACK_NUMBER_POSITION,
     ID3V1_TRACK_NUMBER_VALUE_POSITION,
 )
+from ._id3v1_tag_writer import write_id3v1_tag
 from .id3v1_raw_metadata_key import Id3v1RawMetadataKey
 
 
@@ -33,14 +34,22 @@ class Id3v1RawMetadata(FileType):
         track_number: int | None = None
         genre_code: int = 255  # 255 is undefined genre
 
-    def __init__(self, fileobj: Any):
+    def __init__(self, fileobj: Any, tail_data: bytes | None = None):
+        """Load the ID3v1 tag of a file.
+
+        Args:
+            fileobj: File path or file object
+            tail_data: Last 128 bytes of the file if the caller already read them, to avoid seeking to the end again
+        """
         self.fileobj = fileobj
         object.__setattr__(self, "tags", None)
-        self._load_tags()
+        self._load_tags(tail_data)
 
-    def _load_tags(self) -> None:
-        # Handle both file objects and file paths
-        if isinstance(self.fileobj, str | Path):
+    def _load_tags(self, tail_data: bytes | None = None) -> None:
+        # Handle already-read tail bytes, file objects and file paths
+        if tail_data is not None:
+            data = tail_data
+        elif isinstance(self.fileobj, str | Path):
             with Path(self.fileobj).open("rb") as f:
                 f.seek(-ID3V1_TAG_SIZE, 2)  # Seek from end
                 data = f.read(ID3V1_TAG_SIZE)
@@ -48,7 +57,7 @@ class Id3v1RawMetadata(FileType):
             self.fileobj.seek(-ID3V1_TAG_SIZE, 2)  # Seek from end
             data = self.fileobj.read(ID3V1_TAG_SIZE)
 
-        if not data.startswith(b"TAG"):
+        if len(data) < ID3V1_TAG_SIZE or not data.startswith(b"TAG"):
             self.tags = None
             return
 
@@ -104,35 +113,17 @@ class Id3v1RawMetadata(FileType):
         if not self.tags:
             return
 
-        # Read the entire file
-        if isinstance(self.fileobj, str | Path):  # type: ignore[unreachable]
-            # File path
-            with Path(self.fileobj).open("rb") as f:
-                file_data = bytearray(f.read())
-        else:
-            # File object - use the same pattern as _load_tags
-            self.fileobj.seek(0)
-            file_data = bytearray(self.fileobj.read())
-
         # Create ID3v1 tag data
-        tag_data = self._create_id3v1_tag_data()
-
-        # Remove existing ID3v1 tag if present
-        self._remove_existing_id3v1_tag(file_data)
-
-        # Append new ID3v1 tag
-        file_data.extend(tag_data)
+        tag_data = self._create_id3v1_tag_data()  # type: ignore[unreachable]
 
-        # Write back to file
+        # Replace the existing ID3v1 tag or append a new one, without reading or rewriting the rest of the file
         if isinstance(self.fileobj, str | Path):
             # File path
-            with Path(self.fileobj).open("wb") as f:
-                f.write(file_data)
+            with Path(self.fileobj).open("r+b") as f:
+                write_id3v1_tag(f, tag_data)
         else:
-            # File object
-            self.fileobj.seek(0)
-            self.fileobj.write(file_data)
-            self.fileobj.truncate()
+            # File object, opened for reading and writing
+            write_id3v1_tag(self.fileobj, tag_data)
 
     def _create_id3v1_tag_data(self) -> bytes:
         """Create 128-byte ID3v1 tag data from current tags."""
@@ -190,21 +181,6 @@ class Id3v1RawMetadata(FileType):
 
         return bytes(tag_data)
 
-    def _remove_existing_id3v1_tag(self, file_data: bytearray) -> bool:
-        """Remove existing ID3v1 tag from file data if present.
-
-        Returns:
-            bool: True if a tag was removed, False otherwise
-        """
-        if len(file_data) >= ID3V1_TAG_SIZE:
-            # Check if last 128 bytes contain ID3v1 tag
-            last_128 = file_data[-ID3V1_TAG_SIZE:]
-            if last_128[:3] == b"TAG":
-                # Remove the last 128 bytes
-                del file_data[-ID3V1_TAG_SIZE:]
-                return True
-        return False
-
     def _truncate_string(self, text: str, max_length: int) -> str:
         """Truncate string to maximum length, handling encoding properly."""
         if len(text) <= max_length:
@@ -224,15 +200,9 @@ class Id3v1RawMetadata(FileType):
     def delete(self, filename: str) -> None:
         """Remove tags from a file."""
         try:
-            # Read the entire file
-            with Path(filename).open("rb") as f:
-                file_data = bytearray(f.read())
-
-            # Remove existing ID3v1 tag if present
-            if self._remove_existing_id3v1_tag(file_data):
-                # Write back to file
-                with Path(filename).open("wb") as f:
-                    f.write(file_data)
+            # Truncate the existing ID3v1 tag if present
+            with Path(filename).open("r+b") as f:
+                write_id3v1_tag(f, None)
         except Exception:
             pass  # Ignore errors during deletion
 
@@ -0,0 +1,368 @@
+"""Server answering metadata requests on a Unix socket, for scripts that would otherwise run audiometa once per file.
+
+Each run of the command line interface pays the interpreter startup and the imports of audiometa and mutagen. The
+server pays them once, and answers requests in a pool of threads that keeps the state of the library in memory between
+requests, such as the loaded configuration and the metadata cache.
+
+Requests and responses are JSON objects, one per line. A connection can send any number of requests without waiting
+for their responses, which come back in the order of the requests. Requests on the same file run in the order they
+were received, and requests on different files run concurrently. The "id" of a request, if any, is copied to its
+response:
+
+    {"id": 1, "command": "unified", "file": "song.mp3"}
+    {"id": 1, "ok": true, "result": {"title": "Song", "artists": ["Artist"]}}
+    {"id": 2, "command": "write", "file": "song.mp3", "metadata": {"title": "New title"}}
+    {"id": 2, "ok": true, "result": null}
+    {"id": 3, "command": "read", "file": "missing.mp3"}
+    {"id": 3, "ok": false, "error": "File missing.mp3 does not exist", "error_type": "FileNotFoundError"}
+
+Examples:
+    from audiometa.server import MetadataServer, send_requests
+
+    server = MetadataServer("/tmp/audiometa.sock")
+    server.serve_forever()  # Runs until shutdown is called from another thread
+
+    # In another process
+    for response in send_requests("/tmp/audiometa.sock", [{"command": "unified", "file": "song.mp3"}]):
+        print(response["result"])
+"""
+
+import contextlib
+import errno
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from . import delete_all_metadata, get_full_metadata, get_unified_metadata, update_metadata
+from ._batch import _get_worker_count
+from .utils.batch_executor import BatchExecutor
+from .utils.metadata_format import MetadataFormat
+from .utils.server_command import ServerCommand
+
+# Longest request line accepted, beyond which the connection is closed
+MAX_REQUEST_SIZE = 1024 * 1024
+
+# Number of requests of a connection whose response has not been sent yet before the server stops reading it
+MAX_PENDING_REQUESTS_PER_CONNECTION = 256
+
+# Interval at which serve_forever checks whether shutdown was called
+SHUTDOWN_POLL_INTERVAL_SEC = 0.5
+
+# Response to the requests that were still waiting when the server was closed
+SHUTDOWN_ERROR_RESPONSE = {"ok": False, "error": "The server is shutting down"}
+
+
+def _parse_request(line: bytes) -> dict[str, Any]:
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        msg = f"Invalid JSON: {e}"
+        raise ValueError(msg) from e
+    if not isinstance(request, dict):
+        msg = "A request must be a JSON object"
+        raise TypeError(msg)
+    return request
+
+
+def _get_bool(request: dict[str, Any], name: str, default: bool) -> bool:
+    value = request.get(name, default)
+    if not isinstance(value, bool):
+        msg = f'"{name}" must be true or false'
+        raise TypeError(msg)
+    return value
+
+
+def run_request(request: dict[str, Any]) -> Any:
+    """Run a request in the current thread and get its result.
+
+    Args:
+        request: Request with a "command" and, for the commands other than ping, a "file". See ServerCommand for the
+            commands and their results. read accepts "include_headers" and "include_technical", unified accepts
+            "fields", write requires "metadata", and unified, write and delete accept "metadata_format"
+
+    Returns:
+        The JSON-serializable result of the command
+
+    Raises:
+        TypeError: If a field of the request has the wrong type
+        ValueError: If the request has an unknown command or invalid values
+        Exception: The exceptions raised by the function run by the command, e.g. FileNotFoundError
+    """
+    try:
+        command = ServerCommand(request.get("command"))
+    except ValueError as e:
+        msg = f"Unknown command: {request.get('command')!r}"
+        raise ValueError(msg) from e
+    if command == ServerCommand.PING:
+        return None
+
+    file = request.get("file")
+    if not isinstance(file, str):
+        msg = '"file" must be the path of the file'
+        raise TypeError(msg)
+    metadata_format = MetadataFormat(request["metadata_format"]) if request.get("metadata_format") else None
+
+    if command == ServerCommand.READ:
+        return get_full_metadata(
+            file,
+            include_headers=_get_bool(request, "include_headers", True),
+            include_technical=_get_bool(request, "include_technical", True),
+        )
+    if command == ServerCommand.UNIFIED:
+        return get_unified_metadata(file, metadata_format=metadata_format, fields=request.get("fields"))
+    if command == ServerCommand.WRITE:
+        metadata = request.get("metadata")
+        if not isinstance(metadata, dict):
+            msg = '"metadata" must be an object'
+            raise TypeError(msg)
+        if not metadata:
+            msg = '"metadata" must have at least one field'
+            raise ValueError(msg)
+        update_metadata(file, metadata, metadata_format=metadata_format)
+        return None
+    return delete_all_metadata(file, metadata_format=metadata_format)
+
+
+def _encode_response(request: dict[str, Any], response: dict[str, Any]) -> bytes:
+    if "id" in request:
+        response = {"id": request["id"], **response}
+    try:
+        return json.dumps(response).encode() + b"\n"
+    except (TypeError, ValueError) as e:
+        return _encode_response(request, {"ok": False, "error": f"Result is not JSON serializable: {e}"})
+
+
+def _answer_request(request: dict[str, Any]) -> bytes:
+    try:
+        result = run_request(request)
+    except Exception as e:
+        return _encode_response(request, {"ok": False, "error": str(e), "error_type": type(e).__name__})
+    return _encode_response(request, {"ok": True, "result": result})
+
+
+def _forward_response(request: dict[str, Any], response: Future[bytes], answer: Future[bytes]) -> None:
+    if answer.cancelled():
+        response.set_result(_encode_response(request, SHUTDOWN_ERROR_RESPONSE))
+    else:
+        response.set_result(answer.result())
+
+
+def _get_completed_future(response: bytes) -> Future[bytes]:
+    future: Future[bytes] = Future()
+    future.set_result(response)
+    return future
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Connection whose requests are read and submitted to the pool, while a second thread sends their responses."""
+
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        # Responses are sent in the order of the requests, and reading pauses while too many are pending
+        pending: queue.Queue[Future[bytes] | None] = queue.Queue(maxsize=MAX_PENDING_REQUESTS_PER_CONNECTION)
+        sender = threading.Thread(target=self._send_responses, args=(pending,), daemon=True)
+        sender.start()
+        try:
+            while line := self.rfile.readline(MAX_REQUEST_SIZE + 1):
+                if not line.strip():
+                    continue
+                if len(line) > MAX_REQUEST_SIZE:
+                    error = {"ok": False, "error": f"Requests must be at most {MAX_REQUEST_SIZE} bytes long"}
+                    pending.put(_get_completed_future(_encode_response({}, error)))
+                    break
+                try:
+                    request = _parse_request(line)
+                except (TypeError, ValueError) as e:
+                    error = {"ok": False, "error": str(e), "error_type": type(e).__name__}
+                    pending.put(_get_completed_future(_encode_response({}, error)))
+                else:
+                    pending.put(self.server.metadata_server.submit(request))
+        finally:
+            pending.put(None)
+            sender.join()
+
+    def _send_responses(self, pending: "queue.Queue[Future[bytes] | None]") -> None:
+        is_connected = True
+        while (future := pending.get()) is not None:
+            response = future.result()
+            if not is_connected:
+                # The queue is still drained, so that the reading thread is not blocked
+                continue
+            try:
+                self.wfile.write(response)
+                self.wfile.flush()
+            except OSError:
+                is_connected = False
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, socket_path: str, metadata_server: "MetadataServer"):
+        self.metadata_server = metadata_server
+        super().__init__(socket_path, _RequestHandler)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Remove the socket file left by a server that did not stop cleanly.
+
+    Raises:
+        OSError: If a server is listening on the socket
+    """
+    if not socket_path.is_socket():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(os.fspath(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink(missing_ok=True)
+            return
+    raise OSError(errno.EADDRINUSE, "A server is already listening on this socket", os.fspath(socket_path))
+
+
+class MetadataServer:
+    """Server answering metadata requests on a Unix socket, in a pool of threads.
+
+    The socket file is created readable and writable by the current user only, and the socket file of a server that
+    did not stop cleanly is replaced.
+
+    Args:
+        socket_path: Path of the socket file to listen on
+        workers: Number of requests run at once, or None for the default of read_many
+
+    Raises:
+        OSError: If a server is already listening on socket_path, or the socket cannot be created
+        ValueError: If workers is lower than 1
+    """
+
+    def __init__(self, socket_path: str | Path, *, workers: int | None = None):
+        self.socket_path = Path(socket_path).expanduser()
+        self._pool = ThreadPoolExecutor(
+            max_workers=_get_worker_count(BatchExecutor.THREAD, workers), thread_name_prefix="audiometa-serve"
+        )
+        self._lock = threading.Lock()
+        self._last_futures: dict[str, Future[bytes]] = {}  # Last request submitted per file
+        _remove_stale_socket(self.socket_path)
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(os.fspath(self.socket_path), self)
+        except OSError:
+            self._pool.shutdown()
+            raise
+        finally:
+            os.umask(previous_umask)
+
+    def submit(self, request: dict[str, Any]) -> Future[bytes]:
+        """Submit a request to the pool, once the requests on the same file submitted before it are answered.
+
+        Requests waiting for a previous request on their file are chained from its completion rather than submitted
+        right away, so that they do not hold a thread of the pool while they wait.
+
+        Returns:
+            Future of the response, encoded as a JSON line
+        """
+        response: Future[bytes] = Future()
+        file = request.get("file")
+        if not isinstance(file, str):
+            self._run(request, response)
+            return response
+        key = os.path.abspath(file)  # noqa: PTH100
+        with self._lock:
+            previous = self._last_futures.get(key)
+            self._last_futures[key] = response
+        response.add_done_callback(partial(self._forget, key))
+        if previous is None:
+            self._run(request, response)
+        else:
+            # Requests on the same file run in the order they were received, e.g. a read after a write sees the write
+            previous.add_done_callback(lambda _previous: self._run(request, response))
+        return response
+
+    def _run(self, request: dict[str, Any], response: Future[bytes]) -> None:
+        try:
+            answer = self._pool.submit(_answer_request, request)
+        except RuntimeError:
+            # Requests chained after the pool was shut down by close
+            response.set_result(_encode_response(request, SHUTDOWN_ERROR_RESPONSE))
+            return
+        answer.add_done_callback(partial(_forward_response, request, response))
+
+    def _forget(self, key: str, future: Future[bytes]) -> None:
+        with self._lock:
+            if self._last_futures.get(key) is future:
+                del self._last_futures[key]
+
+    def serve_forever(self) -> None:
+        """Answer requests until shutdown is called from another thread."""
+        self._server.serve_forever(poll_interval=SHUTDOWN_POLL_INTERVAL_SEC)
+
+    def shutdown(self) -> None:
+        """Stop serve_forever, waiting for it to return. Must be called from another thread."""
+        self._server.shutdown()
+
+    def close(self) -> None:
+        """Stop listening, finish the requests that are running and remove the socket file."""
+        self._server.server_close()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+
+def _send_lines(connection: socket.socket, lines: Iterable[bytes], errors: list[Exception]) -> None:
+    try:
+        for line in lines:
+            connection.sendall(line)
+    except Exception as e:
+        # Raised again by the reading side, once the responses to the requests sent are read
+        errors.append(e)
+    finally:
+        with contextlib.suppress(OSError):
+            connection.shutdown(socket.SHUT_WR)
+
+
+def _with_absolute_file(request: dict[str, Any]) -> dict[str, Any]:
+    file = request.get("file") if isinstance(request, dict) else None
+    if not isinstance(file, str) or Path(file).is_absolute():
+        return request
+    return {**request, "file": str(Path(file).expanduser().absolute())}
+
+
+def send_requests(socket_path: str | Path, requests: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Send requests to a server over one connection and get their responses, in the order of the requests.
+
+    Requests are sent by a background thread while the responses are read, so they can be streamed without waiting for
+    each response. Relative file paths are made absolute against the current directory, as the server runs in its own.
+
+    Args:
+        socket_path: Path of the socket file the server listens on
+        requests: Requests to send, consumed lazily
+
+    Returns:
+        Iterator of the responses
+
+    Raises:
+        OSError: If no server listens on socket_path, or the connection is lost
+        TypeError: If a request is not JSON serializable
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(os.fspath(Path(socket_path).expanduser()))
+        errors: list[Exception] = []
+        lines = (json.dumps(_with_absolute_file(request)).encode() + b"\n" for request in requests)
+        sender = threading.Thread(target=_send_lines, args=(connection, lines, errors), daemon=True)
+        sender.start()
+        with connection.makefile("rb") as responses:
+            for response in responses:
+                yield json.loads(response)
+        sender.join()
+        if errors:
+            raise errors[0]
@@ -1,7 +1,9 @@
 """Test configuration for audiometa-python tests."""
 
 import importlib.util
+import shutil
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -56,6 +58,18 @@ def assets_dir() -> Path:
     return Path(__file__).parent.parent.parent / "test" / "assets"
 
 
+@pytest.fixture
+def copy_to_tmp_path(tmp_path: Path) -> Callable[..., Path]:
+    """Get a function copying a file to tmp_path under a name, keeping its extension, so tests can modify the copy."""
+
+    def copy(source: Path, name: str = "copy") -> Path:
+        target = tmp_path / f"{name}{source.suffix}"
+        shutil.copy(source, target)
+        return target
+
+    return copy
+
+
 @pytest.fixture
 def sample_mp3_file(assets_dir: Path) -> Path:
     return assets_dir / "sample.mp3"
@@ -0,0 +1,17 @@
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+
+def run_cli(*args: str) -> subprocess.CompletedProcess:
+    """Run the audiometa command line interface in a new interpreter and capture its output."""
+    return subprocess.run([sys.executable, "-m", "audiometa", *args], capture_output=True, text=True, check=False)
+
+
+@pytest.fixture
+def mp3_files(sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]) -> list[Path]:
+    """Copies of the sample MP3 file, to run commands on several files."""
+    return [copy_to_tmp_path(sample_mp3_file, f"track{index}") for index in range(6)]
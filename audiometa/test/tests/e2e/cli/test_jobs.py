@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from audiometa.test.tests.e2e.cli.conftest import run_cli
+
+
+def _json_documents(output: str) -> list[dict]:
+    decoder = json.JSONDecoder()
+    documents = []
+    position = 0
+    while position < len(output.rstrip()):
+        document, end = decoder.raw_decode(output, position)
+        documents.append(document)
+        position = end + 1
+    return documents
+
+
+@pytest.mark.e2e
+class TestCLIJobs:
+    def test_parallel_read_output_matches_serial_output(self, mp3_files: list[Path]):
+        serial = run_cli("read", *map(str, mp3_files), "--no-headers")
+        parallel = run_cli("read", *map(str, mp3_files), "--no-headers", "--jobs", "3")
+
+        assert parallel.returncode == serial.returncode == 0
+        assert parallel.stdout == serial.stdout
+
+    def test_unordered_read_outputs_every_file(self, mp3_files: list[Path]):
+        result = run_cli("unified", *map(str, mp3_files), "--jobs", "auto", "--unordered")
+
+        assert result.returncode == 0
+        assert len(_json_documents(result.stdout)) == len(mp3_files)
+
+    def test_parallel_write_and_delete(self, mp3_files: list[Path]):
+        written = run_cli("write", *map(str, mp3_files), "--title", "Parallel", "-j", "4")
+        read_back = run_cli("unified", *map(str, mp3_files), "-j", "4")
+        deleted = run_cli("delete", *map(str, mp3_files), "-j", "4")
+
+        assert written.returncode == read_back.returncode == deleted.returncode == 0
+        assert sorted(written.stdout.splitlines()) == sorted(f"Updated metadata for: {file}" for file in mp3_files)
+        assert all(document["title"] == "Parallel" for document in _json_documents(read_back.stdout))
+        assert len(deleted.stdout.splitlines()) == len(mp3_files)
+
+    def test_parallel_write_skips_files_given_twice(self, mp3_files: list[Path]):
+        # The directory lists the same files again
+        files = [*map(str, mp3_files), str(mp3_files[0].parent), "--recursive"]
+
+        written = run_cli("write", *files, "--title", "Once", "-j", "4")
+        deleted = run_cli("delete", *files, "-j", "4")
+
+        assert written.returncode == deleted.returncode == 0
+        assert sorted(written.stdout.splitlines()) == sorted(f"Updated metadata for: {file}" for file in mp3_files)
+        assert len(deleted.stdout.splitlines()) == len(mp3_files)
+
+    def test_errors_keep_serial_exit_codes(self, mp3_files: list[Path], tmp_path: Path):
+        broken_file = tmp_path / "broken.mp3"
+        broken_file.write_bytes(b"not an mp3 file")
+        files = [str(mp3_files[0]), str(broken_file), *map(str, mp3_files[1:])]
+
+        stopped = run_cli("unified", *files, "--jobs", "2")
+        continued = run_cli("unified", *files, "--jobs", "2", "--continue-on-error")
+
+        assert stopped.returncode == 1
+        assert len(_json_documents(stopped.stdout)) == 1  # Only the file before the error, as in a serial run
+        assert continued.returncode == 0
+        assert len(_json_documents(continued.stdout)) == len(mp3_files)
+        assert continued.stderr.startswith("Error:")
+
+    def test_invalid_job_count(self, mp3_files: list[Path]):
+        result = run_cli("read", str(mp3_files[0]), "--jobs", "0")
+
+        assert result.returncode == 2
+        assert "positive integer or auto" in result.stderr
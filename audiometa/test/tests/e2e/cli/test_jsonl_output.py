@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from audiometa.test.tests.e2e.cli.conftest import run_cli
+
+
+@pytest.mark.e2e
+class TestCLIJsonlOutput:
+    def test_unified_outputs_one_line_per_file(self, mp3_files: list[Path]):
+        result = run_cli("unified", *map(str, mp3_files), "--format", "jsonl")
+
+        assert result.returncode == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [record["file"] for record in records] == list(map(str, mp3_files))
+
+    def test_read_with_jobs_outputs_every_file(self, mp3_files: list[Path]):
+        result = run_cli("read", *map(str, mp3_files), "--format", "jsonl", "--jobs", "3", "--unordered")
+
+        assert result.returncode == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert sorted(record["file"] for record in records) == sorted(map(str, mp3_files))
+        assert all("unified_metadata" in record for record in records)
+
+    def test_output_file_receives_every_file(self, mp3_files: list[Path], tmp_path: Path):
+        output_file = tmp_path / "metadata.jsonl"
+
+        result = run_cli("unified", *map(str, mp3_files), "--format", "jsonl", "--output", str(output_file))
+
+        assert result.returncode == 0
+        assert result.stdout == ""
+        records = [json.loads(line) for line in output_file.read_text().splitlines()]
+        assert [record["file"] for record in records] == list(map(str, mp3_files))
+
+    def test_output_file_is_not_overwritten_by_each_file(self, mp3_files: list[Path], tmp_path: Path):
+        output_file = tmp_path / "metadata.json"
+
+        result = run_cli("unified", *map(str, mp3_files[:2]), "--output", str(output_file))
+
+        assert result.returncode == 0
+        decoder = json.JSONDecoder()
+        content = output_file.read_text()
+        _first, end = decoder.raw_decode(content)
+        _second, _ = decoder.raw_decode(content, end + 1)
+
+    def test_unreadable_file_outputs_error_record(self, mp3_files: list[Path], tmp_path: Path):
+        corrupted = tmp_path / "corrupted.mp3"
+        corrupted.write_bytes(b"not audio")
+
+        result = run_cli("unified", str(mp3_files[0]), str(corrupted), "--format", "jsonl", "--continue-on-error")
+
+        assert result.returncode == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert records[0]["file"] == str(mp3_files[0])
+        assert records[1]["file"] == str(corrupted)
+        assert records[1]["error"]
+        assert result.stderr.startswith("Error:")
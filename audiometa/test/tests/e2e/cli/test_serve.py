@@ -0,0 +1,72 @@
+import json
+import signal
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+
+def _run_client(socket_path: Path, *requests: str, stdin: str | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "audiometa", "client", "--socket", str(socket_path), *requests],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+@pytest.fixture
+def server_socket(tmp_path: Path) -> Iterator[Path]:
+    socket_path = tmp_path / "audiometa.sock"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "audiometa", "serve", "--socket", str(socket_path), "--workers", "2"],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stderr is not None
+    # Written once the socket is listening
+    assert process.stderr.readline().startswith("Listening on")
+    yield socket_path
+    process.send_signal(signal.SIGTERM)
+    process.wait(timeout=10)
+    assert process.returncode == 0
+    assert not socket_path.exists()
+
+
+@pytest.mark.e2e
+class TestCLIServe:
+    def test_client_sends_requests_from_arguments(self, server_socket: Path, sample_mp3_file: Path):
+        request = json.dumps({"id": 1, "command": "unified", "file": str(sample_mp3_file)})
+
+        result = _run_client(server_socket, '{"command": "ping"}', request)
+
+        assert result.returncode == 0
+        responses = [json.loads(line) for line in result.stdout.splitlines()]
+        assert responses[0] == {"ok": True, "result": None}
+        assert responses[1]["id"] == 1
+        assert responses[1]["ok"]
+
+    def test_client_sends_requests_from_stdin(self, server_socket: Path, sample_mp3_file: Path):
+        requests = [{"command": "read", "file": str(sample_mp3_file), "include_technical": False}] * 3
+
+        result = _run_client(server_socket, stdin="".join(json.dumps(request) + "\n" for request in requests))
+
+        assert result.returncode == 0
+        assert len(result.stdout.splitlines()) == len(requests)
+
+    def test_client_exits_with_error_when_a_request_fails(self, server_socket: Path, tmp_path: Path):
+        request = json.dumps({"command": "delete", "file": str(tmp_path / "missing.mp3")})
+
+        result = _run_client(server_socket, request, '{"command": "ping"}')
+
+        assert result.returncode == 1
+        assert [json.loads(line)["ok"] for line in result.stdout.splitlines()] == [False, True]
+
+    def test_client_fails_without_server(self, tmp_path: Path):
+        result = _run_client(tmp_path / "missing.sock", '{"command": "ping"}')
+
+        assert result.returncode == 1
+        assert result.stderr.startswith("Error:")
@@ -0,0 +1,54 @@
+import json
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from audiometa.test.tests.e2e.cli.conftest import run_cli
+
+
+def _run_verify(*args: str) -> subprocess.CompletedProcess:
+    return run_cli("verify", "--method", "native", *args)
+
+
+@pytest.mark.e2e
+class TestCLIVerify:
+    def test_cli_verify_writes_json_lines_and_throughput(
+        self, sample_flac_file: Path, tmp_path: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        for index in range(2):
+            copy_to_tmp_path(sample_flac_file, f"track{index}")
+        (tmp_path / "notes.mp3").write_text("ignored")
+
+        result = _run_verify(str(tmp_path), "--recursive", "--workers", "2")
+
+        assert result.returncode == 0
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert sorted(Path(line["file"]).name for line in lines) == ["track0.flac", "track1.flac"]
+        assert all(line["md5_state"] == "valid" and line["error"] is None for line in lines)
+        assert "MB/s" in result.stderr
+        assert "files/s" in result.stderr
+
+    def test_cli_verify_resumes_from_state_file(
+        self, sample_flac_file: Path, tmp_path: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        flac_file = copy_to_tmp_path(sample_flac_file, "track")
+        state_file = tmp_path / "state.jsonl"
+        output_file = tmp_path / "results.jsonl"
+
+        first = _run_verify(str(flac_file), "--state-file", str(state_file), "-o", str(output_file), "--no-progress")
+        second = _run_verify(str(flac_file), "--state-file", str(state_file), "-o", str(output_file), "--no-progress")
+
+        assert first.returncode == second.returncode == 0
+        assert first.stderr == second.stderr == ""
+        assert len(output_file.read_text().splitlines()) == 1
+
+    def test_cli_verify_fails_on_unreadable_file(self, tmp_path: Path):
+        broken_file = tmp_path / "broken.flac"
+        broken_file.write_bytes(b"not a flac file")
+
+        result = _run_verify(str(broken_file), "--no-progress")
+
+        assert result.returncode == 1
+        assert json.loads(result.stdout)["error"]
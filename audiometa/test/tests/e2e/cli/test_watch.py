@@ -0,0 +1,47 @@
+import json
+import shutil
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.e2e
+class TestCLIWatch:
+    def test_cli_watch_updates_index_until_terminated(self, sample_mp3_file: Path, tmp_path: Path):
+        library = tmp_path / "library"
+        library.mkdir()
+        shutil.copy(sample_mp3_file, library / "existing.mp3")
+        index_file = tmp_path / "index.sqlite3"
+
+        process = subprocess.Popen(
+            [sys.executable, "-m", "audiometa", "watch", str(library), "--index", str(index_file), "--debounce", "0.2"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert process.stdout is not None
+            initial_scan = json.loads(process.stdout.readline())
+            shutil.copy(sample_mp3_file, library / "added.mp3")
+            update = json.loads(process.stdout.readline())
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=10)
+
+        assert process.returncode == 0
+        assert initial_scan["read_count"] == 1
+        assert update["read_count"] == 1
+
+    def test_cli_watch_fails_on_missing_directory(self, tmp_path: Path):
+        result = subprocess.run(
+            [sys.executable, "-m", "audiometa", "watch", str(tmp_path / "missing"), "--index", str(tmp_path / "i.db")],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        assert result.returncode == 1
+        assert "Not a directory" in result.stderr
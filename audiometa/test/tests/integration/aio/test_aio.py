@@ -0,0 +1,97 @@
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from audiometa import aio, get_full_metadata
+from audiometa._audio_file import _AudioFile
+from audiometa.utils.flac_md5_state import FlacMd5State
+from audiometa.utils.flac_md5_verification_method import FlacMd5VerificationMethod
+from audiometa.utils.metadata_format import MetadataFormat
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+def _fail_blocking_run(*_args, **_kwargs):
+    pytest.fail("External tools should be run with asyncio.create_subprocess_exec")
+
+
+@pytest.fixture
+def _restore_concurrency_limit():
+    limit = aio.get_concurrency_limit()
+    yield
+    aio.set_concurrency_limit(limit)
+
+
+@pytest.mark.integration
+class TestAio:
+    def test_update_and_read(self, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        mp3_file = copy_to_tmp_path(sample_mp3_file)
+
+        async def update_and_read():
+            reports = await aio.update_metadata(
+                mp3_file, {UnifiedMetadataKey.TITLE: "Async"}, metadata_format=MetadataFormat.ID3V2
+            )
+            return reports, await aio.get_unified_metadata(mp3_file)
+
+        reports, metadata = asyncio.run(update_and_read())
+
+        assert [report.metadata_format for report in reports] == [MetadataFormat.ID3V2]
+        assert metadata[UnifiedMetadataKey.TITLE] == "Async"
+
+    def test_flac_tool_is_run_asynchronously(self, monkeypatch: pytest.MonkeyPatch, sample_flac_file: Path):
+        monkeypatch.setattr(_AudioFile, "get_flac_md5_state_without_test", lambda _self: None)
+        monkeypatch.setattr(_AudioFile, "get_flac_test_command", lambda _self: [sys.executable, "-c", "print('ok')"])
+        monkeypatch.setattr(subprocess, "run", _fail_blocking_run)
+
+        assert asyncio.run(aio.is_flac_md5_valid(sample_flac_file)) == FlacMd5State.VALID
+
+    def test_missing_flac_tool_raises_instead_of_decoding_natively(
+        self, monkeypatch: pytest.MonkeyPatch, sample_flac_file: Path
+    ):
+        monkeypatch.setattr(_AudioFile, "get_flac_md5_state_without_test", lambda _self: None)
+        monkeypatch.setattr(_AudioFile, "get_flac_test_command", lambda _self: ["audiometa-missing-flac", "-t"])
+        monkeypatch.setattr(subprocess, "run", _fail_blocking_run)
+
+        with pytest.raises(FileNotFoundError, match="NATIVE"):
+            asyncio.run(aio.is_flac_md5_valid(sample_flac_file))
+
+    def test_full_metadata_matches_sync_api(self, sample_flac_file: Path):
+        expected = get_full_metadata(sample_flac_file, flac_md5_method=FlacMd5VerificationMethod.NATIVE)
+
+        result = asyncio.run(aio.get_full_metadata(sample_flac_file, flac_md5_method=FlacMd5VerificationMethod.NATIVE))
+
+        assert result == expected
+
+    @pytest.mark.usefixtures("_restore_concurrency_limit")
+    def test_concurrency_limit(self, monkeypatch: pytest.MonkeyPatch, sample_mp3_file: Path):
+        lock = threading.Lock()
+        active = 0
+        max_active = 0
+
+        def slow_read(*_args):
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {}
+
+        monkeypatch.setattr(aio, "_get_unified_metadata", slow_read)
+        aio.set_concurrency_limit(2)
+
+        async def read_all():
+            return await asyncio.gather(*(aio.get_unified_metadata(sample_mp3_file) for _ in range(8)))
+
+        assert asyncio.run(read_all()) == [{}] * 8
+        assert max_active == 2
+
+    def test_invalid_concurrency_limit(self):
+        with pytest.raises(ValueError, match="limit must be at least 1"):
+            aio.set_concurrency_limit(0)
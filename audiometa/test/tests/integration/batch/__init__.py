@@ -0,0 +1 @@
+"""Integration tests for batch reading and writing."""
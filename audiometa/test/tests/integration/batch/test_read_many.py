@@ -0,0 +1,115 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import audiometa
+from audiometa import get_unified_metadata, read_many
+from audiometa._audio_file import _AudioFile
+from audiometa.cache import MetadataCache, set_metadata_cache
+from audiometa.exceptions import FileTypeNotSupportedError, MetadataFieldNotSupportedByLibError
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+class _CountingAudioFile(_AudioFile):
+    def __init__(self, opened: list["_CountingAudioFile"], *args: Any):
+        super().__init__(*args)
+        self.is_closed = False
+        opened.append(self)
+
+    def close(self) -> None:
+        self.is_closed = True
+        super().close()
+
+
+@pytest.mark.integration
+class TestReadMany:
+    def test_ordered_results_match_single_file_reads(
+        self, sample_mp3_file: Path, sample_flac_file: Path, sample_wav_file: Path
+    ):
+        files = [sample_mp3_file, sample_flac_file, sample_wav_file]
+
+        results = list(read_many(files, workers=2))
+
+        assert [result.file for result in results] == files
+        assert all(result.ok for result in results)
+        assert [result.unified_metadata for result in results] == [get_unified_metadata(file) for file in files]
+
+    def test_errors_are_captured_per_file(self, sample_mp3_file: Path, tmp_path: Path):
+        unsupported_file = tmp_path / "notes.txt"
+        unsupported_file.write_text("not audio")
+        missing_file = tmp_path / "missing.mp3"
+
+        results = list(read_many([missing_file, unsupported_file, sample_mp3_file]))
+
+        assert isinstance(results[0].error, FileNotFoundError)
+        assert isinstance(results[1].error, FileTypeNotSupportedError)
+        assert results[2].ok
+
+    def test_fields_and_technical_info(self, sample_mp3_file: Path):
+        result = next(
+            read_many([sample_mp3_file], fields=["title", UnifiedMetadataKey.ARTISTS], include_technical=True)
+        )
+
+        assert set(result.unified_metadata) <= {UnifiedMetadataKey.TITLE, UnifiedMetadataKey.ARTISTS}
+        assert result.technical_info["sample_rate_hz"] > 0
+        assert result.technical_info["file_size_bytes"] == sample_mp3_file.stat().st_size
+
+    def test_technical_info_is_read_from_the_same_parse(self, monkeypatch: pytest.MonkeyPatch, sample_mp3_file: Path):
+        opened: list[_CountingAudioFile] = []
+        monkeypatch.setattr(audiometa, "_AudioFile", lambda *args: _CountingAudioFile(opened, *args))
+
+        result = next(read_many([sample_mp3_file], include_technical=True))
+
+        assert result.ok
+        assert len(opened) == 1
+        assert opened[0].is_closed
+
+    def test_cached_technical_info_skips_parsing(
+        self, monkeypatch: pytest.MonkeyPatch, sample_mp3_file: Path, tmp_path: Path
+    ):
+        cache = MetadataCache(tmp_path / "cache.sqlite3")
+        set_metadata_cache(cache)
+        try:
+            first = next(read_many([sample_mp3_file], include_technical=True))
+            opened: list[_CountingAudioFile] = []
+            monkeypatch.setattr(audiometa, "_AudioFile", lambda *args: _CountingAudioFile(opened, *args))
+            second = next(read_many([sample_mp3_file], include_technical=True))
+        finally:
+            set_metadata_cache(None)
+            cache.close()
+
+        assert second.unified_metadata == first.unified_metadata
+        assert second.technical_info == first.technical_info
+        assert opened == []
+
+    def test_unordered_process_pool(self, sample_mp3_file: Path, sample_flac_file: Path):
+        files = [sample_mp3_file, sample_flac_file] * 3
+
+        results = list(read_many(files, workers=2, executor="process", ordered=False))
+
+        assert sorted(str(result.file) for result in results) == sorted(str(file) for file in files)
+        assert all(result.ok for result in results)
+
+    def test_files_are_pulled_lazily(self, sample_mp3_file: Path):
+        consumed: list[int] = []
+
+        def files() -> Iterator[Path]:
+            for index in range(100):
+                consumed.append(index)
+                yield sample_mp3_file
+
+        results = read_many(files(), workers=1, max_in_flight=2)
+        next(results)
+
+        assert len(consumed) <= 3
+        results.close()
+
+    def test_invalid_arguments(self, sample_mp3_file: Path):
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            read_many([sample_mp3_file], workers=0)
+        with pytest.raises(ValueError, match="max_in_flight must be at least 1"):
+            read_many([sample_mp3_file], max_in_flight=0)
+        with pytest.raises(MetadataFieldNotSupportedByLibError):
+            read_many([sample_mp3_file], fields=["not a field"])
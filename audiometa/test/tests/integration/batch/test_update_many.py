@@ -0,0 +1,143 @@
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import audiometa
+from audiometa import get_unified_metadata, update_many
+from audiometa.exceptions import InvalidRatingValueError, MetadataWritingConflictParametersError
+from audiometa.utils.metadata_format import MetadataFormat
+from audiometa.utils.metadata_writing_strategy import MetadataWritingStrategy
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+@pytest.mark.integration
+class TestUpdateMany:
+    def test_shared_metadata_is_written_to_every_file(
+        self,
+        sample_mp3_file: Path,
+        sample_flac_file: Path,
+        sample_wav_file: Path,
+        copy_to_tmp_path: Callable[..., Path],
+    ):
+        files = [copy_to_tmp_path(sample) for sample in (sample_mp3_file, sample_flac_file, sample_wav_file)]
+
+        results = update_many(files, {UnifiedMetadataKey.ALBUM: "Batch Album"}, workers=3)
+
+        assert [result.file for result in results] == files
+        assert all(result.ok for result in results)
+        for file in files:
+            assert get_unified_metadata(file)[UnifiedMetadataKey.ALBUM] == "Batch Album"
+
+    def test_pairs_and_per_dict_validation(
+        self, monkeypatch: pytest.MonkeyPatch, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        validated: list[Any] = []
+        validate = audiometa._validate_unified_metadata_types
+
+        def counting_validate(unified_metadata):
+            validated.append(unified_metadata)
+            validate(unified_metadata)
+
+        monkeypatch.setattr(audiometa, "_validate_unified_metadata_types", counting_validate)
+        files = [copy_to_tmp_path(sample_mp3_file, f"track{index}") for index in range(4)]
+        shared_metadata = {UnifiedMetadataKey.ALBUM: "Shared"}
+        invalid_metadata = {UnifiedMetadataKey.RATING: -1}
+
+        results = update_many(
+            [(files[0], shared_metadata), (files[1], shared_metadata), (files[2], invalid_metadata), files[3]],
+            {UnifiedMetadataKey.TITLE: "Default"},
+            metadata_format=MetadataFormat.ID3V2,
+        )
+
+        assert len(validated) == 3
+        assert [result.ok for result in results] == [True, True, False, True]
+        assert isinstance(results[2].error, InvalidRatingValueError)
+        assert results[0].write_reports[0].metadata_format == MetadataFormat.ID3V2
+        assert get_unified_metadata(files[1])[UnifiedMetadataKey.ALBUM] == "Shared"
+        assert get_unified_metadata(files[3])[UnifiedMetadataKey.TITLE] == "Default"
+
+    def test_write_errors_are_captured_per_file(
+        self, sample_mp3_file: Path, tmp_path: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        mp3_file = copy_to_tmp_path(sample_mp3_file)
+
+        results = update_many([tmp_path / "missing.mp3", mp3_file], {UnifiedMetadataKey.TITLE: "Title"})
+
+        assert isinstance(results[0].error, FileNotFoundError)
+        assert results[1].ok
+
+    def test_flac_writes_are_capped(
+        self, monkeypatch: pytest.MonkeyPatch, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        lock = threading.Lock()
+        active = 0
+        max_active = 0
+
+        def slow_write(*_args, **_kwargs):
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return []
+
+        monkeypatch.setattr(audiometa, "_handle_metadata_strategy", slow_write)
+        files = [copy_to_tmp_path(sample_flac_file, f"track{index}") for index in range(6)]
+
+        results = update_many(files, {UnifiedMetadataKey.TITLE: "Title"}, workers=6, max_concurrent_flac_writes=2)
+
+        assert all(result.ok for result in results)
+        assert max_active <= 2
+
+    def test_file_given_twice_is_written_once_at_a_time(
+        self, monkeypatch: pytest.MonkeyPatch, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        lock = threading.Lock()
+        active = 0
+        max_active = 0
+        handle_metadata_strategy = audiometa._handle_metadata_strategy
+
+        def slow_write(*args):
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.02)
+            try:
+                return handle_metadata_strategy(*args)
+            finally:
+                with lock:
+                    active -= 1
+
+        monkeypatch.setattr(audiometa, "_handle_metadata_strategy", slow_write)
+        mp3_file = copy_to_tmp_path(sample_mp3_file)
+        same_file = str(mp3_file.parent / "." / mp3_file.name)
+
+        results = update_many(
+            [(mp3_file, {UnifiedMetadataKey.TITLE: "First"}), (same_file, {UnifiedMetadataKey.TITLE: "Second"})],
+            workers=2,
+        )
+
+        assert [result.file for result in results] == [mp3_file, same_file]
+        assert all(result.ok for result in results)
+        assert max_active == 1
+        assert get_unified_metadata(mp3_file)[UnifiedMetadataKey.TITLE] == "Second"
+
+    def test_invalid_arguments(self, sample_mp3_file: Path):
+        with pytest.raises(ValueError, match="No metadata given"):
+            update_many([sample_mp3_file])
+        with pytest.raises(ValueError, match="max_concurrent_flac_writes must be at least 1"):
+            update_many([sample_mp3_file], {UnifiedMetadataKey.TITLE: "Title"}, max_concurrent_flac_writes=0)
+        with pytest.raises(MetadataWritingConflictParametersError):
+            update_many(
+                [sample_mp3_file],
+                {UnifiedMetadataKey.TITLE: "Title"},
+                metadata_strategy=MetadataWritingStrategy.SYNC,
+                metadata_format=MetadataFormat.ID3V2,
+            )
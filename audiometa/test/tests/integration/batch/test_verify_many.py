@@ -0,0 +1,77 @@
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from audiometa import FlacMd5State, is_flac_md5_valid, verify_many
+from audiometa.exceptions import FileTypeNotSupportedError
+from audiometa.utils.flac_md5_verification_method import FlacMd5VerificationMethod
+
+
+@pytest.fixture
+def flac_files(sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]) -> list[Path]:
+    return [copy_to_tmp_path(sample_flac_file, f"track{index}") for index in range(3)]
+
+
+@pytest.mark.integration
+class TestVerifyMany:
+    def test_results_match_single_file_checks(self, flac_files: list[Path]):
+        results = list(verify_many(flac_files, workers=2, method=FlacMd5VerificationMethod.NATIVE, ordered=True))
+
+        assert [result.file for result in results] == flac_files
+        assert all(result.ok for result in results)
+        expected = [is_flac_md5_valid(file, method=FlacMd5VerificationMethod.NATIVE) for file in flac_files]
+        assert [result.md5_state for result in results] == expected
+        assert all(
+            result.file_size_bytes == file.stat().st_size for result, file in zip(results, flac_files, strict=True)
+        )
+
+    def test_errors_are_captured_per_file(self, sample_mp3_file: Path, flac_files: list[Path], tmp_path: Path):
+        missing_file = tmp_path / "missing.flac"
+
+        results = list(verify_many([missing_file, sample_mp3_file, flac_files[0]], method="native", ordered=True))
+
+        assert isinstance(results[0].error, FileNotFoundError)
+        assert isinstance(results[1].error, FileTypeNotSupportedError)
+        assert results[1].to_dict()["md5_state"] is None
+        assert results[2].ok
+        assert results[2].md5_state is not None
+        assert json.loads(json.dumps(results[2].to_dict()))["md5_state"] == results[2].md5_state.value
+
+    def test_state_file_resumes_audit(self, flac_files: list[Path], tmp_path: Path):
+        state_file = tmp_path / "state" / "audit.jsonl"
+
+        first_run = verify_many(flac_files, method="native", state_file=state_file, ordered=True)
+        assert next(first_run).file == flac_files[0]
+        first_run.close()  # Interrupted after the first file
+
+        resumed = list(verify_many(flac_files, method="native", state_file=state_file))
+
+        assert sorted(result.file for result in resumed) == flac_files[1:]
+        assert list(verify_many(flac_files, method="native", state_file=state_file)) == []
+        assert len(state_file.read_text().splitlines()) == len(flac_files)
+
+    def test_changed_and_failed_files_are_checked_again(self, flac_files: list[Path], tmp_path: Path):
+        state_file = tmp_path / "audit.jsonl"
+        missing_file = tmp_path / "missing.flac"
+        list(verify_many([*flac_files, missing_file], method="native", state_file=state_file))
+
+        stat_result = flac_files[0].stat()
+        os.utime(flac_files[0], ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+        results = list(verify_many([*flac_files, missing_file], method="native", state_file=state_file))
+
+        assert sorted(result.file for result in results) == sorted([flac_files[0], missing_file])
+
+    def test_truncated_state_line_is_ignored(self, flac_files: list[Path], tmp_path: Path):
+        state_file = tmp_path / "audit.jsonl"
+        list(verify_many(flac_files[:1], method="native", state_file=state_file))
+        with state_file.open("a") as f:
+            f.write('{"path": "/cut')
+
+        results = list(verify_many(flac_files, method="native", state_file=state_file))
+
+        assert sorted(result.file for result in results) == flac_files[1:]
+        for line in state_file.read_text().splitlines()[-2:]:
+            assert json.loads(line)["md5_state"] == FlacMd5State.VALID.value
@@ -5,7 +5,10 @@ from pathlib import Path
 
 import pytest
 
-from audiometa import get_full_metadata
+from audiometa import _audio_file_context as audio_file_context_module
+from audiometa import get_full_metadata, get_unified_metadata
+from audiometa._audio_file import _AudioFile
+from audiometa.utils.flac_md5_verification_method import FlacMd5VerificationMethod
 
 
 @pytest.mark.integration
@@ -93,3 +96,37 @@ class TestGetFullMetadataPerformance:
         # Headers and technical info should be minimal
         assert "headers" in result_minimal
         assert "technical_info" in result_minimal
+
+    @pytest.mark.parametrize(
+        ("sample_file_fixture", "mutagen_class_name"), [("sample_mp3_file", "MP3"), ("sample_flac_file", "FLAC")]
+    )
+    def test_get_full_metadata_parses_file_once(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        request: pytest.FixtureRequest,
+        sample_file_fixture: str,
+        mutagen_class_name: str,
+    ):
+        audio_files: list[_AudioFile] = []
+        parses: list[object] = []
+        audio_file_init = _AudioFile.__init__
+        mutagen_class = getattr(audio_file_context_module, mutagen_class_name)
+
+        def counting_init(self, *args, **kwargs):
+            audio_files.append(self)
+            audio_file_init(self, *args, **kwargs)
+
+        def counting_parse(*args, **kwargs):
+            parses.append(args)
+            return mutagen_class(*args, **kwargs)
+
+        monkeypatch.setattr(_AudioFile, "__init__", counting_init)
+        monkeypatch.setattr(audio_file_context_module, mutagen_class_name, counting_parse)
+
+        result = get_full_metadata(
+            request.getfixturevalue(sample_file_fixture), flac_md5_method=FlacMd5VerificationMethod.NATIVE
+        )
+
+        assert len(audio_files) == 1
+        assert len(parses) == 1
+        assert result["unified_metadata"] == get_unified_metadata(request.getfixturevalue(sample_file_fixture))
@@ -0,0 +1,143 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import audiometa.index
+from audiometa import update_metadata
+from audiometa.exceptions import MetadataFieldNotSupportedByLibError
+from audiometa.index import Between, Contains, MetadataIndex
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+@pytest.fixture
+def metadata_index(tmp_path: Path):
+    index = MetadataIndex(tmp_path / "index" / "audiometa.sqlite3")
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def library(sample_mp3_file: Path, tmp_path: Path) -> Path:
+    library = tmp_path / "library"
+    (library / "album").mkdir(parents=True)
+    tracks = {
+        "slow.mp3": (["Daft Punk"], 110),
+        "album/fast.mp3": (["Daft Punk", "Pharrell Williams"], 125),
+        "album/other.mp3": (["Justice"], 128),
+    }
+    for name, (artists, bpm) in tracks.items():
+        target = library / name
+        shutil.copy(sample_mp3_file, target)
+        update_metadata(target, {UnifiedMetadataKey.ARTISTS: artists, UnifiedMetadataKey.BPM: bpm})
+    return library
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    reads: list[str] = []
+    read_file_for_index = audiometa.index._read_file_for_index
+
+    def counting_read(identity):
+        reads.append(identity[0])
+        return read_file_for_index(identity)
+
+    monkeypatch.setattr(audiometa.index, "_read_file_for_index", counting_read)
+    return reads
+
+
+def _names(entries) -> list[str]:
+    return [entry.path.name for entry in entries]
+
+
+@pytest.mark.integration
+class TestMetadataIndex:
+    def test_scan_indexes_full_metadata(self, metadata_index: MetadataIndex, library: Path):
+        report = metadata_index.scan(library)
+
+        assert (report.file_count, report.read_count, report.unchanged_count) == (3, 3, 0)
+        entry = metadata_index.get(library / "album" / "fast.mp3")
+        assert entry is not None
+        assert entry.ok
+        assert entry.unified_metadata[UnifiedMetadataKey.ARTISTS] == ["Daft Punk", "Pharrell Williams"]
+        assert entry.metadata_format["id3v2"][UnifiedMetadataKey.BPM] == 125
+        assert "TBPM" in entry.raw_metadata["id3v2"]["frames"]
+        assert entry.technical_info["file_size_bytes"] == entry.size == (library / "album" / "fast.mp3").stat().st_size
+
+    def test_rescan_reads_only_changed_files(
+        self, monkeypatch: pytest.MonkeyPatch, metadata_index: MetadataIndex, library: Path
+    ):
+        metadata_index.scan(library)
+        changed_file = library / "slow.mp3"
+        update_metadata(changed_file, {UnifiedMetadataKey.BPM: 90})
+        stat_result = changed_file.stat()
+        os.utime(changed_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+        reads = _count_reads(monkeypatch)
+
+        report = metadata_index.scan(library)
+
+        assert reads == [str(changed_file.absolute())]
+        assert (report.read_count, report.unchanged_count) == (1, 2)
+        assert _names(metadata_index.query({UnifiedMetadataKey.BPM: 90})) == ["slow.mp3"]
+
+    def test_rescan_removes_deleted_files(self, metadata_index: MetadataIndex, library: Path):
+        metadata_index.scan(library)
+        (library / "album" / "other.mp3").unlink()
+
+        report = metadata_index.scan(library)
+
+        assert report.removed_count == 1
+        assert len(metadata_index) == 2
+        assert metadata_index.get(library / "album" / "other.mp3") is None
+
+    def test_library_version_change_empties_index(
+        self, monkeypatch: pytest.MonkeyPatch, metadata_index: MetadataIndex, library: Path
+    ):
+        metadata_index.scan(library)
+        metadata_index.close()
+
+        monkeypatch.setattr("audiometa.cache.__version__", "0.0.0-other")
+
+        reopened = MetadataIndex(metadata_index.path)
+        try:
+            assert len(reopened) == 0
+        finally:
+            reopened.close()
+
+    def test_query_conditions(self, metadata_index: MetadataIndex, library: Path):
+        metadata_index.scan(library)
+
+        assert _names(
+            metadata_index.query({UnifiedMetadataKey.ARTISTS: Contains("daft"), "bpm": Between(120, 130)})
+        ) == ["fast.mp3"]
+        assert _names(metadata_index.query({UnifiedMetadataKey.ARTISTS: "Justice"})) == ["other.mp3"]
+        assert _names(metadata_index.query({UnifiedMetadataKey.BPM: Between(low=125)})) == ["fast.mp3", "other.mp3"]
+        assert _names(metadata_index.query({"file_extension": ".mp3"})) == ["fast.mp3", "other.mp3", "slow.mp3"]
+        assert metadata_index.query({UnifiedMetadataKey.ARTISTS: Contains("%")}) == []
+        with pytest.raises(MetadataFieldNotSupportedByLibError):
+            metadata_index.query({"not_a_field": "value"})
+
+    def test_unreadable_files_are_kept_until_they_change(
+        self, monkeypatch: pytest.MonkeyPatch, metadata_index: MetadataIndex, tmp_path: Path
+    ):
+        broken_file = tmp_path / "broken.mp3"
+        broken_file.write_bytes(b"not an mp3 file")
+
+        report = metadata_index.scan(tmp_path)
+        reads = _count_reads(monkeypatch)
+        metadata_index.scan(tmp_path)
+
+        assert report.error_count == 1
+        entry = metadata_index.get(broken_file)
+        assert entry is not None
+        assert entry.error
+        assert reads == []
+
+    def test_update_indexes_and_removes_given_files(self, metadata_index: MetadataIndex, library: Path):
+        metadata_index.update([library / "slow.mp3", library / "album" / "fast.mp3"])
+        (library / "slow.mp3").unlink()
+
+        report = metadata_index.update([library / "slow.mp3"])
+
+        assert report.removed_count == 1
+        assert _names(metadata_index.query()) == ["fast.mp3"]
@@ -0,0 +1,103 @@
+import queue
+import shutil
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from audiometa.index import IndexScanReport, MetadataIndex
+from audiometa.watcher import _InotifyChangeSource, watch_index
+
+# Longest wait for an update of the index in the tests
+UPDATE_TIMEOUT_SEC = 10
+
+
+class _Watch:
+    def __init__(self, index: MetadataIndex, directory: Path, use_inotify: bool):
+        self.reports: queue.Queue[IndexScanReport] = queue.Queue()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(
+            target=watch_index,
+            args=(index, directory),
+            kwargs={
+                "debounce_sec": 0.2,
+                "poll_interval_sec": 0.1,
+                "use_inotify": use_inotify,
+                "on_update": self.reports.put,
+                "stop_event": self.stop_event,
+            },
+        )
+        self.thread.start()
+
+    def next_report(self) -> IndexScanReport:
+        return self.reports.get(timeout=UPDATE_TIMEOUT_SEC)
+
+    def wait_for_total(self, count_name: str, total: int) -> None:
+        """Consume reports until one of their counts adds up to total, whatever other reports come in between."""
+        count = 0
+        while count < total:
+            count += getattr(self.next_report(), count_name)
+        assert count == total
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self.thread.join(timeout=UPDATE_TIMEOUT_SEC)
+
+
+@pytest.fixture(params=[True, False], ids=["inotify", "polling"])
+def watch(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[tuple[_Watch, MetadataIndex, Path]]:
+    library = tmp_path / "library"
+    library.mkdir()
+    if request.param:
+        try:
+            _InotifyChangeSource(library).close()
+        except OSError:
+            pytest.skip("inotify is not available")
+    index = MetadataIndex(tmp_path / "index.sqlite3")
+    watcher = _Watch(index, library, use_inotify=request.param)
+    yield watcher, index, library
+    watcher.stop()
+    index.close()
+
+
+@pytest.mark.integration
+class TestWatchIndex:
+    def test_added_and_deleted_files_update_the_index(
+        self, watch: tuple[_Watch, MetadataIndex, Path], sample_mp3_file: Path, sample_flac_file: Path
+    ):
+        watcher, index, library = watch
+        assert watcher.next_report().file_count == 0  # Initial scan of the empty directory
+
+        (library / "album").mkdir()
+        shutil.copy(sample_mp3_file, library / "album" / "track1.mp3")
+        shutil.copy(sample_flac_file, library / "album" / "track2.flac")
+        (library / "album" / "cover.txt").write_text("not audio")
+        watcher.wait_for_total("read_count", 2)
+
+        assert sorted(entry.path.name for entry in index.query()) == ["track1.mp3", "track2.flac"]
+
+        shutil.rmtree(library / "album")
+        # Late write events of the copied files can still produce reports of unchanged files before the removal
+        watcher.wait_for_total("removed_count", 2)
+        assert len(index) == 0
+
+    def test_initial_scan_indexes_existing_files(self, sample_mp3_file: Path, tmp_path: Path):
+        shutil.copy(sample_mp3_file, tmp_path / "existing.mp3")
+        index = MetadataIndex(tmp_path / "index.sqlite3")
+        stop_event = threading.Event()
+        reports: list[IndexScanReport] = []
+
+        def stop_after_scan(report: IndexScanReport) -> None:
+            reports.append(report)
+            stop_event.set()
+
+        watch_index(index, tmp_path, use_inotify=False, on_update=stop_after_scan, stop_event=stop_event)
+
+        assert reports[0].read_count == 1
+        assert index.get(tmp_path / "existing.mp3") is not None
+        index.close()
+
+    def test_missing_directory(self, tmp_path: Path):
+        with pytest.raises(NotADirectoryError):
+            watch_index(MetadataIndex(tmp_path / "index.sqlite3"), tmp_path / "missing")
@@ -0,0 +1,155 @@
+import os
+import sqlite3
+import tomllib
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import audiometa
+from audiometa import delete_all_metadata, get_full_metadata, get_unified_metadata, update_metadata
+from audiometa._version import __version__
+from audiometa.cache import MetadataCache, get_cache_fingerprint, set_metadata_cache
+from audiometa.index import get_index_fingerprint
+from audiometa.utils.metadata_format import MetadataFormat
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+@pytest.fixture
+def metadata_cache(tmp_path: Path):
+    cache = MetadataCache(tmp_path / "cache" / "audiometa.sqlite3")
+    set_metadata_cache(cache)
+    yield cache
+    set_metadata_cache(None)
+    cache.close()
+
+
+@pytest.fixture
+def mp3_file(sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]) -> Path:
+    return copy_to_tmp_path(sample_mp3_file)
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    reads: list[str] = []
+    read_unified_metadata = audiometa._read_unified_metadata
+
+    def counting_read(file, *args):
+        reads.append(str(file))
+        return read_unified_metadata(file, *args)
+
+    monkeypatch.setattr(audiometa, "_read_unified_metadata", counting_read)
+    return reads
+
+
+@pytest.mark.integration
+class TestMetadataCache:
+    def test_unchanged_file_is_read_once(
+        self, monkeypatch: pytest.MonkeyPatch, metadata_cache: MetadataCache, mp3_file: Path
+    ):
+        reads = _count_reads(monkeypatch)
+
+        first = get_unified_metadata(mp3_file)
+        second = get_unified_metadata(str(mp3_file))
+        get_unified_metadata(mp3_file, metadata_format=MetadataFormat.ID3V2)
+
+        assert first == second
+        assert len(reads) == 2
+        assert len(metadata_cache) == 2
+
+    def test_changed_identity_misses(
+        self, monkeypatch: pytest.MonkeyPatch, metadata_cache: MetadataCache, mp3_file: Path
+    ):
+        reads = _count_reads(monkeypatch)
+        get_unified_metadata(mp3_file)
+
+        stat_result = mp3_file.stat()
+        os.utime(mp3_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+        get_unified_metadata(mp3_file)
+
+        assert len(reads) == 2
+        assert len(metadata_cache) == 1
+
+    def test_writes_invalidate_their_entries(self, metadata_cache: MetadataCache, mp3_file: Path):
+        get_unified_metadata(mp3_file)
+        get_full_metadata(mp3_file, include_technical=False)
+
+        update_metadata(mp3_file, {UnifiedMetadataKey.TITLE: "Cached"}, metadata_format=MetadataFormat.ID3V2)
+
+        assert len(metadata_cache) == 0
+        assert get_unified_metadata(mp3_file)[UnifiedMetadataKey.TITLE] == "Cached"
+        delete_all_metadata(mp3_file)
+        assert len(metadata_cache) == 0
+
+    def test_fingerprint_change_drops_entries(
+        self, monkeypatch: pytest.MonkeyPatch, metadata_cache: MetadataCache, mp3_file: Path
+    ):
+        get_unified_metadata(mp3_file)
+        metadata_cache.close()
+
+        monkeypatch.setattr("audiometa.cache.__version__", "0.0.0-other")
+
+        assert len(MetadataCache(metadata_cache.path)) == 0
+
+    def test_fingerprints_change_with_library_version(self, monkeypatch: pytest.MonkeyPatch):
+        cache_fingerprint, index_fingerprint = get_cache_fingerprint(), get_index_fingerprint()
+
+        monkeypatch.setattr("audiometa.cache.__version__", "0.0.0-other")
+
+        assert get_cache_fingerprint() != cache_fingerprint
+        assert get_index_fingerprint() != index_fingerprint
+
+    def test_library_version_matches_project_version(self):
+        pyproject = Path(audiometa.__file__).parent.parent / "pyproject.toml"
+
+        assert tomllib.loads(pyproject.read_text())["project"]["version"] == __version__
+
+    def test_least_recently_used_entries_are_evicted(
+        self, sample_mp3_file: Path, sample_flac_file: Path, sample_wav_file: Path, tmp_path: Path
+    ):
+        cache = MetadataCache(tmp_path / "audiometa.sqlite3", max_size_bytes=1)
+
+        cache.get_or_read(str(sample_mp3_file), "kind", lambda: "first")
+        cache.get_or_read(str(sample_flac_file), "kind", lambda: "second")
+
+        assert len(cache) == 0
+        cache.max_size_bytes = 10_000
+        cache.get_or_read(str(sample_mp3_file), "kind", lambda: "first")
+        cache.get_or_read(str(sample_flac_file), "kind", lambda: "second")
+        cache.max_size_bytes = 60
+        cache.get_or_read(str(sample_mp3_file), "kind", lambda: "unused")
+        cache.get_or_read(str(sample_wav_file), "kind", lambda: "third")
+
+        assert cache.get_or_read(str(sample_mp3_file), "kind", lambda: "reread") == "first"
+        assert cache.get_or_read(str(sample_flac_file), "kind", lambda: "reread") == "reread"
+        cache.close()
+
+    def test_invalid_max_size(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="max_size_bytes must be at least 1"):
+            MetadataCache(tmp_path / "audiometa.sqlite3", max_size_bytes=0)
+
+    def test_unusable_database_falls_back_to_reading(self, mp3_file: Path, tmp_path: Path):
+        # A directory cannot be opened as a database
+        (tmp_path / "directory.sqlite3").mkdir()
+        cache = MetadataCache(tmp_path / "directory.sqlite3")
+
+        assert cache.get_or_read(str(mp3_file), "kind", lambda: "read") == "read"
+
+        set_metadata_cache(cache)
+        try:
+            update_metadata(mp3_file, {UnifiedMetadataKey.TITLE: "Written"})
+            title = get_unified_metadata(mp3_file).get(UnifiedMetadataKey.TITLE)
+        finally:
+            set_metadata_cache(None)
+        assert title == "Written"
+
+    def test_failed_store_returns_the_result_without_caching_it(
+        self, monkeypatch: pytest.MonkeyPatch, metadata_cache: MetadataCache, mp3_file: Path
+    ):
+        def full_database(*_args):
+            msg = "database or disk is full"
+            raise sqlite3.OperationalError(msg)
+
+        monkeypatch.setattr(MetadataCache, "_store", full_database)
+
+        assert metadata_cache.get_or_read(str(mp3_file), "kind", lambda: "read") == "read"
+        assert len(metadata_cache) == 0
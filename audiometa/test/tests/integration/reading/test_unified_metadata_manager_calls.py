@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from audiometa import get_unified_metadata
+from audiometa.manager._MetadataManager import _MetadataManager
+from audiometa.utils.metadata_format import MetadataFormat
+from audiometa.utils.types import UnifiedMetadata
+
+
+@pytest.mark.integration
+class TestUnifiedMetadataManagerCalls:
+    @pytest.fixture
+    def manager_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        calls: list[str] = []
+        original_get_unified_metadata = _MetadataManager.get_unified_metadata
+
+        def counting_get_unified_metadata(self: _MetadataManager) -> UnifiedMetadata:
+            calls.append(type(self).__name__)
+            return original_get_unified_metadata(self)
+
+        monkeypatch.setattr(_MetadataManager, "get_unified_metadata", counting_get_unified_metadata)
+        return calls
+
+    @pytest.mark.parametrize(
+        ("fixture_name", "extension"),
+        [("sample_mp3_file", ".mp3"), ("sample_flac_file", ".flac"), ("sample_wav_file", ".wav")],
+    )
+    def test_each_manager_is_asked_once(
+        self, request: pytest.FixtureRequest, manager_calls: list[str], fixture_name: str, extension: str
+    ):
+        file_path: Path = request.getfixturevalue(fixture_name)
+
+        get_unified_metadata(file_path)
+
+        assert len(manager_calls) == len(MetadataFormat.get_priorities()[extension])
+        assert len(set(manager_calls)) == len(manager_calls)
@@ -0,0 +1,134 @@
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from audiometa.server import MetadataServer, send_requests
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[MetadataServer]:
+    metadata_server = MetadataServer(tmp_path / "audiometa.sock", workers=4)
+    thread = threading.Thread(target=metadata_server.serve_forever)
+    thread.start()
+    yield metadata_server
+    metadata_server.shutdown()
+    thread.join()
+    metadata_server.close()
+
+
+@pytest.mark.integration
+class TestMetadataServer:
+    def test_responses_follow_the_order_of_the_requests(self, server: MetadataServer, sample_mp3_file: Path):
+        requests = [{"id": number, "command": "ping"} for number in range(20)]
+        requests.insert(10, {"id": "read", "command": "unified", "file": str(sample_mp3_file)})
+
+        responses = list(send_requests(server.socket_path, requests))
+
+        assert [response["id"] for response in responses] == [request["id"] for request in requests]
+        assert all(response["ok"] for response in responses)
+
+    def test_read_after_write_on_the_same_file_sees_the_write(
+        self, server: MetadataServer, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        files = [copy_to_tmp_path(sample_mp3_file, f"track{number}") for number in range(4)]
+        requests = []
+        for file in files:
+            requests.append({"command": "write", "file": str(file), "metadata": {"title": file.stem}})
+            requests.append({"command": "unified", "file": str(file), "fields": ["title"]})
+
+        responses = list(send_requests(server.socket_path, requests))
+
+        assert all(response["ok"] for response in responses)
+        assert [response["result"]["title"] for response in responses[1::2]] == [file.stem for file in files]
+
+    def test_requests_waiting_on_a_file_do_not_hold_the_pool(
+        self, monkeypatch: pytest.MonkeyPatch, server: MetadataServer, tmp_path: Path
+    ):
+        busy_file = str(tmp_path / "busy.mp3")
+        first_request_started = threading.Event()
+        release = threading.Event()
+
+        def blocking_run_request(request: dict) -> None:
+            if request.get("file") == busy_file:
+                first_request_started.set()
+                release.wait(timeout=10)
+
+        monkeypatch.setattr("audiometa.server.run_request", blocking_run_request)
+        busy_requests = [{"command": "unified", "file": busy_file}] * 10
+        busy_responses: list[dict] = []
+        busy_client = threading.Thread(
+            target=lambda: busy_responses.extend(send_requests(server.socket_path, busy_requests))
+        )
+        busy_client.start()
+        assert first_request_started.wait(timeout=5)
+        time.sleep(0.2)  # Let the server read the other requests on the busy file
+
+        # The requests on the busy file outnumber the 4 threads of the pool, which must still answer other clients
+        ping_responses: list[dict] = []
+        ping_client = threading.Thread(
+            target=lambda: ping_responses.extend(send_requests(server.socket_path, [{"command": "ping"}]))
+        )
+        ping_client.start()
+        ping_client.join(timeout=5)
+        answered_while_busy = not ping_client.is_alive()
+        release.set()
+        busy_client.join()
+        ping_client.join()
+
+        assert answered_while_busy
+        assert ping_responses == [{"ok": True, "result": None}]
+        assert len(busy_responses) == len(busy_requests)
+
+    def test_errors_are_answered_without_closing_the_connection(self, server: MetadataServer, tmp_path: Path):
+        requests = [
+            {"id": 1, "command": "unified", "file": str(tmp_path / "missing.mp3")},
+            {"id": 2, "command": "unknown"},
+            {"id": 3, "command": "write", "file": str(tmp_path / "missing.mp3"), "metadata": {}},
+            {"id": 4, "command": "ping"},
+        ]
+
+        responses = list(send_requests(server.socket_path, requests))
+
+        assert [response["ok"] for response in responses] == [False, False, False, True]
+        assert responses[0]["error_type"] == "FileNotFoundError"
+        assert responses[1]["error_type"] == "ValueError"
+
+    def test_invalid_json_line_gets_an_error_response(self, server: MetadataServer):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(str(server.socket_path))
+            connection.sendall(b'not json\n[1]\n{"command": "ping"}\n')
+            connection.shutdown(socket.SHUT_WR)
+            with connection.makefile("rb") as responses:
+                lines = responses.read().splitlines()
+
+        assert len(lines) == 3
+        assert b'"ok": false' in lines[0]
+        assert b'"ok": false' in lines[1]
+        assert b'"ok": true' in lines[2]
+
+    def test_relative_paths_are_sent_as_absolute(
+        self, server: MetadataServer, sample_mp3_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.chdir(sample_mp3_file.parent)
+
+        (response,) = send_requests(server.socket_path, [{"command": "unified", "file": sample_mp3_file.name}])
+
+        assert response["ok"]
+
+    def test_second_server_on_the_same_socket_is_refused(self, server: MetadataServer):
+        with pytest.raises(OSError, match="already listening"):
+            MetadataServer(server.socket_path)
+
+    def test_stale_socket_file_is_replaced(self, tmp_path: Path):
+        socket_path = tmp_path / "stale.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(socket_path))
+
+        metadata_server = MetadataServer(socket_path)
+        metadata_server.close()
+
+        assert not socket_path.exists()
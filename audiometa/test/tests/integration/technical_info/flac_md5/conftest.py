@@ -46,7 +46,8 @@ def get_md5_position(file_path: Path) -> int:
         if flac_marker_pos == -1:
             msg = "Could not find FLAC marker in file"
             raise RuntimeError(msg)
-        md5_start = flac_marker_pos + 4 + 1 + 18
+        # Marker, 4-byte block header, then the MD5 at offset 18 of the STREAMINFO data
+        md5_start = flac_marker_pos + 4 + 4 + 18
         if md5_start + 16 > len(data):
             msg = "FLAC file too small to contain MD5 checksum"
             raise RuntimeError(msg)
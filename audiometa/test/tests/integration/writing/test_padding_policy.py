@@ -0,0 +1,109 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from mutagen import PaddingInfo
+
+from audiometa import get_unified_metadata, update_metadata
+from audiometa.utils.metadata_format import MetadataFormat
+from audiometa.utils.padding_policy import PaddingPolicy
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+@pytest.mark.integration
+class TestPaddingPolicy:
+    @pytest.mark.parametrize(
+        ("sample_file_fixture", "metadata_format"),
+        [("sample_mp3_file", MetadataFormat.ID3V2), ("sample_flac_file", MetadataFormat.VORBIS)],
+    )
+    def test_repeated_edits_settle_in_place(
+        self,
+        request: pytest.FixtureRequest,
+        copy_to_tmp_path: Callable[..., Path],
+        sample_file_fixture: str,
+        metadata_format: MetadataFormat,
+    ):
+        audio_file = copy_to_tmp_path(request.getfixturevalue(sample_file_fixture))
+        policy = PaddingPolicy.percentage(100)
+
+        first_reports = update_metadata(
+            audio_file, {UnifiedMetadataKey.TITLE: "x" * 20000}, metadata_format=metadata_format, padding=policy
+        )
+        size_after_growth = audio_file.stat().st_size
+        second_reports = update_metadata(
+            audio_file, {UnifiedMetadataKey.TITLE: "y" * 25000}, metadata_format=metadata_format, padding=policy
+        )
+
+        assert [report.metadata_format for report in first_reports] == [metadata_format]
+        assert first_reports[0].audio_shifted
+        assert first_reports[0].padding_size >= first_reports[0].tag_size
+        assert second_reports[0].in_place
+        assert audio_file.stat().st_size == size_after_growth
+        assert (
+            get_unified_metadata(audio_file, metadata_format=metadata_format)[UnifiedMetadataKey.TITLE] == "y" * 25000
+        )
+
+    @pytest.mark.parametrize(
+        ("sample_file_fixture", "metadata_format"),
+        [("sample_mp3_file", MetadataFormat.ID3V2), ("sample_flac_file", MetadataFormat.VORBIS)],
+    )
+    def test_fixed_padding(
+        self,
+        request: pytest.FixtureRequest,
+        copy_to_tmp_path: Callable[..., Path],
+        sample_file_fixture: str,
+        metadata_format: MetadataFormat,
+    ):
+        audio_file = copy_to_tmp_path(request.getfixturevalue(sample_file_fixture))
+
+        reports = update_metadata(
+            audio_file,
+            {UnifiedMetadataKey.TITLE: "Fixed"},
+            metadata_format=metadata_format,
+            padding=PaddingPolicy.fixed(0),
+        )
+
+        assert reports[0].padding_size == 0
+        assert get_unified_metadata(audio_file, metadata_format=metadata_format)[UnifiedMetadataKey.TITLE] == "Fixed"
+
+    def test_preserve_keeps_large_padding(self, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        mp3_file = copy_to_tmp_path(sample_mp3_file)
+        update_metadata(
+            mp3_file,
+            {UnifiedMetadataKey.TITLE: "Big"},
+            metadata_format=MetadataFormat.ID3V2,
+            padding=PaddingPolicy.fixed(50000),
+        )
+
+        reports = update_metadata(
+            mp3_file,
+            {UnifiedMetadataKey.TITLE: "Small"},
+            metadata_format=MetadataFormat.ID3V2,
+            padding=PaddingPolicy.preserve(),
+        )
+
+        assert reports[0].in_place
+        assert reports[0].padding_size > 40000
+
+    def test_mutagen_style_callable(self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        seen_infos: list[PaddingInfo] = []
+
+        def padding(info: PaddingInfo) -> int:
+            seen_infos.append(info)
+            return 1234
+
+        reports = update_metadata(
+            flac_file, {UnifiedMetadataKey.ALBUM: "Album"}, metadata_format=MetadataFormat.VORBIS, padding=padding
+        )
+
+        assert len(seen_infos) == 1
+        assert seen_infos[0].padding >= 0
+        assert reports[0].padding_size == 1234
+        assert reports[0].audio_shifted
+
+    def test_invalid_policy_values(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            PaddingPolicy.fixed(-1)
+        with pytest.raises(ValueError, match="must be positive"):
+            PaddingPolicy.percentage(-5)
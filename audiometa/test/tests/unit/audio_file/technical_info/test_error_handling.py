@@ -1,3 +1,4 @@
+import struct
 from pathlib import Path
 
 import pytest
@@ -80,7 +81,17 @@ class TestAudioFileTechnicalInfoErrorHandling:
         except InvalidChunkDecodeError:
             pass
 
-    def test_duration_not_found_error_invalid_wav_duration(self, monkeypatch):
+    def test_duration_not_found_error_invalid_wav_duration(self, tmp_path):
+        # A fmt chunk but no audio data
+        wav_file = tmp_path / "empty.wav"
+        fmt_chunk = b"fmt " + struct.pack("<IHHIIHH", 16, 1, 2, 44100, 176400, 4, 16)
+        wav_file.write_bytes(b"RIFF" + struct.pack("<I", 4 + len(fmt_chunk)) + b"WAVE" + fmt_chunk)
+
+        audio_file = _AudioFile(wav_file)
+        with pytest.raises(DurationNotFoundError):
+            audio_file.get_duration_in_sec()
+
+    def test_duration_not_found_error_ffprobe_fallback_invalid_wav_duration(self, monkeypatch, tmp_path):
         def mock_subprocess_run(*_args, **_kwargs):
             class MockResult:
                 returncode = 0
@@ -90,16 +101,11 @@ class TestAudioFileTechnicalInfoErrorHandling:
 
         monkeypatch.setattr("subprocess.run", mock_subprocess_run)
 
-        wav_file = "audiometa/test/assets/sample.wav"
-
-        try:
-            audio_file = _AudioFile(wav_file)
+        audio_file = _AudioFile(self._create_wav_without_fmt_chunk(tmp_path), wav_ffprobe_fallback=True)
+        with pytest.raises(DurationNotFoundError):
             audio_file.get_duration_in_sec()
-            pytest.fail("Should have raised DurationNotFoundError")
-        except DurationNotFoundError:
-            pass
 
-    def test_audio_file_metadata_parse_error_invalid_json(self, monkeypatch):
+    def test_audio_file_metadata_parse_error_invalid_json(self, monkeypatch, tmp_path):
         def mock_subprocess_run(*_args, **_kwargs):
             class MockResult:
                 returncode = 0
@@ -109,14 +115,16 @@ class TestAudioFileTechnicalInfoErrorHandling:
 
         monkeypatch.setattr("subprocess.run", mock_subprocess_run)
 
-        wav_file = "audiometa/test/assets/sample.wav"
-
-        try:
-            audio_file = _AudioFile(wav_file)
+        audio_file = _AudioFile(self._create_wav_without_fmt_chunk(tmp_path), wav_ffprobe_fallback=True)
+        with pytest.raises(AudioFileMetadataParseError):
             audio_file.get_duration_in_sec()
-            pytest.fail("Should have raised AudioFileMetadataParseError")
-        except AudioFileMetadataParseError:
-            pass
+
+    @staticmethod
+    def _create_wav_without_fmt_chunk(tmp_path):
+        wav_file = tmp_path / "no_fmt.wav"
+        data_chunk = b"data" + struct.pack("<I", 4) + b"\x00" * 4
+        wav_file.write_bytes(b"RIFF" + struct.pack("<I", 4 + len(data_chunk)) + b"WAVE" + data_chunk)
+        return wav_file
 
     def test_file_corrupted_error_invalid_wav(self, tmp_path):
         invalid_wav = tmp_path / "invalid.wav"
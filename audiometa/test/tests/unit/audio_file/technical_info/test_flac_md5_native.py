@@ -0,0 +1,106 @@
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from audiometa import get_full_metadata
+from audiometa._audio_file import _AudioFile
+from audiometa.utils.flac_md5_state import FlacMd5State
+from audiometa.utils.flac_md5_verification_method import FlacMd5VerificationMethod
+from audiometa.utils.flac_md5_verifier import compute_flac_audio_md5
+
+
+def _get_audio_offset(audio_file: _AudioFile) -> int:
+    last_block = audio_file.get_context().get_flac_blocks()[-1]
+    return last_block.data_offset + last_block.size
+
+
+@pytest.mark.unit
+class TestNativeFlacMd5Verification:
+    def test_valid_signature(self, sample_flac_file: Path):
+        audio_file = _AudioFile(sample_flac_file)
+
+        assert audio_file.is_flac_file_md5_valid(method=FlacMd5VerificationMethod.NATIVE) == FlacMd5State.VALID
+
+    @pytest.mark.parametrize(
+        ("subtype", "channel_gains"),
+        [("PCM_S8", [1.0]), ("PCM_16", [1.0, 0.5]), ("PCM_16", [1.0, 0.9]), ("PCM_24", [1.0, -0.7])],
+    )
+    def test_decoded_audio_matches_encoder_signature(self, tmp_path: Path, subtype: str, channel_gains: list[float]):
+        # Noisy, correlated channels make the encoder use FIXED and LPC subframes and stereo decorrelation
+        np = pytest.importorskip("numpy")
+        sf = pytest.importorskip("soundfile")
+        rng = np.random.default_rng(0)
+        time = np.arange(22050) / 22050
+        signal = 0.4 * np.sin(2 * np.pi * 440 * time) + 0.05 * rng.standard_normal(len(time))
+        flac_file = tmp_path / "encoded.flac"
+        sf.write(str(flac_file), np.column_stack([signal * gain for gain in channel_gains]), 22050, subtype=subtype)
+
+        audio_file = _AudioFile(flac_file)
+
+        assert audio_file.is_flac_file_md5_valid(method=FlacMd5VerificationMethod.NATIVE) == FlacMd5State.VALID
+
+    def test_chunk_size_does_not_change_digest(self, sample_flac_file: Path):
+        audio_file = _AudioFile(sample_flac_file)
+        stream_info = audio_file.get_context().get_flac().info
+        audio_offset = _get_audio_offset(audio_file)
+
+        default_digest = compute_flac_audio_md5(sample_flac_file, audio_offset, stream_info)
+
+        assert compute_flac_audio_md5(sample_flac_file, audio_offset, stream_info, chunk_size=7) == default_digest
+
+    def test_mismatching_signature_is_invalid(self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        content = bytearray(flac_file.read_bytes())
+        md5_start = content.find(b"fLaC") + 4 + 4 + 18
+        content[md5_start : md5_start + 16] = bytes(b ^ 0xFF for b in content[md5_start : md5_start + 16])
+        flac_file.write_bytes(bytes(content))
+
+        audio_file = _AudioFile(flac_file)
+
+        assert audio_file.is_flac_file_md5_valid(method=FlacMd5VerificationMethod.NATIVE) == FlacMd5State.INVALID
+
+    def test_corrupted_frame_is_invalid(self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        audio_offset = _get_audio_offset(_AudioFile(flac_file))
+        content = bytearray(flac_file.read_bytes())
+        content[audio_offset + 8] ^= 0xFF
+        flac_file.write_bytes(bytes(content))
+
+        audio_file = _AudioFile(flac_file)
+
+        assert audio_file.is_flac_file_md5_valid(method=FlacMd5VerificationMethod.NATIVE) == FlacMd5State.INVALID
+
+    def test_truncated_stream_is_invalid(self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        audio_offset = _get_audio_offset(_AudioFile(flac_file))
+        flac_file.write_bytes(flac_file.read_bytes()[: audio_offset + 20])
+
+        audio_file = _AudioFile(flac_file)
+
+        assert audio_file.is_flac_file_md5_valid(method=FlacMd5VerificationMethod.NATIVE) == FlacMd5State.INVALID
+
+    def test_cli_method_does_not_decode_natively_without_flac_tool(
+        self, monkeypatch: pytest.MonkeyPatch, sample_flac_file: Path
+    ):
+        def missing_tool(*_args, **_kwargs):
+            raise FileNotFoundError
+
+        monkeypatch.setattr(subprocess, "run", missing_tool)
+        monkeypatch.setattr(_AudioFile, "check_flac_md5_natively", lambda *_args: pytest.fail("decoded natively"))
+
+        with pytest.raises(FileNotFoundError, match="NATIVE"):
+            _AudioFile(sample_flac_file).is_flac_file_md5_valid()
+
+    def test_full_metadata_does_not_decode_natively_without_flac_tool(
+        self, monkeypatch: pytest.MonkeyPatch, sample_flac_file: Path
+    ):
+        def missing_tool(*_args, **_kwargs):
+            raise FileNotFoundError
+
+        monkeypatch.setattr(subprocess, "run", missing_tool)
+        monkeypatch.setattr(_AudioFile, "_is_md5_unset", lambda _self: False)
+        monkeypatch.setattr(_AudioFile, "check_flac_md5_natively", lambda *_args: pytest.fail("decoded natively"))
+
+        assert get_full_metadata(sample_flac_file)["technical_info"]["is_flac_md5_valid"] is None
@@ -0,0 +1,82 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from mutagen.id3 import ID3, TIT2
+
+from audiometa._audio_file import _AudioFile
+from audiometa._audio_file_context import HEAD_READ_SIZE, _AudioFileContext
+from audiometa.utils.flac_md5_state import FlacMd5State
+
+# Offset of the MD5 signature: fLaC marker, STREAMINFO block header, then 18 bytes of STREAMINFO data
+MD5_OFFSET = 4 + 4 + 18
+
+
+def _zero_bytes(file_path: Path, offset: int, size: int) -> None:
+    content = bytearray(file_path.read_bytes())
+    content[offset : offset + size] = b"\x00" * size
+    file_path.write_bytes(bytes(content))
+
+
+@pytest.mark.unit
+class TestFlacStreamInfo:
+    def test_fields_match_mutagen(self, sample_flac_file: Path):
+        context = _AudioFileContext(str(sample_flac_file))
+        expected = context.get_flac().info
+
+        stream_info = context.get_flac_stream_info()
+
+        assert stream_info.min_block_size == expected.min_blocksize
+        assert stream_info.max_block_size == expected.max_blocksize
+        assert stream_info.min_frame_size == expected.min_framesize
+        assert stream_info.max_frame_size == expected.max_framesize
+        assert stream_info.sample_rate == expected.sample_rate
+        assert stream_info.channels == expected.channels
+        assert stream_info.bits_per_sample == expected.bits_per_sample
+        assert stream_info.total_samples == expected.total_samples
+        assert stream_info.md5_signature == expected.md5_signature.to_bytes(16, "big")
+        assert stream_info.duration_in_sec == pytest.approx(expected.length)
+        assert stream_info.is_md5_unset is False
+        context.release()
+
+    def test_unset_md5_is_detected(self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        _zero_bytes(flac_file, MD5_OFFSET, 16)
+
+        assert _AudioFile(flac_file).get_flac_md5_state_without_test() == FlacMd5State.UNSET
+
+    def test_zeros_before_md5_are_not_an_unset_md5(self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        # The 13 first bytes of the signature and the 3 bytes before it
+        _zero_bytes(flac_file, MD5_OFFSET - 3, 16)
+
+        assert _AudioFile(flac_file).get_flac_md5_state_without_test() is None
+
+    def test_only_streaminfo_is_read_after_id3v2_tag(
+        self, monkeypatch: pytest.MonkeyPatch, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        id3 = ID3()
+        id3.add(TIT2(encoding=3, text=["Prefixed"]))
+        id3.save(flac_file, padding=lambda _info: 64 * 1024)
+        _zero_bytes(flac_file, _AudioFileContext(str(flac_file)).id3v2_size + MD5_OFFSET, 16)
+        reads: list[int] = []
+        read_at = _AudioFileContext.read_at
+
+        def counting_read_at(self, offset: int, size: int) -> bytes:
+            reads.append(size)
+            return read_at(self, offset, size)
+
+        monkeypatch.setattr(_AudioFileContext, "read_at", counting_read_at)
+
+        assert _AudioFile(flac_file).get_flac_md5_state_without_test() == FlacMd5State.UNSET
+        assert max(reads) <= HEAD_READ_SIZE
+
+    def test_file_without_streaminfo(self, tmp_path: Path):
+        flac_file = tmp_path / "marker.flac"
+        flac_file.write_bytes(b"fLaC" + b"\x84\x00\x00\x08" + b"\x00" * 8)
+        context = _AudioFileContext(str(flac_file))
+
+        with pytest.raises(ValueError, match="not a STREAMINFO block"):
+            context.get_flac_stream_info()
+        context.release()
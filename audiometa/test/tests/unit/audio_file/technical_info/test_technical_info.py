@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+
+from audiometa._audio_file import _AudioFile
+
+
+@pytest.mark.unit
+class TestTechnicalInfo:
+    def test_technical_info_is_computed_once(self, monkeypatch: pytest.MonkeyPatch, sample_mp3_file: Path):
+        audio_file = _AudioFile(sample_mp3_file)
+        calls: list[None] = []
+        get_duration_in_sec = audio_file.get_duration_in_sec
+
+        def counting_get_duration_in_sec() -> float:
+            calls.append(None)
+            return get_duration_in_sec()
+
+        monkeypatch.setattr(audio_file, "get_duration_in_sec", counting_get_duration_in_sec)
+
+        technical_info = audio_file.get_technical_info()
+
+        assert audio_file.get_technical_info() is technical_info
+        assert len(calls) == 1
+        assert technical_info.to_dict() == {
+            "duration_seconds": audio_file.get_duration_in_sec(),
+            "bitrate_bps": audio_file.get_bitrate(),
+            "sample_rate_hz": audio_file.get_sample_rate(),
+            "channels": audio_file.get_channels(),
+            "file_size_bytes": 17307,
+            "file_extension": ".mp3",
+            "audio_format_name": "MP3",
+        }
+
+    def test_technical_info_is_recomputed_after_write(self, sample_flac_file: Path):
+        audio_file = _AudioFile(sample_flac_file)
+        technical_info = audio_file.get_technical_info()
+
+        audio_file.invalidate_context()
+
+        assert audio_file.get_technical_info() is not technical_info
+        assert audio_file.get_technical_info() == technical_info
@@ -0,0 +1,127 @@
+import struct
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from audiometa._audio_file import _AudioFile
+from audiometa.exceptions import DurationNotFoundError, InvalidChunkDecodeError
+
+KSDATAFORMAT_SUBTYPE_GUID_TAIL = b"\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71"
+
+
+def _chunk(chunk_id: bytes, data: bytes, declared_size: int | None = None) -> bytes:
+    size = len(data) if declared_size is None else declared_size
+    return chunk_id + struct.pack("<I", size) + data + (b"\x00" if len(data) % 2 else b"")
+
+
+def _fmt(
+    format_tag: int, channels: int, sample_rate: int, bits_per_sample: int, block_align: int | None = None
+) -> bytes:
+    block_align = block_align if block_align is not None else channels * bits_per_sample // 8
+    return struct.pack(
+        "<HHIIHH", format_tag, channels, sample_rate, sample_rate * block_align, block_align, bits_per_sample
+    )
+
+
+def _wav(*chunks: bytes, form: bytes = b"RIFF") -> bytes:
+    body = b"WAVE" + b"".join(chunks)
+    return form + struct.pack("<I", len(body)) + body
+
+
+def _write(tmp_path: Path, content: bytes) -> Path:
+    wav_file = tmp_path / "stream.wav"
+    wav_file.write_bytes(content)
+    return wav_file
+
+
+@pytest.mark.unit
+class TestWavStreamInfo:
+    def test_pcm(self, tmp_path: Path):
+        wav_file = _write(tmp_path, _wav(_chunk(b"fmt ", _fmt(1, 2, 8000, 16)), _chunk(b"data", b"\x00" * 32000)))
+        audio_file = _AudioFile(wav_file)
+
+        assert audio_file.get_duration_in_sec() == 1.0
+        assert audio_file.get_bitrate() == 256000
+        assert audio_file.get_sample_rate() == 8000
+        assert audio_file.get_channels() == 2
+
+    def test_wave_format_extensible(self, tmp_path: Path):
+        fmt = _fmt(0xFFFE, 6, 48000, 24) + struct.pack("<HHI", 22, 24, 0x3F)
+        fmt += struct.pack("<H", 1) + KSDATAFORMAT_SUBTYPE_GUID_TAIL
+        wav_file = _write(tmp_path, _wav(_chunk(b"fmt ", fmt), _chunk(b"data", b"\x00" * 18 * 4800)))
+
+        stream_info = _AudioFile(wav_file).get_context().get_wav_stream_info()
+
+        assert stream_info.format_tag == 1
+        assert stream_info.duration_in_sec == 0.1
+        assert stream_info.bitrate == 48000 * 6 * 24
+
+    def test_rf64_data_size_from_ds64(self, tmp_path: Path):
+        data = b"\x00" * 4000
+        ds64 = struct.pack("<QQQI", 0, len(data), 1000, 0)
+        content = _wav(
+            _chunk(b"ds64", ds64),
+            _chunk(b"fmt ", _fmt(1, 1, 4000, 8)),
+            _chunk(b"data", data, declared_size=0xFFFFFFFF),
+            form=b"RF64",
+        )
+        wav_file = _write(tmp_path, content[:4] + struct.pack("<I", 0xFFFFFFFF) + content[8:])
+
+        audio_file = _AudioFile(wav_file)
+
+        assert audio_file.get_duration_in_sec() == 1.0
+        assert audio_file.get_sample_rate() == 4000
+
+    def test_id3v2_prefixed_wav(self, tmp_path: Path):
+        id3v2_tag = b"ID3\x03\x00\x00" + bytes([0, 0, 0, 20]) + b"\x00" * 20
+        wav = _wav(_chunk(b"fmt ", _fmt(1, 1, 8000, 16)), _chunk(b"data", b"\x00" * 8000))
+        wav_file = _write(tmp_path, id3v2_tag + wav)
+
+        audio_file = _AudioFile(wav_file)
+
+        assert audio_file.get_duration_in_sec() == 0.5
+        assert audio_file.get_channels() == 1
+
+    def test_compressed_duration_from_fact_chunk(self, tmp_path: Path):
+        adpcm_fmt = _fmt(2, 1, 22050, 4, block_align=256)
+        wav_file = _write(
+            tmp_path,
+            _wav(_chunk(b"fmt ", adpcm_fmt), _chunk(b"fact", struct.pack("<I", 44100)), _chunk(b"data", b"\x00" * 512)),
+        )
+
+        assert _AudioFile(wav_file).get_duration_in_sec() == 2.0
+
+    def test_truncated_data_chunk_is_clamped_to_file_size(self, tmp_path: Path):
+        wav_file = _write(
+            tmp_path, _wav(_chunk(b"fmt ", _fmt(1, 1, 1000, 8)), _chunk(b"data", b"\x00" * 500, declared_size=10000))
+        )
+
+        assert _AudioFile(wav_file).get_duration_in_sec() == 0.5
+
+    def test_empty_data_chunk_raises_duration_not_found(self, tmp_path: Path):
+        wav_file = _write(tmp_path, _wav(_chunk(b"fmt ", _fmt(1, 1, 1000, 8)), _chunk(b"data", b"")))
+
+        with pytest.raises(DurationNotFoundError):
+            _AudioFile(wav_file).get_duration_in_sec()
+
+    def test_missing_fmt_chunk(self, tmp_path: Path):
+        wav_file = _write(tmp_path, _wav(_chunk(b"data", b"\x00" * 100)))
+        audio_file = _AudioFile(wav_file)
+
+        with pytest.raises(InvalidChunkDecodeError):
+            audio_file.get_duration_in_sec()
+        assert audio_file.get_sample_rate() == 0
+        assert audio_file.get_channels() == 0
+
+    def test_sample_wav_is_read_without_subprocess(self, monkeypatch: pytest.MonkeyPatch, sample_wav_file: Path):
+        def fail_subprocess_run(*_args, **_kwargs):
+            pytest.fail("WAV technical info should not spawn a subprocess")
+
+        monkeypatch.setattr(subprocess, "run", fail_subprocess_run)
+        audio_file = _AudioFile(sample_wav_file)
+
+        assert audio_file.get_duration_in_sec() > 0
+        assert audio_file.get_bitrate() > 0
+        assert audio_file.get_sample_rate() > 0
+        assert audio_file.get_channels() > 0
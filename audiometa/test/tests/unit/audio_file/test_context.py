@@ -0,0 +1,67 @@
+import builtins
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from audiometa import get_unified_metadata
+from audiometa._audio_file import _AudioFile
+
+
+@pytest.mark.unit
+class TestAudioFileContext:
+    def test_context_is_built_once(self, sample_mp3_file: Path):
+        audio_file = _AudioFile(sample_mp3_file)
+
+        context = audio_file.get_context()
+
+        assert audio_file.get_context() is context
+        assert context.get_mp3() is context.get_mp3()
+
+    def test_write_invalidates_context(self, tmp_path: Path, sample_mp3_file: Path):
+        mp3_file = tmp_path / "copy.mp3"
+        mp3_file.write_bytes(sample_mp3_file.read_bytes())
+        audio_file = _AudioFile(mp3_file)
+        context = audio_file.get_context()
+
+        audio_file.write(b"new content")
+
+        assert audio_file.get_context() is not context
+        assert audio_file.get_context().head == b"new content"
+        assert audio_file.get_file_size() == len(b"new content")
+
+    def test_flac_block_layout(self, sample_flac_file: Path):
+        blocks = _AudioFile(sample_flac_file).get_context().get_flac_blocks()
+
+        assert blocks[0].block_type == 0  # STREAMINFO always comes first
+        assert blocks[0].size == 34
+        assert blocks[-1].is_last
+
+    def test_unified_read_of_mp3_opens_and_stats_file_once(
+        self, monkeypatch: pytest.MonkeyPatch, sample_mp3_file: Path
+    ):
+        target = os.fspath(sample_mp3_file)
+        opens: list[str] = []
+        stats: list[str] = []
+        original_open = builtins.open
+        original_stat = os.stat
+
+        def counting_open(file, *args, **kwargs):
+            if isinstance(file, str | os.PathLike) and os.fspath(file) == target:
+                opens.append(target)
+            return original_open(file, *args, **kwargs)
+
+        def counting_stat(path, *args, **kwargs):
+            if isinstance(path, str | os.PathLike) and os.fspath(path) == target:
+                stats.append(target)
+            return original_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+        monkeypatch.setattr(io, "open", counting_open)
+        monkeypatch.setattr(os, "stat", counting_stat)
+
+        get_unified_metadata(sample_mp3_file)
+
+        assert len(opens) == 1
+        assert len(stats) == 1
@@ -0,0 +1,98 @@
+import mmap
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from audiometa import delete_all_metadata, get_unified_metadata, update_metadata
+from audiometa._audio_file import _AudioFile
+from audiometa._audio_file_context import _AudioFileContext
+from audiometa.utils.metadata_format import MetadataFormat
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+def _fail_read(*_args, **_kwargs):
+    pytest.fail("The whole file should not be read")
+
+
+@pytest.mark.unit
+class TestMappedFile:
+    def test_views_are_not_copies(self, sample_flac_file: Path):
+        context = _AudioFileContext(str(sample_flac_file))
+
+        with context.view_at(0, 4) as view:
+            assert isinstance(view.obj, mmap.mmap)
+            assert view == b"fLaC"
+        assert context.read_at(0, 4) == b"fLaC"
+        assert context.find(b"fLaC") == 0
+        context.release()
+
+    def test_reads_past_the_end_are_shortened(self, tmp_path: Path):
+        file_path = tmp_path / "short.mp3"
+        file_path.write_bytes(b"0123456789")
+        context = _AudioFileContext(str(file_path))
+
+        assert context.read_at(8, 16) == b"89"
+        assert len(context.view_at(8, 16)) == 2
+        assert context.read_at(16, 4) == b""
+        context.release()
+
+    def test_empty_file_is_read_without_map(self, tmp_path: Path):
+        file_path = tmp_path / "empty.mp3"
+        file_path.touch()
+        context = _AudioFileContext(str(file_path))
+
+        assert context.read_at(0, 4) == b""
+        assert len(context.view_at(0, 4)) == 0
+        assert context.find(b"TAG") == -1
+        context.release()
+
+    def test_release_with_live_view(self, sample_wav_file: Path):
+        context = _AudioFileContext(str(sample_wav_file))
+        view = context.view_at(0, 4)
+
+        context.release()
+
+        assert view == b"RIFF"
+        assert context.read_at(0, 4) == b"RIFF"
+        context.release()
+
+    @pytest.mark.parametrize(
+        ("file_fixture", "metadata_format"),
+        [("sample_flac_file", MetadataFormat.VORBIS), ("sample_wav_file", MetadataFormat.RIFF)],
+    )
+    def test_metadata_parsed_from_views(
+        self,
+        request: pytest.FixtureRequest,
+        copy_to_tmp_path: Callable[..., Path],
+        file_fixture: str,
+        metadata_format: MetadataFormat,
+    ):
+        file_path = copy_to_tmp_path(request.getfixturevalue(file_fixture))
+        update_metadata(file_path, {UnifiedMetadataKey.TITLE: "Mapped"}, metadata_format=metadata_format)
+        update_metadata(file_path, {UnifiedMetadataKey.ALBUM: "Album"}, metadata_format=metadata_format)
+
+        metadata = get_unified_metadata(file_path, metadata_format=metadata_format)
+
+        assert metadata[UnifiedMetadataKey.TITLE] == "Mapped"
+        assert metadata[UnifiedMetadataKey.ALBUM] == "Album"
+
+    def test_id3v1_tag_written_in_place(self, monkeypatch: pytest.MonkeyPatch, sample_mp3_file: Path, tmp_path: Path):
+        audio_data = sample_mp3_file.read_bytes()
+        if audio_data[-128:].startswith(b"TAG"):
+            audio_data = audio_data[:-128]
+        file_path = tmp_path / "copy.mp3"
+        file_path.write_bytes(audio_data)
+        monkeypatch.setattr(_AudioFile, "read", _fail_read)
+
+        update_metadata(file_path, {UnifiedMetadataKey.TITLE: "First"}, metadata_format=MetadataFormat.ID3V1)
+        update_metadata(file_path, {UnifiedMetadataKey.TITLE: "Second"}, metadata_format=MetadataFormat.ID3V1)
+
+        content = file_path.read_bytes()
+        assert content[: len(audio_data)] == audio_data
+        assert len(content) == len(audio_data) + 128
+        assert content[-128:].startswith(b"TAGSecond")
+
+        delete_all_metadata(file_path, metadata_format=MetadataFormat.ID3V1)
+
+        assert file_path.read_bytes() == audio_data
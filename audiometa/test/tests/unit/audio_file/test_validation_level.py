@@ -0,0 +1,100 @@
+import struct
+from pathlib import Path
+
+import pytest
+
+from audiometa import _audio_file_context, is_audio_file
+from audiometa._audio_file import _AudioFile
+from audiometa._audio_file_context import _AudioFileContext
+from audiometa.exceptions import FileCorruptedError
+from audiometa.utils.validation_level import ValidationLevel
+
+# MPEG-1 Layer III, 128 kbps, 44100 Hz, no padding: 417-byte frames
+MPEG_FRAME_HEADER = b"\xff\xfb\x90\x64"
+MPEG_FRAME = MPEG_FRAME_HEADER + b"\x00" * 413
+
+
+def _fail_parse(*_args, **_kwargs):
+    pytest.fail("The file should not be parsed with mutagen below the full validation level")
+
+
+def _write(tmp_path: Path, name: str, content: bytes) -> Path:
+    file_path = tmp_path / name
+    file_path.write_bytes(content)
+    return file_path
+
+
+def _flac_with_streaminfo(min_block_size: int = 4096, sample_rate: int = 44100) -> bytes:
+    stream_info = struct.pack(">HH", min_block_size, 4096) + b"\x00" * 6
+    stream_info += ((sample_rate << 44) | (1 << 41) | (15 << 36)).to_bytes(8, "big") + b"\x00" * 16
+    return b"fLaC" + b"\x80" + len(stream_info).to_bytes(3, "big") + stream_info
+
+
+@pytest.mark.unit
+class TestValidationLevel:
+    @pytest.mark.parametrize("validation_level", list(ValidationLevel))
+    @pytest.mark.parametrize("sample_file_fixture", ["sample_mp3_file", "sample_flac_file", "sample_wav_file"])
+    def test_valid_files_pass_every_level(
+        self, request: pytest.FixtureRequest, sample_file_fixture: str, validation_level: ValidationLevel
+    ):
+        assert is_audio_file(request.getfixturevalue(sample_file_fixture), validation_level=validation_level) is True
+
+    @pytest.mark.parametrize("extension", ["mp3", "flac", "wav"])
+    def test_none_level_only_checks_existence_and_extension(self, tmp_path: Path, extension: str):
+        not_audio = _write(tmp_path, f"text.{extension}", b"not a real audio file")
+
+        assert is_audio_file(not_audio, validation_level=ValidationLevel.NONE) is True
+        assert is_audio_file(not_audio, validation_level=ValidationLevel.MAGIC) is False
+        assert is_audio_file(tmp_path / "missing.mp3", validation_level=ValidationLevel.NONE) is False
+
+    @pytest.mark.parametrize("sample_file_fixture", ["sample_mp3_file", "sample_flac_file", "sample_wav_file"])
+    def test_magic_level_reads_the_start_of_the_file_once(
+        self, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest, sample_file_fixture: str
+    ):
+        reads: list[tuple[int, int]] = []
+        read_at = _AudioFileContext.read_at
+
+        def counting_read_at(self, offset: int, size: int) -> bytes:
+            reads.append((offset, size))
+            return read_at(self, offset, size)
+
+        monkeypatch.setattr(_AudioFileContext, "read_at", counting_read_at)
+        monkeypatch.setattr(_audio_file_context, "MP3", _fail_parse)
+        monkeypatch.setattr(_audio_file_context, "FLAC", _fail_parse)
+
+        _AudioFile(request.getfixturevalue(sample_file_fixture), validation_level=ValidationLevel.MAGIC)
+
+        assert len(reads) == 1
+
+    def test_structural_level_checks_consecutive_mpeg_frames(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setattr(_audio_file_context, "MP3", _fail_parse)
+        valid = _write(tmp_path, "valid.mp3", MPEG_FRAME * 3)
+        broken = _write(tmp_path, "broken.mp3", MPEG_FRAME + b"junk" * 200)
+
+        assert is_audio_file(valid, validation_level=ValidationLevel.STRUCTURAL) is True
+        assert is_audio_file(broken, validation_level=ValidationLevel.MAGIC) is True
+        assert is_audio_file(broken, validation_level=ValidationLevel.STRUCTURAL) is False
+
+    def test_structural_level_accepts_last_frame_before_id3v1_tag(self, tmp_path: Path):
+        single_frame = _write(tmp_path, "single.mp3", MPEG_FRAME + b"TAG" + b"\x00" * 125)
+
+        assert is_audio_file(single_frame, validation_level=ValidationLevel.STRUCTURAL) is True
+
+    def test_structural_level_checks_flac_streaminfo(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setattr(_audio_file_context, "FLAC", _fail_parse)
+        valid = _write(tmp_path, "valid.flac", _flac_with_streaminfo())
+        no_sample_rate = _write(tmp_path, "rate.flac", _flac_with_streaminfo(sample_rate=0))
+        small_blocks = _write(tmp_path, "blocks.flac", _flac_with_streaminfo(min_block_size=8))
+        no_streaminfo = _write(tmp_path, "marker.flac", b"fLaC" + b"\x84\x00\x00\x08" + b"\x00" * 8)
+
+        assert is_audio_file(valid, validation_level=ValidationLevel.STRUCTURAL) is True
+        assert is_audio_file(no_streaminfo, validation_level=ValidationLevel.MAGIC) is True
+        for invalid in (no_sample_rate, small_blocks, no_streaminfo):
+            assert is_audio_file(invalid, validation_level=ValidationLevel.STRUCTURAL) is False
+
+    def test_level_accepts_strings(self, sample_mp3_file: Path, tmp_path: Path):
+        assert is_audio_file(sample_mp3_file, validation_level="magic") is True
+        with pytest.raises(FileCorruptedError):
+            _AudioFile(_write(tmp_path, "text.mp3", b"not a real audio file"), validation_level="structural")
+        with pytest.raises(ValueError, match="is not a valid ValidationLevel"):
+            _AudioFile(sample_mp3_file, validation_level="quick")
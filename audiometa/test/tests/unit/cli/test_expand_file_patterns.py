@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from audiometa.cli import expand_file_patterns
+from audiometa.cli import expand_file_patterns, iter_file_patterns
 
 
 @pytest.mark.unit
@@ -232,3 +232,19 @@ class TestExpandFilePatterns:
         result2 = expand_file_patterns([str(music_dir)], recursive=True)
         assert len(result2) == 1
         assert result2[0] == music_dir / "song.mp3"
+
+    def test_iter_file_patterns_filters_directory_files(self, tmp_path):
+        music_dir = tmp_path / "music"
+        (music_dir / "Live").mkdir(parents=True)
+        (music_dir / "song.mp3").write_text("audio")
+        (music_dir / "SONG.FLAC").write_text("audio")
+        (music_dir / "Live" / "live.mp3").write_text("audio")
+        explicit_file = tmp_path / "explicit.wav"
+        explicit_file.write_text("audio")
+
+        files = iter_file_patterns(
+            [str(explicit_file), str(music_dir)], recursive=True, include=["*.mp3", "*.flac"], exclude=["Live"]
+        )
+
+        assert next(files) == explicit_file
+        assert sorted(file.name for file in files) == ["SONG.FLAC", "song.mp3"]
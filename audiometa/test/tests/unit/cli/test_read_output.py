@@ -0,0 +1,46 @@
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import audiometa.cli
+from audiometa.cli import JSONL_FLUSH_INTERVAL_SEC, main
+
+
+@pytest.mark.unit
+class TestReadOutput:
+    def test_record_is_flushed_while_next_file_is_read(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_mp3_file: Path,
+        tmp_path: Path,
+        copy_to_tmp_path: Callable[..., Path],
+    ):
+        output_file = tmp_path / "metadata.jsonl"
+        first_record_seen = threading.Event()
+
+        def slow_read(file_path: Path) -> dict:
+            if file_path.name == "second.mp3":
+                # The first record must reach the output before the second file is read
+                deadline = time.monotonic() + JSONL_FLUSH_INTERVAL_SEC * 10
+                while time.monotonic() < deadline and not first_record_seen.is_set():
+                    if output_file.exists() and output_file.read_text().endswith("\n"):
+                        first_record_seen.set()
+                    time.sleep(0.02)
+            return {"title": file_path.stem}
+
+        monkeypatch.setattr(audiometa.cli, "get_unified_metadata", slow_read)
+        first_file, second_file = (
+            copy_to_tmp_path(sample_mp3_file, "first"),
+            copy_to_tmp_path(sample_mp3_file, "second"),
+        )
+        argv = ["audiometa", "unified", str(first_file), str(second_file), "--format", "jsonl", "--output"]
+        monkeypatch.setattr(sys, "argv", [*argv, str(output_file)])
+
+        main()
+
+        assert first_record_seen.is_set()
+        assert len(output_file.read_text().splitlines()) == 2
@@ -0,0 +1,101 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from mutagen.id3 import APIC, ID3, POPM, TIT2, TPOS, TSRC
+
+from audiometa import get_unified_metadata, get_unified_metadata_field, update_metadata
+from audiometa._audio_file import _AudioFile
+from audiometa.exceptions import MetadataFieldNotSupportedByLibError
+from audiometa.manager._rating_supporting.riff._RiffManager import _RiffManager
+from audiometa.manager._rating_supporting.vorbis._VorbisManager import _VorbisManager
+from audiometa.utils.metadata_format import MetadataFormat
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+def _fail_decode(*_args, **_kwargs):
+    pytest.fail("APIC frames should not be decoded when pictures are not read")
+
+
+@pytest.fixture
+def mp3_file_with_picture(
+    request: pytest.FixtureRequest, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]
+) -> Path:
+    target = copy_to_tmp_path(sample_mp3_file, "picture")
+    id3 = ID3()
+    id3.add(TIT2(encoding=3, text=["Projected"]))
+    id3.add(TSRC(encoding=3, text=["USRC17607839"]))
+    id3.add(TPOS(encoding=3, text=["2/3"]))
+    id3.add(POPM(email="test@example.com", rating=128))
+    id3.add(APIC(encoding=3, mime="image/jpeg", type=3, desc="Cover", data=b"\xff\xd8" + b"\x00" * 512 * 1024))
+    id3.save(target, v2_version=getattr(request, "param", 3))
+    return target
+
+
+@pytest.mark.unit
+class TestFieldProjection:
+    @pytest.mark.parametrize("mp3_file_with_picture", [3, 4], indirect=True)
+    def test_id3v2_pictures_are_not_decoded(self, monkeypatch: pytest.MonkeyPatch, mp3_file_with_picture: Path):
+        monkeypatch.setattr(APIC, "_fromData", classmethod(_fail_decode))
+
+        metadata = get_unified_metadata(
+            mp3_file_with_picture, fields=[UnifiedMetadataKey.TITLE, UnifiedMetadataKey.ISRC]
+        )
+
+        assert metadata == {UnifiedMetadataKey.TITLE: "Projected", UnifiedMetadataKey.ISRC: "USRC17607839"}
+        assert get_unified_metadata_field(mp3_file_with_picture, UnifiedMetadataKey.TITLE) == "Projected"
+
+    def test_id3v2_undirectly_mapped_fields(self, mp3_file_with_picture: Path):
+        metadata = get_unified_metadata(
+            mp3_file_with_picture,
+            metadata_format=MetadataFormat.ID3V2,
+            fields=["disc_number", "disc_total", "rating"],
+        )
+
+        assert metadata == {
+            UnifiedMetadataKey.DISC_NUMBER: 2,
+            UnifiedMetadataKey.DISC_TOTAL: 3,
+            UnifiedMetadataKey.RATING: 128,
+        }
+
+    @pytest.mark.parametrize("file_fixture", ["mp3_file_with_picture", "sample_flac_file", "sample_wav_file"])
+    def test_projection_matches_full_read(self, request: pytest.FixtureRequest, file_fixture: str):
+        file_path = request.getfixturevalue(file_fixture)
+        full_metadata = get_unified_metadata(file_path)
+
+        for key in UnifiedMetadataKey:
+            expected = {key: full_metadata[key]} if key in full_metadata else {}
+            assert get_unified_metadata(file_path, fields=[key]) == expected
+
+    def test_vorbis_comments_not_read_are_skipped(self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        update_metadata(
+            flac_file,
+            {UnifiedMetadataKey.TITLE: "Projected", UnifiedMetadataKey.ALBUM: "Album", UnifiedMetadataKey.RATING: 60},
+            metadata_format=MetadataFormat.VORBIS,
+        )
+
+        manager = _VorbisManager(_AudioFile(flac_file))
+        manager.fields = frozenset({UnifiedMetadataKey.TITLE, UnifiedMetadataKey.RATING})
+
+        assert manager.get_unified_metadata() == {UnifiedMetadataKey.TITLE: "Projected", UnifiedMetadataKey.RATING: 60}
+        assert manager.raw_clean_metadata is not None
+        assert {key.upper() for key in manager.raw_clean_metadata} == {"TITLE", "RATING"}
+
+    def test_riff_subchunks_not_read_are_skipped(self, sample_wav_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        wav_file = copy_to_tmp_path(sample_wav_file)
+        update_metadata(
+            wav_file,
+            {UnifiedMetadataKey.TITLE: "Projected", UnifiedMetadataKey.ALBUM: "Album"},
+            metadata_format=MetadataFormat.RIFF,
+        )
+
+        manager = _RiffManager(_AudioFile(wav_file))
+        manager.fields = frozenset({UnifiedMetadataKey.TITLE})
+
+        assert manager.get_unified_metadata() == {UnifiedMetadataKey.TITLE: "Projected"}
+        assert manager.raw_clean_metadata == {_RiffManager.RiffTagKey.TITLE: ["Projected"]}
+
+    def test_invalid_field(self, sample_mp3_file: Path):
+        with pytest.raises(MetadataFieldNotSupportedByLibError):
+            get_unified_metadata(sample_mp3_file, fields=["not_a_field"])
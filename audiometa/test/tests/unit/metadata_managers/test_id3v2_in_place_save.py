@@ -0,0 +1,58 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from mutagen.id3 import ID3
+
+from audiometa._audio_file import _AudioFile
+from audiometa.manager._rating_supporting.id3v2._Id3v2Manager import _Id3v2Manager
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+ID3V1_TAG = b"TAG" + b"Original v1 title".ljust(30, b"\x00") + b"\x00" * 94 + b"\xff"
+
+
+def _append_id3v1_tag(file_path: Path) -> Path:
+    with file_path.open("ab") as f:
+        f.write(ID3V1_TAG)
+    return file_path
+
+
+def _get_id3v2_size(file_path: Path) -> int:
+    return _AudioFile(file_path).get_context().id3v2_size
+
+
+@pytest.mark.unit
+class TestId3v2InPlaceSave:
+    def test_update_within_padding_keeps_file_size(self, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        mp3_file = _append_id3v1_tag(copy_to_tmp_path(sample_mp3_file))
+        _Id3v2Manager(_AudioFile(mp3_file)).update_metadata({UnifiedMetadataKey.TITLE: "First"})
+        size_after_first_write = mp3_file.stat().st_size
+
+        _Id3v2Manager(_AudioFile(mp3_file)).update_metadata({UnifiedMetadataKey.TITLE: "Second"})
+
+        assert mp3_file.stat().st_size == size_after_first_write
+        assert str(ID3(mp3_file)["TIT2"]) == "Second"
+
+    def test_growing_tag_shifts_audio_and_keeps_id3v1_untouched(
+        self, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        mp3_file = _append_id3v1_tag(copy_to_tmp_path(sample_mp3_file))
+        original_id3v2_size = _get_id3v2_size(mp3_file)
+        original_audio = mp3_file.read_bytes()[original_id3v2_size:]
+
+        lyrics = "la " * 20000
+        _Id3v2Manager(_AudioFile(mp3_file)).update_metadata({UnifiedMetadataKey.UNSYNCHRONIZED_LYRICS: lyrics})
+
+        content = mp3_file.read_bytes()
+        assert content[_get_id3v2_size(mp3_file) :] == original_audio
+        assert content.endswith(ID3V1_TAG)
+        assert content.count(b"TAG" + b"Original v1 title") == 1
+
+    def test_save_without_id3v1(self, sample_mp3_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        mp3_file = copy_to_tmp_path(sample_mp3_file)
+        original_audio = mp3_file.read_bytes()[_get_id3v2_size(mp3_file) :]
+
+        _Id3v2Manager(_AudioFile(mp3_file)).update_metadata({UnifiedMetadataKey.ARTISTS: ["One", "Two"]})
+
+        assert mp3_file.read_bytes()[_get_id3v2_size(mp3_file) :] == original_audio
+        assert ID3(mp3_file).version == (2, 3, 0)
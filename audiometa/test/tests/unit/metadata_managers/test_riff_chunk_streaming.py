@@ -0,0 +1,98 @@
+import struct
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from audiometa._audio_file import _AudioFile
+from audiometa.manager._rating_supporting.riff._RiffManager import _RiffManager
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+ID3V2_TAG = b"ID3\x03\x00\x00\x00\x00\x00\x0a" + b"\x00" * 10
+
+
+def _prepend_id3v2_tag(file_path: Path) -> Path:
+    file_path.write_bytes(ID3V2_TAG + file_path.read_bytes())
+    return file_path
+
+
+def _get_chunk(file_path: Path, chunk_id: bytes) -> tuple[int, bytes]:
+    context = _AudioFile(file_path).get_context()
+    chunk = next(chunk for chunk in context.get_riff_chunks() if chunk.chunk_id == chunk_id)
+    return chunk.offset, context.read_at(chunk.data_offset, chunk.size)
+
+
+def _get_riff_size(file_path: Path, riff_start: int = 0) -> int:
+    with file_path.open("rb") as f:
+        f.seek(riff_start + 4)
+        return int(struct.unpack("<I", f.read(4))[0])
+
+
+def _fail_read(*_args, **_kwargs):
+    pytest.fail("RIFF metadata should be handled without reading the whole file")
+
+
+@pytest.mark.unit
+class TestRiffChunkStreaming:
+    def test_read_update_and_delete_never_load_whole_file(
+        self, monkeypatch: pytest.MonkeyPatch, sample_wav_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        wav_file = copy_to_tmp_path(sample_wav_file)
+        monkeypatch.setattr(_AudioFile, "read", _fail_read)
+
+        _RiffManager(_AudioFile(wav_file)).update_metadata({UnifiedMetadataKey.TITLE: "Streamed"})
+        manager = _RiffManager(_AudioFile(wav_file))
+
+        assert manager.get_unified_metadata_field(UnifiedMetadataKey.TITLE) == "Streamed"
+        assert manager.get_header_info()["present"]
+        assert manager.get_raw_metadata_info()["parsed_fields"]["INAM"] == "Streamed"
+        assert _RiffManager(_AudioFile(wav_file)).delete_metadata()
+
+    def test_update_keeps_audio_and_fixes_riff_size(self, sample_wav_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        wav_file = copy_to_tmp_path(sample_wav_file)
+        _data_offset, original_audio = _get_chunk(wav_file, b"data")
+
+        _RiffManager(_AudioFile(wav_file)).update_metadata({UnifiedMetadataKey.ARTISTS: ["One", "Two"]})
+
+        assert _get_chunk(wav_file, b"data")[1] == original_audio
+        assert _get_riff_size(wav_file) == wav_file.stat().st_size - 8
+
+    def test_new_info_chunk_is_appended_without_moving_audio(
+        self, sample_wav_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        wav_file = copy_to_tmp_path(sample_wav_file)
+        assert _RiffManager(_AudioFile(wav_file)).delete_metadata()
+        assert _get_riff_size(wav_file) == wav_file.stat().st_size - 8
+        data_offset, original_audio = _get_chunk(wav_file, b"data")
+
+        _RiffManager(_AudioFile(wav_file)).update_metadata({UnifiedMetadataKey.ALBUM: "Album"})
+
+        assert _get_chunk(wav_file, b"data") == (data_offset, original_audio)
+        assert _get_chunk(wav_file, b"LIST")[0] > data_offset
+        assert _get_riff_size(wav_file) == wav_file.stat().st_size - 8
+        assert _RiffManager(_AudioFile(wav_file)).get_unified_metadata_field(UnifiedMetadataKey.ALBUM) == "Album"
+
+    def test_id3v2_prefix_is_left_untouched(self, sample_wav_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        wav_file = _prepend_id3v2_tag(copy_to_tmp_path(sample_wav_file))
+
+        _RiffManager(_AudioFile(wav_file)).update_metadata({UnifiedMetadataKey.TITLE: "After ID3v2"})
+
+        assert wav_file.read_bytes().startswith(ID3V2_TAG)
+        assert _get_riff_size(wav_file, len(ID3V2_TAG)) == wav_file.stat().st_size - len(ID3V2_TAG) - 8
+        title = _RiffManager(_AudioFile(wav_file)).get_unified_metadata_field(UnifiedMetadataKey.TITLE)
+        assert title == "After ID3v2"
+
+    def test_read_does_not_copy_file_to_temporary_file(
+        self, monkeypatch: pytest.MonkeyPatch, sample_wav_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        def fail_temporary_file(*_args, **_kwargs):
+            pytest.fail("RIFF metadata should be read straight from the file")
+
+        wav_file = _prepend_id3v2_tag(copy_to_tmp_path(sample_wav_file))
+        _RiffManager(_AudioFile(wav_file)).update_metadata({UnifiedMetadataKey.TITLE: "No temp"})
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", fail_temporary_file)
+
+        raw_metadata = _RiffManager(_AudioFile(wav_file))._extract_mutagen_metadata()
+
+        assert getattr(raw_metadata, "info", {})["INAM"] == ["No temp"]
@@ -0,0 +1,126 @@
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from audiometa._audio_file import _AudioFile
+from audiometa.manager._rating_supporting.vorbis._vorbis_comment_writer import (
+    encode_vorbis_comments,
+    parse_vorbis_comments,
+    update_vorbis_comment_entries,
+    write_vorbis_comment_block,
+)
+from audiometa.manager._rating_supporting.vorbis._vorbis_constants import (
+    VORBIS_COMMENT_BLOCK_TYPE,
+    VORBIS_DEFAULT_PADDING_SIZE,
+    VORBIS_PADDING_BLOCK_TYPE,
+)
+from audiometa.manager._rating_supporting.vorbis._VorbisManager import _VorbisManager
+from audiometa.utils.unified_metadata_key import UnifiedMetadataKey
+
+
+def _get_blocks(file_path: Path) -> list[tuple[int, int, bool]]:
+    return [
+        (block.block_type, block.size, block.is_last) for block in _AudioFile(file_path).get_context().get_flac_blocks()
+    ]
+
+
+def _get_entries(file_path: Path) -> list[bytes]:
+    context = _AudioFile(file_path).get_context()
+    block = next(block for block in context.get_flac_blocks() if block.block_type == VORBIS_COMMENT_BLOCK_TYPE)
+    return parse_vorbis_comments(context.read_at(block.data_offset, block.size))[1]
+
+
+def _get_audio_frames(file_path: Path) -> bytes:
+    blocks = _AudioFile(file_path).get_context().get_flac_blocks()
+    return file_path.read_bytes()[blocks[-1].data_offset + blocks[-1].size :]
+
+
+@pytest.mark.unit
+class TestVorbisCommentWriter:
+    def test_encode_parse_round_trip(self):
+        entries = [b"TITLE=Song", b"artist=One", b"ARTIST=Two"]
+
+        assert parse_vorbis_comments(encode_vorbis_comments(b"vendor", entries)) == (b"vendor", entries)
+
+    def test_update_entries_matches_keys_case_insensitively(self):
+        entries = [b"title=Old", b"Album=Kept", b"TITLE=Older"]
+
+        updated = update_vorbis_comment_entries(entries, {"TITLE": ["New"], "GENRE": None})
+
+        assert updated == [b"Album=Kept", b"TITLE=New"]
+
+    def test_update_fits_in_padding_without_rewriting_audio(
+        self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        original_size = flac_file.stat().st_size
+        original_frames = _get_audio_frames(flac_file)
+
+        _VorbisManager(_AudioFile(flac_file)).update_metadata({UnifiedMetadataKey.TITLE: "Native"})
+
+        assert flac_file.stat().st_size == original_size
+        assert _get_audio_frames(flac_file) == original_frames
+        assert b"TITLE=Native" in _get_entries(flac_file)
+        assert _get_blocks(flac_file)[-1][0] == VORBIS_PADDING_BLOCK_TYPE
+
+    def test_growing_beyond_padding_rewrites_file(self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        original_frames = _get_audio_frames(flac_file)
+        lyrics = "la " * 20000
+
+        _VorbisManager(_AudioFile(flac_file)).update_metadata({UnifiedMetadataKey.UNSYNCHRONIZED_LYRICS: lyrics})
+
+        assert _get_audio_frames(flac_file) == original_frames
+        assert f"LYRICS={lyrics}".encode() in _get_entries(flac_file)
+        assert _get_blocks(flac_file)[-1] == (VORBIS_PADDING_BLOCK_TYPE, VORBIS_DEFAULT_PADDING_SIZE, True)
+
+    def test_untouched_comments_keep_their_casing_and_order(
+        self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        context = _AudioFile(flac_file).get_context()
+        write_vorbis_comment_block(context, encode_vorbis_comments(b"vendor", [b"Artist=One", b"title=Old"]))
+        context.release()
+
+        _VorbisManager(_AudioFile(flac_file)).update_metadata({UnifiedMetadataKey.TITLE: "New"})
+
+        assert _get_entries(flac_file) == [b"Artist=One", b"TITLE=New"]
+
+    def test_comment_block_created_in_padding_when_missing(
+        self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        assert _VorbisManager(_AudioFile(flac_file)).delete_metadata()
+        original_size = flac_file.stat().st_size
+
+        _VorbisManager(_AudioFile(flac_file)).update_metadata({UnifiedMetadataKey.ALBUM: "Album"})
+
+        assert flac_file.stat().st_size == original_size
+        assert _get_entries(flac_file) == [b"ALBUM=Album"]
+
+    def test_delete_turns_comment_block_into_padding(
+        self, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        original_size = flac_file.stat().st_size
+
+        assert _VorbisManager(_AudioFile(flac_file)).delete_metadata()
+
+        assert flac_file.stat().st_size == original_size
+        assert [block_type for block_type, _size, _is_last in _get_blocks(flac_file)] == [0, VORBIS_PADDING_BLOCK_TYPE]
+
+    def test_update_does_not_spawn_subprocess(
+        self, monkeypatch: pytest.MonkeyPatch, sample_flac_file: Path, copy_to_tmp_path: Callable[..., Path]
+    ):
+        def fail_subprocess_run(*_args, **_kwargs):
+            pytest.fail("Vorbis comments should be written without an external tool")
+
+        flac_file = copy_to_tmp_path(sample_flac_file)
+        monkeypatch.setattr(subprocess, "run", fail_subprocess_run)
+
+        _VorbisManager(_AudioFile(flac_file)).update_metadata({UnifiedMetadataKey.ARTISTS: ["One", "Two"]})
+
+        assert _get_entries(flac_file).count(b"ARTIST=One") == 1
+        assert b"ARTIST=Two" in _get_entries(flac_file)
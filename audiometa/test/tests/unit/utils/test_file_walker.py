@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from audiometa.utils.file_walker import walk_audio_files
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    library = tmp_path / "library"
+    for relative_path in [
+        "root.mp3",
+        "Artist/Album/01.flac",
+        "Artist/Album/02.WAV",
+        "Artist/Album/cover.jpg",
+        "Artist/Live/03.mp3",
+        "@eaDir/thumb.mp3",
+    ]:
+        path = library / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+    return library
+
+
+def _relative_paths(files, root: Path) -> list[str]:
+    return sorted(file.relative_to(root).as_posix() for file in files)
+
+
+@pytest.mark.unit
+class TestWalkAudioFiles:
+    def test_finds_all_extensions_in_one_pass(self, library: Path):
+        assert _relative_paths(walk_audio_files([library], workers=3), library) == [
+            "@eaDir/thumb.mp3",
+            "Artist/Album/01.flac",
+            "Artist/Album/02.WAV",
+            "Artist/Live/03.mp3",
+            "root.mp3",
+        ]
+
+    def test_include_and_exclude_patterns(self, library: Path):
+        files = walk_audio_files([library], include=["*.mp3", "*.flac"], exclude=["@eaDir", "Artist/Live"])
+
+        assert _relative_paths(files, library) == ["Artist/Album/01.flac", "root.mp3"]
+
+    def test_symlinked_directories_are_followed_on_request(self, library: Path, tmp_path: Path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "linked.mp3").write_bytes(b"")
+        (library / "link").symlink_to(outside, target_is_directory=True)
+        (library / "loop").symlink_to(library, target_is_directory=True)
+
+        not_followed = _relative_paths(walk_audio_files([library]), library)
+        followed = _relative_paths(walk_audio_files([library], follow_symlinks=True), library)
+
+        assert "link/linked.mp3" not in not_followed
+        assert "link/linked.mp3" in followed
+        assert len(followed) == len(not_followed) + 1  # The loop back to the root is not walked again
+
+    def test_files_are_yielded_before_the_walk_ends(self, tmp_path: Path):
+        for index in range(200):
+            directory = tmp_path / f"dir{index}"
+            directory.mkdir()
+            (directory / "song.mp3").write_bytes(b"")
+
+        files = walk_audio_files([tmp_path], workers=2)
+        first_file = next(files)
+        files.close()  # Abandoning the walk stops its threads
+
+        assert first_file.name == "song.mp3"
+
+    def test_missing_root_and_invalid_workers(self, tmp_path: Path):
+        assert list(walk_audio_files([tmp_path / "missing"])) == []
+        with pytest.raises(ValueError, match="workers"):
+            walk_audio_files([tmp_path], workers=0)
+
+    @pytest.mark.skipif(os.name == "nt" or os.geteuid() == 0, reason="Permissions are not enforced")
+    def test_unreadable_directory_is_skipped(self, library: Path):
+        unreadable = library / "Artist" / "Live"
+        unreadable.chmod(0)
+        try:
+            files = _relative_paths(walk_audio_files([library]), library)
+        finally:
+            unreadable.chmod(0o755)
+
+        assert "Artist/Live/03.mp3" not in files
+        assert "root.mp3" in files
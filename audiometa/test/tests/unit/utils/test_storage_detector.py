@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from audiometa.utils import storage_detector
+from audiometa.utils.storage_detector import detect_storage_type, get_recommended_worker_count
+from audiometa.utils.storage_type import StorageType
+
+
+def _write_mountinfo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *mounts: tuple[str, str]) -> None:
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(
+        "".join(
+            f"{number} 1 0:{number} / {mount_point} rw,relatime shared:1 - {filesystem_type} source rw\n"
+            for number, (mount_point, filesystem_type) in enumerate(mounts, start=20)
+        )
+    )
+    monkeypatch.setattr(storage_detector, "MOUNTINFO_PATH", mountinfo)
+
+
+def _write_block_device(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, rotational: str, partition: bool) -> None:
+    """Fake the /sys/dev/block entry of the device of tmp_path, as a disk or as a partition of a disk."""
+    device = tmp_path.stat().st_dev
+    disk = tmp_path / "sys" / "devices" / "sda"
+    (disk / "queue").mkdir(parents=True)
+    (disk / "queue" / "rotational").write_text(f"{rotational}\n")
+    device_directory = disk / "sda1" if partition else disk
+    device_directory.mkdir(exist_ok=True)
+    block = tmp_path / "sys" / "dev" / "block"
+    block.mkdir(parents=True)
+    (block / f"{os.major(device)}:{os.minor(device)}").symlink_to(device_directory, target_is_directory=True)
+    monkeypatch.setattr(storage_detector, "SYS_DEV_BLOCK_PATH", block)
+
+
+@pytest.mark.unit
+class TestStorageDetector:
+    def test_network_file_system_from_longest_mount_point(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        share = tmp_path / "nas share"
+        share.mkdir()
+        _write_mountinfo(tmp_path, monkeypatch, ("/", "ext4"), (str(share).replace(" ", "\\040"), "nfs4"))
+
+        assert detect_storage_type(share / "album" / "missing.flac") == StorageType.NETWORK
+        assert detect_storage_type(tmp_path) != StorageType.NETWORK
+
+    @pytest.mark.parametrize(
+        ("rotational", "partition", "expected"),
+        [("1", False, StorageType.HDD), ("0", False, StorageType.SSD), ("1", True, StorageType.HDD)],
+    )
+    def test_local_disk_from_block_device(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, rotational: str, partition: bool, expected: StorageType
+    ):
+        _write_mountinfo(tmp_path, monkeypatch, ("/", "ext4"))
+        _write_block_device(tmp_path, monkeypatch, rotational, partition)
+
+        assert detect_storage_type(tmp_path) == expected
+
+    def test_unknown_without_linux_information(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(storage_detector, "MOUNTINFO_PATH", tmp_path / "missing")
+        monkeypatch.setattr(storage_detector, "SYS_DEV_BLOCK_PATH", tmp_path / "missing")
+
+        assert detect_storage_type(tmp_path) == StorageType.UNKNOWN
+
+    def test_recommended_worker_count(self):
+        assert get_recommended_worker_count(StorageType.SSD, cpu_count=12) == 12
+        assert get_recommended_worker_count(StorageType.HDD, cpu_count=12) == storage_detector.HDD_WORKER_COUNT
+        assert get_recommended_worker_count(StorageType.NETWORK, cpu_count=2) == storage_detector.NETWORK_WORKER_COUNT
+        assert get_recommended_worker_count(StorageType.UNKNOWN, cpu_count=4) == 8
@@ -0,0 +1,13 @@
+"""Batch executor kind enumeration."""
+
+from enum import Enum
+
+
+class BatchExecutor(str, Enum):
+    """Kind of worker pool used by the batch functions."""
+
+    THREAD = "thread"
+    """Run files in a thread pool (default). Best when reads wait on storage, e.g. network shares."""
+
+    PROCESS = "process"
+    """Run files in a process pool. Best when parsing is CPU-bound, e.g. many small files on local SSDs."""
@@ -0,0 +1,90 @@
+"""Per-file results of the batch functions."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .flac_md5_state import FlacMd5State
+from .metadata_write_report import MetadataWriteReport
+from .types import UnifiedMetadata
+
+
+@dataclass(frozen=True)
+class BatchReadResult:
+    """Outcome of reading one file in a batch.
+
+    Errors are captured rather than raised so that one unreadable file does not stop the batch.
+
+    Attributes:
+        file: The file as it was passed in
+        unified_metadata: Unified metadata of the file, restricted to the requested fields if any
+        technical_info: Technical information of the file (duration, bitrate, sample rate, channels and size), empty
+            unless requested
+        error: The exception raised while reading the file, or None if it was read successfully
+    """
+
+    file: str | Path
+    unified_metadata: UnifiedMetadata = field(default_factory=dict)
+    technical_info: dict[str, Any] = field(default_factory=dict)
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BatchWriteResult:
+    """Outcome of writing metadata to one file in a batch.
+
+    Errors are captured rather than raised so that one failing file does not stop the batch.
+
+    Attributes:
+        file: The file as it was passed in
+        write_reports: The MetadataWriteReport list returned by update_metadata for the file
+        error: The exception raised while validating the metadata or writing the file, or None if it was written
+            successfully
+    """
+
+    file: str | Path
+    write_reports: list[MetadataWriteReport] = field(default_factory=list)
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BatchVerifyResult:
+    """Outcome of checking the MD5 signature of one FLAC file in a batch.
+
+    Errors are captured rather than raised so that one unreadable file does not stop the batch.
+
+    Attributes:
+        file: The file as it was passed in
+        md5_state: The MD5 validation state of the file, or None if it could not be checked
+        file_size_bytes: Size of the file, counted in the throughput of the batch
+        duration_sec: Time spent checking the file
+        error: The exception raised while checking the file, or None if it was checked successfully
+    """
+
+    file: str | Path
+    md5_state: FlacMd5State | None = None
+    file_size_bytes: int = 0
+    duration_sec: float = 0.0
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the result as a JSON-serializable dictionary, with the error as its message."""
+        return {
+            "file": str(self.file),
+            "md5_state": self.md5_state.value if self.md5_state is not None else None,
+            "file_size_bytes": self.file_size_bytes,
+            "duration_sec": round(self.duration_sec, 6),
+            "error": str(self.error) if self.error is not None else None,
+        }
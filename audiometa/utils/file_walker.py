@@ -0,0 +1,190 @@
+"""Concurrent search of the audio files of directory trees.
+
+Directories are listed with os.scandir by a pool of threads, so the latency of remote file systems is overlapped across
+subtrees, and every supported extension is matched in the same pass. Files are yielded as their directory is listed,
+so that they can be processed while the rest of the tree is still being walked.
+"""
+
+import fnmatch
+import os
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# Extensions of the audio files that are found, compared in lowercase
+AUDIO_FILE_EXTENSIONS = frozenset({".mp3", ".flac", ".wav"})
+
+# Number of threads listing directories. Listing mostly waits on the file system, so it can exceed the CPU count
+DEFAULT_WALK_WORKERS = 8
+
+# Number of listed directories whose files can wait for the consumer before the threads pause
+RESULT_QUEUE_SIZE = 64
+
+# Interval at which threads waiting for the consumer check whether the walk was abandoned
+STOP_CHECK_INTERVAL_SEC = 0.1
+
+
+def is_audio_file_path(path: str | Path) -> bool:
+    """Check whether a path has the extension of a supported audio file."""
+    return os.path.splitext(path)[1].lower() in AUDIO_FILE_EXTENSIONS  # noqa: PTH122
+
+
+def _matches(patterns: tuple[str, ...], relative_path: str, name: str) -> bool:
+    """Check whether a path matches one of the patterns, which must already be in lowercase."""
+    relative_path = relative_path.lower()
+    name = name.lower()
+    return any(
+        fnmatch.fnmatchcase(relative_path, pattern) or fnmatch.fnmatchcase(name, pattern) for pattern in patterns
+    )
+
+
+class _ParallelWalk:
+    """Walk of directory trees shared by a pool of threads, with a queue of directories left to list."""
+
+    def __init__(
+        self, include: tuple[str, ...], exclude: tuple[str, ...], follow_symlinks: bool, worker_count: int
+    ) -> None:
+        self.include = include
+        self.exclude = exclude
+        self.follow_symlinks = follow_symlinks
+        self.worker_count = worker_count
+        # Directories left to list, with their path relative to their root, or None to stop a thread
+        self._directories: queue.SimpleQueue[tuple[str, str] | None] = queue.SimpleQueue()
+        # Files of each listed directory, or None once every directory is listed
+        self._results: queue.Queue[list[Path] | None] = queue.Queue(maxsize=RESULT_QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._pending_count = 0
+        self._visited: set[tuple[int, int]] = set()  # Device and inode of the directories, to break symlink loops
+        self._stop = threading.Event()
+
+    def _add_directory(self, directory: str, relative_path: str) -> None:
+        if self.follow_symlinks:
+            try:
+                stat_result = os.stat(directory)  # noqa: PTH116
+            except OSError:
+                return
+            with self._lock:
+                identity = (stat_result.st_dev, stat_result.st_ino)
+                if identity in self._visited:
+                    return
+                self._visited.add(identity)
+        with self._lock:
+            self._pending_count += 1
+        self._directories.put((directory, relative_path))
+
+    def _finish_directory(self) -> None:
+        with self._lock:
+            self._pending_count -= 1
+            is_walk_done = self._pending_count == 0
+        if is_walk_done:
+            for _ in range(self.worker_count):
+                self._directories.put(None)
+            self._put_result(None)
+
+    def _put_result(self, files: list[Path] | None) -> None:
+        while not self._stop.is_set():
+            try:
+                self._results.put(files, timeout=STOP_CHECK_INTERVAL_SEC)
+            except queue.Full:
+                continue
+            return
+
+    def _list_directory(self, directory: str, relative_path: str) -> list[Path]:
+        """List a directory, queueing its subdirectories and returning its audio files."""
+        files: list[Path] = []
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Unreadable directories are skipped, as by Path.rglob
+            return files
+        with entries:
+            for entry in entries:
+                entry_relative_path = f"{relative_path}/{entry.name}" if relative_path else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                        if not _matches(self.exclude, entry_relative_path, entry.name):
+                            self._add_directory(entry.path, entry_relative_path)
+                    elif (
+                        is_audio_file_path(entry.name)
+                        and entry.is_file()
+                        and not _matches(self.exclude, entry_relative_path, entry.name)
+                        and (not self.include or _matches(self.include, entry_relative_path, entry.name))
+                    ):
+                        files.append(Path(entry.path))
+                except OSError:
+                    continue
+        return files
+
+    def _work(self) -> None:
+        while True:
+            item = self._directories.get()
+            if item is None or self._stop.is_set():
+                return
+            files = self._list_directory(*item)
+            if files:
+                self._put_result(files)
+            self._finish_directory()
+
+    def iter_files(self, roots: list[Path]) -> Iterator[Path]:
+        for root in roots:
+            self._add_directory(os.fspath(root), "")
+        if self._pending_count == 0:
+            return
+
+        threads = [
+            threading.Thread(target=self._work, name=f"audiometa-walk-{number}", daemon=True)
+            for number in range(self.worker_count)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            while (files := self._results.get()) is not None:
+                yield from files
+        finally:
+            # Releases the threads if the consumer stops early
+            self._stop.set()
+            for _ in range(self.worker_count):
+                self._directories.put(None)
+
+
+def walk_audio_files(
+    roots: Iterable[str | Path],
+    *,
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+    follow_symlinks: bool = False,
+    workers: int = DEFAULT_WALK_WORKERS,
+) -> Iterator[Path]:
+    """Find the MP3, FLAC and WAV files under directories, recursively.
+
+    Subtrees are listed concurrently, so files are yielded in no particular order, as soon as their directory is
+    listed. Extensions are matched regardless of case.
+
+    Patterns are shell-style globs matched regardless of case against the name of a file or directory, or against its
+    path relative to its root with / separators, e.g. "*.flac", "live/*" or "@eaDir".
+
+    Args:
+        roots: Directories to search
+        include: If given, only files matching one of these patterns are yielded
+        exclude: Files and directories matching one of these patterns are skipped, directories with their whole subtree
+        follow_symlinks: Whether to walk into symbolic links to directories. Loops are only walked once. Symbolic links
+            to files are yielded either way
+        workers: Number of threads listing directories
+
+    Returns:
+        Iterator of the paths of the audio files, starting with the root they were found under
+
+    Raises:
+        ValueError: If workers is lower than 1
+    """
+    if workers < 1:
+        msg = f"workers must be at least 1, got {workers}"
+        raise ValueError(msg)
+    walk = _ParallelWalk(
+        tuple(pattern.lower() for pattern in include),
+        tuple(pattern.lower() for pattern in exclude),
+        follow_symlinks,
+        workers,
+    )
+    return walk.iter_files([Path(root) for root in roots])
@@ -0,0 +1,14 @@
+"""FLAC MD5 verification method enumeration."""
+
+from enum import Enum
+
+
+class FlacMd5VerificationMethod(str, Enum):
+    """How the MD5 signature of a FLAC file is checked against its audio data."""
+
+    NATIVE = "native"
+    """Decode the audio frames in-process and hash the PCM samples. No external tool is needed, but it is much slower
+    than `flac -t` on long files."""
+
+    FLAC_CLI = "flac_cli"
+    """Run `flac -t` and interpret its output (default). Fails if the flac tool is not installed."""
@@ -0,0 +1,536 @@
+"""In-process FLAC decoding to verify the MD5 signature of the audio data without the flac command line tool.
+
+The decoder supports the whole FLAC subframe set (CONSTANT, VERBATIM, FIXED and LPC with Rice-coded residuals) and the
+four channel assignments. Decoded samples are packed the way the reference encoder hashes them (interleaved,
+little-endian, signed, on the smallest whole number of bytes) and streamed into an incremental MD5.
+
+Decoding stops at the first frame whose header or CRC does not check out, since the MD5 can no longer match from that
+point on. A mismatch of the MD5 itself is only known once every sample is hashed.
+"""
+
+import hashlib
+import sys
+from array import array
+from collections.abc import Callable
+from functools import cache
+from itertools import accumulate, pairwise
+from pathlib import Path
+from typing import Any, cast
+
+from mutagen.flac import StreamInfo
+
+from ..exceptions import FlacFrameDecodeError
+
+# Size of the reads from the file. Frames are decoded out of this buffer, which is refilled as they are consumed
+DEFAULT_READ_CHUNK_SIZE = 1024 * 1024
+
+FRAME_SYNC_FIRST_BYTE = 0xFF
+FRAME_SYNC_SECOND_BYTE = 0xF8  # Last 6 bits of the 14-bit sync code, the reserved bit, then the blocking strategy bit
+FRAME_HEADER_MAX_SIZE = 16
+FRAME_FOOTER_SIZE = 2  # CRC-16
+
+CHANNEL_ASSIGNMENT_LEFT_SIDE = 8
+CHANNEL_ASSIGNMENT_SIDE_RIGHT = 9
+CHANNEL_ASSIGNMENT_MID_SIDE = 10
+
+SUBFRAME_CONSTANT = 0
+SUBFRAME_VERBATIM = 1
+SUBFRAME_FIXED_MIN = 8
+SUBFRAME_FIXED_MAX = 12
+SUBFRAME_LPC_MIN = 32
+
+RESIDUAL_CODING_RICE = 0
+RESIDUAL_CODING_RICE2 = 1
+LPC_PRECISION_INVALID = 15
+
+SAMPLE_SIZES_BY_CODE = {1: 8, 2: 12, 4: 16, 5: 20, 6: 24, 7: 32}
+BLOCK_SIZES_BY_CODE = {1: 192, 2: 576, 3: 1152, 4: 2304, 5: 4608, **{code: 256 << (code - 8) for code in range(8, 16)}}
+BLOCK_SIZE_CODE_8_BIT = 6  # Block size minus one stored in the 8 bits after the frame number
+BLOCK_SIZE_CODE_16_BIT = 7  # Block size minus one stored in the 16 bits after the frame number
+SAMPLE_RATE_EXTRA_BYTES_BY_CODE = {12: 1, 13: 2, 14: 2}
+SAMPLE_RATE_CODE_INVALID = 15
+# (mask, value, size) of the first byte of the UTF-8-like coded frame or sample number
+UTF8_CODED_NUMBER_SIZES = (
+    (0x80, 0x00, 1),
+    (0xE0, 0xC0, 2),
+    (0xF0, 0xE0, 3),
+    (0xF8, 0xF0, 4),
+    (0xFC, 0xF8, 5),
+    (0xFE, 0xFC, 6),
+    (0xFF, 0xFE, 7),
+)
+ARRAY_TYPECODES_BY_SAMPLE_WIDTH = {1: "b", 2: "h", 3: "i", 4: "i"}
+PACKED_24_BIT_SAMPLE_WIDTH = 3  # Packed from 32-bit values, there is no 3-byte array type
+
+
+def _build_crc_table(polynomial: int, width: int) -> list[int]:
+    top_bit = 1 << (width - 1)
+    mask = (1 << width) - 1
+    table = []
+    for byte in range(256):
+        crc = byte << (width - 8)
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial) if crc & top_bit else (crc << 1)
+        table.append(crc & mask)
+    return table
+
+
+CRC8_TABLE = _build_crc_table(0x07, 8)
+CRC16_TABLE = _build_crc_table(0x8005, 16)
+
+
+def _crc8(data: bytes) -> int:
+    crc = 0
+    table = CRC8_TABLE
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+
+def _crc16(data: bytes) -> int:
+    crc = 0
+    table = CRC16_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
+    return crc
+
+
+class _FrameUnderrunError(Exception):
+    """Raised when a frame extends past the bytes currently buffered."""
+
+
+class _BitString:
+    """Bits of a byte window as a string of '0' and '1' characters.
+
+    Reading fixed-width fields then costs a slice and an int() call, and unary codes are found with str.find, both of
+    which run in C.
+    """
+
+    def __init__(self, data: bytes):
+        self.bits = format(int.from_bytes(data, "big"), f"0{len(data) * 8}b") if data else ""
+        self.pos = 0
+
+    def read(self, size: int) -> int:
+        if size == 0:
+            return 0
+        end = self.pos + size
+        if end > len(self.bits):
+            raise _FrameUnderrunError
+        value = int(self.bits[self.pos : end], 2)
+        self.pos = end
+        return value
+
+    def read_signed(self, size: int) -> int:
+        value = self.read(size)
+        if size and value >> (size - 1):
+            value -= 1 << size
+        return value
+
+    def read_unary(self) -> int:
+        """Read a run of 0 bits terminated by a 1 bit and return the number of 0 bits."""
+        end = self.bits.find("1", self.pos)
+        if end < 0:
+            raise _FrameUnderrunError
+        count = end - self.pos
+        self.pos = end + 1
+        return count
+
+    def read_signed_block(self, count: int, size: int) -> list[int]:
+        start = self.pos
+        end = start + count * size
+        if end > len(self.bits):
+            raise _FrameUnderrunError
+        self.pos = end
+        if size == 0:
+            return [0] * count
+        bits = self.bits
+        sign_bit = 1 << (size - 1)
+        offset = 1 << size
+        values = [int(bits[i : i + size], 2) for i in range(start, end, size)]
+        return [value - offset if value & sign_bit else value for value in values]
+
+    def read_rice_block(self, count: int, parameter: int, values: list[int]) -> None:
+        """Decode count Rice-coded signed integers and append them to values."""
+        bits = self.bits
+        find = bits.find
+        append = values.append
+        pos = self.pos
+        try:
+            for _ in range(count):
+                one = find("1", pos)
+                end = one + 1 + parameter
+                # bits[one:end] is the terminating 1 followed by the low bits, worth (1 << parameter) + low
+                folded = ((one - pos - 1) << parameter) + int(bits[one:end], 2)
+                append((folded >> 1) ^ -(folded & 1))
+                pos = end
+        except ValueError:
+            # find() returned -1, leaving an empty slice: the codes run past the buffered bytes
+            raise _FrameUnderrunError from None
+        if pos > len(bits):
+            raise _FrameUnderrunError
+        self.pos = pos
+
+
+def _restore_fixed(warmup: list[int], residual: list[int]) -> list[int]:
+    """Undo a fixed predictor by integrating the residual, which is the order-th difference of the signal."""
+    order = len(warmup)
+    if order == 0:
+        return residual
+    # Initial value of each difference level: level j starts with the j-th difference at index j
+    initial_values = []
+    level = warmup
+    for _ in range(order):
+        initial_values.append(level[0])
+        level = [b - a for a, b in pairwise(level)]
+    samples = residual
+    for initial_value in reversed(initial_values):
+        samples = list(accumulate(samples, initial=initial_value))
+    return samples
+
+
+@cache
+def _get_lpc_restorer(order: int) -> Callable[[list[int], list[int], int, list[int]], list[int]]:
+    """Build the LPC restoration loop for one predictor order, with the history held in local variables.
+
+    The prediction is a recurrence on the previous outputs and cannot be vectorized. Unrolling the dot product over
+    locals makes the per-sample cost about a third of a generic sum(map(mul, ...)) over a sliding list slice.
+    """
+    coefficient_names = [f"c{i}" for i in range(order)]
+    # h0 is the most recent sample, h{order-1} the oldest
+    history_names = [f"h{i}" for i in range(order)]
+    prediction = " + ".join(f"{c} * {h}" for c, h in zip(coefficient_names, history_names, strict=True))
+    shifted_history = ", ".join(["sample", *history_names[:-1]])
+    source = f"""
+def restore(warmup, coefficients, shift, residual):
+    {", ".join(coefficient_names)}, = coefficients
+    {", ".join(reversed(history_names))}, = warmup
+    samples = list(warmup)
+    append = samples.append
+    for value in residual:
+        sample = value + (({prediction}) >> shift)
+        append(sample)
+        {", ".join(history_names)}, = {shifted_history},
+    return samples
+"""
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)  # Source built from the predictor order only
+    return cast(Callable[[list[int], list[int], int, list[int]], list[int]], namespace["restore"])
+
+
+def _restore_lpc(warmup: list[int], coefficients: list[int], shift: int, residual: list[int]) -> list[int]:
+    return _get_lpc_restorer(len(warmup))(warmup, coefficients, shift, residual)
+
+
+class _FlacFrameDecoder:
+    """Decodes FLAC frames of one stream into per-channel sample lists."""
+
+    def __init__(self, stream_info: StreamInfo):
+        self.stream_bits_per_sample = stream_info.bits_per_sample
+        self.stream_channels = stream_info.channels
+
+    def decode(self, data: bytes) -> tuple[list[list[int]], int]:
+        """Decode the frame at the start of data.
+
+        Returns:
+            The samples of each channel and the size of the frame in bytes
+
+        Raises:
+            _FrameUnderrunError: If the frame extends past the end of data
+            FlacFrameDecodeError: If the frame is not valid
+        """
+        try:
+            return self._decode(data)
+        except IndexError:
+            # The frame header runs past the end of data
+            raise _FrameUnderrunError from None
+
+    def _decode(self, data: bytes) -> tuple[list[list[int]], int]:
+        if data[0] != FRAME_SYNC_FIRST_BYTE or (data[1] & 0xFE) != FRAME_SYNC_SECOND_BYTE:
+            msg = "Lost sync: no FLAC frame header"
+            raise FlacFrameDecodeError(msg)
+
+        block_size_code = data[2] >> 4
+        sample_rate_code = data[2] & 0x0F
+        channel_assignment = data[3] >> 4
+        sample_size_code = (data[3] >> 1) & 0x07
+        position = 4 + self._get_coded_number_size(data[4])
+
+        if block_size_code in BLOCK_SIZES_BY_CODE:
+            block_size = BLOCK_SIZES_BY_CODE[block_size_code]
+        elif block_size_code == BLOCK_SIZE_CODE_8_BIT:
+            block_size = data[position] + 1
+            position += 1
+        elif block_size_code == BLOCK_SIZE_CODE_16_BIT:
+            block_size = int.from_bytes(data[position : position + 2], "big") + 1
+            position += 2
+        else:
+            msg = "Reserved block size in FLAC frame header"
+            raise FlacFrameDecodeError(msg)
+
+        if sample_rate_code == SAMPLE_RATE_CODE_INVALID:
+            msg = "Invalid sample rate in FLAC frame header"
+            raise FlacFrameDecodeError(msg)
+        # Sample rates that do not fit the 4-bit code follow the frame number; only their size matters here
+        position += SAMPLE_RATE_EXTRA_BYTES_BY_CODE.get(sample_rate_code, 0)
+
+        if position >= len(data):
+            raise _FrameUnderrunError
+        if _crc8(data[:position]) != data[position]:
+            msg = "FLAC frame header CRC mismatch"
+            raise FlacFrameDecodeError(msg)
+        position += 1
+
+        if sample_size_code == 0:
+            bits_per_sample = self.stream_bits_per_sample
+        elif sample_size_code in SAMPLE_SIZES_BY_CODE:
+            bits_per_sample = SAMPLE_SIZES_BY_CODE[sample_size_code]
+        else:
+            msg = "Reserved sample size in FLAC frame header"
+            raise FlacFrameDecodeError(msg)
+
+        if channel_assignment < CHANNEL_ASSIGNMENT_LEFT_SIDE:
+            channel_count = channel_assignment + 1
+        elif channel_assignment <= CHANNEL_ASSIGNMENT_MID_SIDE:
+            channel_count = 2
+        else:
+            msg = "Reserved channel assignment in FLAC frame header"
+            raise FlacFrameDecodeError(msg)
+        if channel_count != self.stream_channels:
+            msg = f"FLAC frame has {channel_count} channels, STREAMINFO declares {self.stream_channels}"
+            raise FlacFrameDecodeError(msg)
+
+        reader = _BitString(data[position:])
+        channels = []
+        for channel in range(channel_count):
+            # The side channel carries one extra bit
+            is_side_channel = (
+                (channel_assignment == CHANNEL_ASSIGNMENT_LEFT_SIDE and channel == 1)
+                or (channel_assignment == CHANNEL_ASSIGNMENT_SIDE_RIGHT and channel == 0)
+                or (channel_assignment == CHANNEL_ASSIGNMENT_MID_SIDE and channel == 1)
+            )
+            channels.append(self._decode_subframe(reader, bits_per_sample + is_side_channel, block_size))
+
+        frame_end = position + (reader.pos + 7) // 8
+        if frame_end + FRAME_FOOTER_SIZE > len(data):
+            raise _FrameUnderrunError
+        if _crc16(data[:frame_end]) != int.from_bytes(data[frame_end : frame_end + FRAME_FOOTER_SIZE], "big"):
+            msg = "FLAC frame CRC mismatch"
+            raise FlacFrameDecodeError(msg)
+
+        return self._decorrelate(channels, channel_assignment), frame_end + FRAME_FOOTER_SIZE
+
+    @staticmethod
+    def _get_coded_number_size(first_byte: int) -> int:
+        """Size of the UTF-8-like coded frame or sample number."""
+        for mask, value, size in UTF8_CODED_NUMBER_SIZES:
+            if first_byte & mask == value:
+                return size
+        msg = "Invalid coded frame number in FLAC frame header"
+        raise FlacFrameDecodeError(msg)
+
+    def _decode_subframe(self, reader: _BitString, bits_per_sample: int, block_size: int) -> list[int]:
+        if reader.read(1):
+            msg = "Invalid subframe padding bit"
+            raise FlacFrameDecodeError(msg)
+        subframe_type = reader.read(6)
+        wasted_bits = reader.read_unary() + 1 if reader.read(1) else 0
+        bits_per_sample -= wasted_bits
+
+        if subframe_type == SUBFRAME_CONSTANT:
+            samples = [reader.read_signed(bits_per_sample)] * block_size
+        elif subframe_type == SUBFRAME_VERBATIM:
+            samples = reader.read_signed_block(block_size, bits_per_sample)
+        elif SUBFRAME_FIXED_MIN <= subframe_type <= SUBFRAME_FIXED_MAX:
+            order = subframe_type - SUBFRAME_FIXED_MIN
+            warmup = reader.read_signed_block(order, bits_per_sample)
+            samples = _restore_fixed(warmup, self._decode_residual(reader, block_size, order))
+        elif subframe_type >= SUBFRAME_LPC_MIN:
+            order = subframe_type - SUBFRAME_LPC_MIN + 1
+            warmup = reader.read_signed_block(order, bits_per_sample)
+            precision = reader.read(4)
+            if precision == LPC_PRECISION_INVALID:
+                msg = "Invalid LPC coefficient precision"
+                raise FlacFrameDecodeError(msg)
+            shift = reader.read_signed(5)
+            if shift < 0:
+                msg = "Negative LPC shift"
+                raise FlacFrameDecodeError(msg)
+            coefficients = reader.read_signed_block(order, precision + 1)
+            residual = self._decode_residual(reader, block_size, order)
+            samples = _restore_lpc(warmup, coefficients, shift, residual)
+        else:
+            msg = f"Reserved subframe type {subframe_type}"
+            raise FlacFrameDecodeError(msg)
+
+        if wasted_bits:
+            samples = [sample << wasted_bits for sample in samples]
+        return samples
+
+    @staticmethod
+    def _decode_residual(reader: _BitString, block_size: int, predictor_order: int) -> list[int]:
+        coding_method = reader.read(2)
+        if coding_method == RESIDUAL_CODING_RICE:
+            parameter_size, escape_code = 4, 0x0F
+        elif coding_method == RESIDUAL_CODING_RICE2:
+            parameter_size, escape_code = 5, 0x1F
+        else:
+            msg = "Reserved residual coding method"
+            raise FlacFrameDecodeError(msg)
+
+        partition_order = reader.read(4)
+        partition_size = block_size >> partition_order
+        if partition_size << partition_order != block_size or partition_size < predictor_order:
+            msg = "Invalid residual partition order"
+            raise FlacFrameDecodeError(msg)
+
+        residual: list[int] = []
+        for partition in range(1 << partition_order):
+            count = partition_size - predictor_order if partition == 0 else partition_size
+            parameter = reader.read(parameter_size)
+            if parameter == escape_code:
+                residual.extend(reader.read_signed_block(count, reader.read(5)))
+            else:
+                reader.read_rice_block(count, parameter, residual)
+        return residual
+
+    @staticmethod
+    def _decorrelate(channels: list[list[int]], channel_assignment: int) -> list[list[int]]:
+        if channel_assignment == CHANNEL_ASSIGNMENT_LEFT_SIDE:
+            left, side = channels
+            return [left, [left_sample - side_sample for left_sample, side_sample in zip(left, side, strict=True)]]
+        if channel_assignment == CHANNEL_ASSIGNMENT_SIDE_RIGHT:
+            side, right = channels
+            return [[side_sample + right_sample for side_sample, right_sample in zip(side, right, strict=True)], right]
+        if channel_assignment == CHANNEL_ASSIGNMENT_MID_SIDE:
+            left, right = [], []
+            for mid_sample, side_sample in zip(channels[0], channels[1], strict=True):
+                # The mid channel lost its lowest bit, which is the lowest bit of the side channel
+                full_mid_sample = (mid_sample << 1) | (side_sample & 1)
+                left.append((full_mid_sample + side_sample) >> 1)
+                right.append((full_mid_sample - side_sample) >> 1)
+            return [left, right]
+        return channels
+
+
+def _pack_samples(channels: list[list[int]], bits_per_sample: int) -> bytes:
+    """Interleave the channels and pack the samples the way the reference encoder feeds them to MD5."""
+    sample_width = (bits_per_sample + 7) // 8
+    if len(channels) == 1:
+        interleaved = channels[0]
+    else:
+        interleaved = [0] * (len(channels[0]) * len(channels))
+        for index, channel in enumerate(channels):
+            interleaved[index :: len(channels)] = channel
+
+    packed = array(ARRAY_TYPECODES_BY_SAMPLE_WIDTH[sample_width], interleaved)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    raw = packed.tobytes()
+    if sample_width == PACKED_24_BIT_SAMPLE_WIDTH:
+        # Drop the most significant byte of each little-endian 32-bit value
+        narrowed = bytearray(len(raw) // 4 * 3)
+        for byte in range(3):
+            narrowed[byte::3] = raw[byte::4]
+        return bytes(narrowed)
+    return raw
+
+
+def compute_flac_audio_md5(
+    file_path: str | Path,
+    audio_offset: int,
+    stream_info: StreamInfo,
+    chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+) -> bytes:
+    """Decode the audio frames of a FLAC file and compute the MD5 of the decoded samples.
+
+    Args:
+        file_path: Path to the FLAC file
+        audio_offset: Offset of the first audio frame, right after the last metadata block
+        stream_info: STREAMINFO of the file, giving the sample format and the total number of samples
+        chunk_size: Number of bytes read from the file at a time
+
+    Returns:
+        The 16-byte MD5 digest, comparable to the signature stored in STREAMINFO
+
+    Raises:
+        FlacFrameDecodeError: If a frame cannot be decoded, fails its CRC check or the stream ends early
+    """
+    if chunk_size <= 0:
+        msg = "chunk_size must be a positive number of bytes"
+        raise ValueError(msg)
+
+    decoder = _FlacFrameDecoder(stream_info)
+    md5 = hashlib.md5()
+    total_samples = stream_info.total_samples
+    decoded_samples = 0
+    # A frame never needs more room than its verbatim encoding, or than the largest frame STREAMINFO declares
+    max_block_size = stream_info.max_blocksize or 65535
+    verbatim_frame_size = (
+        FRAME_HEADER_MAX_SIZE
+        + stream_info.channels * ((stream_info.bits_per_sample + 1) * max_block_size + 40) // 8
+        + FRAME_FOOTER_SIZE
+    )
+    window_size = max(stream_info.max_framesize, min(verbatim_frame_size, chunk_size))
+
+    with Path(file_path).open("rb") as f:
+        f.seek(audio_offset)
+        data = f.read(chunk_size)
+        at_eof = len(data) < chunk_size
+        data_file_offset = audio_offset  # Position of data[0] in the file
+        offset = 0
+        while not total_samples or decoded_samples < total_samples:
+            if len(data) - offset < window_size and not at_eof:
+                read_size = max(chunk_size, window_size)
+                more = f.read(read_size)
+                at_eof = len(more) < read_size
+                data_file_offset += offset
+                data = data[offset:] + more
+                offset = 0
+            if offset >= len(data):
+                if total_samples:
+                    msg = f"FLAC stream ends after {decoded_samples} of {total_samples} samples"
+                    raise FlacFrameDecodeError(msg)
+                break
+            try:
+                channels, frame_size = decoder.decode(data[offset : offset + window_size])
+            except _FrameUnderrunError:
+                if at_eof and offset + window_size >= len(data):
+                    msg = f"FLAC stream ends in the middle of a frame, after {decoded_samples} samples"
+                    raise FlacFrameDecodeError(msg) from None
+                window_size *= 2
+                continue
+            except FlacFrameDecodeError as e:
+                msg = f"{e} (frame at byte {data_file_offset + offset})"
+                raise FlacFrameDecodeError(msg) from e
+            if total_samples and decoded_samples + len(channels[0]) > total_samples:
+                # STREAMINFO is authoritative on the stream length, as it is for libFLAC
+                channels = [channel[: total_samples - decoded_samples] for channel in channels]
+            md5.update(_pack_samples(channels, decoder.stream_bits_per_sample))
+            decoded_samples += len(channels[0])
+            offset += frame_size
+
+    return md5.digest()
+
+
+def verify_flac_md5(
+    file_path: str | Path,
+    audio_offset: int,
+    stream_info: StreamInfo,
+    chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+) -> bool:
+    """Check that the decoded audio of a FLAC file matches the MD5 signature stored in its STREAMINFO block.
+
+    Args:
+        file_path: Path to the FLAC file
+        audio_offset: Offset of the first audio frame, right after the last metadata block
+        stream_info: STREAMINFO of the file
+        chunk_size: Number of bytes read from the file at a time
+
+    Returns:
+        True if the signature matches the decoded audio
+
+    Raises:
+        FlacFrameDecodeError: If the audio frames cannot be decoded
+    """
+    expected_md5 = int(stream_info.md5_signature).to_bytes(16, "big")
+    return compute_flac_audio_md5(file_path, audio_offset, stream_info, chunk_size) == expected_md5
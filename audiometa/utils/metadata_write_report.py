@@ -0,0 +1,26 @@
+"""Report describing how a metadata format was written to a file."""
+
+from dataclasses import dataclass
+
+from .metadata_format import MetadataFormat
+
+
+@dataclass(frozen=True)
+class MetadataWriteReport:
+    """Outcome of writing one metadata format to a file.
+
+    Attributes:
+        metadata_format: The metadata format that was written
+        in_place: True if the tag was overwritten in its existing space, False if the audio data had to be moved
+        tag_size: Size in bytes of the written tag, headers included and padding excluded
+        padding_size: Size in bytes of the padding left after the tag
+    """
+
+    metadata_format: MetadataFormat
+    in_place: bool
+    tag_size: int
+    padding_size: int
+
+    @property
+    def audio_shifted(self) -> bool:
+        return not self.in_place
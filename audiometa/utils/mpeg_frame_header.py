@@ -0,0 +1,84 @@
+"""Parsing of MPEG audio frame headers, used to check MP3 files without scanning their whole stream."""
+
+from dataclasses import dataclass
+
+MPEG_FRAME_HEADER_SIZE = 4
+MPEG_SYNC_FIRST_BYTE = 0xFF
+MPEG_SYNC_SECOND_BYTE_MASK = 0xE0  # Last 3 bits of the 11-bit sync code
+MPEG_LAYER_RESERVED = 4  # Layer computed from the reserved layer code
+MPEG_LAYER_3 = 3
+MPEG_BITRATE_CODE_FREE = 0
+MPEG_BITRATE_CODE_INVALID = 15
+MPEG_SAMPLE_RATE_CODE_RESERVED = 3
+
+# Version codes of the header mapped to MPEG versions (code 1 is reserved)
+MPEG_VERSIONS_BY_CODE = {0: 2.5, 2: 2, 3: 1}
+# Bitrates in kbps by (MPEG-1 or not, layer), indexed by the bitrate code (0 is free format, 15 is invalid)
+MPEG_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates in Hz by MPEG version, indexed by the sample rate code (3 is reserved)
+MPEG_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 2.5: (11025, 12000, 8000)}
+
+
+@dataclass(frozen=True)
+class MpegFrameHeader:
+    """Fields of an MPEG audio frame header needed to find the next frame."""
+
+    version: float
+    layer: int
+    bitrate: int  # In bits per second
+    sample_rate: int
+    frame_length: int  # In bytes, header included
+
+    def is_same_stream(self, other: "MpegFrameHeader") -> bool:
+        """Check whether another frame header can follow this one in the same stream."""
+        return (self.version, self.layer, self.sample_rate) == (other.version, other.layer, other.sample_rate)
+
+
+def parse_mpeg_frame_header(header: bytes) -> MpegFrameHeader | None:
+    """Parse the 4 bytes of an MPEG audio frame header.
+
+    Free-format frames, whose length cannot be computed from the header, are rejected like invalid headers.
+
+    Args:
+        header: The bytes of the header
+
+    Returns:
+        The parsed header, or None if the bytes are not a valid frame header
+    """
+    if (
+        len(header) < MPEG_FRAME_HEADER_SIZE
+        or header[0] != MPEG_SYNC_FIRST_BYTE
+        or header[1] & MPEG_SYNC_SECOND_BYTE_MASK != MPEG_SYNC_SECOND_BYTE_MASK
+    ):
+        return None
+    version = MPEG_VERSIONS_BY_CODE.get((header[1] >> 3) & 0x03)
+    layer = 4 - ((header[1] >> 1) & 0x03)
+    bitrate_code = header[2] >> 4
+    sample_rate_code = (header[2] >> 2) & 0x03
+    if (
+        version is None
+        or layer == MPEG_LAYER_RESERVED
+        or bitrate_code in (MPEG_BITRATE_CODE_FREE, MPEG_BITRATE_CODE_INVALID)
+        or sample_rate_code == MPEG_SAMPLE_RATE_CODE_RESERVED
+    ):
+        return None
+
+    bitrate = MPEG_BITRATES[(version == 1, layer)][bitrate_code] * 1000
+    sample_rate = MPEG_SAMPLE_RATES[version][sample_rate_code]
+    padding = (header[2] >> 1) & 0x01
+    if layer == 1:
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == MPEG_LAYER_3 and version != 1:
+        frame_length = 72 * bitrate // sample_rate + padding
+    else:
+        frame_length = 144 * bitrate // sample_rate + padding
+    return MpegFrameHeader(
+        version=version, layer=layer, bitrate=bitrate, sample_rate=sample_rate, frame_length=frame_length
+    )
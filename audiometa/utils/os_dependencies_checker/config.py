@@ -1,5 +1,6 @@
 """Configuration loading for OS-specific dependency checkers."""
 
+import functools
 import tomllib
 from pathlib import Path
 
@@ -17,9 +18,13 @@ def _load_config_file(project_root: Path, filename: str) -> dict | None:
         return None
 
 
+@functools.cache
 def load_dependencies_pinned_versions() -> dict[str, dict[str, str]] | None:
     """Load pinned versions from system-dependencies-prod.toml and system-dependencies-test-only.toml.
 
+    The files are only read on the first call of each process, as they are looked up for every run of an external tool.
+    The returned dictionary is shared by the callers and must not be modified.
+
     Returns:
         Dictionary mapping tool names to OS-specific versions, or None if config not found
     """
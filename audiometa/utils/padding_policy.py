@@ -0,0 +1,96 @@
+"""Padding policies deciding how much free space is left after ID3v2 tags and FLAC metadata blocks."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from mutagen import PaddingInfo
+
+PERCENT = 100
+
+
+@dataclass(frozen=True)
+class PaddingPolicy:
+    """Amount of padding to leave after a tag when it is written.
+
+    Padding is free space reserved after the tag. As long as an updated tag fits in the existing tag size plus padding,
+    it is overwritten in place; otherwise every byte of audio after it has to be shifted. A policy is a mutagen-style
+    padding function: it is called with a mutagen.PaddingInfo whose padding attribute is the space left over if the
+    tag were written in place (negative if it does not fit) and whose size attribute is the amount of data after the
+    tag, and returns the padding to use.
+
+    Use the constructors rather than instantiating the class directly:
+    - PaddingPolicy.fixed(size): always exactly size bytes of padding
+    - PaddingPolicy.percentage(percent): reuse the existing space while the tag fits, otherwise pad with percent% of
+      the tag size so that the next edits fit in place
+    - PaddingPolicy.preserve(): reuse the existing space while the tag fits and never shrink it, otherwise pad with
+      mutagen's default amount
+
+    Any callable taking a mutagen.PaddingInfo and returning an int can be used instead of a PaddingPolicy. None selects
+    mutagen's default policy, which also reuses the existing space but shrinks it when it exceeds 10 KiB plus 1% of the
+    audio size.
+    """
+
+    size: int | None = None
+    percent: float | None = None
+
+    @classmethod
+    def fixed(cls, size: int) -> "PaddingPolicy":
+        if size < 0:
+            msg = f"Padding size must be positive or zero, got {size}"
+            raise ValueError(msg)
+        return cls(size=size)
+
+    @classmethod
+    def percentage(cls, percent: float) -> "PaddingPolicy":
+        if percent < 0:
+            msg = f"Padding percentage must be positive or zero, got {percent}"
+            raise ValueError(msg)
+        return cls(percent=percent)
+
+    @classmethod
+    def preserve(cls) -> "PaddingPolicy":
+        return cls()
+
+    def __call__(self, info: PaddingInfo) -> int:
+        if self.size is not None:
+            return self.size
+        if info.padding >= 0:
+            return int(info.padding)
+        if self.percent is not None:
+            tag_size = getattr(info, "tag_size", 0)
+            return int(tag_size * self.percent / PERCENT)
+        return int(info.get_default_padding())
+
+
+type PaddingFunction = Callable[[PaddingInfo], int]
+
+
+class _TagPaddingInfo(PaddingInfo):
+    """mutagen.PaddingInfo that also carries the size of the tag being written, for percentage policies."""
+
+    def __init__(self, padding: int, size: int, tag_size: int):
+        super().__init__(padding, size)
+        self.tag_size = tag_size
+
+
+def get_padding(padding: PaddingFunction | None, available_size: int, tag_size: int, trailing_size: int) -> int:
+    """Get the amount of padding to write after a tag.
+
+    Args:
+        padding: The padding policy, or None for mutagen's default policy
+        available_size: Space currently taken by the tag and its padding
+        tag_size: Size of the new tag without padding
+        trailing_size: Amount of data after the tag
+
+    Returns:
+        The padding size in bytes
+
+    Raises:
+        ValueError: If the policy returns a negative size
+    """
+    info = _TagPaddingInfo(available_size - tag_size, trailing_size, tag_size)
+    new_padding = info._get_padding(padding)
+    if new_padding < 0:
+        msg = f"Padding policy returned a negative size: {new_padding}"
+        raise ValueError(msg)
+    return int(new_padding)
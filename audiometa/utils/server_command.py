@@ -0,0 +1,22 @@
+"""Server command enumeration."""
+
+from enum import Enum
+
+
+class ServerCommand(str, Enum):
+    """Command of a request sent to the metadata server."""
+
+    PING = "ping"
+    """Check that the server answers. The result is null."""
+
+    READ = "read"
+    """Read the full metadata of a file, as get_full_metadata."""
+
+    UNIFIED = "unified"
+    """Read the unified metadata of a file, as get_unified_metadata."""
+
+    WRITE = "write"
+    """Write the unified metadata given under "metadata" to a file, as update_metadata. The result is null."""
+
+    DELETE = "delete"
+    """Delete all metadata from a file, as delete_all_metadata. The result is whether metadata was deleted."""
@@ -0,0 +1,129 @@
+"""Detection of the kind of storage a path is on, to size worker pools."""
+
+import os
+import re
+from pathlib import Path
+
+from .storage_type import StorageType
+
+# Mount information of the current process, on Linux
+MOUNTINFO_PATH = Path("/proc/self/mountinfo")
+
+# Index of the mount point in the fields of a mountinfo line
+MOUNTINFO_MOUNT_POINT_FIELD = 4
+
+# Spaces and other special characters of mount points are escaped as octal codes, e.g. \040
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+# Block devices by major:minor number, on Linux
+SYS_DEV_BLOCK_PATH = Path("/sys/dev/block")
+
+NETWORK_FILESYSTEM_TYPES = frozenset(
+    {
+        "9p",
+        "afs",
+        "ceph",
+        "cifs",
+        "davfs",
+        "fuse.rclone",
+        "fuse.sshfs",
+        "glusterfs",
+        "lustre",
+        "ncpfs",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+        "sshfs",
+    }
+)
+
+# Workers kept busy per storage kind. Rotational disks lose throughput to seeks beyond a couple of concurrent reads,
+# while network file systems are bound by latency and gain from many requests in flight
+HDD_WORKER_COUNT = 2
+NETWORK_WORKER_COUNT = 32
+MAX_DEFAULT_WORKER_COUNT = 32
+
+
+def _get_filesystem_type(path: Path) -> str | None:
+    """Get the type of the file system of the longest mount point containing path, from the Linux mountinfo."""
+    try:
+        lines = MOUNTINFO_PATH.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return None
+    best_mount_point: Path | None = None
+    filesystem_type = None
+    for line in lines:
+        # The mount point is the fifth field, and the file system type the first one after the " - " separator
+        mount_fields, separator, filesystem_fields = line.partition(" - ")
+        fields = mount_fields.split(" ")
+        if not separator or len(fields) < MOUNTINFO_MOUNT_POINT_FIELD + 1 or not filesystem_fields:
+            continue
+        mount_point = Path(_OCTAL_ESCAPE.sub(lambda match: chr(int(match[1], 8)), fields[MOUNTINFO_MOUNT_POINT_FIELD]))
+        if (path == mount_point or mount_point in path.parents) and (
+            best_mount_point is None or len(mount_point.parts) >= len(best_mount_point.parts)
+        ):
+            best_mount_point = mount_point
+            filesystem_type = filesystem_fields.split(" ")[0]
+    return filesystem_type
+
+
+def _is_rotational(path: Path) -> bool | None:
+    """Check whether path is on a rotational disk, from the Linux block device attributes, or None if unknown."""
+    try:
+        device = path.stat().st_dev
+        device_path = (SYS_DEV_BLOCK_PATH / f"{os.major(device)}:{os.minor(device)}").resolve()
+    except (OSError, AttributeError):
+        return None
+    # Partitions have no queue attributes of their own, the disk they belong to has
+    for candidate in (device_path, device_path.parent):
+        try:
+            return (candidate / "queue" / "rotational").read_text().strip() == "1"
+        except OSError:
+            continue
+    return None
+
+
+def detect_storage_type(path: str | Path) -> StorageType:
+    """Detect the kind of storage a path is on.
+
+    Detection relies on /proc and /sys, so it is only available on Linux.
+
+    Args:
+        path: Path of a file or directory. If it does not exist, its closest existing parent is used
+
+    Returns:
+        The kind of storage, or StorageType.UNKNOWN if it cannot be detected
+    """
+    path = Path(path).absolute()
+    while not path.exists() and path != path.parent:
+        path = path.parent
+
+    filesystem_type = _get_filesystem_type(path)
+    if filesystem_type in NETWORK_FILESYSTEM_TYPES:
+        return StorageType.NETWORK
+    is_rotational = _is_rotational(path)
+    if is_rotational is None:
+        return StorageType.UNKNOWN
+    return StorageType.HDD if is_rotational else StorageType.SSD
+
+
+def get_recommended_worker_count(storage_type: StorageType, cpu_count: int | None = None) -> int:
+    """Get the number of workers reading files at once that suits a kind of storage.
+
+    Args:
+        storage_type: Kind of storage the files are on
+        cpu_count: Number of CPUs. Defaults to os.cpu_count()
+
+    Returns:
+        The CPU count for SSDs, a few workers for rotational disks, many for network file systems, and the default of
+        thread pools when the storage is unknown
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    if storage_type == StorageType.HDD:
+        return HDD_WORKER_COUNT
+    if storage_type == StorageType.NETWORK:
+        return NETWORK_WORKER_COUNT
+    if storage_type == StorageType.SSD:
+        return cpu_count
+    return min(MAX_DEFAULT_WORKER_COUNT, cpu_count + 4)
@@ -0,0 +1,19 @@
+"""Storage type enumeration."""
+
+from enum import Enum
+
+
+class StorageType(str, Enum):
+    """Kind of storage audio files are on, which sets how many of them are best read at once."""
+
+    SSD = "ssd"
+    """Local solid-state storage. Reads hardly wait, so one worker per CPU keeps it busy."""
+
+    HDD = "hdd"
+    """Local rotational disk. Concurrent reads beyond a couple make the heads seek back and forth."""
+
+    NETWORK = "network"
+    """Network file system (NFS, SMB, sshfs...). Reads wait on round trips, so many can be in flight."""
+
+    UNKNOWN = "unknown"
+    """Storage that could not be detected, e.g. on other systems than Linux."""
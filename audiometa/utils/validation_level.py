@@ -0,0 +1,24 @@
+"""Audio file validation level enumeration."""
+
+from enum import Enum
+
+
+class ValidationLevel(str, Enum):
+    """How thoroughly the content of an audio file is checked when it is opened.
+
+    Each level is cheaper than the next one. Files accepted by a cheap level may still fail later, when their audio
+    stream or metadata is actually read. WAV files are never parsed with mutagen: their RIFF header is checked at all
+    levels but NONE.
+    """
+
+    NONE = "none"
+    """Only check that the file exists and has a supported extension."""
+
+    MAGIC = "magic"
+    """Check the format marker at the start of the file (ID3v2 or MPEG sync, fLaC, RIFF/WAVE), in one small read."""
+
+    STRUCTURAL = "structural"
+    """Also check the first audio headers: two consecutive MPEG frame headers or the FLAC STREAMINFO block."""
+
+    FULL = "full"
+    """Parse the file with mutagen, scanning MP3 frames and VBR headers (default)."""
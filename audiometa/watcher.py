@@ -0,0 +1,280 @@
+"""Keep a metadata index up to date with the changes made to a directory.
+
+Changes are detected with inotify on Linux, or by comparing the size and modification time of the files of the
+directory at a fixed interval elsewhere. Bursts of changes, such as an album being copied, are gathered until the
+directory has been quiet for the debounce delay, and only the touched files are then read, in a worker pool, and
+written to the index.
+
+Examples:
+    from audiometa.index import MetadataIndex
+    from audiometa.watcher import watch_index
+
+    watch_index(MetadataIndex("~/.cache/audiometa-index.sqlite3"), "~/Music")  # Runs until interrupted
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from .index import IndexScanReport, MetadataIndex
+from .utils.batch_executor import BatchExecutor
+from .utils.file_walker import is_audio_file_path, walk_audio_files
+
+# Time without new changes after which pending changes are written to the index
+DEFAULT_DEBOUNCE_SEC = 1.0
+
+# Interval between two scans of the directory when inotify is not used
+DEFAULT_POLL_INTERVAL_SEC = 5.0
+
+# Pending changes are written after this many debounce delays even if changes keep coming
+MAX_DEBOUNCE_DELAYS = 10
+
+# Longest wait for changes while none are pending, which bounds the time taken to notice a stop request
+IDLE_WAIT_SEC = 1.0
+
+# inotify event masks, from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+INOTIFY_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+# Header of an inotify event: watch descriptor, mask, cookie and length of the name that follows
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+# Size of the buffer events are read into, enough for a few hundred events
+INOTIFY_READ_SIZE = 64 * 1024
+
+
+class _InotifyChangeSource:
+    """Changes of a directory tree reported by inotify, with one watch per directory.
+
+    Files are reported once they are closed after writing, moved or deleted, and directories once they are created,
+    moved or deleted. The root is reported when the kernel queue overflowed and events were lost.
+
+    Raises:
+        OSError: If inotify is not available, or the directory tree needs more watches than the system allows
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (AttributeError, TypeError) as e:
+            msg = "inotify is not available on this system"
+            raise OSError(msg) from e
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._directories: dict[int, Path] = {}
+        try:
+            self._watch_tree(root, strict=True)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, directory: Path, strict: bool) -> None:
+        for dir_path, _dir_names, _file_names in os.walk(directory):
+            watch_descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), INOTIFY_WATCH_MASK)
+            if watch_descriptor >= 0:
+                self._directories[watch_descriptor] = Path(dir_path)
+            elif strict:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), dir_path)
+
+    def wait_for_changes(self, timeout: float) -> set[Path]:
+        """Wait up to timeout seconds for changes, and get the paths of the files and directories that changed."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        changes: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, INOTIFY_READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                watch_descriptor, mask, _cookie, name_size = _INOTIFY_EVENT.unpack_from(data, offset)
+                name = data[offset + _INOTIFY_EVENT.size : offset + _INOTIFY_EVENT.size + name_size].rstrip(b"\0")
+                offset += _INOTIFY_EVENT.size + name_size
+                self._handle_event(watch_descriptor, mask, os.fsdecode(name), changes)
+        return changes
+
+    def _handle_event(self, watch_descriptor: int, mask: int, name: str, changes: set[Path]) -> None:
+        if mask & IN_Q_OVERFLOW:
+            changes.add(self.root)
+            return
+        if mask & IN_IGNORED:
+            self._directories.pop(watch_descriptor, None)
+            return
+        directory = self._directories.get(watch_descriptor)
+        if directory is None or not name:
+            return
+        path = directory / name
+        if mask & IN_ISDIR:
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                # Files created before the watch is added are found by reading the whole new directory
+                self._watch_tree(path, strict=False)
+            changes.add(path)
+        elif not mask & IN_CREATE and is_audio_file_path(path):
+            # A created file is reported once it is closed after writing
+            changes.add(path)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _PollingChangeSource:
+    """Changes of a directory tree found by comparing the size and modification time of its audio files at intervals."""
+
+    def __init__(self, root: Path, interval_sec: float):
+        self.root = root
+        self.interval_sec = interval_sec
+        self._snapshot = self._take_snapshot()
+        self._next_poll_time = time.monotonic() + interval_sec
+
+    def _take_snapshot(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for path in walk_audio_files([self.root]):
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat_result.st_size, stat_result.st_mtime_ns)
+        return snapshot
+
+    def wait_for_changes(self, timeout: float) -> set[Path]:
+        """Wait up to timeout seconds for the next scan, and get the paths of the files that changed."""
+        remaining = self._next_poll_time - time.monotonic()
+        if remaining > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(max(remaining, 0))
+        snapshot = self._take_snapshot()
+        self._next_poll_time = time.monotonic() + self.interval_sec
+        changes = {
+            path for path in snapshot.keys() | self._snapshot.keys() if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changes
+
+    def close(self) -> None:
+        self._snapshot.clear()
+
+
+def _apply_changes(
+    index: MetadataIndex, changes: set[Path], workers: int | None, executor: BatchExecutor
+) -> IndexScanReport:
+    """Update the index with changed files and directories, reading only the files that are new or changed."""
+    files: list[Path] = []
+    reports: list[IndexScanReport] = []
+    for path in sorted(changes):
+        if path.is_dir():
+            if next(walk_audio_files([path]), None) is not None:
+                reports.append(index.scan(path, workers=workers, executor=executor))
+            else:
+                reports.append(IndexScanReport(removed_count=index.remove_tree(path)))
+        elif is_audio_file_path(path):
+            files.append(path)
+        else:
+            # A directory that was deleted or moved away
+            reports.append(IndexScanReport(removed_count=index.remove_tree(path)))
+    if files:
+        reports.append(index.update(files, workers=workers, executor=executor))
+    return IndexScanReport(
+        file_count=sum(report.file_count for report in reports),
+        read_count=sum(report.read_count for report in reports),
+        unchanged_count=sum(report.unchanged_count for report in reports),
+        error_count=sum(report.error_count for report in reports),
+        removed_count=sum(report.removed_count for report in reports),
+    )
+
+
+def watch_index(
+    index: MetadataIndex,
+    directory: str | Path,
+    *,
+    debounce_sec: float = DEFAULT_DEBOUNCE_SEC,
+    poll_interval_sec: float = DEFAULT_POLL_INTERVAL_SEC,
+    use_inotify: bool | None = None,
+    initial_scan: bool = True,
+    workers: int | None = None,
+    executor: BatchExecutor = BatchExecutor.THREAD,
+    on_update: Callable[[IndexScanReport], None] | None = None,
+    stop_event: threading.Event | None = None,
+) -> None:
+    """Update an index with the changes made to a directory, until stopped.
+
+    Args:
+        index: Index to update
+        directory: Directory to watch, recursively
+        debounce_sec: Time without new changes after which pending changes are written to the index
+        poll_interval_sec: Interval between two scans of the directory when inotify is not used
+        use_inotify: Whether to use inotify (True), scan the directory at intervals (False), or use inotify when it is
+            available and scan otherwise (None, default)
+        initial_scan: Whether to scan the whole directory first, to index the changes made while it was not watched
+        workers: Number of workers reading the changed files, as in read_many
+        executor: Kind of worker pool, as in read_many
+        on_update: Function called with the report of each update of the index, including the initial scan
+        stop_event: Event stopping the watch when set. Without it, the watch runs until interrupted
+
+    Raises:
+        NotADirectoryError: If directory is not a directory
+        OSError: If use_inotify is True and inotify is not available
+    """
+    root = Path(directory).expanduser().absolute()
+    if not root.is_dir():
+        msg = f"Not a directory: {root}"
+        raise NotADirectoryError(msg)
+    stop_event = stop_event or threading.Event()
+
+    # The watch is set up before the initial scan, so no change made during the scan is missed
+    change_source: _InotifyChangeSource | _PollingChangeSource
+    if use_inotify is False:
+        change_source = _PollingChangeSource(root, poll_interval_sec)
+    else:
+        try:
+            change_source = _InotifyChangeSource(root)
+        except OSError:
+            if use_inotify:
+                raise
+            change_source = _PollingChangeSource(root, poll_interval_sec)
+
+    try:
+        if initial_scan:
+            report = index.scan(root, workers=workers, executor=executor)
+            if on_update is not None:
+                on_update(report)
+
+        pending: set[Path] = set()
+        first_pending_time = 0.0
+        while not stop_event.is_set():
+            changes = change_source.wait_for_changes(debounce_sec if pending else IDLE_WAIT_SEC)
+            if changes:
+                if not pending:
+                    first_pending_time = time.monotonic()
+                pending |= changes
+                if time.monotonic() - first_pending_time < debounce_sec * MAX_DEBOUNCE_DELAYS:
+                    continue
+            if pending:
+                report = _apply_changes(index, pending, workers, executor)
+                pending = set()
+                if on_update is not None:
+                    on_update(report)
+    finally:
+        change_source.close()